@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -48,6 +49,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'solver.middleware.TraceMiddleware',
 ]
 
 ROOT_URLCONF = 'mysite.urls'
@@ -122,3 +124,24 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Worker pool for CPU-heavy jobs of the async views (solver/workers.py):
+# processes, jobs allowed to wait for one (more get HTTP 429), and
+# seconds a request waits for its job (then HTTP 503)
+SOLVER_POOL_SIZE = int(os.environ.get("SOLVER_POOL_SIZE", os.cpu_count() or 1))
+SOLVER_QUEUE_DEPTH = int(os.environ.get("SOLVER_QUEUE_DEPTH", 32))
+SOLVER_TASK_TIMEOUT = float(os.environ.get("SOLVER_TASK_TIMEOUT", 30))
+
+# Persistent evaluation/equity cache shared by all processes
+# (solver/result_cache.py): a WAL-mode SQLite file next to the database.
+# Entries live TTL seconds; the least recently used go beyond MAX_ENTRIES.
+# An empty SOLVER_RESULT_CACHE_PATH turns it off.
+SOLVER_RESULT_CACHE = {
+    "PATH": os.environ.get("SOLVER_RESULT_CACHE_PATH", str(BASE_DIR / "cache.sqlite3")) or None,
+    "TTL": int(os.environ.get("SOLVER_RESULT_CACHE_TTL", 30 * 24 * 3600)),
+    "MAX_ENTRIES": int(os.environ.get("SOLVER_RESULT_CACHE_MAX_ENTRIES", 200_000)),
+}
+
+# Stored solutions (solver/models.py SolvedSpot) serve requests whose
+# stack-to-pot ratio is within this share of theirs
+SOLVER_STORE_SPR_TOLERANCE = float(os.environ.get("SOLVER_STORE_SPR_TOLERANCE", 0.1))
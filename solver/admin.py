@@ -1,3 +1,11 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import SolvedSpot
+
+
+@admin.register(SolvedSpot)
+class SolvedSpotAdmin(admin.ModelAdmin):
+    list_display = ("board", "mode", "pot", "stack", "spr", "iterations", "exploitability_pct", "created")
+    list_filter = ("mode",)
+    search_fields = ("board",)
+    exclude = ("blob",)
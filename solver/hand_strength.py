@@ -1,79 +1,57 @@
-# --- robust logger + print wrapper (manual insert) ---
-import logging
-_logger = logging.getLogger('solver.hand_strength')
-
-# Ensure module logger does not propagate to ancestor loggers
-_logger.propagate = False
-
-# Remove any existing handlers and install a single plain handler
-for _h in list(_logger.handlers):
-    try:
-        _logger.removeHandler(_h)
-    except Exception:
-        pass
-if not _logger.handlers:
-    _handler = logging.StreamHandler()
-    _handler.setFormatter(logging.Formatter('%(message)s'))
-    _logger.addHandler(_handler)
-
-_logger.setLevel(logging.INFO)
-
-def set_debug(enabled: bool):
-    _logger.setLevel(logging.DEBUG if enabled else logging.INFO)
-
-def _module_print(*args, **kwargs):
-    try:
-        msg = ' '.join(str(a) for a in args)
-    except Exception:
-        msg = ' '.join(repr(a) for a in args)
-    # Strip any leading repeated [HS-DEBUG] tokens and surrounding whitespace
-    prefix = '[HS-DEBUG]'
-    while msg.lstrip().startswith(prefix):
-        msg = msg.lstrip()[len(prefix):].lstrip()
-    # Add exactly one prefix
-    msg = '[HS-DEBUG] ' + msg
-    _logger.debug(msg)
-
-# Route module-level print calls to the wrapper
-globals()['print'] = _module_print
-# --- end robust logger + print wrapper ---
 """
 hand_strength.py
 Micro‑chunk rebuild
 Chunk 1A
+
+Debug output goes through solver.logic.tracing: pass verbose=True to
+evaluate_hand / compute_best_possible_hand to trace one call, wrap a
+request in tracing() or call set_debug(True) to trace everything.
 """
-# --- module logger initialization (inserted to avoid NameError) ---
-import logging
-_logger = logging.getLogger('solver.hand_strength')
-if not _logger.handlers:
-    _handler = logging.StreamHandler()
-    _handler.setFormatter(logging.Formatter('[HS-DEBUG] %(message)s'))
-    _logger.addHandler(_handler)
-_logger.setLevel(logging.INFO)
-def set_debug(enabled: bool):
-    _logger.setLevel(logging.DEBUG if enabled else logging.INFO)
-# --- end inserted logger init ---
+from .logic.cards import (
+    CARD_INDEX,
+    CARD_RANK,
+    CARD_STRINGS,
+    cards_to_strs,
+)
+from .logic.batch_eval import (
+    batch_best_five,
+    batch_categories,
+    batch_category_names,
+    evaluate_batch,
+)
+from .logic.eval_tables import (
+    best_five_positions,
+    evaluate,
+    strength_category,
+    strength_name,
+    strength_tiebreak,
+)
+from .logic.flop_index import flop_summary
+from .logic.nuts import nuts_completion
+from .logic.outs import find_outs
+from .logic.spot_cache import spot_cache
+from .logic.tracing import get_tracer, set_default, traceable
+
+_trace = get_tracer("solver.hand_strength", "[HS-DEBUG]")
 
 
-from itertools import combinations
+def set_debug(enabled: bool):
+    """Enable or disable debug tracing for every thread."""
+    set_default(enabled)
 
-# Rank ordering
-RANK_ORDER = "23456789TJQKA"
-RANK_INDEX = {r: i for i, r in enumerate(RANK_ORDER)}
 
 def _rank_value(card):
     """Return numeric rank index."""
-    return RANK_INDEX[card[0]]
+    return CARD_RANK[CARD_INDEX[card]]
+
 
-if _logger.isEnabledFor(logging.DEBUG):
-    print("Loaded rank helpers")
 def _classify_five(cards):
     """
     Classify exactly 5 cards.
     Returns:
         category, name, tiebreak, cards
     """
-    print("[HS-DEBUG] Classifying:", cards)
+    _trace("Classifying: %s", cards)
 
     # Extract ranks and suits
     ranks = [_rank_value(c) for c in cards]
@@ -180,37 +158,37 @@ def _classify_five(cards):
 
     # High Card
     return 0, "High Card", ranks_sorted, cards
+
+
+def _table_best_five(cards):
+    """
+    Best 5 of 5-7 cards from the lookup tables in
+    solver.logic.eval_tables (one pass, no 5-card subsets).
+    Returns:
+        category, name, tiebreak, best_five
+    """
+    idx = [CARD_INDEX[c] for c in cards]
+    strength = evaluate(idx)
+    best_five = [cards[i] for i in best_five_positions(idx, strength)]
+    return (
+        strength_category(strength),
+        strength_name(strength),
+        strength_tiebreak(strength),
+        best_five,
+    )
+
+
+@traceable
 def _best_five_from_seven(cards):
     """
     Choose best 5 from 7 cards.
     Returns:
         category, name, tiebreak, best_five
     """
-    print("[HS-DEBUG] Evaluating best 5 from 7:", cards)
-
-    best_cat = -1
-    best_name = ""
-    best_tb = []
-    best_five = None
-
-    # Generate all 21 combos
-    for combo in combinations(cards, 5):
-        cat, name, tb, _ = _classify_five(list(combo))
-
-        if cat > best_cat:
-            best_cat = cat
-            best_name = name
-            best_tb = tb
-            best_five = list(combo)
-            print("[HS-DEBUG] New best:", name, best_five)
-
-        elif cat == best_cat and tb > best_tb:
-            best_name = name
-            best_tb = tb
-            best_five = list(combo)
-            print("[HS-DEBUG] Tiebreak improved:", name, best_five)
-
-    return best_cat, best_name, best_tb, best_five
+    return _table_best_five(cards)
+
+
+@traceable
 def evaluate_hand(hand_cards, board_cards):
     """
     Evaluate hero's current hand.
@@ -223,13 +201,13 @@ def evaluate_hand(hand_cards, board_cards):
     all_cards = hand_cards + board_cards
     n = len(all_cards)
 
-    print("[HS-DEBUG] evaluate_hand: total cards =", n)
-    print("[HS-DEBUG] Hand:", hand_cards)
-    print("[HS-DEBUG] Board:", board_cards)
+    _trace("evaluate_hand: total cards = %d", n)
+    _trace("Hand: %s", hand_cards)
+    _trace("Board: %s", board_cards)
 
     # Not enough cards
     if n < 5:
-        print("[HS-DEBUG] Not enough cards to evaluate")
+        _trace("Not enough cards to evaluate")
         return {
             "hand_cards": hand_cards,
             "board_cards": board_cards,
@@ -241,26 +219,10 @@ def evaluate_hand(hand_cards, board_cards):
             "tiebreak": [],
         }
 
-    # Exactly 5 cards
-    if n == 5:
-        cat, name, tb, best_five = _classify_five(all_cards)
-        print("[HS-DEBUG] 5-card result:", name, best_five)
-        return {
-            "hand_cards": hand_cards,
-            "board_cards": board_cards,
-            "all_cards": all_cards,
-            "best_five": best_five,
-            "category": cat,
-            "hand_type": name,
-            "hand_name": name,
-            "tiebreak": tb,
-        }
-
-    # 6 or 7 cards
-    if n in (6, 7):
-        cat, name, tb, best_five = _best_five_from_seven(all_cards[:7])
-        print("[HS-DEBUG] Best from", n, "cards:", name, best_five)
-        print("[HS-DEBUG] Best from", n, "cards:", name, best_five)
+    # 5, 6 or 7 cards: one table lookup
+    if n in (5, 6, 7):
+        cat, name, tb, best_five = _table_best_five(all_cards)
+        _trace("Best from %d cards: %s %s", n, name, best_five)
         return {
             "hand_cards": hand_cards,
             "board_cards": board_cards,
@@ -273,7 +235,7 @@ def evaluate_hand(hand_cards, board_cards):
         }
 
     # Fallback (should not happen)
-    print("[HS-DEBUG] Unexpected card count")
+    _trace("Unexpected card count")
     return {
         "hand_cards": hand_cards,
         "board_cards": board_cards,
@@ -285,80 +247,154 @@ def evaluate_hand(hand_cards, board_cards):
         "tiebreak": [],
     }
 
+
+@traceable
 def compute_best_possible_hand(hole, board):
     """
-    Compute the best possible 5-card hand (nuts) given
-    hero hole cards and current board (0-5 cards).
-    Returns a dict with the best category, name, tiebreak,
-    and the best five-card combination found.
+    Compute the best possible 5-card hand (nuts) given hero hole cards
+    and the current board (0-5 cards). The best reachable hand
+    is derived from rank/suit bitmasks (solver.logic.nuts) instead of
+    evaluating every board completion; only the winning completion is
+    evaluated to build the result dict.
     """
-    print("[HS-DEBUG] compute_best_possible_hand: hole", hole, "board", board)
+    _trace("compute_best_possible_hand: hole %s board %s", hole, board)
 
-    # Build full deck
-    deck = []
-    for r in RANK_ORDER:
-        for s in "cdhs":
-            deck.append(r + s)
+    known_cards = hole + board
+    known_idx = [CARD_INDEX[c] for c in known_cards]
 
-    # Remove known cards
-    known = set(hole + board)
-    deck = [c for c in deck if c not in known]
-
-    # Number of board cards
     b = len(board)
     if b > 5:
-        print("[HS-DEBUG] Too many board cards")
+        _trace("Too many board cards")
         return None
-    # How many cards to add to reach 5
-    to_add = 5 - b
 
-    # If board already complete, just evaluate current
+    to_add = 5 - b
     if to_add == 0:
-        cat, name, tb, best_five = _best_five_from_seven(hole + board)
+        # Board complete: the current hand is the best one
+        res = evaluate_hand(hole, board)
         return {
-            "best_category": cat,
-            "best_name": name,
-            "best_tiebreak": tb,
-            "best_five": best_five,
+            "best_category": res["category"],
+            "best_name": res["hand_name"],
+            "best_tiebreak": res["tiebreak"],
+            "best_five": res["best_five"],
             "completion": [],
         }
 
-    # Iterate all possible completions
-    from itertools import combinations as combs
-    best_overall = {
-        "best_category": -1,
-        "best_name": None,
-        "best_tiebreak": [],
-        "best_five": None,
-        "completion": None,
+    extra = nuts_completion(known_idx, to_add)
+    best_strength = evaluate(known_idx + extra)
+    completion = cards_to_strs(extra)
+    best_name = strength_name(best_strength)
+    _trace("Nuts via %s -> %s", completion, best_name)
+
+    all_cards = known_cards + completion
+    all_idx = known_idx + extra
+    return {
+        "best_category": strength_category(best_strength),
+        "best_name": best_name,
+        "best_tiebreak": strength_tiebreak(best_strength),
+        "best_five": [all_cards[i] for i in best_five_positions(all_idx, best_strength)],
+        "completion": completion,
+    }
+
+
+def evaluate_hands_batch(cards, decode=False):
+    """
+    Batch counterpart of evaluate_hand.
+    cards: (N, 7) card-index array (see solver.logic.cards; 5 or 6
+    columns also work). Returns the (N,) strength array, or with
+    decode=True a dict that adds categories, hand names and best five
+    card indices.
+    """
+    strengths = evaluate_batch(cards)
+    if not decode:
+        return strengths
+    return {
+        "strength": strengths,
+        "category": batch_categories(strengths),
+        "hand_name": batch_category_names(strengths),
+        "best_five": batch_best_five(cards, strengths),
+    }
+
+
+def compute_future_improvements(hand_cards, board_cards, runner_runner=True):
+    """
+    Improvements for hero on a flop or turn (see solver.logic.outs):
+    next-card outs grouped by the new hand name and, from the flop unless
+    runner_runner is False, turn + river combos that need both cards.
+    Returns:
+        {"message": nuts name,
+         "improvements": {"turn": {...}, "river": {...}, "combined": {...}},
+         "probability": {"next_card": p, "runner_runner": p},
+         "draws": draw names on the flop (flop index when built)}
+    """
+    improvements = {"turn": {}, "river": {}, "combined": {}}
+    probability = {"next_card": 0.0, "runner_runner": 0.0}
+    street = {3: "turn", 4: "river"}.get(len(board_cards))
+    if street:
+        report = find_outs(
+            [CARD_INDEX[c] for c in hand_cards], [CARD_INDEX[c] for c in board_cards], runner_runner
+        )
+        improvements[street] = {
+            name: cards_to_strs(cards) for name, cards in report["by_category"].items()
+        }
+        probability["next_card"] = report["probability"]
+        rr = report["runner_runner"]
+        if rr is not None:
+            improvements["combined"] = {
+                name: [CARD_STRINGS[t] + CARD_STRINGS[r] for t, r in entry["combos"]]
+                for name, entry in rr["by_category"].items()
+            }
+            probability["runner_runner"] = rr["probability"]
+
+    draws = flop_summary(hand_cards, board_cards)["draws"] if len(board_cards) == 3 else []
+
+    best = compute_best_possible_hand(hand_cards, board_cards)
+    return {
+        "message": best["best_name"] if best else "",
+        "improvements": improvements,
+        "probability": probability,
+        "draws": draws,
+    }
+
+
+def restore_evaluation(res, relabel):
+    """evaluate_hand() of the canonical spot in a caller's cards (see spot_cache)."""
+    cards = ("hand_cards", "board_cards", "all_cards", "best_five")
+    return {**res, **{k: [relabel.given(c) for c in res[k]] for k in cards}}
+
+
+def restore_improvements(res, relabel):
+    """compute_future_improvements() of the canonical spot in a caller's suits."""
+    improvements = res["improvements"]
+    return {
+        **res,
+        "improvements": {
+            "turn": relabel.first_found({n: relabel.deck_order(c) for n, c in improvements["turn"].items()}),
+            "river": relabel.first_found({n: relabel.deck_order(c) for n, c in improvements["river"].items()}),
+            "combined": relabel.first_found({n: relabel.combos(c) for n, c in improvements["combined"].items()}),
+        },
     }
 
-    for extra in combs(deck, to_add):
-        full_board = board + list(extra)
-        result = evaluate_hand(hole, full_board)
-        cat = result["category"]
-        tb = result["tiebreak"]
-
-        if cat > best_overall["best_category"]:
-            best_overall["best_category"] = cat
-            best_overall["best_name"] = result["hand_name"]
-            best_overall["best_tiebreak"] = tb
-            best_overall["best_five"] = result["best_five"]
-            best_overall["completion"] = list(extra)
-            print("[HS-DEBUG] New nuts via", extra, "->", result["hand_name"])
-
-        elif cat == best_overall["best_category"] and tb > best_overall["best_tiebreak"]:
-            best_overall["best_name"] = result["hand_name"]
-            best_overall["best_tiebreak"] = tb
-            best_overall["best_five"] = result["best_five"]
-            best_overall["completion"] = list(extra)
-            print("[HS-DEBUG] Tiebreak nuts improved via", extra)
-
-    return best_overall
+
+# Cached variants of the public evaluators. Results are read-only; see
+# solver.logic.spot_cache. The nuts completion picks suits by their
+# index, so its cache is keyed on the exact cards.
+cached_evaluate_hand = spot_cache(restore=restore_evaluation)(evaluate_hand)
+cached_compute_best_possible_hand = spot_cache()(compute_best_possible_hand)
+cached_compute_future_improvements = spot_cache(restore=restore_improvements)(compute_future_improvements)
+
+
 # Exports
 __all__ = [
     "evaluate_hand",
+    "evaluate_hands_batch",
     "compute_best_possible_hand",
+    "compute_future_improvements",
+    "cached_evaluate_hand",
+    "cached_compute_best_possible_hand",
+    "cached_compute_future_improvements",
+    "restore_evaluation",
+    "restore_improvements",
+    "set_debug",
     "_classify_five",
     "_best_five_from_seven",
 ]
@@ -368,163 +404,12 @@ if __name__ == "__main__":
     # Quick smoke tests
     hole = ["As", "Kd"]
     board = ["Ah", "Ad", "Ac"]
-    print("[HS-DEBUG] Smoke test: hole", hole, "board", board)
+    print("Smoke test: hole", hole, "board", board)
     res = evaluate_hand(hole, board)
-    print("[HS-DEBUG] evaluate_hand result:", res)
+    print("evaluate_hand result:", res)
 
     # Nuts calc example: turn (4 board cards)
     hole2 = ["7h", "8h"]
     board2 = ["9h", "Th", "2c", "3d"]
     nuts = compute_best_possible_hand(hole2, board2)
-    print("[HS-DEBUG] compute_best_possible_hand result:", nuts)
-import sys
-import io
-import contextlib
-
-# Keep originals so we can override safely
-_orig_evaluate_hand = evaluate_hand
-_orig_compute_best_possible_hand = compute_best_possible_hand
-
-@contextlib.contextmanager
-def _suppress_stdout(suppress):
-    if not suppress:
-        yield
-        return
-    old_stdout = sys.stdout
-    sys.stdout = io.StringIO()
-    try:
-        yield
-    finally:
-        sys.stdout = old_stdout
-
-def evaluate_hand(hand_cards, board_cards, verbose=False):
-    """
-    Wrapper around original evaluate_hand that can silence debug prints.
-    If verbose is False, stdout from the original function is suppressed.
-    """
-    with _suppress_stdout(not verbose):
-        return _orig_evaluate_hand(hand_cards, board_cards)
-
-def compute_best_possible_hand(hole, board, verbose=False):
-    """
-    Reimplementation of nuts search that supports verbose flag
-    and early exit when the absolute best (category 8) is found.
-    """
-    print("[HS-DEBUG] compute_best_possible_hand: hole", hole, "board", board) if verbose else None
-
-    # Build full deck
-    deck = []
-    for r in RANK_ORDER:
-        for s in "cdhs":
-            deck.append(r + s)
-
-    # Remove known cards
-    known = set(hole + board)
-    deck = [c for c in deck if c not in known]
-
-    b = len(board)
-    if b > 5:
-        if verbose:
-            print("[HS-DEBUG] Too many board cards")
-        return None
-
-    to_add = 5 - b
-    if to_add == 0:
-        # Evaluate current complete board using suppressed prints as requested
-        res = evaluate_hand(hole, board, verbose=verbose)
-        return {
-            "best_category": res["category"],
-            "best_name": res["hand_name"],
-            "best_tiebreak": res["tiebreak"],
-            "best_five": res["best_five"],
-            "completion": [],
-        }
-
-    from itertools import combinations as combs
-    best_overall = {
-        "best_category": -1,
-        "best_name": None,
-        "best_tiebreak": [],
-        "best_five": None,
-        "completion": None,
-    }
-
-    for extra in combs(deck, to_add):
-        full_board = board + list(extra)
-        # Use the wrapper evaluate_hand which respects verbose
-        result = evaluate_hand(hole, full_board, verbose=verbose)
-        cat = result["category"]
-        tb = result["tiebreak"]
-
-        if cat > best_overall["best_category"]:
-            best_overall["best_category"] = cat
-            best_overall["best_name"] = result["hand_name"]
-            best_overall["best_tiebreak"] = tb
-            best_overall["best_five"] = result["best_five"]
-            best_overall["completion"] = list(extra)
-            if verbose:
-                print("[HS-DEBUG] New nuts via", extra, "->", result["hand_name"])
-
-        elif cat == best_overall["best_category"] and tb > best_overall["best_tiebreak"]:
-            best_overall["best_name"] = result["hand_name"]
-            best_overall["best_tiebreak"] = tb
-            best_overall["best_five"] = result["best_five"]
-            best_overall["completion"] = list(extra)
-            if verbose:
-                print("[HS-DEBUG] Tiebreak nuts improved via", extra)
-
-        # Early exit: Straight Flush is the absolute best
-        if best_overall["best_category"] == 8:
-            if verbose:
-                print("[HS-DEBUG] Early exit: found Straight Flush nuts")
-            break
-
-    return best_overall
-# --- Quiet wrapper for _best_five_from_seven to avoid duplicate prints ---
-# Keep original reference
-_orig__best_five_from_seven = _best_five_from_seven
-
-def _best_five_from_seven(cards, verbose=False):
-    """
-    Wrapper around original _best_five_from_seven that suppresses
-    stdout when verbose is False. This prevents duplicate debug lines
-    when higher-level functions also print the same events.
-    """
-    with _suppress_stdout(not verbose):
-        return _orig__best_five_from_seven(cards)
-# --- end wrapper ---
-# --- Logging setup and module-level print override ---
-import logging
-import builtins
-
-_logger = logging.getLogger("solver.hand_strength")
-if not _logger.handlers:
-    _handler = logging.StreamHandler()
-    _handler.setFormatter(logging.Formatter("%(message)s"))
-    _logger.addHandler(_handler)
-# Default to INFO so normal runs are quiet; enable debug with set_debug(True)
-_logger.setLevel(logging.INFO)
-
-def set_debug(enabled: bool):
-    """
-    Enable or disable debug logging for this module.
-    Call set_debug(True) to see debug traces; set_debug(False) to silence them.
-    """
-    _logger.setLevel(logging.DEBUG if enabled else logging.INFO)
-
-def _module_print(*args, **kwargs):
-    """
-    Module-scoped replacement for print that routes to the logger at DEBUG level.
-    Keeps behavior simple: joins args with spaces and logs them.
-    """
-    try:
-        msg = " ".join(str(a) for a in args)
-    except Exception:
-        # Fallback to repr if something is not stringable
-        msg = " ".join(repr(a) for a in args)
-    _logger.debug(msg)
-
-# Replace the module-level print name so existing print(...) calls in this file
-# will be routed to the logger. This does not modify builtins.print globally.
-globals()["print"] = _module_print
-# --- end logging setup ---
+    print("compute_best_possible_hand result:", nuts)
@@ -0,0 +1,133 @@
+"""
+Vectorised batch evaluation on NumPy arrays.
+
+evaluate_batch takes an (N, k) integer array of card indices (k = 5, 6 or 7,
+see cards.py) and returns an (N,) array of strengths identical to
+eval_tables.evaluate, using the same tables:
+
+    - card keys are gathered and summed per row
+    - non-flush rows look up RANK_TABLE via searchsorted on its sorted keys
+    - flush rows build the flush-suit rank mask and index FLUSH_TABLE
+
+Names and best-five cards are only decoded when asked for.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .cards import CARD_INDEX
+from .eval_tables import (
+    CARD_KEY,
+    CATEGORY_SHIFT,
+    FLUSH_BITS,
+    FLUSH_PROBE,
+    FLUSH_TABLE,
+    HAND_NAMES,
+    RANK_KEY_MASK,
+    RANK_TABLE,
+    SUIT_SHIFT,
+    best_five_positions,
+)
+
+# Rows evaluated per chunk; bounds the size of the temporaries.
+CHUNK_ROWS = 1 << 18
+
+_CARD_KEYS = np.array(CARD_KEY, dtype=np.int64)
+_RANK_KEYS = np.array(sorted(RANK_TABLE), dtype=np.int64)
+_RANK_STRENGTHS = np.array([RANK_TABLE[k] for k in sorted(RANK_TABLE)], dtype=np.int32)
+_FLUSH_STRENGTHS = np.array(FLUSH_TABLE, dtype=np.int32)
+_HAND_NAMES = np.array(HAND_NAMES)
+
+
+def cards_array(hands):
+    """Convert a list of card-string lists into an (N, k) int8 array."""
+    return np.array([[CARD_INDEX[c] for c in hand] for hand in hands], dtype=np.int8)
+
+
+@lru_cache(maxsize=16)
+def _combinations(n, k):
+    # Grow k-subsets one column at a time: every row is repeated once for
+    # each larger value that can follow its last element.
+    combos = np.zeros((1, 0), dtype=np.int8)
+    last = np.full(1, -1, dtype=np.int64)
+    for depth in range(k):
+        # Leave room for the columns still to come
+        counts = np.maximum(n - (k - depth - 1) - (last + 1), 0)
+        rows = np.repeat(np.arange(combos.shape[0]), counts)
+        starts = np.cumsum(counts) - counts
+        offsets = np.arange(rows.size) - np.repeat(starts, counts)
+        last = last[rows] + 1 + offsets
+        combos = np.hstack([combos[rows], last[:, None].astype(np.int8)])
+    return combos
+
+
+def combinations_array(items, k):
+    """
+    All k-subsets of `items` as a (C(n, k), k) array, in the same order
+    as itertools.combinations.
+    """
+    items = np.asarray(items)
+    return items[_combinations(len(items), k)]
+
+
+def _evaluate_chunk(cards):
+    keys = _CARD_KEYS[cards].sum(axis=1)
+    out = _RANK_STRENGTHS[np.searchsorted(_RANK_KEYS, keys & RANK_KEY_MASK)]
+
+    flush = ((keys >> SUIT_SHIFT) + FLUSH_PROBE) & FLUSH_BITS
+    rows = np.flatnonzero(flush)
+    if rows.size:
+        flush = flush[rows]
+        suit = np.zeros(rows.size, dtype=np.int64)
+        for s in range(1, 4):
+            suit[(flush >> (4 * s + 3)) & 1 == 1] = s
+        held = cards[rows].astype(np.int64)
+        bits = np.where((held & 3) == suit[:, None], 1 << (held >> 2), 0)
+        out[rows] = _FLUSH_STRENGTHS[bits.sum(axis=1)]
+    return out
+
+
+def evaluate_batch(cards):
+    """
+    Strengths for an (N, k) array of card indices, 5 <= k <= 7.
+    Returns an (N,) int32 array comparable like eval_tables.evaluate.
+    """
+    cards = np.asarray(cards)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError(f"Expected an (N, 5..7) card array, got shape {cards.shape}")
+    if cards.size and (cards.min() < 0 or cards.max() > 51):
+        raise ValueError("Card indices must be in 0..51")
+    cards = cards.astype(np.intp, copy=False)
+
+    out = np.empty(cards.shape[0], dtype=np.int32)
+    for start in range(0, cards.shape[0], CHUNK_ROWS):
+        stop = start + CHUNK_ROWS
+        out[start:stop] = _evaluate_chunk(cards[start:stop])
+    return out
+
+
+def batch_categories(strengths):
+    """Category 0..8 for every strength."""
+    return np.asarray(strengths) >> CATEGORY_SHIFT
+
+
+def batch_category_names(strengths):
+    """Hand name ("Flush", ...) for every strength."""
+    return _HAND_NAMES[batch_categories(strengths)]
+
+
+def batch_best_five(cards, strengths, rows=None):
+    """
+    (len(rows), 5) card indices of the best five for the selected rows
+    (all rows by default). Decoding is per row, so only ask for the
+    rows you need.
+    """
+    cards = np.asarray(cards)
+    strengths = np.asarray(strengths)
+    if rows is None:
+        rows = range(cards.shape[0])
+    out = []
+    for i in rows:
+        held = cards[i].tolist()
+        out.append([held[p] for p in best_five_positions(held, int(strengths[i]))])
+    return np.array(out, dtype=np.int8).reshape(-1, 5)
@@ -0,0 +1,93 @@
+"""
+Compact card representation shared by the evaluators and parsers.
+
+A card is an int 0..51:  rank * 4 + suit
+    rank: 0..12 for "23456789TJQKA"
+    suit: 0..3  for "cdhs"
+
+A set of cards is a 52-bit int mask with bit `card` set.  Strings like
+"As" are only parsed and formatted at the API edges.
+"""
+
+RANK_ORDER = "23456789TJQKA"
+SUIT_ORDER = "cdhs"
+
+FULL_DECK = (1 << 52) - 1
+
+# Canonical string per card index ("2c", "2d", ..., "As")
+CARD_STRINGS = [r + s for r in RANK_ORDER for s in SUIT_ORDER]
+
+# String -> index. Accepts either case for rank and suit and "10" for T.
+CARD_INDEX = {}
+for _c, _text in enumerate(CARD_STRINGS):
+    for _r in {_text[0], _text[0].lower()}:
+        for _s in {_text[1], _text[1].upper()}:
+            CARD_INDEX[_r + _s] = _c
+            if _r in "Tt":
+                CARD_INDEX["10" + _s] = _c
+
+# Rank and suit of every card index
+CARD_RANK = [c >> 2 for c in range(52)]
+CARD_SUIT = [c & 3 for c in range(52)]
+
+
+def card_from_str(text):
+    """Parse "As" (or "AS", "as", "10s") into a card index."""
+    try:
+        return CARD_INDEX[text.strip()]
+    except KeyError:
+        raise ValueError(f"Invalid card: {text!r}") from None
+
+
+def card_to_str(card):
+    return CARD_STRINGS[card]
+
+
+def cards_from_strs(texts):
+    return [card_from_str(t) for t in texts]
+
+
+def cards_to_strs(cards):
+    return [CARD_STRINGS[c] for c in cards]
+
+
+def card_mask(cards):
+    """Bitmask of card indices."""
+    mask = 0
+    for c in cards:
+        mask |= 1 << c
+    return mask
+
+
+def mask_from_strs(texts):
+    return card_mask(cards_from_strs(texts))
+
+
+def mask_cards(mask):
+    """Card indices set in `mask`, lowest first."""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+
+def mask_count(mask):
+    return mask.bit_count()
+
+
+def deck_cards(dead_mask=0):
+    """Remaining deck as card indices (lowest first) after removing `dead_mask`."""
+    return mask_cards(FULL_DECK & ~dead_mask)
+
+
+def find_duplicate(cards):
+    """Return the first card index seen twice, or None."""
+    seen = 0
+    for c in cards:
+        bit = 1 << c
+        if seen & bit:
+            return c
+        seen |= bit
+    return None
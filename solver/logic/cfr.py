@@ -0,0 +1,325 @@
+"""
+River subgame solver: CFR+ over a game_tree.GameTree with both ranges
+handled as vectors.
+
+Each player's range is the list of its combos that survive the board.
+Regrets and cumulative strategies are (n_nodes, n_hands) arrays per
+player: row `child` holds the regret or weight of the action leading to
+that child, for every hand of the player acting at its parent.  One
+iteration updates each player in turn (alternating CFR+):
+
+    forward    reach of both players at every node (current strategies)
+    terminals  traverser's value at every fold and showdown node
+    backward   node values, regret update R = max(R + v_a - v, 0) and
+               strategy sum += t * reach * strategy
+
+Terminal values against the opponent's reach vector r avoid the
+(n x n) hand matrix.  At a showdown a hand wins r over the weaker
+opponent hands and loses it over the stronger ones; with the opponent
+hands sorted by strength once per board, both are prefix sums, and the
+hands sharing a card with hero are taken out with per-card prefix sums
+(over the at most 51 opponent hands holding that card).
+Folds only need the card-disjoint total of r.
+
+Values are chips won on the river: the pot before the street plus the
+opponent's chips, minus hero's own chips put in.  Both players' values
+therefore add up to the pot for every hand pair, and exploitability is
+
+    (best response EV of OOP + best response EV of IP - pot) / 2
+"""
+import numpy as np
+
+from .cards import cards_from_strs, find_duplicate
+from .combos import COMBO_CARDS, N_COMBOS, blocked_combos, combo_str
+from .game_tree import FOLD, PLAYER_NAMES, SHOWDOWN
+from .range_equity import board_strengths, range_weights
+
+# Check exploitability every this many iterations
+CHECK_EVERY = 10
+
+
+class Side:
+    """One player's hands on the board: combo indices, weights and lookups."""
+
+    __slots__ = ("combos", "weights", "strength", "cards", "onehot")
+
+    def __init__(self, weights, strengths):
+        self.combos = np.flatnonzero(weights > 0)
+        self.weights = weights[self.combos]
+        self.strength = strengths[self.combos]
+        self.cards = COMBO_CARDS[self.combos].astype(np.int64)
+        self.onehot = np.zeros((self.combos.size, 52))
+        self.onehot[np.arange(self.combos.size), self.cards[:, 0]] = 1
+        self.onehot[np.arange(self.combos.size), self.cards[:, 1]] = 1
+
+
+class Matchup:
+    """Sorted-order lookups of hero's hands into the opponent's hands."""
+
+    __slots__ = ("order", "lo", "hi", "same", "cards", "card_hands", "card_lo", "card_hi")
+
+    def __init__(self, hero, opp):
+        self.order = np.argsort(opp.strength, kind="stable")
+        ranked = opp.strength[self.order]
+        # Opponent hands strictly weaker than / at most as strong as each hero hand
+        self.lo = np.searchsorted(ranked, hero.strength, side="left")
+        self.hi = np.searchsorted(ranked, hero.strength, side="right")
+        position = np.full(N_COMBOS, -1)
+        position[opp.combos] = np.arange(opp.combos.size)
+        self.same = position[hero.combos]
+        self.cards = hero.cards
+
+        # Sorted positions of the opponent hands holding each card, padded
+        # with a position past the end (zero reach), and where each hero
+        # hand's lo / hi fall among them for each of its two cards
+        held = opp.onehot[self.order].T
+        card, hand = np.nonzero(held)
+        counts = np.bincount(card, minlength=52)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        self.card_hands = np.full((52, counts.max()), opp.combos.size)
+        self.card_hands[card, np.arange(card.size) - starts[card]] = hand
+        # below[k, c]: opponent hands among the k weakest that hold card c
+        below = np.zeros((opp.combos.size + 1, 52), dtype=np.int64)
+        below[1:] = np.cumsum(held.T, axis=0)
+        self.card_lo = below[self.lo[None, :], hero.cards.T]
+        self.card_hi = below[self.hi[None, :], hero.cards.T]
+
+    def fold_totals(self, reach, onehot):
+        """(k, n_hero) card-disjoint opponent reach for reach (k, n_opp)."""
+        card = reach @ onehot
+        total = reach.sum(axis=1, keepdims=True) - card[:, self.cards[:, 0]] - card[:, self.cards[:, 1]]
+        same = self.same >= 0
+        total[:, same] += reach[:, self.same[same]]
+        return total
+
+    def showdown(self, reach):
+        """(k, n_hero) card-disjoint (wins - losses) against reach (k, n_opp)."""
+        k, n = reach.shape
+        ranked = np.zeros((k, n + 1))
+        ranked[:, :n] = reach[:, self.order]
+        cum = np.zeros((k, n + 2))
+        np.cumsum(ranked, axis=1, out=cum[:, 1:])
+        card_cum = np.zeros((k, 52, self.card_hands.shape[1] + 1))
+        np.cumsum(ranked[:, self.card_hands], axis=2, out=card_cum[:, :, 1:])
+
+        a, b = self.cards[:, 0], self.cards[:, 1]
+        below = cum[:, self.lo] - card_cum[:, a, self.card_lo[0]] - card_cum[:, b, self.card_lo[1]]
+        upto = cum[:, self.hi] - card_cum[:, a, self.card_hi[0]] - card_cum[:, b, self.card_hi[1]]
+        total = cum[:, -1:] - card_cum[:, a, -1] - card_cum[:, b, -1]
+        return below - (total - upto)
+
+
+def terminal_values(tree, folds, showdowns, player, matchup, opp_onehot, opp_reach):
+    """
+    (n_nodes, n_hero) chips `player` wins at the `folds` and `showdowns`
+    nodes of `tree` against the opponent's (n_nodes, n_opp) reach; other
+    rows are zero.
+    """
+    pot = tree.pot
+    other = 1 - player
+    values = np.zeros((len(tree), matchup.cards.shape[0]))
+    if folds.size:
+        matched = matchup.fold_totals(opp_reach[folds], opp_onehot)
+        gain = np.where(tree.player[folds] == player, -tree.commit[folds, player], pot + tree.commit[folds, other])
+        values[folds] = gain[:, None] * matched
+    if showdowns.size:
+        reach = opp_reach[showdowns]
+        net = matchup.showdown(reach)
+        matched = matchup.fold_totals(reach, opp_onehot)
+        values[showdowns] = (pot / 2 + tree.commit[showdowns, player])[:, None] * net + pot / 2 * matched
+    return values
+
+
+class RiverSolver:
+    """
+    CFR+ on one river tree. `ranges` are anything range_equity.range_weights
+    accepts; combos blocked by the board are dropped.
+    """
+
+    def __init__(self, tree, board, range_oop, range_ip):
+        board = cards_from_strs(board)
+        if len(board) != 5:
+            raise ValueError("The river solver needs a 5-card board")
+        if find_duplicate(board) is not None:
+            raise ValueError("Duplicate board card")
+        strengths = board_strengths(board)
+        blocked = blocked_combos(board)
+        self.tree = tree
+        self.board = board
+        self.sides = [
+            Side(np.where(blocked, 0.0, range_weights(r)), strengths)
+            for r in (range_oop, range_ip)
+        ]
+        if not all(side.combos.size for side in self.sides):
+            raise ValueError("Both ranges need a combo that the board does not block")
+        self.matchups = [Matchup(self.sides[0], self.sides[1]), Matchup(self.sides[1], self.sides[0])]
+
+        n = len(tree)
+        self.regret = [np.zeros((n, side.combos.size)) for side in self.sides]
+        self.strategy_sum = [np.zeros((n, side.combos.size)) for side in self.sides]
+        self.iterations = 0
+
+        self._nodes = [
+            (int(node), int(tree.player[node]), slice(int(tree.first_child[node]), int(tree.first_child[node] + tree.n_children[node])))
+            for node in tree.action_nodes
+        ]
+        self._folds = np.flatnonzero(tree.kind == FOLD)
+        self._showdowns = np.flatnonzero(tree.kind == SHOWDOWN)
+        root_opp = [self.sides[1].weights[None, :], self.sides[0].weights[None, :]]
+        self._matched = [self.matchups[p].fold_totals(root_opp[p], self.sides[1 - p].onehot)[0] for p in (0, 1)]
+        self._pairs = float(self.sides[0].weights @ self._matched[0])
+
+    # Strategies -----------------------------------------------------------
+
+    def _current(self, player, children):
+        positive = self.regret[player][children]
+        total = positive.sum(axis=0)
+        n = positive.shape[0]
+        return np.where(total > 0, positive / np.where(total > 0, total, 1), 1.0 / n)
+
+    def _average(self, player, children):
+        weights = self.strategy_sum[player][children]
+        total = weights.sum(axis=0)
+        n = weights.shape[0]
+        return np.where(total > 0, weights / np.where(total > 0, total, 1), 1.0 / n)
+
+    def average_strategy(self, player):
+        """(n_nodes, n_hands) average strategy; rows are the children of `player`'s nodes."""
+        out = np.zeros_like(self.strategy_sum[player])
+        for node, acting, children in self._nodes:
+            if acting == player:
+                out[children] = self._average(player, children)
+        return out
+
+    # Passes ---------------------------------------------------------------
+
+    def _reach(self, strategy):
+        reach = [np.empty((len(self.tree), side.combos.size)) for side in self.sides]
+        reach[0][0] = self.sides[0].weights
+        reach[1][0] = self.sides[1].weights
+        for node, player, children in self._nodes:
+            other = 1 - player
+            reach[player][children] = reach[player][node] * strategy(player, children)
+            reach[other][children] = reach[other][node]
+        return reach
+
+    def _terminal_values(self, player, opp_reach):
+        return terminal_values(
+            self.tree, self._folds, self._showdowns, player,
+            self.matchups[player], self.sides[1 - player].onehot, opp_reach,
+        )
+
+    def _iterate(self, player, weight):
+        reach = self._reach(self._current)
+        values = self._terminal_values(player, reach[1 - player])
+        regret = self.regret[player]
+        strategy_sum = self.strategy_sum[player]
+        for node, acting, children in reversed(self._nodes):
+            child_values = values[children]
+            if acting != player:
+                values[node] = child_values.sum(axis=0)
+                continue
+            strategy = self._current(player, children)
+            values[node] = (strategy * child_values).sum(axis=0)
+            np.maximum(regret[children] + child_values - values[node], 0, out=regret[children])
+            strategy_sum[children] += weight * reach[player][node] * strategy
+
+    def _root_values(self, player, best_response):
+        reach = self._reach(self._average)
+        values = self._terminal_values(player, reach[1 - player])
+        for node, acting, children in reversed(self._nodes):
+            child_values = values[children]
+            if acting != player:
+                values[node] = child_values.sum(axis=0)
+            elif best_response:
+                values[node] = child_values.max(axis=0)
+            else:
+                values[node] = (self._average(player, children) * child_values).sum(axis=0)
+        return values[0]
+
+    # Results --------------------------------------------------------------
+
+    def ev(self, player, best_response=False):
+        """Chips `player` wins on average (per card-disjoint hand pair)."""
+        return float(self.sides[player].weights @ self._root_values(player, best_response)) / self._pairs
+
+    def combo_ev(self, player):
+        """(n_hands,) chips won by each of `player`'s hands at the average strategies."""
+        values = self._root_values(player, False)
+        matched = self._matched[player]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(matched > 0, values / matched, 0.0)
+
+    def exploitability(self):
+        """Average gain of a best response over the average strategies, in chips."""
+        return (self.ev(0, True) + self.ev(1, True) - self.tree.pot) / 2
+
+    def solve(self, iterations=1000, target=0.005):
+        """
+        Run CFR+ until `iterations` or until exploitability falls to
+        `target` of the pot (checked every CHECK_EVERY iterations).
+        Returns the final exploitability in chips.
+        """
+        exploitability = self.exploitability()
+        for _ in range(iterations):
+            self.iterations += 1
+            # Linear averaging: iteration t counts t times
+            for player in (0, 1):
+                self._iterate(player, self.iterations)
+            if self.iterations % CHECK_EVERY == 0:
+                exploitability = self.exploitability()
+                if exploitability <= target * self.tree.pot:
+                    return exploitability
+        return self.exploitability()
+
+
+def solve_river(tree, board, range_oop, range_ip, iterations=1000, target=0.005):
+    """
+    Solve a river tree and return a dict with
+        solver          the RiverSolver (arrays, further iterations)
+        hands           combo indices per player
+        strategy        (n_nodes, n_hands) average strategy per player
+        ev              chips each player wins on average
+        combo_ev        (n_hands,) chips per hand, per player
+        exploitability  chips, and exploitability_pct as a share of the pot
+        iterations      CFR+ iterations run
+    """
+    solver = RiverSolver(tree, board, range_oop, range_ip)
+    exploitability = solver.solve(iterations, target)
+    return {
+        "solver": solver,
+        "hands": [side.combos for side in solver.sides],
+        "strategy": [solver.average_strategy(p) for p in (0, 1)],
+        "ev": [solver.ev(p) for p in (0, 1)],
+        "combo_ev": [solver.combo_ev(p) for p in (0, 1)],
+        "exploitability": exploitability,
+        "exploitability_pct": exploitability / tree.pot,
+        "iterations": solver.iterations,
+    }
+
+
+def strategy_report(result, max_nodes=None):
+    """
+    JSON-friendly view of solve_river() output: per action node its
+    path, player, actions, range-wide frequencies and per-combo strategy.
+    """
+    solver = result["solver"]
+    tree = solver.tree
+    reach_all = solver._reach(solver._average)
+    nodes = []
+    for node, player, children in solver._nodes[:max_nodes]:
+        strategy = result["strategy"][player][children]
+        reach = reach_all[player][node]
+        weight = reach.sum()
+        nodes.append({
+            "node": node,
+            "path": tree.path(node),
+            "player": PLAYER_NAMES[player],
+            "actions": [tree.action[c] for c in range(children.start, children.stop)],
+            "frequencies": ((strategy @ reach) / weight).tolist() if weight > 0 else None,
+            "strategy": {
+                combo_str(int(c)): [round(float(f), 4) for f in strategy[:, i]]
+                for i, c in enumerate(result["hands"][player])
+            },
+        })
+    return nodes
@@ -0,0 +1,114 @@
+"""
+The 1326 two-card starting combos and the 169 preflop hand classes.
+
+A combo index 0..1325 names an unordered pair of card indices (see
+cards.py).  COMBO_CARDS holds the pair (higher card first) for every
+index, COMBO_INDEX the reverse lookup for either card order.  Every combo
+belongs to one of the 169 classes ("AA", "AKs", "AKo", ...).
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .cards import CARD_STRINGS, RANK_ORDER
+
+N_COMBOS = 1326
+N_CLASSES = 169
+
+# (1326, 2) card indices, higher card first, ordered by (high, low)
+COMBO_CARDS = np.array([(hi, lo) for hi in range(52) for lo in range(hi)], dtype=np.int8)
+
+# (52, 52) -> combo index, -1 on the diagonal
+COMBO_INDEX = np.full((52, 52), -1, dtype=np.int16)
+COMBO_INDEX[COMBO_CARDS[:, 0], COMBO_CARDS[:, 1]] = np.arange(N_COMBOS)
+COMBO_INDEX[COMBO_CARDS[:, 1], COMBO_CARDS[:, 0]] = np.arange(N_COMBOS)
+
+
+def _class_name(hi, lo):
+    r1, r2 = hi >> 2, lo >> 2
+    if r1 == r2:
+        return RANK_ORDER[r1] * 2
+    r1, r2 = max(r1, r2), min(r1, r2)
+    return RANK_ORDER[r1] + RANK_ORDER[r2] + ("s" if hi & 3 == lo & 3 else "o")
+
+
+# 169 class names: pairs AA..22, then suited and offsuit by high/low rank
+CLASS_NAMES = [RANK_ORDER[r] * 2 for r in range(12, -1, -1)]
+for _hi in range(12, -1, -1):
+    for _lo in range(_hi - 1, -1, -1):
+        CLASS_NAMES.append(RANK_ORDER[_hi] + RANK_ORDER[_lo] + "s")
+        CLASS_NAMES.append(RANK_ORDER[_hi] + RANK_ORDER[_lo] + "o")
+CLASS_INDEX = {name: i for i, name in enumerate(CLASS_NAMES)}
+
+# (1326,) class index of every combo
+COMBO_CLASS = np.array([CLASS_INDEX[_class_name(hi, lo)] for hi, lo in COMBO_CARDS.tolist()], dtype=np.int16)
+
+# Combos per class: 6 for pairs, 4 suited, 12 offsuit
+CLASS_COMBO_COUNT = np.bincount(COMBO_CLASS, minlength=N_CLASSES)
+
+
+def combo_index(card_a, card_b):
+    return int(COMBO_INDEX[card_a, card_b])
+
+
+def combo_str(index):
+    hi, lo = COMBO_CARDS[index]
+    return CARD_STRINGS[hi] + CARD_STRINGS[lo]
+
+
+def class_combos(name):
+    """Combo indices of a class name like "AKs"."""
+    return np.flatnonzero(COMBO_CLASS == CLASS_INDEX[name])
+
+
+def blocked_combos(dead_cards):
+    """(1326,) bool: combos that use any of the given card indices."""
+    dead = np.zeros(52, dtype=bool)
+    dead[list(dead_cards)] = True
+    return dead[COMBO_CARDS].any(axis=1)
+
+
+@lru_cache(maxsize=24)
+def combo_suit_perm(suit_map):
+    """
+    (1326,) combo index of every combo after relabelling suits with
+    `suit_map` (tuple: original suit -> new suit).
+    """
+    cards = (COMBO_CARDS & ~3) | np.array(suit_map, dtype=np.int8)[COMBO_CARDS & 3]
+    perm = COMBO_INDEX[cards[:, 0], cards[:, 1]]
+    perm.setflags(write=False)
+    return perm
+
+
+@lru_cache(maxsize=1)
+def combo_card_matrix():
+    """(1326, 52) one-hot card membership of every combo."""
+    onehot = np.zeros((N_COMBOS, 52), dtype=np.uint8)
+    onehot[np.arange(N_COMBOS), COMBO_CARDS[:, 0]] = 1
+    onehot[np.arange(N_COMBOS), COMBO_CARDS[:, 1]] = 1
+    return onehot
+
+
+@lru_cache(maxsize=1)
+def combo_overlap():
+    """(1326, 1326) bool: the two combos share a card."""
+    onehot = combo_card_matrix().astype(np.int16)
+    return (onehot @ onehot.T) > 0
+
+
+@lru_cache(maxsize=1)
+def combo_class_matrix():
+    """(1326, 169) one-hot class membership of every combo."""
+    onehot = np.zeros((N_COMBOS, N_CLASSES))
+    onehot[np.arange(N_COMBOS), COMBO_CLASS] = 1
+    onehot.setflags(write=False)
+    return onehot
+
+
+@lru_cache(maxsize=1)
+def class_pair_counts():
+    """(169, 169) number of card-disjoint combo pairs between two classes."""
+    onehot = combo_class_matrix()
+    counts = onehot.T @ (~combo_overlap()) @ onehot
+    counts.setflags(write=False)
+    return counts
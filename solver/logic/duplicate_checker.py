@@ -1,3 +1,6 @@
+from .cards import CARD_INDEX
+
+
 def check_for_duplicates(hand, board):
     """
     Returns None if no duplicates.
@@ -15,12 +18,15 @@ def check_for_duplicates(hand, board):
 
     all_cards = hand_cards + board_cards
 
-    # If any card appears more than once, it's a duplicate
-    seen = set()
+    # If any card bit is already set in the mask, it's a duplicate
+    seen = 0
     for card in all_cards:
-        if card in seen:
+        index = CARD_INDEX.get(card)
+        if index is None:
+            return f"Invalid card detected: {card}"
+        bit = 1 << index
+        if seen & bit:
             return f"Duplicate card detected: {card}"
-        seen.add(card)
+        seen |= bit
 
     return None
-
@@ -0,0 +1,98 @@
+"""
+Exact hero-vs-villain equity by enumerating every remaining runout.
+
+Runouts are scored with the batch evaluator (same tables as
+solver/hand_strength.py).  Flop and turn spots run in-process; big
+enumerations (preflop: C(48, 5) = 1,712,304 boards) are split by the first
+runout card across a multiprocessing pool and the win/tie/loss counts are
+summed.
+"""
+from math import comb
+from multiprocessing import Pool
+
+import numpy as np
+
+from .batch_eval import combinations_array, evaluate_batch
+from .cards import card_mask, cards_from_strs, cards_to_strs, deck_cards, find_duplicate
+
+# Enumerations at least this large go to the process pool.
+POOL_MIN_RUNOUTS = 200_000
+
+
+def _parse_spot(hero, villain, board):
+    hero = cards_from_strs(hero)
+    villain = cards_from_strs(villain)
+    board = cards_from_strs(board)
+    if len(hero) != 2 or len(villain) != 2:
+        raise ValueError("Hero and villain need exactly 2 hole cards each")
+    if len(board) > 5:
+        raise ValueError("Board can have at most 5 cards")
+    dup = find_duplicate(hero + villain + board)
+    if dup is not None:
+        raise ValueError(f"Duplicate card: {cards_to_strs([dup])[0]}")
+    return hero, villain, board
+
+
+def count_runouts(hero, villain, board, runouts):
+    """
+    Win/tie/loss counts for hero over an (M, k) array of runout cards.
+    hero, villain, board are card-index lists; board + k must be 5.
+    """
+    runouts = np.asarray(runouts, dtype=np.int8)
+    m = runouts.shape[0]
+    if m == 0:
+        return np.zeros(3, dtype=np.int64)
+    fixed_board = np.broadcast_to(np.array(board, dtype=np.int8), (m, len(board)))
+    hero_rows = np.hstack([np.broadcast_to(np.array(hero, dtype=np.int8), (m, 2)), fixed_board, runouts])
+    villain_rows = np.hstack([np.broadcast_to(np.array(villain, dtype=np.int8), (m, 2)), fixed_board, runouts])
+    diff = evaluate_batch(hero_rows).astype(np.int64) - evaluate_batch(villain_rows)
+    return np.array(
+        [np.count_nonzero(diff > 0), np.count_nonzero(diff == 0), np.count_nonzero(diff < 0)],
+        dtype=np.int64,
+    )
+
+
+def _count_from_first(args):
+    """Pool task: every runout whose lowest card is deck[first]."""
+    hero, villain, board, deck, first = args
+    k = 5 - len(board)
+    rest = combinations_array(deck[first + 1:], k - 1)
+    head = np.full((rest.shape[0], 1), deck[first], dtype=np.int8)
+    return count_runouts(hero, villain, board, np.hstack([head, rest]))
+
+
+def _result(counts):
+    win, tie, loss = (int(x) for x in counts)
+    total = win + tie + loss
+    return {
+        "win": win,
+        "tie": tie,
+        "loss": loss,
+        "runouts": total,
+        "equity": (win + tie / 2) / total if total else 0.0,
+    }
+
+
+def exact_equity(hero, villain, board=(), processes=None):
+    """
+    Exact all-runout equity of hero vs villain.
+
+    hero, villain: two card strings each, e.g. ["As", "Kd"]
+    board: 0-5 card strings
+    processes: pool size for large enumerations (None = os.cpu_count(),
+    1 = always in-process)
+
+    Returns a dict with win/tie/loss counts, runouts and hero equity
+    (ties count half).
+    """
+    hero, villain, board = _parse_spot(hero, villain, board)
+    deck = np.array(deck_cards(card_mask(hero + villain + board)), dtype=np.int8)
+    k = 5 - len(board)
+
+    if processes == 1 or comb(len(deck), k) < POOL_MIN_RUNOUTS:
+        return _result(count_runouts(hero, villain, board, combinations_array(deck, k)))
+
+    tasks = [(hero, villain, board, deck, first) for first in range(len(deck) - k + 1)]
+    with Pool(processes) as pool:
+        counts = sum(pool.imap_unordered(_count_from_first, tasks))
+    return _result(counts)
@@ -0,0 +1,262 @@
+"""
+Table-driven hand evaluator.
+
+Any 5, 6 or 7 card holding is reduced to one comparable integer strength
+without walking the 21 five-card subsets:
+
+    strength = category << 20 | tiebreak ranks packed 4 bits each
+
+Each card contributes a precomputed key: 3 bits per rank (rank counts) and
+4 bits per suit (suit counts).  Summing the keys of a holding gives its rank
+multiset and suit distribution in one integer.  Non-flush hands are looked up
+in RANK_TABLE by the rank-count part of the key, flushes in FLUSH_TABLE by the
+13-bit rank mask of the flush suit.  Both tables are built once at import.
+
+Categories and tiebreak lists match `_classify_five` in solver/hand_strength.py
+(wheel straights have high rank 3).
+"""
+
+from .cards import CARD_INDEX
+
+HAND_NAMES = [
+    "High Card",
+    "One Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+]
+
+# Number of tiebreak ranks stored for each category.
+TIEBREAK_LEN = (5, 4, 3, 3, 1, 5, 2, 2, 1)
+
+CATEGORY_SHIFT = 20
+
+# Key layout: 13 ranks x 3 bits, then 4 suits x 4 bits.
+SUIT_SHIFT = 39
+RANK_KEY_MASK = (1 << SUIT_SHIFT) - 1
+FLUSH_PROBE = 0x3333
+FLUSH_BITS = 0x8888
+
+# card index = rank * 4 + suit (see cards.py)
+CARD_KEY = [
+    (1 << (3 * (c >> 2))) + (1 << (SUIT_SHIFT + 4 * (c & 3)))
+    for c in range(52)
+]
+
+# Straight windows as (rank mask, high rank), best first.  Wheel high is 3.
+STRAIGHT_WINDOWS = [(0x1F << (h - 4), h) for h in range(12, 3, -1)]
+STRAIGHT_WINDOWS.append(((1 << 12) | 0xF, 3))
+
+
+def make_strength(category, tiebreak):
+    """Pack a category and tiebreak rank list into one integer."""
+    value = category << CATEGORY_SHIFT
+    shift = 16
+    for r in tiebreak:
+        value |= r << shift
+        shift -= 4
+    return value
+
+
+def strength_category(strength):
+    return strength >> CATEGORY_SHIFT
+
+
+def strength_name(strength):
+    return HAND_NAMES[strength >> CATEGORY_SHIFT]
+
+
+def _unpack_tiebreak(strength):
+    cat = strength >> CATEGORY_SHIFT
+    return tuple((strength >> (16 - 4 * i)) & 0xF for i in range(TIEBREAK_LEN[cat]))
+
+
+def strength_tiebreak(strength):
+    """Unpack the tiebreak list in the same form `_classify_five` returns."""
+    tb = _TIEBREAKS.get(strength)
+    if tb is None:
+        tb = _TIEBREAKS[strength] = _unpack_tiebreak(strength)
+    return list(tb)
+
+
+def _straight_high(mask):
+    for window, high in STRAIGHT_WINDOWS:
+        if mask & window == window:
+            return high
+    return -1
+
+
+def _top_ranks(mask, n, exclude=()):
+    out = []
+    for r in range(12, -1, -1):
+        if mask >> r & 1 and r not in exclude:
+            out.append(r)
+            if len(out) == n:
+                break
+    return out
+
+
+def _strength_from_counts(counts):
+    """Best non-flush strength for a rank-count vector (5 to 7 cards)."""
+    mask = 0
+    quads, trips, pairs = [], [], []
+    for r in range(12, -1, -1):
+        n = counts[r]
+        if n:
+            mask |= 1 << r
+            if n == 4:
+                quads.append(r)
+            elif n == 3:
+                trips.append(r)
+            elif n == 2:
+                pairs.append(r)
+
+    if quads:
+        q = quads[0]
+        return make_strength(7, [q] + _top_ranks(mask, 1, (q,)))
+
+    if trips and (len(trips) > 1 or pairs):
+        t = trips[0]
+        return make_strength(6, [t, max(trips[1:] + pairs)])
+
+    high = _straight_high(mask)
+    if high >= 0:
+        return make_strength(4, [high])
+
+    if trips:
+        t = trips[0]
+        return make_strength(3, [t] + _top_ranks(mask, 2, (t,)))
+
+    if len(pairs) >= 2:
+        p1, p2 = pairs[0], pairs[1]
+        return make_strength(2, [p1, p2] + _top_ranks(mask, 1, (p1, p2)))
+
+    if pairs:
+        p = pairs[0]
+        return make_strength(1, [p] + _top_ranks(mask, 3, (p,)))
+
+    return make_strength(0, _top_ranks(mask, 5))
+
+
+def _build_rank_table():
+    table = {}
+    counts = [0] * 13
+
+    def walk(rank, total, key):
+        if rank == 13:
+            if total >= 5:
+                table[key] = _strength_from_counts(counts)
+            return
+        for n in range(min(4, 7 - total) + 1):
+            counts[rank] = n
+            walk(rank + 1, total + n, key + (n << (3 * rank)))
+        counts[rank] = 0
+
+    walk(0, 0, 0)
+    return table
+
+
+def _build_flush_table():
+    table = [0] * 8192
+    for mask in range(8192):
+        if bin(mask).count("1") < 5:
+            continue
+        high = _straight_high(mask)
+        if high >= 0:
+            table[mask] = make_strength(8, [high])
+        else:
+            table[mask] = make_strength(5, _top_ranks(mask, 5))
+    return table
+
+
+RANK_TABLE = _build_rank_table()
+FLUSH_TABLE = _build_flush_table()
+
+
+def evaluate(cards):
+    """
+    Strength of 5 to 7 card indices (0..51).
+    Higher is better; equal strengths tie.
+    """
+    key = 0
+    for c in cards:
+        key += CARD_KEY[c]
+    flush = ((key >> SUIT_SHIFT) + FLUSH_PROBE) & FLUSH_BITS
+    if flush:
+        suit = (flush.bit_length() - 4) >> 2
+        mask = 0
+        for c in cards:
+            if c & 3 == suit:
+                mask |= 1 << (c >> 2)
+        return FLUSH_TABLE[mask]
+    return RANK_TABLE[key & RANK_KEY_MASK]
+
+
+def evaluate_strings(cards):
+    """Strength of card strings like ["As", "Kd", ...]."""
+    return evaluate([CARD_INDEX[c] for c in cards])
+
+
+def _needed_ranks(strength):
+    """Copies of each rank (13-list) that make up the best five."""
+    cat = strength >> CATEGORY_SHIFT
+    tb = _unpack_tiebreak(strength)
+    if cat in (4, 8):
+        high = tb[0]
+        if high == 3:
+            ranks = {12: 1, 0: 1, 1: 1, 2: 1, 3: 1}
+        else:
+            ranks = {r: 1 for r in range(high - 4, high + 1)}
+    elif cat == 7:
+        ranks = {tb[0]: 4, tb[1]: 1}
+    elif cat == 6:
+        ranks = {tb[0]: 3, tb[1]: 2}
+    elif cat == 3:
+        ranks = {tb[0]: 3, tb[1]: 1, tb[2]: 1}
+    elif cat == 2:
+        ranks = {tb[0]: 2, tb[1]: 2, tb[2]: 1}
+    elif cat == 1:
+        ranks = {tb[0]: 2, tb[1]: 1, tb[2]: 1, tb[3]: 1}
+    else:
+        ranks = {r: 1 for r in tb}
+    return tuple(ranks.get(r, 0) for r in range(13))
+
+
+# Decoded forms per strength, filled on first use (at most 7462 entries).
+_TIEBREAKS = {}
+_NEEDED = {}
+
+
+def best_five_positions(cards, strength):
+    """
+    Positions (in input order) of the five cards that realise `strength`.
+    Earliest matching cards win, like the first combination found by
+    iterating `itertools.combinations` over the input.
+    """
+    need = _NEEDED.get(strength)
+    if need is None:
+        need = _NEEDED[strength] = _needed_ranks(strength)
+    need = list(need)
+    suit = -1
+    if (strength >> CATEGORY_SHIFT) in (5, 8):
+        suit_counts = [0, 0, 0, 0]
+        for c in cards:
+            suit_counts[c & 3] += 1
+        suit = suit_counts.index(max(suit_counts))
+    out = []
+    for i, c in enumerate(cards):
+        if suit >= 0 and c & 3 != suit:
+            continue
+        r = c >> 2
+        if need[r]:
+            need[r] -= 1
+            out.append(i)
+    return out
+
+
+def best_five(cards, strength):
+    return [cards[i] for i in best_five_positions(cards, strength)]
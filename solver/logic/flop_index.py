@@ -0,0 +1,270 @@
+"""
+Precomputed flop index: made hand, draws and outs for every strategically
+distinct flop x hole-card combo.
+
+The 22,100 flops fall into 1,755 suit-isomorphism classes (isomorphism.py).
+For each class and each of the 1,326 combos the index stores
+
+    strength   uint32  hero's 5-card strength (eval_tables.py)
+    info       uint16  category (bits 0-3) | draw flags (bits 4-7) |
+                       outs (bits 8-13): turn cards that raise the category
+
+with BLOCKED in both for combos that use a flop card.  Two (52,52,52)
+lookup arrays, indexed by the flop's cards high to low, give every raw
+flop its class row and the suit permutation onto it, so a query is a few
+array reads.
+
+build_flop_index() computes the file once (python manage.py
+build_flop_index).  flop_lookup() returns None while no usable index is
+present; flop_summary() then computes the same answer by evaluation.
+"""
+import warnings
+from functools import lru_cache
+from itertools import combinations, permutations
+from multiprocessing import Pool
+
+import numpy as np
+
+from .batch_eval import evaluate_batch
+from .cards import CARD_INDEX
+from .combos import COMBO_CARDS, COMBO_INDEX, N_COMBOS, blocked_combos, combo_suit_perm
+from .eval_tables import CATEGORY_SHIFT, HAND_NAMES, STRAIGHT_WINDOWS, strength_category
+from .hand_state import HandState
+from .isomorphism import canonical_boards, canonicalize
+from .table_file import StaleTableError, open_table, table_path, write_table
+
+FLOP_INDEX_KIND = "flop_index"
+FLOP_INDEX_VERSION = 1
+DEFAULT_PATH = table_path("flop_index.bin")
+
+BLOCKED = 0xFFFF
+BLOCKED_STRENGTH = 0xFFFFFFFF
+
+FLUSH_DRAW = 1
+BACKDOOR_FLUSH_DRAW = 2
+OPEN_ENDED = 4  # two or more ranks complete a straight
+GUTSHOT = 8
+DRAW_NAMES = {
+    FLUSH_DRAW: "Flush Draw",
+    BACKDOOR_FLUSH_DRAW: "Backdoor Flush Draw",
+    OPEN_ENDED: "Open-Ended Straight Draw",
+    GUTSHOT: "Gutshot",
+}
+
+SUIT_PERMS = [list(p) for p in permutations(range(4))]
+_PERM_NUMBER = {tuple(p): i for i, p in enumerate(SUIT_PERMS)}
+
+
+def _straight_completions():
+    """(8192,) number of missing ranks that complete a straight."""
+    table = np.zeros(8192, dtype=np.uint8)
+    for mask in range(8192):
+        n = 0
+        for r in range(13):
+            if not mask >> r & 1:
+                full = mask | 1 << r
+                if any(full & w == w for w, _ in STRAIGHT_WINDOWS):
+                    n += 1
+        table[mask] = n
+    return table
+
+
+@lru_cache(maxsize=1)
+def straight_completions():
+    return _straight_completions()
+
+
+def draw_flags(hole, flop, category):
+    """Draw flags of hole + flop card indices with made category `category`."""
+    cards = list(hole) + list(flop)
+    flags = 0
+    if category < 5:
+        for s in range(4):
+            n = sum(1 for c in cards if c & 3 == s)
+            if n == 4:
+                flags |= FLUSH_DRAW
+            elif n == 3 and any(c & 3 == s for c in hole):
+                flags |= BACKDOOR_FLUSH_DRAW
+        if flags & FLUSH_DRAW:
+            flags &= ~BACKDOOR_FLUSH_DRAW
+    if category < 4:
+        mask = 0
+        for c in cards:
+            mask |= 1 << (c >> 2)
+        n = straight_completions()[mask]
+        if n >= 2:
+            flags |= OPEN_ENDED
+        elif n == 1:
+            flags |= GUTSHOT
+    return flags
+
+
+def _flop_rows(flop):
+    """(strength, info) rows of the 1326 combos on one flop."""
+    strength = np.full(N_COMBOS, BLOCKED_STRENGTH, dtype=np.uint32)
+    info = np.full(N_COMBOS, BLOCKED, dtype=np.uint16)
+    free = np.flatnonzero(~blocked_combos(flop))
+    hole = COMBO_CARDS[free].astype(np.int64)
+    flop_arr = np.array(flop, dtype=np.int64)
+    m = free.size
+
+    five = np.hstack([hole, np.broadcast_to(flop_arr, (m, 3))])
+    s5 = evaluate_batch(five)
+    cat5 = (s5 >> CATEGORY_SHIFT).astype(np.int64)
+
+    # Outs: every turn card not on the flop and not in the combo
+    turns = np.array([c for c in range(52) if c not in flop], dtype=np.int64)
+    valid = (turns[None, :] != hole[:, :1]) & (turns[None, :] != hole[:, 1:])
+    rows = np.hstack([
+        np.repeat(five, turns.size, axis=0),
+        np.tile(turns, m)[:, None],
+    ])[valid.ravel()]
+    cat6 = np.full(m * turns.size, -1, dtype=np.int64)
+    cat6[valid.ravel()] = evaluate_batch(rows) >> CATEGORY_SHIFT
+    outs = (cat6.reshape(m, turns.size) > cat5[:, None]).sum(axis=1)
+
+    # Draws, vectorised form of draw_flags()
+    suits = five & 3
+    flags = np.zeros(m, dtype=np.int64)
+    no_flush = cat5 < 5
+    flush_draw = np.zeros(m, dtype=bool)
+    backdoor = np.zeros(m, dtype=bool)
+    for s in range(4):
+        n = (suits == s).sum(axis=1)
+        in_hole = (suits[:, :2] == s).any(axis=1)
+        flush_draw |= n == 4
+        backdoor |= (n == 3) & in_hole
+    flags |= np.where(no_flush & flush_draw, FLUSH_DRAW, 0)
+    flags |= np.where(no_flush & ~flush_draw & backdoor, BACKDOOR_FLUSH_DRAW, 0)
+    rank_mask = np.bitwise_or.reduce(1 << (five >> 2), axis=1)
+    completions = straight_completions()[rank_mask]
+    no_straight = cat5 < 4
+    flags |= np.where(no_straight & (completions >= 2), OPEN_ENDED, 0)
+    flags |= np.where(no_straight & (completions == 1), GUTSHOT, 0)
+
+    strength[free] = s5
+    info[free] = cat5 | flags << 4 | outs << 8
+    return strength, info
+
+
+def _flop_key(cards):
+    hi, mid, lo = sorted(cards, reverse=True)
+    return hi, mid, lo
+
+
+def build_flop_index(path=DEFAULT_PATH, processes=None, flops=None):
+    """
+    Compute the index and write it to `path`. `flops` restricts the build
+    to the classes of the given flops (card-index triples); the default is
+    all 1,755. Returns the number of flop classes written.
+    """
+    if flops is None:
+        classes = [_flop_key(canonicalize(f)[0][0]) for f, _ in canonical_boards(3)]
+    else:
+        classes = sorted({_flop_key(canonicalize(f)[0][0]) for f in flops})
+
+    if processes == 1:
+        rows = [_flop_rows(f) for f in classes]
+    else:
+        with Pool(processes) as pool:
+            rows = pool.map(_flop_rows, classes, chunksize=16)
+
+    row_of = {f: i for i, f in enumerate(classes)}
+    flop_row = np.full((52, 52, 52), -1, dtype=np.int16)
+    flop_perm = np.zeros((52, 52, 52), dtype=np.uint8)
+    for flop in combinations(range(52), 3):
+        (canon,), suit_map = canonicalize(flop)
+        row = row_of.get(_flop_key(canon))
+        if row is not None:
+            hi, mid, lo = _flop_key(flop)
+            flop_row[hi, mid, lo] = row
+            flop_perm[hi, mid, lo] = _PERM_NUMBER[tuple(suit_map)]
+
+    write_table(
+        path,
+        FLOP_INDEX_KIND,
+        FLOP_INDEX_VERSION,
+        {
+            "flops": np.array(classes, dtype=np.int8).reshape(-1, 3),
+            "strength": np.stack([r[0] for r in rows]) if rows else np.zeros((0, N_COMBOS), np.uint32),
+            "info": np.stack([r[1] for r in rows]) if rows else np.zeros((0, N_COMBOS), np.uint16),
+            "flop_row": flop_row,
+            "flop_perm": flop_perm,
+        },
+    )
+    load_flop_index.cache_clear()
+    return len(classes)
+
+
+@lru_cache(maxsize=4)
+def load_flop_index(path=DEFAULT_PATH):
+    """Mapped index arrays, or None when the file is missing or stale."""
+    try:
+        arrays, _ = open_table(path, FLOP_INDEX_KIND, FLOP_INDEX_VERSION)
+    except FileNotFoundError:
+        return None
+    except StaleTableError as exc:
+        warnings.warn(f"{exc}; rebuild with build_flop_index", RuntimeWarning)
+        return None
+    return arrays
+
+
+def flop_lookup(hole, flop, path=DEFAULT_PATH):
+    """
+    (strength, info) of hole on flop (card indices) from the index, or
+    None when there is no index or the flop is not in it.
+    """
+    index = load_flop_index(path)
+    if index is None:
+        return None
+    hi, mid, lo = _flop_key(flop)
+    row = int(index["flop_row"][hi, mid, lo])
+    if row < 0:
+        return None
+    perm = SUIT_PERMS[index["flop_perm"][hi, mid, lo]]
+    combo = combo_suit_perm(tuple(perm))[COMBO_INDEX[hole[0], hole[1]]]
+    info = int(index["info"][row, combo])
+    if info == BLOCKED:
+        return None
+    return int(index["strength"][row, combo]), info
+
+
+def decode_info(info):
+    """{"category", "hand_name", "draws", "outs"} from an info value."""
+    category = info & 0xF
+    flags = info >> 4 & 0xF
+    return {
+        "category": category,
+        "hand_name": HAND_NAMES[category],
+        "draws": [name for bit, name in DRAW_NAMES.items() if flags & bit],
+        "outs": info >> 8 & 0x3F,
+    }
+
+
+def _evaluate_info(hole, flop):
+    """The index entry of hole on flop, computed without the index."""
+    state = HandState(list(hole) + list(flop))
+    strength = state.strength()
+    category = strength_category(strength)
+    outs = 0
+    for c in range(52):
+        if c not in state:
+            state.add_card(c)
+            outs += strength_category(state.strength()) > category
+            state.remove_card(c)
+    return strength, category | draw_flags(hole, flop, category) << 4 | outs << 8
+
+
+def flop_summary(hand_cards, flop_cards, path=DEFAULT_PATH):
+    """
+    decode_info() of hole on flop (card strings) plus its "strength":
+    an index lookup when the index is present, evaluation otherwise.
+    """
+    hole = [CARD_INDEX[c] for c in hand_cards]
+    flop = [CARD_INDEX[c] for c in flop_cards]
+    found = flop_lookup(hole, flop, path)
+    strength, info = found if found is not None else _evaluate_info(hole, flop)
+    summary = decode_info(info)
+    summary["strength"] = strength
+    summary["indexed"] = found is not None
+    return summary
@@ -0,0 +1,290 @@
+"""
+Betting trees for the subgame solvers, stored as flat arrays.
+
+Nodes are numbered so that every parent comes before its children and
+the children of a node are consecutive (first_child .. first_child +
+n_children), so a solver walks the tree forward and backward as plain
+loops over node indices and keeps per-node data in [node, ...] arrays.
+
+    kind[node]        ACTION, FOLD, SHOWDOWN or CHANCE
+    player[node]      player to act (ACTION) or the player who folded
+                      (FOLD), -1 otherwise; 0 is out of position
+    street[node]      0 for the tree's first street, 1 for the next...
+    commit[node]      (2,) chips each player has put in since the tree's
+                      first street
+    action[node]      label of the action that led here ("check",
+                      "bet 50%", "raise 100%", "all-in", "call", "fold")
+
+A CHANCE node ends a betting round that is not the last one; its only
+child is the next street's first node, so the tree holds the betting
+once and a solver deals the card (game_tree does not branch on it).
+Calling an all-in goes straight to SHOWDOWN on any street.
+
+Bet sizes are fractions of the pot, raise sizes fractions of the pot
+after calling.  A size that would commit (nearly) the whole stack
+becomes the all-in.  A BetConfig holds the sizes of one street; a tree
+takes one for every street or one for all of them.
+
+The builder appends to one flat list per field, never to per-node
+objects, so a flop tree with several sizes costs a few dozen bytes per
+node while it is built and about 40 bytes per node as arrays.
+footprint() tells what a solver's regret tables over the tree will
+cost before any are allocated.
+"""
+import numpy as np
+
+ACTION = 0
+FOLD = 1
+SHOWDOWN = 2
+CHANCE = 3
+
+PLAYER_NAMES = ("OOP", "IP")
+
+# Bets that leave less than this share of the stack behind are all-ins
+ALL_IN_THRESHOLD = 0.1
+_EPS = 1e-9
+
+
+class BetConfig:
+    """
+    Bet sizing of one street.
+
+    bet_sizes          opening bets as fractions of the pot
+    raise_sizes        raises as fractions of the pot after calling
+    max_raises         raises allowed after the first bet
+    all_in             whether shoving is always an option
+    all_in_threshold   sizes leaving less than this share of the stack
+                       behind become the all-in
+    """
+
+    __slots__ = ("bet_sizes", "raise_sizes", "max_raises", "all_in", "all_in_threshold")
+
+    def __init__(self, bet_sizes=(0.5, 1.0), raise_sizes=(1.0,), max_raises=2, all_in=True,
+                 all_in_threshold=ALL_IN_THRESHOLD):
+        self.bet_sizes = tuple(float(f) for f in bet_sizes)
+        self.raise_sizes = tuple(float(f) for f in raise_sizes)
+        self.max_raises = int(max_raises)
+        self.all_in = bool(all_in)
+        self.all_in_threshold = float(all_in_threshold)
+        if any(f <= 0 for f in self.bet_sizes + self.raise_sizes):
+            raise ValueError("Bet and raise sizes must be positive")
+        if self.max_raises < 0 or not 0 <= self.all_in_threshold < 1:
+            raise ValueError("max_raises must be >= 0 and all_in_threshold in [0, 1)")
+
+    @classmethod
+    def from_dict(cls, options):
+        """BetConfig from a dict with any of the constructor's keys."""
+        return cls(**{k: options[k] for k in cls.__slots__ if k in options})
+
+    def __eq__(self, other):
+        if not isinstance(other, BetConfig):
+            return NotImplemented
+        return all(getattr(self, k) == getattr(other, k) for k in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, k) for k in self.__slots__))
+
+    def __repr__(self):
+        args = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        return f"BetConfig({args})"
+
+
+class GameTree:
+    __slots__ = (
+        "pot", "stack", "kind", "player", "street", "parent", "first_child",
+        "n_children", "commit", "action",
+    )
+
+    def __init__(self, pot, stack, kind, player, street, parent, first_child, n_children, commit, action):
+        self.pot = float(pot)
+        self.stack = float(stack)
+        self.kind = np.array(kind, dtype=np.int8)
+        self.player = np.array(player, dtype=np.int8)
+        self.street = np.array(street, dtype=np.int8)
+        self.parent = np.array(parent, dtype=np.int32)
+        self.first_child = np.array(first_child, dtype=np.int32)
+        self.n_children = np.array(n_children, dtype=np.int32)
+        self.commit = np.array(commit, dtype=np.float64).reshape(-1, 2)
+        # Labels are shared strings, one reference per node
+        self.action = np.array(action, dtype=object)
+
+    def __len__(self):
+        return self.kind.size
+
+    def children(self, node):
+        start = self.first_child[node]
+        return range(start, start + self.n_children[node])
+
+    @property
+    def action_nodes(self):
+        return np.flatnonzero(self.kind == ACTION)
+
+    @property
+    def pots(self):
+        """(n_nodes,) chips in the pot at every node."""
+        return self.pot + self.commit.sum(axis=1)
+
+    @property
+    def behind(self):
+        """(n_nodes, 2) chips each player has left behind at every node."""
+        return self.stack - self.commit
+
+    @property
+    def nbytes(self):
+        """Bytes held by the node arrays."""
+        arrays = (self.kind, self.player, self.street, self.parent, self.first_child, self.n_children, self.commit, self.action)
+        return sum(a.nbytes for a in arrays)
+
+    def edges(self, player, street=None):
+        """Actions of `player` (rows of its regret table), on one street or all."""
+        mask = (self.kind == ACTION) & (self.player == player)
+        if street is not None:
+            mask &= self.street == street
+        return int(self.n_children[mask].sum())
+
+    def footprint(self, hands, runouts=None, tables=2, itemsize=8):
+        """
+        Node count and memory of the tree and of a solver's tables over it,
+        without allocating them.
+
+        hands      hands per player, (n_oop, n_ip)
+        runouts    boards per street that get their own tables (default 1
+                   each: one board, or a runout sampled at a time)
+        tables     arrays per player and board (regrets, strategy sums)
+        """
+        streets = int(self.street.max()) + 1
+        runouts = (1,) * streets if runouts is None else tuple(runouts)
+        rows = [[self.edges(p, s) for s in range(streets)] for p in (0, 1)]
+        table_bytes = sum(
+            rows[p][s] * runouts[s] * hands[p] * tables * itemsize for p in (0, 1) for s in range(streets)
+        )
+        return {
+            "nodes": len(self),
+            "action_nodes": int((self.kind == ACTION).sum()),
+            "edges": rows,
+            "tree_bytes": self.nbytes,
+            "table_bytes": int(table_bytes),
+        }
+
+    def path(self, node):
+        """Actions from the root, e.g. "check > bet 50% > call | bet 50%"."""
+        labels = []
+        while node > 0:
+            labels.append(self.action[node] or "|")
+            node = self.parent[node]
+        return " > ".join(reversed(labels)).replace(" > | > ", " | ").removesuffix(" > |")
+
+    def __repr__(self):
+        return f"GameTree(pot={self.pot:g}, stack={self.stack:g}, nodes={len(self)})"
+
+
+def _sizes(fractions, base, to_call, committed, stack, threshold):
+    """{amount to put in: label} for pot fractions, all-in last."""
+    remaining = stack - committed
+    out = {}
+    for frac in fractions:
+        amount = to_call + frac * base
+        if amount >= remaining * (1 - threshold):
+            continue
+        out.setdefault(round(amount, 6), frac)
+    return out, remaining
+
+
+def build_river_tree(pot, stack, bet_sizes=(0.5, 1.0), raise_sizes=(1.0,), max_raises=2, all_in=True):
+    """
+    Tree for one betting round between OOP (acts first) and IP.
+
+    pot          chips in the pot before the street
+    stack        effective stack behind
+    bet_sizes    opening bets as fractions of the pot
+    raise_sizes  raises as fractions of the pot after calling
+    max_raises   raises allowed after the first bet
+    all_in       whether shoving is always an option
+    """
+    return build_tree(pot, stack, 1, bet_sizes, raise_sizes, max_raises, all_in)
+
+
+def build_tree(pot, stack, streets=3, bet_sizes=(0.5, 1.0), raise_sizes=(1.0,), max_raises=2, all_in=True,
+               config=None):
+    """
+    Tree for `streets` betting rounds (3: flop to river).  The sizes are
+    those of build_river_tree on every street, unless `config` gives a
+    BetConfig for all streets or a sequence of one per street.
+    """
+    if pot <= 0 or stack < 0:
+        raise ValueError("Pot must be positive and stack non-negative")
+    if streets < 1:
+        raise ValueError("A tree needs at least one street")
+    if config is None:
+        config = BetConfig(bet_sizes, raise_sizes, max_raises, all_in)
+    configs = [config] * streets if isinstance(config, BetConfig) else list(config)
+    if len(configs) != streets:
+        raise ValueError(f"Need one BetConfig per street ({streets}), got {len(configs)}")
+
+    kind, player, street_of, parent, first_child, n_children, commit, action = ([] for _ in range(8))
+    labels = {}
+
+    def add(node_kind, who, up, committed, label, street):
+        kind.append(node_kind)
+        player.append(who)
+        street_of.append(street)
+        parent.append(up)
+        first_child.append(0)
+        n_children.append(0)
+        commit.extend(committed)
+        action.append(labels.setdefault(label, label))
+        return len(kind) - 1
+
+    def round_over(committed, street):
+        """Node kind once the betting on `street` is closed at `committed`."""
+        if street + 1 < streets and max(committed) < stack - _EPS:
+            return CHANCE
+        return SHOWDOWN
+
+    def expand(node, who, committed, bets, checked, street):
+        cfg = configs[street]
+        opp = 1 - who
+        to_call = committed[opp] - committed[who]
+        options = []
+        if to_call == 0:
+            if checked or who == 1:
+                options.append((round_over(committed, street), -1, committed, "check", None))
+            else:
+                options.append((ACTION, opp, committed, "check", (bets, True)))
+            sizes, label = cfg.bet_sizes, "bet"
+        else:
+            options.append((FOLD, who, committed, "fold", None))
+            called = list(committed)
+            called[who] = committed[opp]
+            options.append((round_over(called, street), -1, called, "call", None))
+            sizes, label = (cfg.raise_sizes if bets <= cfg.max_raises else ()), "raise"
+
+        opp_all_in = committed[opp] >= stack - _EPS
+        if not opp_all_in and (to_call == 0 or bets <= cfg.max_raises):
+            base = pot + sum(committed) + to_call
+            amounts, remaining = _sizes(sizes, base, to_call, committed[who], stack, cfg.all_in_threshold)
+            if cfg.all_in and remaining > to_call + _EPS:
+                amounts[round(remaining, 6)] = None
+            for amount, frac in sorted(amounts.items()):
+                bet = list(committed)
+                bet[who] = stack if frac is None else bet[who] + amount
+                name = "all-in" if frac is None else f"{label} {frac:.0%}"
+                options.append((ACTION, opp, bet, name, (bets + 1, checked)))
+
+        first_child[node] = len(kind)
+        n_children[node] = len(options)
+        children = [
+            (add(k, w, node, c, name, street), k, w, c, state) for k, w, c, name, state in options
+        ]
+        for child, k, w, c, state in children:
+            if k == ACTION:
+                expand(child, w, c, *state, street)
+            elif k == CHANCE:
+                first_child[child] = len(kind)
+                n_children[child] = 1
+                root = add(ACTION, 0, child, c, "", street + 1)
+                expand(root, 0, c, 0, False, street + 1)
+
+    root = add(ACTION, 0, -1, (0.0, 0.0), "", 0)
+    expand(root, 0, (0.0, 0.0), 0, False, 0)
+    return GameTree(pot, stack, kind, player, street_of, parent, first_child, n_children, commit, action)
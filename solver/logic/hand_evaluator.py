@@ -1,7 +1,5 @@
-from itertools import combinations
-
-RANKS = "23456789TJQKA"
-RANK_VALUE = {r: i for i, r in enumerate(RANKS, start=2)}
+from .cards import CARD_RANK, CARD_SUIT, cards_from_strs
+from .eval_tables import evaluate, strength_name
 
 HAND_ORDER = {
     "High Card": 0,
@@ -17,26 +15,26 @@ HAND_ORDER = {
 
 
 def classify_5(cards):
-    # cards: ["Ah","Kd","Qs","Jc","Tc"]
-    ranks = [c[0].upper() for c in cards]
-    suits = [c[1].lower() for c in cards]
+    # cards: ["Ah","Kd","Qs","Jc","Tc"], parsed once into card indices
+    idx = cards_from_strs(cards)
+    ranks = [CARD_RANK[c] + 2 for c in idx]
+    suits = [CARD_SUIT[c] for c in idx]
 
     rank_counts = {}
     for r in ranks:
         rank_counts[r] = rank_counts.get(r, 0) + 1
 
     counts = sorted(rank_counts.values(), reverse=True)
-    unique_vals = sorted({RANK_VALUE[r] for r in ranks}, reverse=True)
 
     is_flush = len(set(suits)) == 1
 
     # Straight detection (including wheel A2345)
-    sorted_vals = sorted({RANK_VALUE[r] for r in ranks})
+    sorted_vals = sorted(set(ranks))
     is_straight = False
     if len(sorted_vals) == 5 and sorted_vals[-1] - sorted_vals[0] == 4:
         is_straight = True
     # Wheel: A2345 (treat as 5-high straight)
-    if set(ranks) == set("A2345"):
+    if sorted_vals == [2, 3, 4, 5, 14]:
         is_straight = True
         sorted_vals = [5, 4, 3, 2, 1]
 
@@ -65,16 +63,8 @@ def classify_5(cards):
 
 
 def best_5_of_n(cards):
-    best_label = None
-    best_score = None
-
-    for combo in combinations(cards, 5):
-        label, score = classify_5(list(combo))
-        if best_score is None or score > best_score:
-            best_score = score
-            best_label = label
-
-    return best_label
+    # One table lookup instead of classifying every 5-card subset
+    return strength_name(evaluate(cards_from_strs(cards)))
 
 
 def evaluate_hand(all_cards):
@@ -0,0 +1,96 @@
+"""
+Mutable holding for street-by-street and depth-first evaluation.
+
+A HandState keeps the running evaluator key of its cards (3-bit rank
+counts and 4-bit suit counts, see eval_tables.py), the per-suit rank
+bitmasks and the card mask.  add_card / remove_card update all of them
+in O(1), and strength() is one table lookup, so an enumerator can deal a
+card, score the holding, and take the card back without rebuilding
+anything:
+
+    state = HandState(hole + flop)
+    for turn in deck:
+        state.add_card(turn)
+        for river in ...:
+            state.add_card(river)
+            score(state.strength())
+            state.remove_card(river)
+        state.remove_card(turn)
+"""
+from .eval_tables import (
+    CARD_KEY,
+    FLUSH_BITS,
+    FLUSH_PROBE,
+    FLUSH_TABLE,
+    RANK_KEY_MASK,
+    RANK_TABLE,
+    SUIT_SHIFT,
+)
+
+
+def strength_from_key(key, suit_masks):
+    """Strength of a 5-7 card holding from its key and suit rank masks."""
+    flush = ((key >> SUIT_SHIFT) + FLUSH_PROBE) & FLUSH_BITS
+    if flush:
+        return FLUSH_TABLE[suit_masks[(flush.bit_length() - 4) >> 2]]
+    return RANK_TABLE[key & RANK_KEY_MASK]
+
+
+class HandState:
+    __slots__ = ("key", "suit_masks", "mask", "size")
+
+    def __init__(self, cards=()):
+        self.key = 0
+        self.suit_masks = [0, 0, 0, 0]
+        self.mask = 0
+        self.size = 0
+        for c in cards:
+            self.add_card(c)
+
+    def add_card(self, card):
+        self.key += CARD_KEY[card]
+        self.suit_masks[card & 3] |= 1 << (card >> 2)
+        self.mask |= 1 << card
+        self.size += 1
+
+    def remove_card(self, card):
+        self.key -= CARD_KEY[card]
+        self.suit_masks[card & 3] &= ~(1 << (card >> 2))
+        self.mask &= ~(1 << card)
+        self.size -= 1
+
+    def strength(self):
+        """Strength of the current 5-7 cards (see eval_tables.evaluate)."""
+        return strength_from_key(self.key, self.suit_masks)
+
+    def copy(self):
+        other = HandState.__new__(HandState)
+        other.key = self.key
+        other.suit_masks = list(self.suit_masks)
+        other.mask = self.mask
+        other.size = self.size
+        return other
+
+    @property
+    def rank_counts(self):
+        return [(self.key >> (3 * r)) & 7 for r in range(13)]
+
+    @property
+    def suit_counts(self):
+        return [(self.key >> (SUIT_SHIFT + 4 * s)) & 15 for s in range(4)]
+
+    @property
+    def rank_mask(self):
+        """13-bit mask of the ranks present in any suit."""
+        m = self.suit_masks
+        return m[0] | m[1] | m[2] | m[3]
+
+    def __contains__(self, card):
+        return self.mask >> card & 1 == 1
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        cards = [c for c in range(52) if self.mask >> c & 1]
+        return f"HandState({cards})"
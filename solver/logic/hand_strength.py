@@ -1,7 +1,23 @@
 # --- START hand_strength.py ---
 import itertools
 
-RANK_ORDER = "23456789TJQKA"
+from .cards import CARD_INDEX, CARD_RANK, RANK_ORDER
+from .eval_tables import (
+    HAND_NAMES,
+    best_five_positions,
+    evaluate,
+    make_strength,
+    strength_category,
+    strength_name,
+)
+from .flop_index import flop_summary
+from .hand_state import HandState
+from .outs import find_outs
+from .spot_cache import spot_cache
+from .tracing import get_tracer
+
+_trace = get_tracer("solver.logic.hand_strength", "[HS-DEBUG]")
+
 SUIT_SYMBOLS = {
     "C": "♣",
     "D": "♦",
@@ -9,8 +25,12 @@ SUIT_SYMBOLS = {
     "S": "♠"
 }
 
+# Deck strings in this module's upper-case suit form ("AS")
+_UPPER_CARDS = [r + s for r in RANK_ORDER for s in "CDHS"]
+
+
 def rank_value(card):
-    return RANK_ORDER.index(card[0])
+    return CARD_RANK[CARD_INDEX[card]]
 
 
 def is_flush(cards):
@@ -72,29 +92,74 @@ def best_five_from_seven(cards):
     return list(best), classify_hand(best)
 
 
-def simulate_future_outs(hand, board):
-    used = set(hand + board)
-    ranks = list(RANK_ORDER)
-    suits = ["C", "D", "H", "S"]
+# Labels used by classify_hand, per evaluator category
+_TYPE_LABELS = ["High Card", "Pair"] + HAND_NAMES[2:]
+_ROYAL_FLUSH = make_strength(8, [12])
 
-    deck = [r + s for r in ranks for s in suits if (r + s) not in used]
 
-    base_best, base_type = best_five_from_seven(hand + board)
+def _type_label(strength):
+    if strength == _ROYAL_FLUSH:
+        return "Royal Flush"
+    return _TYPE_LABELS[strength_category(strength)]
 
-    future = {"C": [], "D": [], "H": [], "S": []}
 
-    for card in deck:
-        new_board = board + [card]
-        best5, new_type = best_five_from_seven(hand + new_board)
+def simulate_future_outs(hand, board):
+    """
+    Next cards that improve hero (kicker improvements included), by suit:
+        {"C": [(card, suit icon, new hand type), ...], "D": ..., ...}
+    Empty unless the board has 3 or 4 cards.
+    """
+    future = {"C": [], "D": [], "H": [], "S": []}
+    if len(board) not in (3, 4):
+        return future
 
-        if new_type != base_type:
-            suit = card[1]
-            suit_icon = SUIT_SYMBOLS[suit]
-            future[suit].append((card, suit_icon, new_type))
+    report = find_outs([CARD_INDEX[c] for c in hand], [CARD_INDEX[c] for c in board], runner_runner=False)
+    for c, strength in zip(report["outs"], report["out_strengths"]):
+        card = _UPPER_CARDS[c]
+        suit = card[1]
+        future[suit].append((card, SUIT_SYMBOLS[suit], _type_label(strength)))
 
     return future
 
 
+def outs_report(hand, board, runner_runner=True):
+    """
+    Full outs report (see outs.find_outs) with card strings: next-card
+    outs by suit and by category, plus runner-runner combos and their
+    probabilities from the flop unless runner_runner is False (the
+    turn + river enumeration is most of the report's cost).
+    """
+    report = find_outs([CARD_INDEX[c] for c in hand], [CARD_INDEX[c] for c in board], runner_runner)
+
+    def names(cards):
+        return [_UPPER_CARDS[c] for c in cards]
+
+    out = {
+        "current": _type_label(report["strength"]),
+        "cards_left": report["cards_left"],
+        "outs": names(report["outs"]),
+        "by_suit": {suit: names(cards) for suit, cards in zip("CDHS", report["by_suit"])},
+        "by_category": {name: names(cards) for name, cards in report["by_category"].items()},
+        "kicker_outs": names(report["kicker_outs"]),
+        "probability": report["probability"],
+        "runner_runner": None,
+    }
+    rr = report["runner_runner"]
+    if rr is not None:
+        out["runner_runner"] = {
+            "by_category": {
+                name: {
+                    "combos": [_UPPER_CARDS[t] + _UPPER_CARDS[r] for t, r in entry["combos"]],
+                    "probability": entry["probability"],
+                }
+                for name, entry in rr["by_category"].items()
+            },
+            "probability": rr["probability"],
+            "reach": rr["reach"],
+        }
+    return out
+
+
 def evaluate_best_possible_flop(hand_cards, board_cards):
     if len(board_cards) < 3:
         return None, "Board too small", {}
@@ -194,148 +259,52 @@ def _normalize_cards(cards):
     out = []
     for c in cards:
         nc = _normalize_card(c)
-        print("NORMALIZE:", repr(c), "->", repr(nc))
+        _trace("NORMALIZE: %r -> %r", c, nc)
         if nc:
             out.append(nc)
-    print("FINAL NORMALIZED LIST:", out)
+    _trace("FINAL NORMALIZED LIST: %s", out)
     return out
-def _card_rank(card):
-    return RANKS[card[0]]
-
-
-def _hand_rank_5(cards5):
-    ranks = sorted((_card_rank(c) for c in cards5), reverse=True)
-    suits = [c[1] for c in cards5]
-
-    counts = {}
-    for r in ranks:
-        counts[r] = counts.get(r, 0) + 1
-
-    count_rank = sorted(((cnt, r) for r, cnt in counts.items()), reverse=True)
-
-    is_flush = len(set(suits)) == 1
-
-    unique_ranks = sorted(set(ranks), reverse=True)
-    is_straight = False
-    high_straight = None
-
-    if len(unique_ranks) >= 5:
-        for i in range(len(unique_ranks) - 4 + 1):
-            window = unique_ranks[i:i+5]
-            if window[0] - window[4] == 4:
-                is_straight = True
-                high_straight = window[0]
-                break
-
-        if not is_straight and set([14, 5, 4, 3, 2]).issubset(set(unique_ranks)):
-            is_straight = True
-            high_straight = 5
-
-    if is_flush and is_straight:
-        flush_suit = suits[0]
-        flush_cards = [c for c in cards5 if c[1] == flush_suit]
-        flush_ranks = sorted((_card_rank(c) for c in flush_cards), reverse=True)
-        unique_flush_ranks = sorted(set(flush_ranks), reverse=True)
-
-        sf = False
-        sf_high = None
-
-        if len(unique_flush_ranks) >= 5:
-            for i in range(len(unique_flush_ranks) - 4 + 1):
-                window = unique_flush_ranks[i:i+5]
-                if window[0] - window[4] == 4:
-                    sf = True
-                    sf_high = window[0]
-                    break
-            if not sf and set([14, 5, 4, 3, 2]).issubset(set(unique_flush_ranks)):
-                sf = True
-                sf_high = 5
-
-        if sf:
-            return (8, sf_high, sorted(ranks, reverse=True))
-
-    if count_rank[0][0] == 4:
-        four = count_rank[0][1]
-        kicker = max(r for r in ranks if r != four)
-        return (7, four, kicker)
-
-    if count_rank[0][0] == 3 and count_rank[1][0] >= 2:
-        three = count_rank[0][1]
-        pair = count_rank[1][1]
-        return (6, three, pair)
-
-    if is_flush:
-        return (5, ranks)
-
-    if is_straight:
-        return (4, high_straight)
-
-    if count_rank[0][0] == 3:
-        three = count_rank[0][1]
-        kickers = sorted((r for r in ranks if r != three), reverse=True)
-        return (3, three, kickers)
-
-    if count_rank[0][0] == 2 and count_rank[1][0] == 2:
-        high_pair = max(count_rank[0][1], count_rank[1][1])
-        low_pair = min(count_rank[0][1], count_rank[1][1])
-        kicker = max(r for r in ranks if r != high_pair and r != low_pair)
-        return (2, high_pair, low_pair, kicker)
-
-    if count_rank[0][0] == 2:
-        pair = count_rank[0][1]
-        kickers = sorted((r for r in ranks if r != pair), reverse=True)
-        return (1, pair, kickers)
-
-    return (0, ranks)
-def _hand_type_from_rank(rank_tuple):
-    category = rank_tuple[0]
-    return [
-        "High Card",
-        "One Pair",
-        "Two Pair",
-        "Three of a Kind",
-        "Straight",
-        "Flush",
-        "Full House",
-        "Four of a Kind",
-        "Straight Flush",
-    ][category]
-
-
-def _best_5_from_7(cards):
-    best_rank = None
-    best_hand = None
-
-    for combo in itertools.combinations(cards, 5):
-        r = _hand_rank_5(list(combo))
-        if best_rank is None or r > best_rank:
-            best_rank = r
-            best_hand = list(combo)
-
-    if best_hand is None:
+def _best_5_from_7(cards, strength=None):
+    """
+    Best five and hand name of 5-7 card strings. `strength` may be passed
+    when it is already known (HandState, flop index).
+    """
+    if len(cards) < 5:
         return None, None
 
-    best_type = _hand_type_from_rank(best_rank)
-    return best_hand, best_type
+    idx = [CARD_INDEX[c] for c in cards]
+    if strength is None:
+        strength = evaluate(idx)
+    best_hand = [cards[i] for i in best_five_positions(idx, strength)]
+    return best_hand, strength_name(strength)
 
 
-def _future_stub(street, hand_cards, board_cards):
+def _future_outs(street, hand_cards, board_cards, summary=None, runner_runner=False):
     return {
         "street": street,
-        "message": "Future simulation placeholder – evaluator is working.",
         "hand": hand_cards,
         "board": board_cards,
+        "summary": summary,
+        "outs": outs_report(hand_cards, board_cards, runner_runner) if street != "river" else None,
     }
 
 
-def evaluate_best_possible_flop(hand_cards, board_cards):
+def evaluate_best_possible_flop(hand_cards, board_cards, runner_runner=False):
+    """
+    Best five, hand name and future outs on the flop.  The made hand, the
+    draws and the outs count come from the flop index when it is built;
+    the next-card outs list is one pass over the 47 unseen cards, and the
+    runner-runner combos are only enumerated with runner_runner=True.
+    """
     h = _normalize_cards(hand_cards)
     b = _normalize_cards(board_cards)
     if len(h) != 2 or len(b) != 3:
         return None, None, {}
     combined = h + b
-    best5, best_type = _best_5_from_7(combined)
-    return best5, best_type, _future_stub("flop", h, b)
+    # Made hand, draws and outs come from the flop index when it is built
+    summary = flop_summary(h, b)
+    best5, best_type = _best_5_from_7(combined, summary["strength"])
+    return best5, best_type, _future_outs("flop", h, b, summary, runner_runner)
 
 
 def evaluate_best_possible_turn(hand_cards, board_cards):
@@ -345,7 +314,7 @@ def evaluate_best_possible_turn(hand_cards, board_cards):
         return None, None, {}
     combined = h + b
     best5, best_type = _best_5_from_7(combined)
-    return best5, best_type, _future_stub("turn", h, b)
+    return best5, best_type, _future_outs("turn", h, b)
 
 
 def evaluate_best_possible_river(hand_cards, board_cards):
@@ -355,5 +324,76 @@ def evaluate_best_possible_river(hand_cards, board_cards):
         return None, None, {}
     combined = h + b[:5]
     best5, best_type = _best_5_from_7(combined)
-    return best5, best_type, _future_stub("river", h, b[:5])
+    return best5, best_type, _future_outs("river", h, b[:5])
+
+
+def evaluate_streets(hand_cards, board_cards, runner_runner=False):
+    """
+    Flop, turn and river in one pass: one HandState holds hole + flop and
+    the turn and river are added to it, so later streets reuse the
+    earlier work. Returns {street: (best5, best_type, future)} for every
+    street the board reaches; runner_runner as in
+    evaluate_best_possible_flop.
+    """
+    h = _normalize_cards(hand_cards)
+    b = _normalize_cards(board_cards)
+    if len(h) != 2 or len(b) < 3:
+        return {}
+
+    out = {}
+    state = HandState(CARD_INDEX[c] for c in h + b[:3])
+    for street, n in (("flop", 3), ("turn", 4), ("river", 5)):
+        if len(b) < n:
+            break
+        if n > 3:
+            state.add_card(CARD_INDEX[b[n - 1]])
+        best5, best_type = _best_5_from_7(h + b[:n], state.strength())
+        summary = flop_summary(h, b[:3]) if n == 3 else None
+        out[street] = (best5, best_type, _future_outs(street, h, b[:n], summary, runner_runner))
+    return out
+
+
+def _restore_future_outs(future, relabel):
+    return relabel.by_suit(future, lambda entries: sorted(
+        ((relabel.card(c), relabel.suit(icon), name) for c, icon, name in entries),
+        key=lambda entry: CARD_INDEX[entry[0]],
+    ))
+
+
+def _restore_outs_report(report, relabel):
+    out = {
+        **report,
+        "outs": relabel.deck_order(report["outs"]),
+        "by_suit": relabel.by_suit(report["by_suit"], relabel.deck_order),
+        "by_category": relabel.first_found({n: relabel.deck_order(c) for n, c in report["by_category"].items()}),
+        "kicker_outs": relabel.deck_order(report["kicker_outs"]),
+    }
+    rr = report["runner_runner"]
+    if rr is not None:
+        by_category = {n: {**e, "combos": relabel.combos(e["combos"])} for n, e in rr["by_category"].items()}
+        out["runner_runner"] = {**rr, "by_category": relabel.first_found(by_category, lambda e: e["combos"][0])}
+    return out
+
+
+def _restore_street(result, relabel):
+    best5, best_type, future = result
+    if best5 is not None:
+        best5 = [relabel.card(c) for c in best5]
+    if future:
+        future = {
+            **future,
+            "hand": [relabel.card(c) for c in future["hand"]],
+            "board": [relabel.card(c) for c in future["board"]],
+            "outs": future["outs"] and _restore_outs_report(future["outs"], relabel),
+        }
+    return best5, best_type, future
+
+
+# Cached variants keyed on the suit-canonical (hole, board) spot; results
+# are read-only (see spot_cache.py).
+cached_simulate_future_outs = spot_cache(restore=_restore_future_outs)(simulate_future_outs)
+cached_outs_report = spot_cache(restore=_restore_outs_report)(outs_report)
+cached_evaluate_best_possible_flop = spot_cache(restore=_restore_street)(evaluate_best_possible_flop)
+cached_evaluate_best_possible_turn = spot_cache(restore=_restore_street)(evaluate_best_possible_turn)
+cached_evaluate_best_possible_river = spot_cache(restore=_restore_street)(evaluate_best_possible_river)
 # --- END hand_strength.py ---
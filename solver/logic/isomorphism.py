@@ -0,0 +1,140 @@
+"""
+Suit isomorphism: spots that differ only by a relabelling of suits.
+
+As Ks on Qs Js 2h and Ah Kh on Qh Jh 2c are the same spot.  Every suit
+gets a signature: the 13-bit rank mask of each card group (hole, board,
+...) in that suit.  Sorting the suits by signature gives a canonical
+suit order, so isomorphic spots map to the same canonical cards.  The
+suit map is returned as well, so results for the canonical spot can be
+translated back with invert_suit_map().
+
+Suits with equal signatures are interchangeable.  iter_runouts() uses
+this to visit one runout per class of isomorphic runouts, with the size
+of the class as its weight.
+"""
+from itertools import combinations, permutations
+from math import factorial
+
+from .cards import CARD_STRINGS, card_mask, cards_from_strs
+
+
+def _signature(groups, suit):
+    return tuple(
+        sum(1 << (c >> 2) for c in group if c & 3 == suit) for group in groups
+    )
+
+
+def canonical_suit_map(*groups):
+    """
+    Suit map (list: original suit -> canonical suit) that puts the suits of
+    the given card groups in canonical order.
+    """
+    order = sorted(range(4), key=lambda s: _signature(groups, s), reverse=True)
+    suit_map = [0, 0, 0, 0]
+    for canonical, suit in enumerate(order):
+        suit_map[suit] = canonical
+    return suit_map
+
+
+def apply_suit_map(cards, suit_map):
+    return [(c & ~3) | suit_map[c & 3] for c in cards]
+
+
+def invert_suit_map(suit_map):
+    inverse = [0, 0, 0, 0]
+    for suit, canonical in enumerate(suit_map):
+        inverse[canonical] = suit
+    return inverse
+
+
+def canonicalize(*groups):
+    """
+    Canonical form of card groups, e.g. canonicalize(hole, board).
+    Returns (canonical groups as sorted card lists, suit map).
+    """
+    suit_map = canonical_suit_map(*groups)
+    return [sorted(apply_suit_map(g, suit_map), reverse=True) for g in groups], suit_map
+
+
+def canonical_key(hole, board):
+    """
+    Hashable key for a (hole, board) spot given as card strings, equal for
+    every suit relabelling of the spot.  Returns (key, suit map).
+    """
+    groups, suit_map = canonicalize(cards_from_strs(hole), cards_from_strs(board))
+    key = "|".join("".join(CARD_STRINGS[c] for c in g) for g in groups)
+    return key, suit_map
+
+
+def suit_classes(*groups):
+    """Lists of interchangeable suits (equal signatures)."""
+    classes = {}
+    for s in range(4):
+        classes.setdefault(_signature(groups, s), []).append(s)
+    return sorted(classes.values())
+
+
+def all_suit_maps():
+    """All 24 suit permutations as suit maps."""
+    return [list(p) for p in permutations(range(4))]
+
+
+def iter_runouts(groups, k, dead=()):
+    """
+    Yield (runout cards, weight) for k cards dealt from the deck left after
+    `groups` and `dead`, one runout per class of runouts that are equal up
+    to a suit permutation fixing every group.  Weights sum to C(deck, k).
+    Dead cards are treated as one more group.
+    """
+    groups = [list(g) for g in groups] + [list(dead)]
+    known = card_mask(c for g in groups for c in g)
+    classes = suit_classes(*groups)
+    suits = [s for cls in classes for s in cls]
+    # Position in `suits` where each class starts
+    class_start = {}
+    for cls in classes:
+        for s in cls:
+            class_start[s] = suits.index(cls[0])
+    available = [
+        [r for r in range(13) if not known >> (r * 4 + s) & 1] for s in range(4)
+    ]
+
+    chosen = [0, 0, 0, 0]
+
+    def weight():
+        w = 1
+        for cls in classes:
+            masks = [chosen[s] for s in cls]
+            w *= factorial(len(cls))
+            for m in set(masks):
+                w //= factorial(masks.count(m))
+        return w
+
+    def walk(pos, left, cards):
+        if pos == 4:
+            if left == 0:
+                yield cards, weight()
+            return
+        suit = suits[pos]
+        # Within a class, masks must not increase
+        same_class = pos > class_start[suit]
+        limit = chosen[suits[pos - 1]] if same_class else None
+        sizes = [left] if pos == 3 else range(left + 1)
+        for n in sizes:
+            for ranks in combinations(available[suit], n):
+                mask = sum(1 << r for r in ranks)
+                if limit is not None and mask > limit:
+                    continue
+                chosen[suit] = mask
+                yield from walk(pos + 1, left - n, cards + [r * 4 + suit for r in ranks])
+        chosen[suit] = 0
+
+    yield from walk(0, k, [])
+
+
+def canonical_boards(n, dead=()):
+    """
+    Distinct boards of n cards up to suit isomorphism with their
+    multiplicity (1755 flops weighing 22100 in total).
+    """
+    return list(iter_runouts([], n, dead))
@@ -0,0 +1,572 @@
+"""
+Flop and turn subgame solver: chance-sampled Monte Carlo CFR over a
+game_tree.build_tree() tree, spread over worker processes.
+
+A full CFR pass over a flop tree visits every turn and river card, 49 * 48
+river subgames.  An MCCFR iteration deals one runout instead and runs the
+vectorised pass of cfr.py over the betting for that runout only, with both
+ranges as vectors and the hands blocked by the runout given no reach.
+Dealing uniformly and leaving blocked hands out counts every card-disjoint
+hand pair the same number of times, so sampled values are unbiased up to
+one constant factor, which regret matching does not see.
+
+Tables (regrets and strategy sums, one row per action, one column per hand)
+    street 0 (the board's street)   one table
+    street s > 0                    one table per first s runout cards
+Runouts are keyed by suit-isomorphic class: a suit map fixing the board and
+both ranges maps a runout onto its canonical runout and each hand onto the
+canonical hand that plays its part, so isomorphic runouts share a table.
+Tables are allocated (as TABLE_DTYPE) when their runout is first dealt.
+
+Parallel scheme (batch and merge)
+    The first runout cards are split by class between the workers, so each
+    later-street table lives in exactly one worker and is updated there
+    after every iteration.  Only the street-0 tables are shared: each round
+    the parent sends its regrets, every worker runs `batch` iterations on
+    its own cards against them and returns summed regret and strategy
+    deltas, and the parent merges those, weighted by each worker's share of
+    the cards.  Messages are the size of the street-0 tables, whatever
+    the number of later-street tables.  Starting the workers and merging
+    every round cost time of their own, and no benchmark shows that more
+    workers solve faster: on a flop, exact evaluation took longer with
+    four processes than with one.  processes=1 (what the API uses) runs
+    everything in the calling process.
+
+Evaluation (EV, exploitability) walks the runouts in the workers; values
+are summed over runouts before the later-street maxima of a best response
+are taken, and the parent finishes street 0.  Every runout of a turn spot
+is walked, but a flop has 49 * 48 of them, a minute and more of work, so
+solve_sampled() walks a sample of at most EVALUATION_RUNOUTS: the same
+number of cards, drawn without replacement, on every street, with sums
+scaled up to all cards.  EVs stay unbiased; maxima over noisy sums make
+the best responses, and so the exploitability, an overestimate.
+"""
+import os
+from math import prod
+from multiprocessing import Pipe, Process
+
+import numpy as np
+
+from .cards import cards_from_strs, find_duplicate
+from .cfr import Matchup, Side, terminal_values
+from .combos import COMBO_CARDS, N_COMBOS, blocked_combos, combo_overlap, combo_str, combo_suit_perm
+from .game_tree import ACTION, CHANCE, FOLD, PLAYER_NAMES, SHOWDOWN
+from .isomorphism import all_suit_maps, apply_suit_map
+from .range_equity import board_strengths, range_weights
+
+# Sampled runouts per worker between two merges of the street-0 tables
+BATCH = 16
+# Later-street tables, one per runout class dealt, dominate memory
+TABLE_DTYPE = np.float32
+# Runouts solve_sampled() walks to evaluate a spot with more of them
+EVALUATION_RUNOUTS = 200
+
+
+def _normalize(rows):
+    """Columns of non-negative regrets or strategy sums as probabilities."""
+    total = rows.sum(axis=0)
+    return np.where(total > 0, rows / np.where(total > 0, total, 1), 1.0 / rows.shape[0])
+
+
+class SampledGame:
+    """
+    The parts of a spot that stay fixed while solving: tree, hands, runout
+    symmetries and the node layout.  Built in the parent and sent to the
+    workers once.
+    """
+
+    def __init__(self, tree, board, range_oop, range_ip):
+        board = cards_from_strs(board)
+        if len(board) not in (3, 4):
+            raise ValueError("MCCFR needs a flop or turn board")
+        if find_duplicate(board) is not None:
+            raise ValueError("Duplicate board card")
+        self.deal = 5 - len(board)
+        if int(tree.street.max()) != self.deal:
+            raise ValueError(f"A {len(board)}-card board needs a {self.deal + 1}-street tree")
+        self.tree = tree
+        self.board = board
+        self.deck = [c for c in range(52) if c not in board]
+
+        blocked = blocked_combos(board)
+        self.weights = [np.where(blocked, 0.0, range_weights(r)) for r in (range_oop, range_ip)]
+        self.hands = [np.flatnonzero(w) for w in self.weights]
+        if not all(h.size for h in self.hands):
+            raise ValueError("Both ranges need a combo that the board does not block")
+        self.hand_cards = [COMBO_CARDS[h] for h in self.hands]
+
+        # Suit maps that fix the board and both ranges, and where each
+        # map sends every hand (as positions in the player's hand list)
+        self.suit_maps = []
+        self.hand_maps = []
+        for suit_map in all_suit_maps():
+            perm = combo_suit_perm(tuple(suit_map))
+            if sorted(apply_suit_map(board, suit_map)) != sorted(board):
+                continue
+            if not all(np.array_equal(w[perm], w) for w in self.weights):
+                continue
+            moved = []
+            for hands in self.hands:
+                position = np.full(N_COMBOS, -1)
+                position[hands] = np.arange(hands.size)
+                moved.append(position[perm[hands]])
+            self.suit_maps.append(suit_map)
+            self.hand_maps.append(moved)
+        self._keys = {}
+
+        # ACTION and CHANCE nodes in tree order, each with the rows of its
+        # children in the acting player's table for the node's street
+        rows = [[0] * (self.deal + 1) for _ in (0, 1)]
+        self.inner = []
+        for node in np.flatnonzero((tree.kind == ACTION) | (tree.kind == CHANCE)):
+            start = int(tree.first_child[node])
+            children = slice(start, start + int(tree.n_children[node]))
+            street = int(tree.street[node])
+            if tree.kind[node] == CHANCE:
+                self.inner.append((int(node), -1, street, children, None))
+                continue
+            player = int(tree.player[node])
+            first = rows[player][street]
+            rows[player][street] += children.stop - children.start
+            self.inner.append((int(node), player, street, children, slice(first, rows[player][street])))
+        self.rows = rows
+        self.by_street = [[entry for entry in self.inner if entry[2] == s] for s in range(self.deal + 1)]
+        self.folds = np.flatnonzero(tree.kind == FOLD)
+        self.showdowns = np.flatnonzero(tree.kind == SHOWDOWN)
+
+        # Card-disjoint opponent weight per hand, and the number of ordered
+        # runouts behind every disjoint pair (values are sums over runouts)
+        disjoint = ~combo_overlap()
+        self.matched = [
+            disjoint[np.ix_(self.hands[p], self.hands[1 - p])].astype(np.float64) @ self.weights[1 - p][self.hands[1 - p]]
+            for p in (0, 1)
+        ]
+        left = len(self.deck) - 4
+        self.runouts = prod(left - i for i in range(self.deal))
+        self.pairs = float(self.weights[0][self.hands[0]] @ self.matched[0])
+
+    def runout_key(self, runout):
+        """(canonical runout, index of the suit map taking `runout` there)."""
+        runout = tuple(runout)
+        key = self._keys.get(runout)
+        if key is None:
+            key = self._keys[runout] = min(
+                (tuple(apply_suit_map(runout, m)), i) for i, m in enumerate(self.suit_maps)
+            )
+        return key
+
+    def showdown(self, runout):
+        """Sides and matchups of both players on the board completed by `runout`."""
+        strengths = board_strengths(self.board + list(runout))
+        sides = [Side(w, strengths) for w in self.weights]
+        return sides, [Matchup(sides[0], sides[1]), Matchup(sides[1], sides[0])]
+
+    def valid(self, runout):
+        """Per player, the hands that `runout` does not block."""
+        return [~np.isin(cards, runout).any(axis=1) for cards in self.hand_cards]
+
+    def forward(self, strategy, valid):
+        """
+        Strategies {node: (n_actions, n_hands)} from strategy(player,
+        street, rows) and reach of both players at every node.
+        """
+        reach = [np.empty((len(self.tree), h.size)) for h in self.hands]
+        for p in (0, 1):
+            reach[p][0] = self.weights[p][self.hands[p]] * valid[p]
+        strategies = {}
+        for node, player, street, children, rows in self.inner:
+            if player < 0:
+                for p in (0, 1):
+                    reach[p][children] = reach[p][node]
+                continue
+            s = strategies[node] = strategy(player, street, rows)
+            reach[player][children] = reach[player][node] * s
+            reach[1 - player][children] = reach[1 - player][node]
+        return strategies, reach
+
+    def terminal_values(self, player, sides, matchups, reach, valid):
+        values = terminal_values(
+            self.tree, self.folds, self.showdowns, player,
+            matchups[player], sides[1 - player].onehot, reach[1 - player],
+        )
+        values *= valid[player]
+        return values
+
+    def backward(self, values, street, player, strategy):
+        """
+        Back up (best response, average) values of `player` through the
+        nodes of one street; `strategy` gives the average strategies.
+        """
+        best, average = values
+        for node, acting, _, children, rows in reversed(self.by_street[street]):
+            if acting != player:
+                best[node] = best[children].sum(axis=0)
+                average[node] = average[children].sum(axis=0)
+            else:
+                best[node] = best[children].max(axis=0)
+                average[node] = (strategy(player, street, rows) * average[children]).sum(axis=0)
+
+
+class _Worker:
+    """Later-street tables for one share of the first runout cards."""
+
+    def __init__(self, game, cards, seed):
+        self.game = game
+        self.cards = cards
+        self.rng = np.random.default_rng(seed)
+        self.tables = {}
+
+    def _table(self, runout, create=False):
+        """([regret, strategy sum] per player, hand maps) for a runout prefix."""
+        game = self.game
+        key, m = game.runout_key(runout)
+        table = self.tables.get(key)
+        if table is None and create:
+            street = len(runout)
+            table = self.tables[key] = [
+                [np.zeros((game.rows[p][street], game.hands[p].size), dtype=TABLE_DTYPE) for _ in range(2)]
+                for p in (0, 1)
+            ]
+        return table, game.hand_maps[m]
+
+    def _deal(self):
+        first = self.cards[self.rng.integers(len(self.cards))]
+        rest = [c for c in self.game.deck if c != first]
+        return [first] + [int(c) for c in self.rng.choice(rest, self.game.deal - 1, replace=False)]
+
+    def run(self, regret, weight, iterations):
+        """
+        `iterations` sampled CFR+ iterations against the street-0 regrets;
+        returns the summed street-0 regret and strategy deltas per player.
+        """
+        game = self.game
+        regret_delta = [np.zeros_like(r) for r in regret]
+        sum_delta = [np.zeros_like(r) for r in regret]
+        for _ in range(iterations):
+            runout = self._deal()
+            tables = [self._table(runout[:s], create=True) for s in range(1, game.deal + 1)]
+            regrets = [[regret[p]] + [t[p][0][:, maps[p]] for t, maps in tables] for p in (0, 1)]
+            sums = [[sum_delta[p]] + [t[p][1][:, maps[p]] for t, maps in tables] for p in (0, 1)]
+            sides, matchups = game.showdown(runout)
+            valid = game.valid(runout)
+            for player in (0, 1):
+                strategies, reach = game.forward(lambda p, s, rows: _normalize(regrets[p][s][rows]), valid)
+                values = game.terminal_values(player, sides, matchups, reach, valid)
+                for node, acting, street, children, rows in reversed(game.inner):
+                    child_values = values[children]
+                    if acting != player:
+                        values[node] = child_values.sum(axis=0)
+                        continue
+                    strategy = strategies[node]
+                    values[node] = (strategy * child_values).sum(axis=0)
+                    sums[player][street][rows] += weight * reach[player][node] * strategy
+                    if street == 0:
+                        regret_delta[player][rows] += child_values - values[node]
+                    else:
+                        table = regrets[player][street]
+                        np.maximum(table[rows] + child_values - values[node], 0, out=table[rows])
+            for s, (table, maps) in enumerate(tables, 1):
+                for p in (0, 1):
+                    table[p][0][:, maps[p]] = regrets[p][s]
+                    table[p][1][:, maps[p]] = sums[p][s]
+        return regret_delta, sum_delta
+
+    def _average(self, runout, street_zero):
+        """strategy(player, street, rows) at the average strategies for `runout`."""
+        game = self.game
+        views = [None]
+        for s in range(1, len(runout) + 1):
+            table, maps = self._table(runout[:s])
+            views.append(None if table is None else [table[p][1][:, maps[p]] for p in (0, 1)])
+
+        def strategy(player, street, rows):
+            if street == 0:
+                return street_zero[player][rows]
+            if views[street] is None:
+                return np.full((rows.stop - rows.start, game.hands[player].size), 1.0 / (rows.stop - rows.start))
+            return _normalize(views[street][player][rows])
+
+        return strategy
+
+    def _walk(self, prefix, street_zero, branch=None):
+        """
+        Per player, (best response, average) values summed over every
+        completion of `prefix`, backed up through its street.  With a
+        `branch`, only that many cards are dealt after each prefix and
+        their sums are scaled up to all cards.
+        """
+        game = self.game
+        street = len(prefix)
+        if street == game.deal:
+            sides, matchups = game.showdown(prefix)
+            valid = game.valid(prefix)
+            strategies, reach = game.forward(self._average(prefix, street_zero), valid)
+            totals = []
+            for player in (0, 1):
+                values = game.terminal_values(player, sides, matchups, reach, valid)
+                totals.append([values, values.copy()])
+        else:
+            cards = [c for c in game.deck if c not in prefix]
+            dealt = cards
+            if branch is not None and branch < len(cards):
+                dealt = [int(c) for c in self.rng.choice(cards, branch, replace=False)]
+            totals = self._sum([self._walk(prefix + [card], street_zero, branch) for card in dealt])
+            if len(dealt) < len(cards):
+                for total in totals:
+                    total[0] *= len(cards) / len(dealt)
+                    total[1] *= len(cards) / len(dealt)
+        strategy = self._average(prefix, street_zero)
+        for player in (0, 1):
+            game.backward(totals[player], street, player, strategy)
+        return totals
+
+    @staticmethod
+    def _sum(results):
+        totals = results[0]
+        for values in results[1:]:
+            for total, more in zip(totals, values):
+                total[0] += more[0]
+                total[1] += more[1]
+        return totals
+
+    def evaluate(self, street_zero, branch=None, cards=None):
+        """
+        Per player, (best response, average) values summed over the runouts
+        starting with `cards` (default: this worker's), None without any;
+        `branch` as in _walk().
+        """
+        cards = self.cards if cards is None else cards
+        if not cards:
+            return None
+        return self._sum([self._walk([card], street_zero, branch) for card in cards])
+
+
+def _serve(connection, game, cards, seed):
+    worker = _Worker(game, cards, seed)
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        method, args = message
+        connection.send(getattr(worker, method)(*args))
+
+
+def _shares(game, processes):
+    """First runout cards split by isomorphism class into `processes` shares."""
+    classes = {}
+    for card in game.deck:
+        classes.setdefault(game.runout_key([card])[0], []).append(card)
+    shares = [[] for _ in range(max(1, min(processes, len(classes))))]
+    for cards in sorted(classes.values(), key=len, reverse=True):
+        min(shares, key=len).extend(cards)
+    return shares
+
+
+class MCCFRSolver:
+    """
+    Parallel MCCFR on a flop (3-street tree) or turn (2-street tree) spot.
+    `processes` workers (default os.cpu_count()); with one the work runs
+    in this process.  Use as a context manager, or call close().
+    """
+
+    def __init__(self, tree, board, range_oop, range_ip, processes=None, seed=None):
+        self.game = game = SampledGame(tree, board, range_oop, range_ip)
+        self.tree = tree
+        self.regret = [np.zeros((game.rows[p][0], game.hands[p].size)) for p in (0, 1)]
+        self.strategy_sum = [np.zeros_like(r) for r in self.regret]
+        self.iterations = 0
+        self.rounds = 0
+
+        shares = _shares(game, processes or os.cpu_count() or 1)
+        self.processes = len(shares)
+        # A worker's deltas stand for its share of the first cards
+        self._scales = [len(share) / len(game.deck) * len(shares) for share in shares]
+        # The last seed draws the first cards of a sampled evaluation
+        seeds = np.random.SeedSequence(seed).spawn(len(shares) + 1)
+        self._rng = np.random.default_rng(seeds.pop())
+        self._shares = shares
+        self._local = None
+        self._workers = []
+        if len(shares) == 1:
+            self._local = _Worker(game, shares[0], seeds[0])
+            return
+        for share, worker_seed in zip(shares, seeds):
+            parent, child = Pipe()
+            process = Process(target=_serve, args=(child, game, share, worker_seed), daemon=True)
+            process.start()
+            child.close()
+            self._workers.append((process, parent))
+
+    def _call(self, method, *args, per_worker=None):
+        """
+        Results of `method` in every worker; `per_worker` holds one more
+        argument for each.
+        """
+        calls = [args] * self.processes if per_worker is None else [args + (a,) for a in per_worker]
+        if self._local is not None:
+            return [getattr(self._local, method)(*calls[0])]
+        for (_, connection), call in zip(self._workers, calls):
+            connection.send((method, call))
+        return [connection.recv() for _, connection in self._workers]
+
+    def close(self):
+        for process, connection in self._workers:
+            connection.send(None)
+            connection.close()
+            process.join()
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Strategies -----------------------------------------------------------
+
+    def average_strategy(self, player):
+        """(rows, n_hands) average strategy of `player` on the board's street."""
+        out = np.zeros_like(self.strategy_sum[player])
+        for node, acting, street, children, rows in self.game.by_street[0]:
+            if acting == player:
+                out[rows] = _normalize(self.strategy_sum[player][rows])
+        return out
+
+    def solve(self, iterations=2000, batch=BATCH):
+        """
+        Deal at least `iterations` more runouts, `batch` per worker
+        between merges of the street-0 tables.
+        """
+        target = self.iterations + iterations
+        while self.iterations < target:
+            self.rounds += 1
+            # Linear averaging: round t counts t times
+            results = self._call("run", self.regret, self.rounds, batch)
+            for (regret, sums), scale in zip(results, self._scales):
+                for p in (0, 1):
+                    self.regret[p] += scale * regret[p]
+                    self.strategy_sum[p] += scale * sums[p]
+            for p in (0, 1):
+                np.maximum(self.regret[p], 0, out=self.regret[p])
+            self.iterations += batch * self.processes
+        return self
+
+    # Results --------------------------------------------------------------
+
+    def _branch(self, runouts):
+        """Cards dealt per street to walk at most `runouts` runouts; None for all."""
+        deck = len(self.game.deck)
+        if runouts is None or prod(deck - i for i in range(self.game.deal)) <= runouts:
+            return None
+        return max(1, int(runouts ** (1 / self.game.deal) + 1e-9))
+
+    def root_values(self, runouts=None):
+        """
+        Per player, (best response, average) values at the root, summed over
+        runouts: all of them, or an estimate from at most `runouts`.
+        """
+        street_zero = [self.average_strategy(p) for p in (0, 1)]
+        branch = self._branch(runouts)
+        if branch is None:
+            results = self._call("evaluate", street_zero)
+            scale = 1.0
+        else:
+            dealt = set(self._rng.choice(self.game.deck, min(branch, len(self.game.deck)), replace=False).tolist())
+            cards = [[c for c in share if c in dealt] for share in self._shares]
+            results = self._call("evaluate", street_zero, branch, per_worker=cards)
+            scale = len(self.game.deck) / len(dealt)
+        results = [r for r in results if r is not None]
+        out = []
+        for player in (0, 1):
+            best = scale * sum(r[player][0] for r in results)
+            average = scale * sum(r[player][1] for r in results)
+            self.game.backward((best, average), 0, player, lambda p, s, rows: street_zero[p][rows])
+            out.append((best[0], average[0]))
+        return out
+
+    def evaluate(self, runouts=None):
+        """
+        {"ev", "best_response", "combo_ev", "exploitability", "exact"} at
+        the average strategies.  Exact when every runout is visited, by
+        default or when there are at most `runouts`; else estimated from
+        that many (see the module docstring).
+        """
+        game = self.game
+        values = self.root_values(runouts)
+        norm = game.pairs * game.runouts
+        ev = [float(game.weights[p][game.hands[p]] @ values[p][1]) / norm for p in (0, 1)]
+        best = [float(game.weights[p][game.hands[p]] @ values[p][0]) / norm for p in (0, 1)]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            combo_ev = [
+                np.where(game.matched[p] > 0, values[p][1] / (game.matched[p] * game.runouts), 0.0)
+                for p in (0, 1)
+            ]
+        return {
+            "ev": ev,
+            "best_response": best,
+            "combo_ev": combo_ev,
+            "exploitability": (best[0] + best[1] - self.tree.pot) / 2,
+            "exact": self._branch(runouts) is None,
+        }
+
+
+def solve_sampled(tree, board, range_oop, range_ip, iterations=2000, processes=None, batch=BATCH, seed=None,
+                  evaluation_runouts=EVALUATION_RUNOUTS):
+    """
+    Solve a flop or turn tree with MCCFR and return a dict with
+        solver          the (closed) MCCFRSolver
+        hands           combo indices per player
+        strategy        average strategy on the board's street, per player
+        ev, combo_ev    as in cfr.solve_river
+        exploitability  chips, and exploitability_pct as a share of the pot
+        exact           False when evaluated on a sample of at most
+                        `evaluation_runouts` runouts (None: all of them)
+        iterations      runouts dealt, processes workers used
+    """
+    with MCCFRSolver(tree, board, range_oop, range_ip, processes=processes, seed=seed) as solver:
+        solver.solve(iterations, batch)
+        evaluation = solver.evaluate(evaluation_runouts)
+    return {
+        "solver": solver,
+        "hands": solver.game.hands,
+        "strategy": [solver.average_strategy(p) for p in (0, 1)],
+        "ev": evaluation["ev"],
+        "combo_ev": evaluation["combo_ev"],
+        "exploitability": evaluation["exploitability"],
+        "exploitability_pct": evaluation["exploitability"] / tree.pot,
+        "exact": evaluation["exact"],
+        "iterations": solver.iterations,
+        "processes": solver.processes,
+    }
+
+
+def strategy_report(result, max_nodes=None):
+    """
+    JSON-friendly view of solve_sampled() output for the action nodes on
+    the board's street, in the format of cfr.strategy_report().
+    """
+    solver = result["solver"]
+    game = solver.game
+    tree = solver.tree
+    strategy = result["strategy"]
+    _, reach_all = game.forward(
+        lambda p, s, rows: strategy[p][rows] if s == 0 else 1.0 / (rows.stop - rows.start),
+        [np.ones(h.size, dtype=bool) for h in game.hands],
+    )
+    nodes = []
+    for node, player, _, children, rows in [e for e in game.by_street[0] if e[1] >= 0][:max_nodes]:
+        s = strategy[player][rows]
+        reach = reach_all[player][node]
+        weight = reach.sum()
+        nodes.append({
+            "node": node,
+            "path": tree.path(node),
+            "player": PLAYER_NAMES[player],
+            "actions": [tree.action[c] for c in range(children.start, children.stop)],
+            "frequencies": ((s @ reach) / weight).tolist() if weight > 0 else None,
+            "strategy": {
+                combo_str(int(c)): [round(float(f), 4) for f in s[:, i]]
+                for i, c in enumerate(result["hands"][player])
+            },
+        })
+    return nodes
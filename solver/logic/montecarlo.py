@@ -0,0 +1,172 @@
+"""
+Monte Carlo equity for heads-up and multiway pots.
+
+Runouts (and the hole cards of unknown opponents) are sampled in NumPy
+batches and scored with the batch evaluator.  After each batch the
+standard error of every player's equity is updated; sampling stops once
+the largest one is below `target_stderr`, the time budget runs out, or
+`max_samples` is reached.
+
+Randomness comes from numpy Generators.  spawn_rngs() derives
+independent, reproducible streams from one seed, so parallel workers
+give the same merged answer for the same seed and worker count.
+"""
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from .batch_eval import evaluate_batch
+from .cards import card_mask, cards_from_strs, cards_to_strs, deck_cards, find_duplicate
+
+DEFAULT_BATCH = 10_000
+
+
+def spawn_rngs(seed, n):
+    """n independent Generators derived from one seed."""
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+def _parse(hands, board):
+    parsed = [None if h is None else cards_from_strs(h) for h in hands]
+    board = cards_from_strs(board)
+    if len(parsed) < 2:
+        raise ValueError("Need at least two players")
+    if any(h is not None and len(h) != 2 for h in parsed):
+        raise ValueError("Every known hand needs exactly 2 hole cards")
+    if len(board) > 5:
+        raise ValueError("Board can have at most 5 cards")
+    known = [c for h in parsed if h is not None for c in h] + board
+    dup = find_duplicate(known)
+    if dup is not None:
+        raise ValueError(f"Duplicate card: {cards_to_strs([dup])[0]}")
+    return parsed, board, np.array(deck_cards(card_mask(known)), dtype=np.int8)
+
+
+def _sample_shares(hands, board, deck, rng, n):
+    """Pot share of every player for n sampled deals: (players, n)."""
+    runout = 5 - len(board)
+    unknown = sum(h is None for h in hands)
+    draw = runout + 2 * unknown
+    picks = deck[rng.random((n, deck.size)).argpartition(draw, axis=1)[:, :draw]]
+
+    common = np.hstack([np.broadcast_to(np.array(board, dtype=np.int8), (n, len(board))), picks[:, :runout]])
+    strengths = np.empty((len(hands), n), dtype=np.int32)
+    dealt = runout
+    for i, hole in enumerate(hands):
+        if hole is None:
+            hole_cards = picks[:, dealt:dealt + 2]
+            dealt += 2
+        else:
+            hole_cards = np.broadcast_to(np.array(hole, dtype=np.int8), (n, 2))
+        strengths[i] = evaluate_batch(np.hstack([hole_cards, common]))
+
+    winners = strengths == strengths.max(axis=0)
+    return winners / winners.sum(axis=0)
+
+
+def _simulate(hands, board, deck, rng, target_stderr, max_time, max_samples, batch_size):
+    """Returns (samples, share sums, squared share sums, stop reason)."""
+    start = time.perf_counter()
+    n = 0
+    sums = np.zeros(len(hands))
+    sumsq = np.zeros(len(hands))
+    reason = "samples"
+    while n < max_samples:
+        shares = _sample_shares(hands, board, deck, rng, min(batch_size, max_samples - n))
+        n += shares.shape[1]
+        sums += shares.sum(axis=1)
+        sumsq += (shares * shares).sum(axis=1)
+        if target_stderr is not None and _stderr(n, sums, sumsq).max() <= target_stderr:
+            reason = "precision"
+            break
+        if max_time is not None and time.perf_counter() - start >= max_time:
+            reason = "time"
+            break
+    return n, sums, sumsq, reason
+
+
+def _stderr(n, sums, sumsq):
+    mean = sums / n
+    var = np.maximum(sumsq / n - mean * mean, 0.0)
+    return np.sqrt(var / n)
+
+
+def _result(n, sums, sumsq, reason):
+    return {
+        "equity": (sums / n).tolist(),
+        "stderr": _stderr(n, sums, sumsq).tolist(),
+        "samples": int(n),
+        "stopped": reason,
+    }
+
+
+def monte_carlo_equity(
+    hands,
+    board=(),
+    target_stderr=0.002,
+    max_time=None,
+    max_samples=2_000_000,
+    batch_size=DEFAULT_BATCH,
+    seed=None,
+    rng=None,
+):
+    """
+    Estimate the equity of every player.
+
+    hands: list of hole-card string lists, e.g. [["As", "Kd"], ["Qh", "Qc"]];
+           None stands for an unknown opponent dealt at random
+    board: 0-5 card strings
+    target_stderr: stop once every player's standard error is at most this
+    max_time: time budget in seconds (None = no limit)
+    seed / rng: seed for a fresh Generator, or a Generator to draw from
+
+    Returns {"equity": [...], "stderr": [...], "samples": n, "stopped": reason}
+    where reason is "precision", "time" or "samples".
+    """
+    hands, board, deck = _parse(hands, board)
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    return _result(*_simulate(hands, board, deck, rng, target_stderr, max_time, max_samples, batch_size))
+
+
+def _worker(args):
+    hands, board, deck, seed_seq, target_stderr, max_time, max_samples, batch_size = args
+    rng = np.random.default_rng(seed_seq)
+    return _simulate(hands, board, deck, rng, target_stderr, max_time, max_samples, batch_size)
+
+
+def parallel_monte_carlo_equity(
+    hands,
+    board=(),
+    workers=4,
+    target_stderr=0.002,
+    max_time=None,
+    max_samples=2_000_000,
+    batch_size=DEFAULT_BATCH,
+    seed=None,
+):
+    """
+    monte_carlo_equity split over a process pool.
+
+    Each worker draws from its own stream spawned from `seed` and aims
+    for target_stderr * sqrt(workers), so the merged estimate lands near
+    target_stderr. Same seed and worker count give the same result.
+    """
+    hands, board, deck = _parse(hands, board)
+    children = np.random.SeedSequence(seed).spawn(workers)
+    per_target = None if target_stderr is None else target_stderr * np.sqrt(workers)
+    per_samples = -(-max_samples // workers)
+    tasks = [
+        (hands, board, deck, child, per_target, max_time, per_samples, batch_size)
+        for child in children
+    ]
+    with Pool(workers) as pool:
+        parts = pool.map(_worker, tasks)
+
+    n = sum(p[0] for p in parts)
+    sums = sum(p[1] for p in parts)
+    sumsq = sum(p[2] for p in parts)
+    reasons = {p[3] for p in parts}
+    reason = "precision" if reasons == {"precision"} else ("time" if "time" in reasons else "samples")
+    return _result(n, sums, sumsq, reason)
@@ -0,0 +1,175 @@
+"""
+Analytic nuts search: the strongest hand reachable from known cards when
+`to_add` more cards are still to come.
+
+A five-card hand H is reachable when at most `to_add` of its cards are
+unknown (every unknown card is still in the deck).  Working from rank
+counts and per-suit rank masks, categories are tried best first:
+
+    straight-flush windows, quads, full houses, flush suits, straights,
+    trips, two pair, one pair, high card
+
+Within a category ranks are tried high to low and kickers are filled
+greedily: a rank already held is free, a new one costs one card.  The
+first reachable candidate is the nuts, so no runout is ever evaluated.
+"""
+from .cards import FULL_DECK, card_mask
+from .eval_tables import STRAIGHT_WINDOWS
+
+
+def _window_ranks(window):
+    return [r for r in range(13) if window >> r & 1]
+
+
+class _Known:
+    __slots__ = ("mask", "counts", "present", "suit_masks")
+
+    def __init__(self, cards):
+        self.mask = card_mask(cards)
+        self.counts = [0] * 13
+        self.suit_masks = [0, 0, 0, 0]
+        for c in cards:
+            self.counts[c >> 2] += 1
+            self.suit_masks[c & 3] |= 1 << (c >> 2)
+        self.present = self.suit_masks[0] | self.suit_masks[1] | self.suit_masks[2] | self.suit_masks[3]
+
+    def cards_of_rank(self, rank, copies):
+        """`copies` unknown cards of `rank`, lowest suits first."""
+        out = []
+        for s in range(4):
+            c = rank * 4 + s
+            if len(out) < copies and not self.mask >> c & 1:
+                out.append(c)
+        return out
+
+
+def _kickers(known, n, budget, exclude):
+    """Greedy best n kicker ranks not in `exclude`; returns (ranks, new cards)."""
+    ranks, extra = [], []
+    for r in range(12, -1, -1):
+        if len(ranks) == n:
+            break
+        if r in exclude:
+            continue
+        if known.counts[r]:
+            ranks.append(r)
+        elif budget > 0:
+            ranks.append(r)
+            extra += known.cards_of_rank(r, 1)
+            budget -= 1
+    return (ranks, extra) if len(ranks) == n else (None, None)
+
+
+def _straight_flush(known, budget):
+    for window, _ in STRAIGHT_WINDOWS:
+        for s in range(4):
+            missing = window & ~known.suit_masks[s]
+            if bin(missing).count("1") <= budget:
+                return [r * 4 + s for r in _window_ranks(missing)]
+    return None
+
+
+def _quads(known, budget):
+    for r in range(12, -1, -1):
+        need = 4 - known.counts[r]
+        if need <= budget:
+            _, extra = _kickers(known, 1, budget - need, (r,))
+            if extra is not None:
+                return known.cards_of_rank(r, need) + extra
+    return None
+
+
+def _full_house(known, budget):
+    for t in range(12, -1, -1):
+        need_t = max(0, 3 - known.counts[t])
+        if need_t > budget:
+            continue
+        for p in range(12, -1, -1):
+            need_p = max(0, 2 - known.counts[p])
+            if p != t and need_t + need_p <= budget:
+                return known.cards_of_rank(t, need_t) + known.cards_of_rank(p, need_p)
+    return None
+
+
+def _flush(known, budget):
+    best_ranks, best_extra = None, None
+    for s in range(4):
+        held = known.suit_masks[s]
+        if bin(held).count("1") + budget < 5:
+            continue
+        ranks, extra, left = [], [], budget
+        for r in range(12, -1, -1):
+            if len(ranks) == 5:
+                break
+            if held >> r & 1:
+                ranks.append(r)
+            elif left > 0:
+                ranks.append(r)
+                extra.append(r * 4 + s)
+                left -= 1
+        if best_ranks is None or ranks > best_ranks:
+            best_ranks, best_extra = ranks, extra
+    return best_extra
+
+
+def _straight(known, budget):
+    for window, _ in STRAIGHT_WINDOWS:
+        missing = window & ~known.present
+        if bin(missing).count("1") <= budget:
+            return [c for r in _window_ranks(missing) for c in known.cards_of_rank(r, 1)]
+    return None
+
+
+def _sets(known, budget, size, pairs, kickers):
+    """Trips (size 3, pairs 1), two pair (2, 2) or one pair (2, 1) with kickers."""
+    ranks = [r for r in range(12, -1, -1) if size - known.counts[r] <= budget]
+
+    def pick(start, chosen, left):
+        if len(chosen) == pairs:
+            _, extra = _kickers(known, kickers, left, chosen)
+            return extra
+        for i in range(start, len(ranks)):
+            r = ranks[i]
+            need = max(0, size - known.counts[r])
+            if need <= left:
+                extra = pick(i + 1, chosen + (r,), left - need)
+                if extra is not None:
+                    return known.cards_of_rank(r, need) + extra
+        return None
+
+    return pick(0, (), budget)
+
+
+def nuts_completion(known_cards, to_add):
+    """
+    Card indices (sorted) to add to `known_cards` so that the resulting
+    holding is the strongest reachable one.  Always returns `to_add` cards;
+    cards beyond those the nuts needs are the lowest free deck cards.
+    """
+    known = _Known(known_cards)
+    budget = to_add
+    searches = (
+        _straight_flush,
+        _quads,
+        _full_house,
+        _flush,
+        _straight,
+        lambda k, b: _sets(k, b, 3, 1, 2),
+        lambda k, b: _sets(k, b, 2, 2, 1),
+        lambda k, b: _sets(k, b, 2, 1, 3),
+        lambda k, b: _kickers(k, 5, b, ())[1],
+    )
+    extra = []
+    for search in searches:
+        found = search(known, budget)
+        if found is not None:
+            extra = found
+            break
+
+    # Fill the rest of the board with the lowest remaining cards
+    free = FULL_DECK & ~known.mask & ~card_mask(extra)
+    while len(extra) < to_add:
+        low = free & -free
+        extra.append(low.bit_length() - 1)
+        free ^= low
+    return sorted(extra)
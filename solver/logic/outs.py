@@ -0,0 +1,148 @@
+"""
+Outs for hero on a flop or turn: the next cards (and, from the flop, the
+turn + river pairs) that make hero's hand stronger.
+
+Hero's cards are loaded once into a HandState (hand_state.py).  Turn
+and river cards are added to it and taken back depth first, so no
+holding is ever rebuilt or split into 5-card subsets.
+
+An out is a card that raises hero's category, or keeps the category but
+improves hero's own hand: it pairs a hole card (a better two pair, a
+better full house) or lets more hole cards play.  A board card that only
+lifts a shared kicker is not an out.  A runner-runner combo
+is a (turn, river) pair that reaches a category neither card reaches on
+its own: backdoor flushes, straights, full houses...
+"""
+from math import comb
+
+from .cards import deck_cards
+from .eval_tables import HAND_NAMES, best_five_positions, strength_category
+from .hand_state import HandState
+
+
+def _next_strengths(state, deck):
+    """Strength after each deck card: list aligned with `deck`."""
+    out = []
+    for c in deck:
+        state.add_card(c)
+        out.append(state.strength())
+        state.remove_card(c)
+    return out
+
+
+def _hole_cards_used(cards, n_hole, strength):
+    return sum(1 for i in best_five_positions(cards, strength) if i < n_hole)
+
+
+def _improves_hero(known, n_hole, current, card, strength):
+    """Same-category improvement that comes from hero's hole cards."""
+    rank = card >> 2
+    if any(c >> 2 == rank for c in known[:n_hole]):
+        return True
+    return _hole_cards_used(known + [card], n_hole, strength) > _hole_cards_used(known, n_hole, current)
+
+
+def find_outs(hole, board, runner_runner=True):
+    """
+    Outs for hole + board card indices (board of 3 or 4 cards).
+
+    Returns a dict with
+        strength, category      hero's current holding
+        cards_left              unseen cards
+        outs                    improving next cards, deck order
+        out_strengths           hero's strength after each out
+        by_category             {category name: [cards]}
+        by_suit                 [cards] per suit 0..3
+        kicker_outs             outs that keep the category (see above)
+        probability             chance the next card is an out
+        runner_runner           only from the flop, see _runner_runner
+    """
+    known = list(hole) + list(board)
+    if len(board) not in (3, 4):
+        raise ValueError("Outs need a flop or turn board")
+
+    state = HandState(known)
+    current = state.strength()
+    category = strength_category(current)
+
+    deck = deck_cards(state.mask)
+    strengths = _next_strengths(state, deck)
+
+    outs, out_strengths, kicker_outs = [], [], []
+    by_category = {}
+    by_suit = [[], [], [], []]
+    for c, strength in zip(deck, strengths):
+        if strength <= current:
+            continue
+        new_category = strength_category(strength)
+        if new_category == category:
+            if not _improves_hero(known, len(hole), current, c, strength):
+                continue
+            kicker_outs.append(c)
+        outs.append(c)
+        out_strengths.append(strength)
+        by_suit[c & 3].append(c)
+        by_category.setdefault(HAND_NAMES[new_category], []).append(c)
+
+    result = {
+        "strength": current,
+        "category": category,
+        "cards_left": len(deck),
+        "outs": outs,
+        "out_strengths": out_strengths,
+        "by_category": by_category,
+        "by_suit": by_suit,
+        "kicker_outs": kicker_outs,
+        "probability": len(outs) / len(deck),
+        "runner_runner": None,
+    }
+    if runner_runner and len(board) == 3:
+        result["runner_runner"] = _runner_runner(state, deck, strengths, category)
+    return result
+
+
+def _runner_runner(state, deck, turn_strengths, category):
+    """
+    Two-card runouts from the flop.  Returns
+        combos         (turn, river) pairs that need both cards, deck order
+        by_category    {category name: {"combos": [...], "probability": p}}
+        probability    chance of any runner-runner improvement
+        reach          {category name: chance of finishing at least there}
+    """
+    n = len(deck)
+    pairs = comb(n, 2)
+    turn_category = [strength_category(s) for s in turn_strengths]
+    finish = [0] * len(HAND_NAMES)
+
+    combos = []
+    by_category = {}
+    for i in range(n):
+        t = deck[i]
+        state.add_card(t)
+        single_t = turn_category[i]
+        for j in range(i + 1, n):
+            r = deck[j]
+            state.add_card(r)
+            new_category = strength_category(state.strength())
+            state.remove_card(r)
+            finish[new_category] += 1
+            if new_category > category and new_category > single_t and new_category > turn_category[j]:
+                combos.append((t, r))
+                by_category.setdefault(HAND_NAMES[new_category], []).append((t, r))
+        state.remove_card(t)
+
+    reach = {}
+    total = 0
+    for cat in range(len(HAND_NAMES) - 1, -1, -1):
+        total += finish[cat]
+        if cat >= category:
+            reach[HAND_NAMES[cat]] = total / pairs
+    return {
+        "combos": combos,
+        "by_category": {
+            name: {"combos": found, "probability": len(found) / pairs}
+            for name, found in by_category.items()
+        },
+        "probability": len(combos) / pairs,
+        "reach": reach,
+    }
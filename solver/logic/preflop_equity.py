@@ -0,0 +1,225 @@
+"""
+Precomputed all-in preflop equity: 1326 x 1326 combos and 169 x 169
+classes.
+
+Every one of the 2,598,960 boards is covered through the 134,459
+suit-canonical boards (isomorphism.py).  For a canonical board c with
+orbit size w the combo strengths are computed once and the win matrix
+W_c[a, b] = [s_a > s_b] (both combos free of the board) is added to the
+bucket of its weight.  Summing over the orbit is the same as averaging
+the weighted total over all 24 suit permutations:
+
+    sum over boards of W_B = 1/24 * sum_pi pi(sum_c w_c * W_c)
+
+so the permutations are applied once, at the end.  Two disjoint combos
+always share C(48, 5) boards, so ties follow from the wins:
+
+    ties[a, b] = C(48, 5) - W[a, b] - W[b, a]
+
+A class entry is the mean over its disjoint combo pairs (every pair has
+the same number of boards).  Equity is stored as float32 (combos) and
+float64 (classes), NaN where the hands share a card.
+
+build_preflop_equity() runs the boards across a process pool and writes
+one table file (table_file.py); preflop_equity() reads it lazily through
+mmap and falls back to exact enumeration while it is missing.
+"""
+import warnings
+from functools import lru_cache
+from math import comb
+from multiprocessing import Pool
+
+import numpy as np
+
+from .batch_eval import evaluate_batch
+from .cards import cards_from_strs, cards_to_strs
+from .combos import (
+    CLASS_INDEX,
+    COMBO_CARDS,
+    COMBO_CLASS,
+    COMBO_INDEX,
+    N_COMBOS,
+    blocked_combos,
+    class_pair_counts,
+    combo_class_matrix,
+    combo_overlap,
+    combo_suit_perm,
+)
+from .equity import exact_equity
+from .isomorphism import all_suit_maps, canonical_boards, canonicalize
+from .table_file import StaleTableError, open_table, table_path, write_table
+
+PREFLOP_EQUITY_KIND = "preflop_equity"
+PREFLOP_EQUITY_VERSION = 1
+DEFAULT_PATH = table_path("preflop_equity.bin")
+
+BOARDS_PER_PAIR = comb(48, 5)
+
+# Strength given to board-blocked combos on each side of the comparison
+_BLOCKED_LOW = -1
+_BLOCKED_HIGH = 1 << 30
+
+
+def _board_strengths(board):
+    """(1326,) strengths on a 5-card board, -1 for blocked combos."""
+    out = np.full(N_COMBOS, -1, dtype=np.int32)
+    free = np.flatnonzero(~blocked_combos(board))
+    rows = np.hstack([COMBO_CARDS[free], np.broadcast_to(np.array(board, dtype=np.int8), (free.size, 5))])
+    out[free] = evaluate_batch(rows)
+    return out
+
+
+def _accumulate(boards):
+    """Pool task: {weight: (1326, 1326) int32 win counts} for (board, weight) pairs."""
+    buckets = {}
+    for board, weight in boards:
+        s = _board_strengths(board)
+        valid = s >= 0
+        rows = np.where(valid, s, _BLOCKED_LOW)
+        cols = np.where(valid, s, _BLOCKED_HIGH)
+        acc = buckets.get(weight)
+        if acc is None:
+            acc = buckets[weight] = np.zeros((N_COMBOS, N_COMBOS), dtype=np.int32)
+        acc += rows[:, None] > cols[None, :]
+    return buckets
+
+
+def symmetrize(total):
+    """Sum of `total` under all 24 suit permutations of both axes."""
+    out = np.zeros((N_COMBOS, N_COMBOS), dtype=np.int64)
+    for suit_map in all_suit_maps():
+        perm = combo_suit_perm(tuple(suit_map))
+        out += total[np.ix_(perm, perm)]
+    return out
+
+
+def win_counts(boards, processes=None, chunks=None):
+    """
+    (1326, 1326) int64 wins over every board in the orbits of `boards`,
+    a list of (canonical board, orbit size) pairs.
+    """
+    chunks = chunks or max(1, min(len(boards), 64))
+    parts = [boards[i::chunks] for i in range(chunks)]
+    if processes == 1:
+        results = map(_accumulate, parts)
+    else:
+        pool = Pool(processes)
+        results = pool.imap_unordered(_accumulate, parts)
+
+    total = np.zeros((N_COMBOS, N_COMBOS), dtype=np.int64)
+    for buckets in results:
+        for weight, acc in buckets.items():
+            total += weight * acc.astype(np.int64)
+    if processes != 1:
+        pool.close()
+        pool.join()
+
+    total = symmetrize(total)
+    assert not (total % 24).any()
+    return total // 24
+
+
+def equity_matrices(wins, boards_per_pair=BOARDS_PER_PAIR):
+    """(combo equity float32, class equity float64) from a win matrix."""
+    overlap = combo_overlap()
+    ties = boards_per_pair - wins - wins.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        combo_eq = (wins + ties / 2) / boards_per_pair
+    combo_eq[overlap] = np.nan
+
+    one_hot = combo_class_matrix()
+    summed = one_hot.T @ np.where(overlap, 0.0, combo_eq) @ one_hot
+    with np.errstate(invalid="ignore", divide="ignore"):
+        class_eq = summed / class_pair_counts()
+    return combo_eq.astype(np.float32), class_eq
+
+
+def build_preflop_equity(path=DEFAULT_PATH, processes=None):
+    """Enumerate every board and write the equity table to `path`."""
+    boards = [(tuple(b), w) for b, w in canonical_boards(5)]
+    combo_eq, class_eq = equity_matrices(win_counts(boards, processes))
+    write_table(
+        path,
+        PREFLOP_EQUITY_KIND,
+        PREFLOP_EQUITY_VERSION,
+        {"combo": combo_eq, "class": class_eq},
+    )
+    load_preflop_equity.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def load_preflop_equity(path=DEFAULT_PATH):
+    """Mapped {"combo", "class"} matrices, or None when missing or stale."""
+    try:
+        arrays, _ = open_table(path, PREFLOP_EQUITY_KIND, PREFLOP_EQUITY_VERSION)
+    except FileNotFoundError:
+        return None
+    except StaleTableError as exc:
+        warnings.warn(f"{exc}; rebuild with build_preflop_equity", RuntimeWarning)
+        return None
+    return arrays
+
+
+@lru_cache(maxsize=4096)
+def _exact_combo_equity(a, b):
+    """Exact equity of canonical combo pair (a, b) by enumeration."""
+    return exact_equity(cards_to_strs(COMBO_CARDS[a].tolist()), cards_to_strs(COMBO_CARDS[b].tolist()))["equity"]
+
+
+def _combo_equity(a, b, path):
+    table = load_preflop_equity(path)
+    if table is not None:
+        return float(table["combo"][a, b])
+    (ca, cb), _ = canonicalize(COMBO_CARDS[a].tolist(), COMBO_CARDS[b].tolist())
+    return _exact_combo_equity(int(COMBO_INDEX[ca[0], ca[1]]), int(COMBO_INDEX[cb[0], cb[1]]))
+
+
+def _class_equity(x, y, path):
+    table = load_preflop_equity(path)
+    if table is not None:
+        return float(table["class"][x, y])
+    overlap = combo_overlap()
+    total = n = 0
+    for a in np.flatnonzero(COMBO_CLASS == x):
+        for b in np.flatnonzero(COMBO_CLASS == y):
+            if not overlap[a, b]:
+                total += _combo_equity(int(a), int(b), path)
+                n += 1
+    return total / n if n else float("nan")
+
+
+def preflop_equity(hand_a, hand_b, path=DEFAULT_PATH):
+    """
+    All-in preflop equity of hand_a against hand_b. Hands are class names
+    ("AKs", "QQ") or two cards ("AsKd" or ["As", "Kd"]); a class against
+    a class uses the class matrix, anything else the combo matrix
+    (a class against a combo averages over the class). NaN when the
+    hands share a card.
+    """
+    xa, xb = _parse_hand(hand_a), _parse_hand(hand_b)
+    if xa[0] == "class" and xb[0] == "class":
+        return _class_equity(xa[1], xb[1], path)
+    combos_a = _hand_combos(xa)
+    combos_b = _hand_combos(xb)
+    overlap = combo_overlap()
+    values = [
+        _combo_equity(int(a), int(b), path)
+        for a in combos_a for b in combos_b if not overlap[a, b]
+    ]
+    return sum(values) / len(values) if values else float("nan")
+
+
+def _parse_hand(hand):
+    if isinstance(hand, str) and hand in CLASS_INDEX:
+        return "class", CLASS_INDEX[hand]
+    if isinstance(hand, str):
+        hand = [hand[:2], hand[2:]]
+    a, b = cards_from_strs(hand)
+    return "combo", int(COMBO_INDEX[a, b])
+
+
+def _hand_combos(parsed):
+    kind, value = parsed
+    if kind == "class":
+        return np.flatnonzero(COMBO_CLASS == value)
+    return [value]
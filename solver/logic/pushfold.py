@@ -1,69 +1,202 @@
 # Real push/fold engine driven by lookup tables.
-# Fill PUSH_RANGES with your actual charts.
-
-# Example structure:
-# PUSH_RANGES[stack_band][position] = set of combos like "AK", "AQ", "TT", etc.
-
-PUSH_RANGES = {
-    "0-6": {
-        "UTG": {"AA", "KK", "QQ", "JJ", "TT", "AK", "AQ"},
-        "MP":  {"AA", "KK", "QQ", "JJ", "TT", "AK", "AQ", "AJ"},
-        "CO":  {"AA", "KK", "QQ", "JJ", "TT", "99", "AK", "AQ", "AJ", "AT", "KQ"},
-        "BTN": {"AA", "KK", "QQ", "JJ", "TT", "99", "88", "AK", "AQ", "AJ", "AT", "KQ", "KJ", "QJ"},
-        "SB":  {"AA", "KK", "QQ", "JJ", "TT", "99", "88", "AK", "AQ", "AJ", "AT", "KQ", "KJ", "QJ"},
-        "BB":  {"AA", "KK", "QQ", "JJ", "TT", "AK", "AQ"},  # vs unopened pot, adjust as needed
-    },
-    "7-12": {
-        "UTG": {"AA", "KK", "QQ", "JJ", "TT", "AK", "AQ"},
-        "MP":  {"AA", "KK", "QQ", "JJ", "TT", "AK", "AQ", "AJ"},
-        "CO":  {"AA", "KK", "QQ", "JJ", "TT", "99", "AK", "AQ", "AJ", "AT", "KQ"},
-        "BTN": {"AA", "KK", "QQ", "JJ", "TT", "99", "88", "AK", "AQ", "AJ", "AT", "KQ", "KJ", "QJ"},
-        "SB":  {"AA", "KK", "QQ", "JJ", "TT", "99", "88", "AK", "AQ", "AJ", "AT", "KQ", "KJ", "QJ"},
-        "BB":  {"AA", "KK", "QQ", "JJ", "TT", "AK", "AQ"},
-    },
-}
-
-
-def pushfold_decision(position, hand, stack):
+# The charts are solved by pushfold_nash.py and generated into
+# pushfold_charts.py (python manage.py build_pushfold_charts).
+
+# Chart structure (ranges.Range values, membership by class name):
+# PUSH_RANGES[stack][position] = shove range, e.g. Range("22+, A2s+, KTo+").
+# CALL_RANGES[stack][shover][caller] = call range against that shove.
+#
+# With tournament stacks and payouts the decision is made in ICM terms
+# instead (icm_decision below).
+
+import numpy as np
+
+from .cards import cards_from_strs
+from .combos import CLASS_INDEX, CLASS_NAMES, COMBO_CLASS, COMBO_INDEX, class_pair_counts
+from .icm import icm_equity
+from .pushfold_charts import CALL_RANGES, PUSH_RANGES
+from .pushfold_nash import BLINDS, POSITIONS, class_equity_matrix, versus_range
+
+MIN_STACK = min(PUSH_RANGES)
+MAX_STACK = max(PUSH_RANGES)
+
+
+def pushfold_decision(position, hand, stack, vs=None, stacks=None, payouts=None):
     """
     Uses real push/fold ranges from PUSH_RANGES.
+    With `vs` (the shover's position) it is a call decision from
+    CALL_RANGES instead; the big blind always faces a shove, from the
+    small blind unless `vs` says otherwise.
+    With `stacks` ({player: BB}) and `payouts` the answer is in ICM
+    terms (icm_decision); `stack` is then taken from `stacks`.
     """
 
     combo = normalize_combo(hand)
+    if vs is None and position == "BB":
+        vs = "SB"
+
+    if payouts is not None:
+        return _icm_message(position, hand, combo, vs, stacks, payouts)
+
     band = stack_band(stack)
 
-    # If we don't have a band or position defined, fall back to a generic message
-    if band not in PUSH_RANGES or position not in PUSH_RANGES[band]:
-        return f"No range defined for {position} at {stack}BB (band {band})."
+    if band is None:
+        return f"No range defined for {position} at {stack}BB (push/fold charts stop at {MAX_STACK:g}BB)."
+
+    if vs is not None:
+        if vs not in CALL_RANGES[band] or position not in CALL_RANGES[band][vs]:
+            return f"No range defined for {position} vs {vs} at {stack}BB (band {band:g})."
+        allowed = CALL_RANGES[band][vs][position]
+        if combo in allowed:
+            return f"Call ({combo} is in the {band:g}BB call range for {position} vs {vs})."
+        return f"Fold ({combo} is NOT in the {band:g}BB call range for {position} vs {vs})."
+
+    # If we don't have the position defined, fall back to a generic message
+    if position not in PUSH_RANGES[band]:
+        return f"No range defined for {position} at {stack}BB (band {band:g})."
 
     allowed = PUSH_RANGES[band][position]
 
     if combo in allowed:
-        return f"Jam ({combo} is in the {band}BB shove range for {position})."
+        return f"Jam ({combo} is in the {band:g}BB shove range for {position})."
 
-    return f"Fold ({combo} is NOT in the {band}BB shove range for {position})."
+    return f"Fold ({combo} is NOT in the {band:g}BB shove range for {position})."
 
 
 def normalize_combo(hand):
     """
-    Convert 'As Kh' -> 'AK', '7d 7c' -> '77'.
-    Suits are ignored for push/fold charts.
+    Convert 'As Kh' -> 'AKo', 'As Ks' -> 'AKs', '7d 7c' -> '77'.
     """
-    c1, c2 = hand.split()
-    r1, r2 = c1[0], c2[0]
-    # Sort ranks so AK and KA both become AK
-    ranks = sorted([r1, r2], reverse=True)
-    return "".join(ranks)
+    a, b = cards_from_strs(hand.split())
+    if a == b:
+        raise ValueError(f"Duplicate card in {hand!r}")
+    return CLASS_NAMES[COMBO_CLASS[COMBO_INDEX[a, b]]]
 
 
 def stack_band(stack):
     """
-    Map exact stack size to a band key used in PUSH_RANGES.
-    Adjust thresholds to match your charts.
+    Map exact stack size to a key of PUSH_RANGES: the nearest 0.5 BB
+    step, at least 1 BB. None above the deepest chart.
     """
-    if stack <= 6:
-        return "0-6"
-    if 7 <= stack <= 12:
-        return "7-12"
-    return "13+"
+    band = round(float(stack) * 2) / 2
+    if band > MAX_STACK:
+        return None
+    return max(band, MIN_STACK)
+
+
+def _icm_message(position, hand, combo, vs, stacks, payouts):
+    if not stacks:
+        return f"No ICM decision for {position}: ICM needs every player's stack along with the payouts."
+    for who in (position, vs):
+        if who is not None and who not in POSITIONS:
+            return f"No range defined for {who} (positions are {', '.join(POSITIONS)})."
+        if who is not None and who not in stacks:
+            return f"No ICM decision for {position}: no stack given for {who}."
+    if vs == position:
+        return f"No range defined for {position} vs {vs}."
+    try:
+        result = icm_decision(position, hand, stacks, payouts, vs=vs)
+    except FileNotFoundError as exc:
+        return f"No ICM decision for {position}: {exc}."
+    if result is None:
+        return f"No range defined for {position} at {stacks[position]}BB (push/fold charts stop at {MAX_STACK:g}BB)."
+    action = result["action"]
+    verb = "call" if vs is not None else "jam"
+    return (
+        f"{action} ({combo} in ICM terms: ${result['ev_play']:.2f} to {verb} "
+        f"vs ${result['ev_fold']:.2f} to fold for {position}{f' vs {vs}' if vs else ''})."
+    )
+
+
+def _posted(stacks):
+    return {p: min(b, stacks[p]) for p, b in BLINDS.items() if p in stacks}
+
+
+def _all_fold(stacks, shover):
+    """Chips after everybody folds to `shover`'s all-in."""
+    after = dict(stacks)
+    for p, blind in _posted(stacks).items():
+        if p != shover:
+            after[p] -= blind
+            after[shover] += blind
+    return after
+
+
+def _showdown(stacks, winner, loser):
+    """Chips after `winner` beats `loser` all-in, the other blinds dead."""
+    after = dict(stacks)
+    at_risk = min(stacks[winner], stacks[loser])
+    after[winner] += at_risk
+    after[loser] -= at_risk
+    for p, blind in _posted(stacks).items():
+        if p not in (winner, loser):
+            after[p] -= blind
+            after[winner] += blind
+    return after
+
+
+def _icm(chips, payouts, player):
+    names = list(chips)
+    return float(icm_equity([chips[n] for n in names], payouts)[names.index(player)])
+
+
+def icm_decision(position, hand, stacks, payouts, vs=None, equity=None):
+    """
+    Push/fold in ICM terms.
+
+    stacks      {player: chips in BB}, the hand's players keyed by
+                position (POSITIONS), anybody else still in the
+                tournament under any other name
+    payouts     prize per finishing place
+    vs          the shover's position when `position` faces a shove
+
+    The opponents' ranges come from the chip-EV charts at the effective
+    stack: a shover's range is its PUSH_RANGES entry, and each caller
+    calls with the classes whose ICM value of calling that range beats
+    folding.  Returns {"action", "ev_play", "ev_fold"} ($EV of shoving or
+    calling, and of folding), or None past the deepest chart.
+    """
+    equity = class_equity_matrix() if equity is None else np.asarray(equity, dtype=np.float64)
+    pairs = class_pair_counts()
+    pair_equity = pairs * equity
+    x = CLASS_INDEX[normalize_combo(hand)]
+
+    if vs is not None:
+        band = stack_band(min(stacks[vs], stacks[position]))
+        if band is None:
+            return None
+        shove = PUSH_RANGES[band][vs].class_weights[None, :]
+        eq = float(versus_range(shove, pairs, pair_equity)[1][0, x])
+        ev_play = eq * _icm(_showdown(stacks, position, vs), payouts, position)
+        ev_play += (1 - eq) * _icm(_showdown(stacks, vs, position), payouts, position)
+        ev_fold = _icm(_all_fold(stacks, vs), payouts, position)
+        return {"action": "Call" if ev_play > ev_fold else "Fold", "ev_play": ev_play, "ev_fold": ev_fold}
+
+    callers = [p for p in POSITIONS[POSITIONS.index(position) + 1:] if p in stacks]
+    band = stack_band(min(stacks[position], max((stacks[p] for p in callers), default=stacks[position])))
+    if band is None:
+        return None
+    shove = PUSH_RANGES[band][position].class_weights[None, :]
+    caller_eq = versus_range(shove, pairs, pair_equity)[1][0]
+
+    folded = _all_fold(stacks, position)
+    ev_play = 0.0
+    reach = 1.0
+    for caller in callers:
+        win = _showdown(stacks, position, caller)
+        lose = _showdown(stacks, caller, position)
+        call_value = caller_eq * _icm(lose, payouts, caller) + (1 - caller_eq) * _icm(win, payouts, caller)
+        calls = (call_value > _icm(folded, payouts, caller)).astype(np.float64)[None, :]
+        p, eq = versus_range(calls, pairs, pair_equity)
+        p, eq = float(p[0, x]), float(eq[0, x])
+        ev_play += reach * p * (eq * _icm(win, payouts, position) + (1 - eq) * _icm(lose, payouts, position))
+        reach *= 1 - p
+    ev_play += reach * _icm(folded, payouts, position)
 
+    after_fold = dict(stacks)
+    if position == "SB" and "BB" in stacks:
+        blind = _posted(stacks)["SB"]
+        after_fold["SB"] -= blind
+        after_fold["BB"] += blind
+    ev_fold = _icm(after_fold, payouts, position)
+    return {"action": "Jam" if ev_play > ev_fold else "Fold", "ev_play": ev_play, "ev_fold": ev_fold}
@@ -0,0 +1,1855 @@
+"""
+Push/fold charts: shove and call ranges for a six-handed table at every
+stack from 1 to 25 BB in 0.5 BB steps.
+
+    PUSH_RANGES[stack][position]            shove range when folded to position
+    CALL_RANGES[stack][shover][caller]      call range against that shove
+
+Generated by `python manage.py build_pushfold_charts` from the equilibrium
+in pushfold_nash.py; do not edit by hand.
+"""
+from .ranges import Range
+
+_PUSH = {
+    1.0: {
+        "UTG": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        "MP": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        "CO": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+        "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+    },
+    1.5: {
+        "UTG": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+        "MP": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+        "CO": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+        "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82s+, 84o+, 72s+, 74o+, 62s+, 64o+, 52s+, 54o, 43s",
+        "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+    },
+    2.0: {
+        "UTG": "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, 43s",
+        "MP": "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, 43s",
+        "CO": "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 53s+, 43s",
+        "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 93o+, 82s+, 85o+, 73s+, 75o+, 64s+, 54s",
+        "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82s+, 84o+, 72s+, 74o+, 62s+, 64o+, 52s+, 54o, 43s",
+    },
+    2.5: {
+        "UTG": "22+, A2+, K2+, Q2s+, Q3o+, J2s+, J7o+, T6s+, T8o+, 96s+, 98o, 86s+, 75s+, 65s, 54s",
+        "MP": "22+, A2+, K2+, Q2+, J2s+, J7o+, T5s+, T7o+, 95s+, 98o, 85s+, 75s+, 65s, 54s",
+        "CO": "22+, A2+, K2+, Q2+, J2s+, J5o+, T4s+, T7o+, 95s+, 97o+, 85s+, 87o, 75s+, 65s",
+        "BTN": "22+, A2+, K2+, Q2+, J2+, T2s+, T5o+, 95s+, 96o+, 85s+, 87o, 75s+",
+        "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 93o+, 82s+, 85o+, 73s+, 75o+, 64s+, 54s",
+    },
+    3.0: {
+        "UTG": "22+, A2+, K2s+, K7o+, Q7s+, Q9o+, J8s+, JTo, T8s+, 98s",
+        "MP": "22+, A2+, K2s+, K5o+, Q5s+, Q9o+, J7s+, J9o+, T8s+, 98s",
+        "CO": "22+, A2+, K2+, Q3s+, Q7o+, J7s+, J9o+, T7s+, T9o, 97s+, 87s",
+        "BTN": "22+, A2+, K2+, Q2s+, Q4o+, J4s+, J7o+, T6s+, T8o+, 97s+, 98o, 87s",
+        "SB": "22+, A2+, K2+, Q2+, J2+, T2s+, T3o+, 92s+, 95o+, 84s+, 85o+, 74s+, 76o, 64s+, 54s",
+    },
+    3.5: {
+        "UTG": "22+, A2+, K5s+, K9o+, Q8s+, QTo+, J9s+, JTo, T8s+, 98s",
+        "MP": "22+, A2+, K4s+, K8o+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s",
+        "CO": "22+, A2+, K2s+, K5o+, Q6s+, Q9o+, J8s+, J9o+, T8s+, 98s",
+        "BTN": "22+, A2+, K2+, Q3s+, Q7o+, J7s+, J8o+, T7s+, T9o, 97s+",
+        "SB": "22+, A2+, K2+, Q2+, J2+, T2s+, T4o+, 93s+, 95o+, 84s+, 86o+, 74s+, 76o, 64s+, 54s",
+    },
+    4.0: {
+        "UTG": "22+, A2+, K8s+, KTo+, Q9s+, QTo+, J9s+, T9s",
+        "MP": "22+, A2+, K5s+, K9o+, Q8s+, QTo+, J9s+, JTo, T8s+, 98s",
+        "CO": "22+, A2+, K2s+, K7o+, Q8s+, Q9o+, J8s+, JTo, T8s+, 98s",
+        "BTN": "22+, A2+, K2s+, K3o+, Q4s+, Q8o+, J7s+, J9o+, T8s+, T9o, 98s",
+        "SB": "22+, A2+, K2+, Q2+, J2+, T2s+, T5o+, 93s+, 96o+, 84s+, 86o+, 74s+, 76o, 64s+, 54s",
+    },
+    4.5: {
+        "UTG": "22+, A2s+, A3o+, K9s+, KTo+, Q9s+, QJo, J9s+, T9s",
+        "MP": "22+, A2+, K7s+, KTo+, Q9s+, QTo+, J9s+, T8s+, 98s",
+        "CO": "22+, A2+, K3s+, K8o+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K2s+, K4o+, Q5s+, Q8o+, J7s+, J9o+, T8s+, T9o, 98s, 87s",
+        "SB": "22+, A2+, K2+, Q2+, J2+, T2s+, T6o+, 93s+, 96o+, 84s+, 86o+, 74s+, 76o, 64s+, 53s+",
+    },
+    5.0: {
+        "UTG": "22+, A2s+, A5o+, K9s+, KTo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "MP": "22+, A2+, K7s+, KTo+, Q9s+, QTo+, J9s+, T8s+, 98s",
+        "CO": "22+, A2+, K4s+, K9o+, Q8s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s",
+        "BTN": "22+, A2+, K2s+, K5o+, Q5s+, Q9o+, J7s+, J9o+, T7s+, 97s+, 87s, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2+, J2s+, J3o+, T2s+, T6o+, 94s+, 97o+, 84s+, 86o+, 74s+, 76o, 64s+, "
+            "53s+, 43s"
+        ),
+    },
+    5.5: {
+        "UTG": "22+, A2s+, A7o+, A5o, K9s+, KJo+, Q9s+, QJo, J9s+, T9s",
+        "MP": "22+, A2s+, A3o+, K8s+, KTo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "CO": "22+, A2+, K5s+, K9o+, Q8s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s",
+        "BTN": "22+, A2+, K2s+, K5o+, Q5s+, Q9o+, J7s+, JTo, T7s+, 97s+, 87s, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2+, J2s+, J5o+, T2s+, T6o+, 94s+, 97o+, 84s+, 86o+, 74s+, 76o, 64s+, "
+            "53s+, 43s"
+        ),
+    },
+    6.0: {
+        "UTG": "22+, A2s+, A7o+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "MP": "22+, A2s+, A4o+, K9s+, KTo+, Q9s+, QJo, J9s+, JTo, T8s+, 98s",
+        "CO": "22+, A2+, K6s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K2s+, K6o+, Q6s+, Q9o+, J7s+, JTo, T7s+, 97s+, 86s+, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2+, J2s+, J5o+, T2s+, T7o+, 95s+, 97o+, 84s+, 86o+, 74s+, 76o, 64s+, "
+            "53s+, 43s"
+        ),
+    },
+    6.5: {
+        "UTG": "22+, A2s+, A8o+, K9s+, KJo+, Q9s+, J9s+, T8s+, 98s",
+        "MP": "22+, A2s+, A5o+, K9s+, KTo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "CO": "22+, A2+, K6s+, KTo+, Q9s+, QTo+, J9s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K2s+, K7o+, Q6s+, QTo+, J7s+, JTo, T7s+, 97s+, 86s+, 76s, 65s",
+        "SB": (
+            "22+, A2+, K2+, Q2+, J2s+, J6o+, T2s+, T7o+, 94s+, 97o+, 84s+, 86o+, 74s+, 76o, 63s+, "
+            "53s+, 43s"
+        ),
+    },
+    7.0: {
+        "UTG": "22+, A3s+, A8o+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "MP": "22+, A2s+, A7o+, A5o, K9s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "CO": "22+, A2+, K8s+, KTo+, Q9s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K3s+, K9o+, Q6s+, QTo+, J7s+, JTo, T7s+, 97s+, 86s+, 76s, 65s",
+        "SB": (
+            "22+, A2+, K2+, Q2+, J2s+, J7o+, T3s+, T7o+, 95s+, 97o+, 84s+, 86o+, 74s+, 76o, 63s+, "
+            "53s+, 43s"
+        ),
+    },
+    7.5: {
+        "UTG": "22+, A3s+, A9o+, K9s+, KJo+, Q9s+, J9s+, T9s, 98s",
+        "MP": "22+, A2s+, A7o+, A5o, K9s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "CO": "22+, A2s+, A3o+, K8s+, KTo+, Q9s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K4s+, K9o+, Q8s+, QTo+, J7s+, JTo, T7s+, 97s+, 86s+, 76s, 65s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q3o+, J2s+, J7o+, T3s+, T7o+, 95s+, 97o+, 84s+, 87o, 74s+, 76o, "
+            "64s+, 53s+, 43s"
+        ),
+    },
+    8.0: {
+        "UTG": "22+, A4s+, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s, 98s",
+        "MP": "22+, A2s+, A7o+, K9s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "CO": "22+, A2s+, A3o+, K8s+, KTo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K4s+, K9o+, Q8s+, QTo+, J8s+, JTo, T7s+, 97s+, 86s+, 76s, 65s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q5o+, J2s+, J7o+, T4s+, T7o+, 95s+, 97o+, 85s+, 87o, 74s+, 76o, "
+            "64s+, 53s+"
+        ),
+    },
+    8.5: {
+        "UTG": "33+, A5s+, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s, 98s",
+        "MP": "22+, A2s+, A8o+, K9s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "CO": "22+, A2s+, A4o+, K9s+, KTo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K5s+, K9o+, Q8s+, QTo+, J8s+, JTo, T7s+, 97s+, 86s+, 76s, 65s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q5o+, J2s+, J7o+, T4s+, T7o+, 95s+, 97o+, 84s+, 87o, 74s+, 76o, "
+            "64s+, 53s+"
+        ),
+    },
+    9.0: {
+        "UTG": "33+, A7s+, A5s-A4s, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "MP": "22+, A2s+, A8o+, K9s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "CO": "22+, A2s+, A4o+, K9s+, KTo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s",
+        "BTN": "22+, A2+, K5s+, KTo+, Q8s+, QTo+, J8s+, JTo, T7s+, 97s+, 86s+, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q6o+, J3s+, J8o+, T4s+, T7o+, 95s+, 97o+, 85s+, 87o, 74s+, 76o, "
+            "64s+, 53s+, 43s"
+        ),
+    },
+    9.5: {
+        "UTG": "33+, A7s+, A5s, ATo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "MP": "22+, A3s+, A9o+, K9s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "CO": "22+, A2s+, A7o+, A5o, K9s+, KTo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s",
+        "BTN": "22+, A2+, K6s+, KTo+, Q8s+, QTo+, J8s+, JTo, T7s+, 97s+, 86s+, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q6o+, J3s+, J8o+, T4s+, T8o+, 95s+, 97o+, 85s+, 87o, 74s+, 76o, "
+            "64s+, 53s+"
+        ),
+    },
+    10.0: {
+        "UTG": "44+, A7s+, A5s, ATo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "MP": "22+, A4s+, A9o+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "CO": "22+, A2s+, A7o+, A5o, K9s+, KJo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K5s+, KTo+, Q8s+, QTo+, J8s+, JTo, T7s+, 97s+, 87s, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q7o+, J3s+, J8o+, T4s+, T8o+, 95s+, 97o+, 84s+, 87o, 74s+, 76o, "
+            "64s+, 53s+, 43s"
+        ),
+    },
+    10.5: {
+        "UTG": "33+, A8s+, ATo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "MP": "22+, A4s+, ATo+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "CO": "22+, A2s+, A7o+, A5o, K9s+, KJo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s, 87s",
+        "BTN": "22+, A2+, K6s+, KTo+, Q8s+, QTo+, J8s+, JTo, T7s+, 97s+, 86s+, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q8o+, J3s+, J8o+, T4s+, T8o+, 95s+, 97o+, 85s+, 87o, 74s+, 76o, "
+            "64s+, 53s+"
+        ),
+    },
+    11.0: {
+        "UTG": "44+, A8s+, AJo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "MP": "22+, A4s+, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s, 98s",
+        "CO": "22+, A2s+, A8o+, K9s+, KJo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s",
+        "BTN": "22+, A2+, K6s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q8o+, J4s+, J8o+, T5s+, T8o+, 95s+, 98o, 85s+, 87o, 74s+, 64s+, "
+            "53s+"
+        ),
+    },
+    11.5: {
+        "UTG": "44+, A8s+, AJo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "MP": "33+, A4s+, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s, 98s",
+        "CO": "22+, A2s+, A8o+, K8s+, KJo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s",
+        "BTN": "22+, A2+, K7s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s, 76s",
+        "SB": (
+            "22+, A2+, K2+, Q2s+, Q8o+, J4s+, J8o+, T6s+, T8o+, 95s+, 98o, 85s+, 87o, 74s+, 64s+, "
+            "53s+"
+        ),
+    },
+    12.0: {
+        "UTG": "55+, A8s+, A5s, AJo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "MP": "33+, A7s+, A5s, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "CO": "22+, A2s+, A8o+, K9s+, KJo+, Q9s+, QJo, J8s+, JTo, T8s+, 98s",
+        "BTN": "22+, A2+, K7s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s, 76s",
+        "SB": (
+            "22+, A2+, K2s+, K3o+, Q2s+, Q8o+, J4s+, J8o+, T6s+, T8o+, 95s+, 98o, 85s+, 87o, 74s+, "
+            "64s+, 53s+"
+        ),
+    },
+    12.5: {
+        "UTG": "44+, A8s+, AJo+, K9s+, KQo, QTs+, JTs, T9s",
+        "MP": "33+, A7s+, A5s, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "CO": "22+, A2s+, A9o+, K8s+, KJo+, Q8s+, QJo, J8s+, T8s+, 98s",
+        "BTN": "22+, A2s+, A3o+, K7s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K4o+, Q2s+, Q8o+, J4s+, J9o+, T6s+, T8o+, 95s+, 98o, 85s+, 87o, 74s+, "
+            "64s+, 53s+"
+        ),
+    },
+    13.0: {
+        "UTG": "55+, A9s+, AJo+, K9s+, KQo, QTs+, JTs, T9s",
+        "MP": "33+, A8s+, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "CO": "22+, A2s+, A9o+, K9s+, KJo+, Q9s+, QJo, J8s+, T8s+, 98s",
+        "BTN": "22+, A2s+, A3o+, K8s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K4o+, Q3s+, Q8o+, J4s+, J8o+, T6s+, T8o+, 95s+, 98o, 85s+, 87o, 74s+, "
+            "64s+, 54s"
+        ),
+    },
+    13.5: {
+        "UTG": "55+, A9s+, AJo+, K9s+, KQo, QTs+, JTs",
+        "MP": "33+, A8s+, ATo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "CO": "22+, A3s+, A9o+, K8s+, KJo+, Q9s+, QJo, J8s+, T8s+, 98s",
+        "BTN": "22+, A2s+, A4o+, K8s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K5o+, Q3s+, Q9o+, J4s+, J9o+, T6s+, T8o+, 95s+, 98o, 85s+, 87o, 74s+, "
+            "64s+, 54s"
+        ),
+    },
+    14.0: {
+        "UTG": "55+, A9s+, AJo+, K9s+, KQo, QTs+, JTs",
+        "MP": "33+, A8s+, A5s, AJo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "CO": "22+, A3s+, ATo+, K9s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "BTN": "22+, A2s+, A4o+, K9s+, KTo+, Q9s+, QTo+, J8s+, JTo, T8s+, 97s+, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K5o+, Q4s+, Q9o+, J5s+, J9o+, T6s+, T8o+, 95s+, 98o, 85s+, 87o, 75s+, "
+            "64s+, 54s"
+        ),
+    },
+    14.5: {
+        "UTG": "88+, 66-55, A9s+, AJo+, K9s+, KQo, QTs+, JTs",
+        "MP": "44+, A8s+, A5s, AJo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "CO": "22+, A4s+, ATo+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "BTN": "22+, A2s+, A4o+, K9s+, K7s, KTo+, Q9s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K6o+, Q4s+, Q9o+, J5s+, J9o+, T6s+, T8o+, 96s+, 98o, 85s+, 87o, 75s+, "
+            "64s+, 54s"
+        ),
+    },
+    15.0: {
+        "UTG": "55+, A9s+, A5s, AJo+, KTs+, QTs+, JTs",
+        "MP": "44+, A8s+, AJo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "CO": "22+, A4s+, ATo+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "BTN": "22+, A2s+, A7o+, A5o, K9s+, KTo+, Q9s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K6o+, Q4s+, Q9o+, J6s+, J9o+, T6s+, T8o+, 96s+, 98o, 85s+, 75s+, 64s+, "
+            "54s"
+        ),
+    },
+    15.5: {
+        "UTG": "55+, A9s+, A5s, AQo+, KTs+, QTs+, JTs",
+        "MP": "44+, A8s+, AJo+, K9s+, KQo, QTs+, J9s+, T9s",
+        "CO": "22+, A7s+, A5s-A4s, ATo+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "BTN": "22+, A2s+, A7o+, A5o, K8s+, KTo+, Q9s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K7o+, Q4s+, Q9o+, J6s+, J9o+, T6s+, T8o+, 96s+, 98o, 85s+, 75s+, 64s+, "
+            "54s"
+        ),
+    },
+    16.0: {
+        "UTG": "55+, A9s+, A5s, AQo+, KTs+, QTs+, JTs",
+        "MP": "44+, A8s+, AJo+, K9s+, KJo+, QTs+, JTs, T9s",
+        "CO": "33+, A7s+, A5s, ATo+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "BTN": "22+, A2s+, A7o+, A5o, K9s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K7o+, Q4s+, Q9o+, J6s+, J9o+, T6s+, T8o+, 96s+, 98o, 85s+, 75s+, 64s+, "
+            "54s"
+        ),
+    },
+    16.5: {
+        "UTG": "66+, A9s+, A5s, AQo+, KTs+, QTs+, JTs",
+        "MP": "44+, A9s+, AJo+, K9s+, KJo+, QTs+, JTs, T9s",
+        "CO": "33+, A7s+, A5s-A4s, ATo+, K9s+, KJo+, Q9s+, QJo, J9s+, T9s",
+        "BTN": "22+, A2s+, A7o+, K9s+, KTo+, Q9s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K8o+, Q5s+, Q9o+, J6s+, J9o+, T6s+, T8o+, 96s+, 98o, 85s+, 75s+, 65s, "
+            "54s"
+        ),
+    },
+    17.0: {
+        "UTG": "88+, 66, ATs+, A5s-A4s, AQo+, KTs+, QTs+, JTs",
+        "MP": "55+, A9s+, AJo+, K9s+, KJo+, QTs+, JTs",
+        "CO": "33+, A7s+, A5s, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "BTN": "22+, A2s+, A7o+, K8s+, KJo+, Q8s+, QJo, J8s+, JTo, T8s+, 98s, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K8o+, Q5s+, Q9o+, J6s+, J9o+, T6s+, T8o+, 96s+, 98o, 85s+, 75s+, 65s, "
+            "54s"
+        ),
+    },
+    17.5: {
+        "UTG": "88+, 66, ATs+, A5s-A4s, AQo+, KTs+, QTs+, JTs",
+        "MP": "55+, A9s+, A5s, AJo+, K9s+, KQo, QTs+, JTs",
+        "CO": "33+, A7s+, A5s-A4s, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "BTN": "22+, A2s+, A8o+, K8s+, KJo+, Q8s+, QJo, J8s+, JTo, T8s+, 98s, 87s",
+        "SB": (
+            "22+, A2+, K2s+, K8o+, Q5s+, Q9o+, J6s+, J9o+, T6s+, T8o+, 96s+, 98o, 85s+, 75s+, 65s, "
+            "54s"
+        ),
+    },
+    18.0: {
+        "UTG": "88+, 66, ATs+, A5s-A4s, AQo+, KTs+, QTs+, JTs",
+        "MP": "55+, A9s+, AJo+, K9s+, KQo, QTs+, JTs",
+        "CO": "33+, A8s+, ATo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "BTN": "22+, A2s+, A8o+, K8s+, KJo+, Q8s+, QJo, J8s+, JTo, T8s+, 98s, 87s",
+        "SB": "22+, A2+, K2s+, K8o+, Q5s+, Q9o+, J6s+, J9o+, T6s+, T9o, 96s+, 98o, 85s+, 75s+, 65s, 54s",
+    },
+    18.5: {
+        "UTG": "88+, 66, ATs+, A5s-A3s, AQo+, KTs+, QTs+",
+        "MP": "55+, A9s+, AJo+, KTs+, KQo, QTs+, JTs",
+        "CO": "33+, A8s+, AJo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "BTN": "22+, A2s+, A8o+, K8s+, KJo+, Q8s+, QJo, J8s+, JTo, T8s+, 98s",
+        "SB": "22+, A2+, K2s+, K9o+, Q5s+, Q9o+, J6s+, J9o+, T6s+, T9o, 96s+, 98o, 85s+, 75s+, 65s, 54s",
+    },
+    19.0: {
+        "UTG": "99+, 66, ATs+, A5s-A3s, AQo+, KTs+, QTs+",
+        "MP": "55+, A9s+, A5s, AJo+, KTs+, QTs+, JTs",
+        "CO": "33+, A8s+, AJo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "BTN": "22+, A2s+, A8o+, K8s+, KJo+, Q8s+, QJo, J8s+, JTo, T8s+, 98s",
+        "SB": "22+, A2+, K2s+, K9o+, Q5s+, Q9o+, J7s+, J9o+, T6s+, T9o, 96s+, 98o, 86s+, 75s+, 65s, 54s",
+    },
+    19.5: {
+        "UTG": "99+, 66, ATs+, A5s-A3s, AQo+, KTs+, QJs",
+        "MP": "55+, A9s+, A5s, AJo+, KTs+, QTs+, JTs",
+        "CO": "44+, A8s+, A5s, AJo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "BTN": "22+, A2s+, A8o+, K8s+, KJo+, Q8s+, QJo, J8s+, JTo, T8s+, 98s",
+        "SB": "22+, A2+, K3s+, K9o+, Q5s+, Q9o+, J7s+, J9o+, T6s+, T9o, 96s+, 98o, 86s+, 75s+, 65s, 54s",
+    },
+    20.0: {
+        "UTG": "99+, 66, ATs+, A5s-A3s, AQo+, KTs+, QJs",
+        "MP": "55+, A9s+, A5s, AJo+, KTs+, QTs+, JTs",
+        "CO": "44+, A8s+, A5s, AJo+, K9s+, KQo, Q9s+, J9s+, T9s",
+        "BTN": "22+, A2s+, A9o+, K7s+, KJo+, Q8s+, QJo, J8s+, JTo, T8s+, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q5s+, Q9o+, J7s+, J9o+, T6s+, T9o, 96s+, 98o, 86s+, 75s+, 65s, 54s",
+    },
+    20.5: {
+        "UTG": "TT+, ATs+, A5s-A3s, AQo+, KTs+, QJs",
+        "MP": "66+, A9s+, A5s, AJo+, KTs+, QTs+, JTs",
+        "CO": "44+, A8s+, AJo+, K9s+, KJo+, Q9s+, J9s+, T9s",
+        "BTN": "22+, A2s+, A9o+, K8s+, KJo+, Q8s+, QJo, J8s+, T8s+, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q6s+, Q9o+, J7s+, J9o+, T6s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+    },
+    21.0: {
+        "UTG": "TT+, 66, ATs+, A5s-A3s, AQo+, KJs+, QJs",
+        "MP": "66+, A9s+, A5s-A4s, AQo+, KTs+, QTs+, JTs",
+        "CO": "44+, A8s+, AJo+, K9s+, KJo+, QTs+, J9s+, T9s",
+        "BTN": "22+, A3s+, A9o+, K7s+, KJo+, Q8s+, QJo, J8s+, T8s+, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q5s+, QTo+, J7s+, J9o+, T7s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+    },
+    21.5: {
+        "UTG": "TT+, 66, ATs+, A5s-A3s, AQo+, KJs+, QJs",
+        "MP": "88+, 66, ATs+, A5s-A4s, AJo+, KTs+, QTs+, JTs",
+        "CO": "44+, A8s+, AJo+, K9s+, KJo+, QTs+, JTs, T9s",
+        "BTN": "22+, A3s+, ATo+, K8s+, KJo+, Q8s+, QJo, J8s+, T8s+, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q5s+, QTo+, J7s+, J9o+, T7s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+    },
+    22.0: {
+        "UTG": "TT+, 66, ATs+, A5s-A4s, AQo+, KJs+, QJs",
+        "MP": "88+, 66, ATs+, A5s-A4s, AQo+, KTs+, QTs+, JTs",
+        "CO": "44+, A9s+, AJo+, K9s+, KJo+, QTs+, JTs, T9s",
+        "BTN": "22+, A3s+, ATo+, K8s+, KJo+, Q8s+, QJo, J8s+, T8s+, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q5s+, QTo+, J7s+, J9o+, T7s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+    },
+    22.5: {
+        "UTG": "TT+, 66, ATs+, A5s-A4s, AQo+, KJs+, QJs",
+        "MP": "88+, 66, ATs+, A5s-A4s, AQo+, KTs+, QTs+, JTs",
+        "CO": "55+, A9s+, A5s, AJo+, K9s+, KJo+, QTs+, JTs, T9s",
+        "BTN": "22+, A7s+, A5s-A4s, ATo+, K8s+, KJo+, Q9s+, QJo, J8s+, T8s+, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q5s+, QTo+, J7s+, J9o+, T7s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+    },
+    23.0: {
+        "UTG": "TT+, 66, ATs+, A5s-A3s, AQo+, KJs+",
+        "MP": "88+, 66, ATs+, A5s-A3s, AQo+, KTs+, QTs+, JTs",
+        "CO": "55+, A9s+, A5s, AJo+, K9s+, KJo+, QTs+, JTs, T9s",
+        "BTN": "22+, A7s+, A5s-A4s, ATo+, K8s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q5s+, QTo+, J7s+, J9o+, T6s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+    },
+    23.5: {
+        "UTG": "TT+, 66, ATs+, A5s-A3s, AQo+, KJs+",
+        "MP": "99+, 66, ATs+, A5s-A3s, AQo+, KTs+, QTs+",
+        "CO": "55+, A9s+, A5s, AJo+, K9s+, KJo+, QTs+, JTs",
+        "BTN": "22+, A7s+, A5s-A3s, ATo+, K8s+, KJo+, Q9s+, QJo, J9s+, T8s+, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q5s+, QTo+, J7s+, J9o+, T6s+, T9o, 96s+, 86s+, 75s+, 65s",
+    },
+    24.0: {
+        "UTG": "TT+, ATs+, A5s-A3s, AQo+, KJs+",
+        "MP": "88+, 66, ATs+, A5s-A3s, AQo+, KTs+, QTs+",
+        "CO": "55+, A9s+, AJo+, K9s+, KQo, QTs+, JTs",
+        "BTN": "22+, A7s+, A5s-A3s, ATo+, K8s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "SB": "22+, A2+, K4s+, K9o+, Q5s+, Q9o+, J7s+, J9o+, T6s+, T9o, 96s+, 86s+, 76s, 65s",
+    },
+    24.5: {
+        "UTG": "TT+, ATs+, A5s-A3s, AQo+, KQs",
+        "MP": "99+, 66, ATs+, A5s-A3s, AQo+, KTs+, QTs+",
+        "CO": "55+, A9s+, AJo+, K9s+, KQo, QTs+, JTs",
+        "BTN": "22+, A7s+, A5s-A4s, ATo+, K8s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "SB": "22+, A2+, K4s+, KTo+, Q6s+, QTo+, J7s+, J9o+, T6s+, T9o, 96s+, 86s+, 76s, 65s",
+    },
+    25.0: {
+        "UTG": "TT+, ATs+, A5s-A3s, AQo+, KQs",
+        "MP": "99+, 66, ATs+, A7s, A5s-A3s, AQo+, KTs+, QJs",
+        "CO": "55+, A9s+, A5s, AJo+, KTs+, KQo, QTs+, JTs",
+        "BTN": "22+, A7s+, A5s-A4s, ATo+, K8s+, KJo+, Q9s+, QJo, J9s+, T9s, 98s",
+        "SB": "22+, A2+, K4s+, KTo+, Q6s+, QTo+, J7s+, J9o+, T7s+, T9o, 96s+, 86s+, 76s, 65s",
+    },
+}
+
+_CALL = {
+    1.0: {
+        "UTG": {
+            "MP": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "CO": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "MP": {
+            "CO": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "CO": {
+            "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+    },
+    1.5: {
+        "UTG": {
+            "MP": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+            "CO": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+            "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "MP": {
+            "CO": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+            "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "CO": {
+            "BTN": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42s+, 43o, 32s",
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+    },
+    2.0: {
+        "UTG": {
+            "MP": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, "
+                "43s"
+            ),
+            "CO": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, "
+                "43s"
+            ),
+            "BTN": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, "
+                "43s"
+            ),
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "MP": {
+            "CO": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, "
+                "43s"
+            ),
+            "BTN": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, "
+                "43s"
+            ),
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "CO": {
+            "BTN": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 95o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, "
+                "43s"
+            ),
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+    },
+    2.5: {
+        "UTG": {
+            "MP": "22+, A2+, K2+, Q2s+, Q3o+, J3s+, J7o+, T6s+, T8o+, 96s+, 98o, 86s+, 75s+, 65s, 54s",
+            "CO": "22+, A2+, K2+, Q2s+, Q3o+, J3s+, J7o+, T6s+, T8o+, 96s+, 98o, 86s+, 75s+, 65s, 54s",
+            "BTN": "22+, A2+, K2+, Q2s+, Q3o+, J3s+, J7o+, T6s+, T8o+, 96s+, 98o, 86s+, 75s+, 65s, 54s",
+            "SB": (
+                "22+, A2+, K2+, Q2+, J2+, T2s+, T3o+, 92s+, 95o+, 82s+, 85o+, 72s+, 74o+, 62s+, 64o+, "
+                "52s+, 53o+, 42s+, 32s"
+            ),
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "MP": {
+            "CO": "22+, A2+, K2+, Q2+, J2s+, J7o+, T5s+, T8o+, 96s+, 98o, 85s+, 75s+, 65s, 54s",
+            "BTN": "22+, A2+, K2+, Q2+, J2s+, J7o+, T5s+, T8o+, 96s+, 98o, 85s+, 75s+, 65s, 54s",
+            "SB": (
+                "22+, A2+, K2+, Q2+, J2+, T2s+, T3o+, 92s+, 95o+, 82s+, 84o+, 72s+, 74o+, 62s+, 64o+, "
+                "52s+, 53o+, 42s+, 32s"
+            ),
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "CO": {
+            "BTN": "22+, A2+, K2+, Q2+, J2s+, J6o+, T4s+, T7o+, 95s+, 98o, 85s+, 75s+, 65s, 54s",
+            "SB": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 84o+, 72s+, 74o+, 62s+, 64o+, 52s+, "
+                "53o+, 42s+, 32s"
+            ),
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "BTN": {
+            "SB": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 94o+, 82s+, 84o+, 72s+, 74o+, 62s+, 64o+, 52s+, "
+                "53o+, 42s+, 43o, 32s"
+            ),
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82+, 72+, 62+, 52+, 42+, 32",
+        },
+    },
+    3.0: {
+        "UTG": {
+            "MP": "22+, A2+, K3s+, K8o+, Q8s+, QTo+, J9s+, JTo, T9s, 98s",
+            "CO": "22+, A2+, K3s+, K8o+, Q8s+, QTo+, J9s+, JTo, T9s, 98s",
+            "BTN": "22+, A2+, K3s+, K8o+, Q8s+, QTo+, J9s+, JTo, T9s, 98s",
+            "SB": (
+                "22+, A2+, K2+, Q2s+, Q8o+, J3s+, J8o+, T5s+, T8o+, 95s+, 98o, 85s+, 87o, 74s+, 76o, "
+                "64s+, 53s+"
+            ),
+            "BB": (
+                "22+, A2+, K2+, Q2+, J2+, T2s+, T3o+, 92s+, 94o+, 82s+, 84o+, 72s+, 73o+, 62s+, 63o+, "
+                "52+, 42s+, 43o, 32s"
+            ),
+        },
+        "MP": {
+            "CO": "22+, A2+, K2s+, K6o+, Q8s+, Q9o+, J8s+, JTo, T8s+, 98s",
+            "BTN": "22+, A2+, K2s+, K6o+, Q8s+, Q9o+, J8s+, JTo, T8s+, 98s",
+            "SB": (
+                "22+, A2+, K2+, Q2s+, Q6o+, J3s+, J8o+, T4s+, T8o+, 95s+, 98o, 85s+, 87o, 74s+, 76o, "
+                "64s+, 53s+, 43s"
+            ),
+            "BB": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 93o+, 82s+, 84o+, 72s+, 73o+, 62s+, 63o+, 52+, "
+                "42s+, 43o, 32s"
+            ),
+        },
+        "CO": {
+            "BTN": "22+, A2+, K2s+, K3o+, Q5s+, Q8o+, J8s+, J9o+, T8s+, 98s, 87s",
+            "SB": (
+                "22+, A2+, K2+, Q2s+, Q4o+, J2s+, J7o+, T3s+, T7o+, 95s+, 97o+, 84s+, 87o, 74s+, 76o, "
+                "63s+, 65o, 53s+, 43s"
+            ),
+            "BB": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 93o+, 82s+, 84o+, 72s+, 73o+, 62s+, 63o+, 52+, "
+                "42+, 32s"
+            ),
+        },
+        "BTN": {
+            "SB": (
+                "22+, A2+, K2+, Q2+, J2s+, J5o+, T2s+, T7o+, 95s+, 97o+, 84s+, 86o+, 74s+, 76o, 63s+, "
+                "65o, 53s+, 43s"
+            ),
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82s+, 83o+, 72s+, 73o+, 62+, 52+, 42+, 32s",
+        },
+        "SB": {
+            "BB": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92+, 82s+, 84o+, 72s+, 74o+, 62s+, 64o+, 52s+, 53o+, "
+                "42s+, 43o, 32s"
+            ),
+        },
+    },
+    3.5: {
+        "UTG": {
+            "MP": "22+, A2+, K7s+, KTo+, Q9s+, QJo, JTs",
+            "CO": "22+, A2+, K7s+, KTo+, Q9s+, QJo, JTs",
+            "BTN": "22+, A2+, K7s+, KTo+, Q9s+, QJo, JTs",
+            "SB": "22+, A2+, K2s+, K7o+, Q5s+, Q9o+, J7s+, JTo, T7s+, T9o, 97s+, 86s+, 75s+, 65s, 54s",
+            "BB": (
+                "22+, A2+, K2+, Q2s+, Q4o+, J2s+, J7o+, T2s+, T6o+, 93s+, 96o+, 83s+, 86o+, 73s+, "
+                "75o+, 62s+, 65o, 52s+, 54o, 42s+"
+            ),
+        },
+        "MP": {
+            "CO": "22+, A2+, K6s+, K9o+, Q9s+, QTo+, JTs",
+            "BTN": "22+, A2+, K6s+, K9o+, Q9s+, QTo+, JTs",
+            "SB": "22+, A2+, K2s+, K6o+, Q4s+, Q9o+, J7s+, J9o+, T7s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+            "BB": (
+                "22+, A2+, K2+, Q2s+, Q3o+, J2s+, J6o+, T2s+, T6o+, 92s+, 96o+, 83s+, 86o+, 73s+, "
+                "75o+, 62s+, 64o+, 52s+, 54o, 42s+"
+            ),
+        },
+        "CO": {
+            "BTN": "22+, A2+, K4s+, K8o+, Q9s+, QTo+, J9s+, T9s",
+            "SB": "22+, A2+, K2s+, K4o+, Q3s+, Q8o+, J7s+, J9o+, T7s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+            "BB": (
+                "22+, A2+, K2+, Q2s+, Q3o+, J2s+, J6o+, T2s+, T6o+, 92s+, 96o+, 82s+, 85o+, 73s+, "
+                "75o+, 62s+, 64o+, 52s+, 54o, 42s+, 32s"
+            ),
+        },
+        "BTN": {
+            "SB": "22+, A2+, K2+, Q2s+, Q6o+, J5s+, J8o+, T6s+, T9o, 96s+, 85s+, 75s+, 64s+, 54s",
+            "BB": (
+                "22+, A2+, K2+, Q2+, J2s+, J4o+, T2s+, T6o+, 92s+, 95o+, 82s+, 85o+, 72s+, 75o+, "
+                "62s+, 64o+, 52s+, 53o+, 42s+, 32s"
+            ),
+        },
+        "SB": {
+            "BB": (
+                "22+, A2+, K2+, Q2+, J2+, T2+, 92s+, 95o+, 82s+, 85o+, 73s+, 75o+, 63s+, 65o, 52s+, "
+                "54o, 43s"
+            ),
+        },
+    },
+    4.0: {
+        "UTG": {
+            "MP": "22+, A2s+, A4o+, K9s+, KTo+, QTs+",
+            "CO": "22+, A2s+, A4o+, K9s+, KTo+, QTs+",
+            "BTN": "22+, A2s+, A4o+, K9s+, KTo+, QTs+",
+            "SB": "22+, A2+, K5s+, K9o+, Q9s+, QTo+, J8s+, T8s+, 98s, 87s, 76s",
+            "BB": (
+                "22+, A2+, K2s+, K5o+, Q3s+, Q8o+, J4s+, J8o+, T6s+, T8o+, 95s+, 97o+, 85s+, 87o, "
+                "74s+, 76o, 64s+, 53s+"
+            ),
+        },
+        "MP": {
+            "CO": "22+, A2+, K8s+, KTo+, QTs+, QJo, JTs",
+            "BTN": "22+, A2+, K8s+, KTo+, QTs+, QJo, JTs",
+            "SB": "22+, A2+, K3s+, K9o+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s, 87s, 76s",
+            "BB": (
+                "22+, A2+, K2s+, K3o+, Q2s+, Q8o+, J3s+, J8o+, T5s+, T8o+, 95s+, 98o, 85s+, 87o, "
+                "74s+, 76o, 64s+, 53s+"
+            ),
+        },
+        "CO": {
+            "BTN": "22+, A2+, K7s+, K9o+, Q9s+, QTo+, JTs",
+            "SB": "22+, A2+, K2s+, K7o+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s, 87s, 76s",
+            "BB": (
+                "22+, A2+, K2+, Q2s+, Q8o+, J3s+, J8o+, T4s+, T8o+, 95s+, 97o+, 84s+, 87o, 74s+, 76o, "
+                "63s+, 53s+, 43s"
+            ),
+        },
+        "BTN": {
+            "SB": "22+, A2+, K2s+, K3o+, Q4s+, Q8o+, J7s+, J9o+, T7s+, T9o, 97s+, 87s, 76s, 65s",
+            "BB": (
+                "22+, A2+, K2+, Q2s+, Q4o+, J2s+, J7o+, T3s+, T7o+, 95s+, 97o+, 84s+, 86o+, 74s+, "
+                "76o, 63s+, 65o, 53s+, 43s"
+            ),
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2+, J2+, T2s+, T5o+, 93s+, 96o+, 84s+, 86o+, 74s+, 76o, 64s+, 53s+",
+        },
+    },
+    4.5: {
+        "UTG": {
+            "MP": "22+, A2s+, A7o+, KTs+, KJo+, QJs",
+            "CO": "22+, A2s+, A7o+, KTs+, KJo+, QJs",
+            "BTN": "22+, A2s+, A7o+, KTs+, KJo+, QJs",
+            "SB": "22+, A2s+, A3o+, K9s+, KTo+, Q9s+, QJo, J9s+, T9s",
+            "BB": "22+, A2+, K3s+, K9o+, Q6s+, Q9o+, J7s+, J9o+, T7s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+        },
+        "MP": {
+            "CO": "22+, A2s+, A4o+, K9s+, KTo+, QTs+",
+            "BTN": "22+, A2s+, A4o+, K9s+, KTo+, QTs+",
+            "SB": "22+, A2+, K6s+, K9o+, Q9s+, QTo+, J9s+, T9s, 98s",
+            "BB": "22+, A2+, K2s+, K6o+, Q4s+, Q9o+, J7s+, J9o+, T6s+, T9o, 96s+, 86s+, 75s+, 65s, 54s",
+        },
+        "CO": {
+            "BTN": "22+, A2+, K8s+, KTo+, QTs+, QJo, JTs",
+            "SB": "22+, A2+, K4s+, K9o+, Q8s+, QTo+, J9s+, JTo, T9s, 98s",
+            "BB": "22+, A2+, K2s+, K5o+, Q3s+, Q8o+, J5s+, J9o+, T6s+, T9o, 96s+, 86s+, 75s+, 64s+, 54s",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K2s+, K5o+, Q6s+, Q9o+, J8s+, JTo, T8s+, 98s",
+            "BB": "22+, A2+, K2+, Q2s+, Q7o+, J4s+, J8o+, T6s+, T8o+, 96s+, 98o, 85s+, 75s+, 64s+, 54s",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2+, J2s+, J3o+, T2s+, T6o+, 95s+, 97o+, 85s+, 87o, 75s+, 65s, 54s",
+        },
+    },
+    5.0: {
+        "UTG": {
+            "MP": "22+, A4s+, A7o+, KTs+, KQo, QJs",
+            "CO": "22+, A4s+, A7o+, KTs+, KQo, QJs",
+            "BTN": "22+, A4s+, A7o+, KTs+, KQo, QJs",
+            "SB": "22+, A2s+, A5o+, K9s+, KTo+, QTs+, JTs",
+            "BB": "22+, A2+, K5s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        },
+        "MP": {
+            "CO": "22+, A2s+, A5o+, KTs+, KJo+, QJs",
+            "BTN": "22+, A2s+, A5o+, KTs+, KJo+, QJs",
+            "SB": "22+, A2+, K7s+, KTo+, Q9s+, QJo, JTs, T9s",
+            "BB": "22+, A2+, K3s+, K8o+, Q6s+, QTo+, J8s+, JTo, T7s+, 97s+, 86s+, 76s, 65s",
+        },
+        "CO": {
+            "BTN": "22+, A2s+, A3o+, K9s+, KTo+, QTs+, JTs",
+            "SB": "22+, A2+, K6s+, K9o+, Q9s+, QTo+, J9s+, T9s",
+            "BB": "22+, A2+, K2s+, K7o+, Q5s+, Q9o+, J7s+, JTo, T7s+, 97s+, 86s+, 76s, 65s",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K2s+, K7o+, Q8s+, Q9o+, J9s+, JTo, T9s",
+            "BB": "22+, A2+, K2s+, K3o+, Q3s+, Q8o+, J7s+, J9o+, T7s+, T9o, 97s+, 86s+, 76s, 65s",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2+, J2s+, J5o+, T4s+, T7o+, 95s+, 97o+, 86s+, 76s",
+        },
+    },
+    5.5: {
+        "UTG": {
+            "MP": "33+, A7s+, A8o+, KJs+, KQo",
+            "CO": "33+, A7s+, A8o+, KJs+, KQo",
+            "BTN": "33+, A7s+, A8o+, KJs+, KQo",
+            "SB": "22+, A2s+, A7o+, KTs+, KJo+, QTs+, JTs",
+            "BB": "22+, A2s+, A4o+, K6s+, KTo+, Q9s+, QJo, J9s+, T9s",
+        },
+        "MP": {
+            "CO": "22+, A3s+, A7o+, KTs+, KJo+, QJs",
+            "BTN": "22+, A3s+, A7o+, KTs+, KJo+, QJs",
+            "SB": "22+, A2s+, A4o+, K9s+, KTo+, QTs+, JTs",
+            "BB": "22+, A2+, K6s+, KTo+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        },
+        "CO": {
+            "BTN": "22+, A2s+, A4o+, K9s+, KTo+, QTs+",
+            "SB": "22+, A2+, K7s+, KTo+, Q9s+, QTo+, JTs",
+            "BB": "22+, A2+, K3s+, K8o+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s, 87s",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K4s+, K8o+, Q8s+, QTo+, J9s+, JTo, T9s",
+            "BB": "22+, A2+, K2s+, K5o+, Q6s+, Q9o+, J7s+, J9o+, T7s+, 97s+, 87s",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2+, J2s+, J7o+, T6s+, T7o+, 96s+, 98o, 86s+",
+        },
+    },
+    6.0: {
+        "UTG": {
+            "MP": "33+, A7s+, A9o+, KJs+, KQo",
+            "CO": "33+, A7s+, A9o+, KJs+, KQo",
+            "BTN": "33+, A7s+, A9o+, KJs+, KQo",
+            "SB": "22+, A4s+, A8o+, KTs+, KJo+, QTs+",
+            "BB": "22+, A2s+, A7o+, A5o, K9s+, KTo+, QTs+, QJo, JTs",
+        },
+        "MP": {
+            "CO": "33+, A4s+, A7o+, KTs+, KQo",
+            "BTN": "33+, A4s+, A7o+, KTs+, KQo",
+            "SB": "22+, A2s+, A5o+, KTs+, KJo+, QTs+, JTs",
+            "BB": "22+, A2+, K7s+, KTo+, Q9s+, QJo, J9s+, T9s",
+        },
+        "CO": {
+            "BTN": "22+, A2s+, A5o+, KTs+, KJo+, QTs+",
+            "SB": "22+, A2s+, A3o+, K8s+, KTo+, QTs+, QJo, JTs",
+            "BB": "22+, A2+, K4s+, K9o+, Q8s+, QTo+, J9s+, JTo, T9s, 98s",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K5s+, K8o+, Q9s+, QTo+, J9s+, T9s",
+            "BB": "22+, A2+, K2s+, K6o+, Q8s+, Q9o+, J8s+, JTo, T8s+, 98s",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2s+, Q4o+, J4s+, J7o+, T6s+, T8o+, 97s+, 98o, 87s",
+        },
+    },
+    6.5: {
+        "UTG": {
+            "MP": "44+, A8s+, A9o+, KJs+, KQo",
+            "CO": "44+, A8s+, A9o+, KJs+, KQo",
+            "BTN": "44+, A8s+, A9o+, KJs+, KQo",
+            "SB": "33+, A5s+, A9o+, KTs+, KQo, QJs",
+            "BB": "22+, A2s+, A7o+, K9s+, KJo+, QTs+, JTs",
+        },
+        "MP": {
+            "CO": "33+, A5s+, A8o+, KJs+, KQo",
+            "BTN": "33+, A5s+, A8o+, KJs+, KQo",
+            "SB": "22+, A2s+, A7o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A4o+, K9s+, KTo+, QTs+, QJo, JTs",
+        },
+        "CO": {
+            "BTN": "22+, A2s+, A7o+, KTs+, KJo+, QJs",
+            "SB": "22+, A2s+, A4o+, K9s+, KTo+, QTs+, QJo, JTs",
+            "BB": "22+, A2+, K6s+, K9o+, Q9s+, QTo+, J9s+, T9s",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K6s+, K9o+, Q9s+, QTo+, JTs",
+            "BB": "22+, A2+, K3s+, K8o+, Q8s+, QTo+, J8s+, JTo, T8s+, 98s",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2s+, Q5o+, J5s+, J8o+, T7s+, T8o+, 97s+, 87s",
+        },
+    },
+    7.0: {
+        "UTG": {
+            "MP": "44+, A8s+, ATo+, KQ",
+            "CO": "44+, A8s+, ATo+, KQ",
+            "BTN": "44+, A8s+, ATo+, KQ",
+            "SB": "33+, A7s+, A5s, A9o+, KJs+, KQo",
+            "BB": "22+, A3s+, A8o+, KTs+, KJo+, QTs+",
+        },
+        "MP": {
+            "CO": "44+, A7s+, A8o+, KJs+, KQo",
+            "BTN": "44+, A7s+, A8o+, KJs+, KQo",
+            "SB": "33+, A4s+, A8o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A7o+, K9s+, KTo+, QTs+, JTs",
+        },
+        "CO": {
+            "BTN": "33+, A3s+, A7o+, KTs+, KJo+, QJs",
+            "SB": "22+, A2s+, A5o+, K9s+, KTo+, QTs+",
+            "BB": "22+, A2+, K8s+, KTo+, Q9s+, QJo, JTs",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K7s+, K9o+, Q9s+, QJo, JTs",
+            "BB": "22+, A2+, K5s+, K9o+, Q8s+, QTo+, J9s+, JTo, T9s",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q2s+, Q6o+, J6s+, J8o+, T7s+, T9o, 97s+",
+        },
+    },
+    7.5: {
+        "UTG": {
+            "MP": "55+, A9s+, ATo+, KQs",
+            "CO": "55+, A9s+, ATo+, KQs",
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "44+, A7s+, A9o+, KJs+, KQo",
+            "BB": "33+, A3s+, A8o+, KTs+, KJo+, QJs",
+        },
+        "MP": {
+            "CO": "44+, A7s+, A9o+, KJs+, KQo",
+            "BTN": "44+, A7s+, A9o+, KJs+, KQo",
+            "SB": "33+, A5s+, A8o+, KTs+, KQo, QJs",
+            "BB": "22+, A2s+, A7o+, KTs+, KJo+, QTs+, JTs",
+        },
+        "CO": {
+            "BTN": "33+, A4s+, A7o+, KTs+, KQo, QJs",
+            "SB": "22+, A2s+, A6o+, KTs+, KJo+, QTs+",
+            "BB": "22+, A2s+, A3o+, K9s+, KTo+, QTs+, QJo, JTs",
+        },
+        "BTN": {
+            "SB": "22+, A2+, K8s+, KTo+, QTs+, QJo, JTs",
+            "BB": "22+, A2+, K6s+, K9o+, Q9s+, QTo+, J9s+, T9s",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q3s+, Q7o+, J7s+, J8o+, T8s+, T9o, 98s",
+        },
+    },
+    8.0: {
+        "UTG": {
+            "MP": "55+, A9s+, ATo+, KQs",
+            "CO": "55+, A9s+, ATo+, KQs",
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "44+, A8s+, ATo+, KJs+, KQo",
+            "BB": "33+, A5s+, A9o+, KTs+, KQo",
+        },
+        "MP": {
+            "CO": "44+, A8s+, A9o+, KJs+, KQo",
+            "BTN": "44+, A8s+, A9o+, KJs+, KQo",
+            "SB": "33+, A7s+, A9o+, KTs+, KQo",
+            "BB": "22+, A3s+, A8o+, KTs+, KJo+, QTs+",
+        },
+        "CO": {
+            "BTN": "33+, A5s+, A8o+, KTs+, KQo",
+            "SB": "22+, A2s+, A7o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A5o+, K9s+, KTo+, QTs+, QJo, JTs",
+        },
+        "BTN": {
+            "SB": "22+, A2s+, A3o+, K9s+, KTo+, QTs+, QJo, JTs",
+            "BB": "22+, A2+, K7s+, K9o+, Q9s+, QTo+, JTs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2+, Q4s+, Q7o+, J7s+, J9o+, T8s+, T9o, 98s",
+        },
+    },
+    8.5: {
+        "UTG": {
+            "MP": "55+, AT+, KQs",
+            "CO": "55+, AT+, KQs",
+            "BTN": "55+, AT+, KQs",
+            "SB": "55+, A9s+, ATo+, KQ",
+            "BB": "44+, A7s+, A9o+, KJs+, KQo",
+        },
+        "MP": {
+            "CO": "44+, A8s+, A9o+, KQs",
+            "BTN": "44+, A8s+, A9o+, KQs",
+            "SB": "44+, A7s+, A9o+, KJs+, KQo",
+            "BB": "33+, A4s+, A8o+, KTs+, KJo+, QJs",
+        },
+        "CO": {
+            "BTN": "33+, A5s+, A8o+, KJs+, KQo",
+            "SB": "33+, A3s+, A7o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A5o+, K9s+, KJo+, QTs+, JTs",
+        },
+        "BTN": {
+            "SB": "22+, A2s+, A4o+, K9s+, KTo+, QTs+, JTs",
+            "BB": "22+, A2+, K7s+, KTo+, Q9s+, QJo, JTs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2s+, K3o+, Q5s+, Q8o+, J7s+, J9o+, T8s+",
+        },
+    },
+    9.0: {
+        "UTG": {
+            "MP": "66+, AT+, KQs",
+            "CO": "66+, AT+, KQs",
+            "BTN": "66+, AT+, KQs",
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "44+, A8s+, ATo+, KJs+, KQo",
+        },
+        "MP": {
+            "CO": "55+, A8s+, ATo+, KQs",
+            "BTN": "55+, A8s+, ATo+, KQs",
+            "SB": "44+, A7s+, A9o+, KJs+, KQo",
+            "BB": "33+, A4s+, A8o+, KTs+, KQo, QJs",
+        },
+        "CO": {
+            "BTN": "44+, A7s+, A8o+, KJs+, KQo",
+            "SB": "33+, A4s+, A7o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A7o+, KTs+, KJo+, QTs+",
+        },
+        "BTN": {
+            "SB": "22+, A2s+, A5o+, K9s+, KTo+, QTs+",
+            "BB": "22+, A2s+, A3o+, K8s+, KTo+, QTs+, QJo, JTs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2s+, K4o+, Q6s+, Q8o+, J8s+, J9o+, T8s+",
+        },
+    },
+    9.5: {
+        "UTG": {
+            "MP": "66+, ATs+, AJo+, KQs",
+            "CO": "66+, ATs+, AJo+, KQs",
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "55+, AT+, KQs",
+            "BB": "55+, A9s+, ATo+, KJs+, KQo",
+        },
+        "MP": {
+            "CO": "55+, A9s+, ATo+, KQs",
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "44+, A8s+, A9o+, KJs+, KQo",
+            "BB": "44+, A5s+, A9o+, KTs+, KQo",
+        },
+        "CO": {
+            "BTN": "44+, A7s+, A8o+, KJs+, KQo",
+            "SB": "33+, A5s+, A8o+, KTs+, KQo, QJs",
+            "BB": "33+, A2s+, A7o+, KTs+, KJo+, QJs",
+        },
+        "BTN": {
+            "SB": "22+, A2s+, A5o+, K9s+, KTo+, QTs+",
+            "BB": "22+, A2s+, A4o+, K9s+, KTo+, QTs+, QJo, JTs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2s+, K5o+, Q6s+, Q8o+, J8s+, J9o+, T9s",
+        },
+    },
+    10.0: {
+        "UTG": {
+            "MP": "66+, ATs+, AJo+, KQs",
+            "CO": "66+, ATs+, AJo+, KQs",
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "55+, A9s+, ATo+, KQs",
+        },
+        "MP": {
+            "CO": "55+, A9s+, ATo+, KQs",
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "44+, A8s+, ATo+, KJs+, KQo",
+            "BB": "44+, A7s+, A9o+, KJs+, KQo",
+        },
+        "CO": {
+            "BTN": "44+, A7s+, A9o+, KJs+, KQo",
+            "SB": "44+, A7s+, A5s, A8o+, KTs+, KQo",
+            "BB": "33+, A3s+, A8o+, KTs+, KJo+, QTs+",
+        },
+        "BTN": {
+            "SB": "33+, A2s+, A6o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A4o+, K9s+, KTo+, QTs+, QJo, JTs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2s+, K5o+, Q7s+, Q9o+, J8s+, JTo, T9s",
+        },
+    },
+    10.5: {
+        "UTG": {
+            "MP": "77+, ATs+, AJo+",
+            "CO": "77+, ATs+, AJo+",
+            "BTN": "77+, ATs+, AJo+",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "55+, ATs+, AJo+, KQs",
+        },
+        "MP": {
+            "CO": "55+, A9s+, ATo+, KQs",
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "55+, A9s+, ATo+, KQ",
+            "BB": "44+, A7s+, ATo+, KJs+, KQo",
+        },
+        "CO": {
+            "BTN": "44+, A8s+, A9o+, KJs+",
+            "SB": "44+, A7s+, A9o+, KJs+, KQo",
+            "BB": "33+, A4s+, A8o+, KTs+, KJo+, QJs",
+        },
+        "BTN": {
+            "SB": "33+, A2s+, A6o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A5o+, K9s+, KTo+, QTs+",
+        },
+        "SB": {
+            "BB": "22+, A2+, K2s+, K6o+, Q7s+, Q9o+, J8s+, JTo, T9s",
+        },
+    },
+    11.0: {
+        "UTG": {
+            "MP": "77+, ATs+, AJo+",
+            "CO": "77+, ATs+, AJo+",
+            "BTN": "77+, ATs+, AJo+",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, ATs+, AJo+, KQs",
+        },
+        "MP": {
+            "CO": "66+, AT+, KQs",
+            "BTN": "66+, AT+, KQs",
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "55+, A8s+, ATo+, KJs+, KQo",
+        },
+        "CO": {
+            "BTN": "55+, A8s+, A9o+, KJs+, KQo",
+            "SB": "44+, A8s+, A9o+, KJs+, KQo",
+            "BB": "33+, A5s+, A8o+, KTs+, KQo, QJs",
+        },
+        "BTN": {
+            "SB": "33+, A3s+, A7o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A5o+, K9s+, KTo+, QTs+",
+        },
+        "SB": {
+            "BB": "22+, A2+, K3s+, K6o+, Q8s+, Q9o+, J9s+, JTo, T9s",
+        },
+    },
+    11.5: {
+        "UTG": {
+            "MP": "77+, ATs+, AQo+",
+            "CO": "77+, ATs+, AQo+",
+            "BTN": "77+, ATs+, AQo+",
+            "SB": "77+, ATs+, AJo+, KQs",
+            "BB": "66+, ATs+, AJo+, KQs",
+        },
+        "MP": {
+            "CO": "66+, ATs+, AJo+, KQs",
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "55+, A8s+, ATo+, KQ",
+        },
+        "CO": {
+            "BTN": "55+, A8s+, ATo+, KJs+, KQo",
+            "SB": "44+, A8s+, A9o+, KJs+, KQo",
+            "BB": "44+, A7s+, A5s, A9o+, KTs+, KQo, QJs",
+        },
+        "BTN": {
+            "SB": "33+, A3s+, A7o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A5o+, KTs+, KJo+, QTs+",
+        },
+        "SB": {
+            "BB": "22+, A2+, K4s+, K7o+, Q8s+, Q9o+, J9s+, JTo, T9s",
+        },
+    },
+    12.0: {
+        "UTG": {
+            "MP": "77+, AJs+, AQo+",
+            "CO": "77+, AJs+, AQo+",
+            "BTN": "77+, AJs+, AQo+",
+            "SB": "77+, ATs+, AJo+, KQs",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "MP": {
+            "CO": "66+, ATs+, AJo+, KQs",
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "66+, AT+, KQs",
+            "BB": "55+, A9s+, ATo+, KQs",
+        },
+        "CO": {
+            "BTN": "55+, A8s+, ATo+, KJs+",
+            "SB": "44+, A8s+, A9o+, KJs+, KQo",
+            "BB": "44+, A7s+, A9o+, KTs+, KQo",
+        },
+        "BTN": {
+            "SB": "33+, A3s+, A7o+, KTs+, KJo+, QJs",
+            "BB": "22+, A2s+, A6o+, KTs+, KJo+, QJs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K4s+, K7o+, Q8s+, QTo+, J9s+, JTo",
+        },
+    },
+    12.5: {
+        "UTG": {
+            "MP": "88+, AJs+, AQo+",
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "77+, ATs+, AJo+",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "MP": {
+            "CO": "66+, ATs+, AJo+, KQs",
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "55+, A9s+, ATo+, KQs",
+        },
+        "CO": {
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "44+, A8s+, ATo+, KJs+, KQo",
+            "BB": "44+, A7s+, A9o+, KJs+, KQo",
+        },
+        "BTN": {
+            "SB": "33+, A4s+, A7o+, KTs+, KJo+, QJs",
+            "BB": "33+, A2s+, A7o+, KTs+, KJo+, QJs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K5s+, K8o+, Q8s+, QTo+, J9s+, JTo",
+        },
+    },
+    13.0: {
+        "UTG": {
+            "MP": "88+, AJs+, AQo+",
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "77+, AJs+, AQo+",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "MP": {
+            "CO": "77+, ATs+, AJo+",
+            "BTN": "77+, ATs+, AJo+",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, AT+, KQs",
+        },
+        "CO": {
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "55+, A8s+, ATo+, KQ",
+            "BB": "44+, A8s+, A9o+, KJs+, KQo",
+        },
+        "BTN": {
+            "SB": "33+, A5s+, A7o+, KTs+, KQo, QJs",
+            "BB": "33+, A3s+, A7o+, KTs+, KJo+, QJs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K5s+, K8o+, Q8s+, QTo+, J9s+",
+        },
+    },
+    13.5: {
+        "UTG": {
+            "MP": "88+, AJs+, AQo+",
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "77+, AJ+",
+        },
+        "MP": {
+            "CO": "77+, AJ+",
+            "BTN": "77+, AJ+",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, ATs+, AJo+, KQs",
+        },
+        "CO": {
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "55+, A8s+, ATo+, KQs",
+            "BB": "44+, A8s+, ATo+, KJs+, KQo",
+        },
+        "BTN": {
+            "SB": "44+, A5s+, A8o+, KTs+, KQo",
+            "BB": "33+, A3s+, A7o+, KTs+, KJo+, QJs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K6s+, K8o+, Q9s+, QTo+, JTs",
+        },
+    },
+    14.0: {
+        "UTG": {
+            "MP": "88+, AJs+, AQo+",
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "77+, AJs+, AQo+",
+        },
+        "MP": {
+            "CO": "77+, AJ+",
+            "BTN": "77+, AJ+",
+            "SB": "77+, ATs+, AJo+, KQs",
+            "BB": "66+, ATs+, AJo+, KQs",
+        },
+        "CO": {
+            "BTN": "55+, A9s+, ATo+, KQs",
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "55+, A8s+, ATo+, KJs+, KQo",
+        },
+        "BTN": {
+            "SB": "44+, A5s+, A8o+, KTs+, KQo",
+            "BB": "33+, A4s+, A8o+, KTs+, KJo+, QJs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K6s+, K9o+, Q9s+, QTo+, JTs",
+        },
+    },
+    14.5: {
+        "UTG": {
+            "MP": "88+, AQ+",
+            "CO": "88+, AQ+",
+            "BTN": "88+, AQ+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "MP": {
+            "CO": "77+, AJs+, AQo+",
+            "BTN": "77+, AJs+, AQo+",
+            "SB": "77+, ATs+, AJo+",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "CO": {
+            "BTN": "66+, AT+, KQs",
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "55+, A8s+, ATo+, KQ",
+        },
+        "BTN": {
+            "SB": "44+, A6s+, A8o+, KJs+, KQo",
+            "BB": "33+, A5s+, A8o+, KTs+, KJo+, QJs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K7s+, K9o+, Q9s+, QTo+, JTs",
+        },
+    },
+    15.0: {
+        "UTG": {
+            "MP": "88+, AQ+",
+            "CO": "88+, AQ+",
+            "BTN": "88+, AQ+",
+            "SB": "88+, AQ+",
+            "BB": "88+, AQ+",
+        },
+        "MP": {
+            "CO": "77+, AJs+, AQo+",
+            "BTN": "77+, AJs+, AQo+",
+            "SB": "77+, ATs+, AJo+",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "CO": {
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "55+, A9s+, ATo+, KQ",
+        },
+        "BTN": {
+            "SB": "44+, A7s+, A8o+, KJs+, KQo",
+            "BB": "44+, A5s+, A8o+, KTs+, KJo+, QJs",
+        },
+        "SB": {
+            "BB": "22+, A2+, K7s+, K9o+, Q9s+, QTo+, JTs",
+        },
+    },
+    15.5: {
+        "UTG": {
+            "MP": "99+, AQ+",
+            "CO": "99+, AQ+",
+            "BTN": "99+, AQ+",
+            "SB": "88+, AQ+",
+            "BB": "88+, AQ+",
+        },
+        "MP": {
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "77+, AJ+",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "CO": {
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "66+, AT+, KQs",
+            "BB": "55+, A9s+, ATo+, KQ",
+        },
+        "BTN": {
+            "SB": "44+, A7s+, A9o+, KJs+, KQo",
+            "BB": "44+, A5s+, A8o+, KTs+, KQo, QJs",
+        },
+        "SB": {
+            "BB": "33+, A2+, K8s+, K9o+, Q9s+, QJo, JTs",
+        },
+    },
+    16.0: {
+        "UTG": {
+            "MP": "99+, AQ+",
+            "CO": "99+, AQ+",
+            "BTN": "99+, AQ+",
+            "SB": "88+, AQ+",
+            "BB": "88+, AQ+",
+        },
+        "MP": {
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "77+, AJs+, AQo+",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "CO": {
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "66+, AT+, KQs",
+            "BB": "55+, A9s+, ATo+, KQs",
+        },
+        "BTN": {
+            "SB": "44+, A7s+, A9o+, KJs+, KQo",
+            "BB": "44+, A5s+, A8o+, KTs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A3o+, K8s+, K9o+, Q9s+, QJo, JTs",
+        },
+    },
+    16.5: {
+        "UTG": {
+            "MP": "99+, AQs+, AKo",
+            "CO": "99+, AQs+, AKo",
+            "BTN": "99+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "88+, AQ+",
+        },
+        "MP": {
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "77+, AJ+",
+        },
+        "CO": {
+            "BTN": "66+, ATs+, AJo+, KQs",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, AT+, KQs",
+        },
+        "BTN": {
+            "SB": "44+, A8s+, A9o+, KJs+, KQo",
+            "BB": "44+, A7s+, A8o+, KTs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A3o+, K8s+, K9o+, QTs+, QJo, JTs",
+        },
+    },
+    17.0: {
+        "UTG": {
+            "MP": "99+, AQs+, AKo",
+            "CO": "99+, AQs+, AKo",
+            "BTN": "99+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "99+, AQ+",
+        },
+        "MP": {
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "77+, AJs+, AQo+",
+        },
+        "CO": {
+            "BTN": "77+, ATs+, AJo+",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, AT+, KQs",
+        },
+        "BTN": {
+            "SB": "44+, A8s+, A9o+, KJs+, KQo",
+            "BB": "44+, A7s+, A9o+, KTs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A4o+, K8s+, K9o+, QTs+, QJo, JTs",
+        },
+    },
+    17.5: {
+        "UTG": {
+            "MP": "99+, AQs+, AKo",
+            "CO": "99+, AQs+, AKo",
+            "BTN": "99+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "99+, AQ+",
+        },
+        "MP": {
+            "CO": "88+, AJs+, AQo+",
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "CO": {
+            "BTN": "77+, ATs+, AJo+",
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, ATs+, AJo+, KQs",
+        },
+        "BTN": {
+            "SB": "55+, A8s+, A9o+, KJs+, KQo",
+            "BB": "44+, A8s+, A9o+, KJs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A4o+, K8s+, KTo+, QTs+, QJo, JTs",
+        },
+    },
+    18.0: {
+        "UTG": {
+            "MP": "TT+, AQs+, AKo",
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "99+, AQ+",
+        },
+        "MP": {
+            "CO": "88+, AQ+",
+            "BTN": "88+, AQ+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "CO": {
+            "BTN": "77+, ATs+, AJo+",
+            "SB": "77+, ATs+, AJo+",
+            "BB": "66+, ATs+, AJo+, KQs",
+        },
+        "BTN": {
+            "SB": "55+, A8s+, ATo+, KJs+, KQo",
+            "BB": "44+, A8s+, A9o+, KJs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A4o+, K9s+, KTo+, QTs+, QJo, JTs",
+        },
+    },
+    18.5: {
+        "UTG": {
+            "MP": "TT+, AQs+, AKo",
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "99+, AQs+, AKo",
+            "BB": "99+, AQ+",
+        },
+        "MP": {
+            "CO": "88+, AQ+",
+            "BTN": "88+, AQ+",
+            "SB": "88+, AQ+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "CO": {
+            "BTN": "77+, AJ+",
+            "SB": "77+, ATs+, AJo+",
+            "BB": "66+, ATs+, AJo+, KQs",
+        },
+        "BTN": {
+            "SB": "55+, A8s+, ATo+, KJs+, KQo",
+            "BB": "55+, A8s+, A9o+, KJs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A5o+, K9s+, KTo+, QTs+, QJo",
+        },
+    },
+    19.0: {
+        "UTG": {
+            "MP": "TT+, AQs+, AKo",
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "99+, AQs+, AKo",
+            "BB": "99+, AQ+",
+        },
+        "MP": {
+            "CO": "99+, AQ+",
+            "BTN": "99+, AQ+",
+            "SB": "88+, AQ+",
+            "BB": "88+, AQ+",
+        },
+        "CO": {
+            "BTN": "77+, AJs+, AQo+",
+            "SB": "77+, ATs+, AJo+",
+            "BB": "66+, ATs+, AJo+, KQs",
+        },
+        "BTN": {
+            "SB": "55+, A8s+, ATo+, KJs+",
+            "BB": "55+, A8s+, A9o+, KJs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A5o+, K9s+, KTo+, QTs+, QJo",
+        },
+    },
+    19.5: {
+        "UTG": {
+            "MP": "TT+, AQs+, AKo",
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "99+, AQ+",
+        },
+        "MP": {
+            "CO": "99+, AQ+",
+            "BTN": "99+, AQ+",
+            "SB": "88+, AQ+",
+            "BB": "88+, AQ+",
+        },
+        "CO": {
+            "BTN": "77+, AJs+, AQo+",
+            "SB": "77+, ATs+, AJo+",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "BTN": {
+            "SB": "55+, A8s+, ATo+, KJs+",
+            "BB": "55+, A8s+, ATo+, KJs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A5o+, K9s+, KTo+, QTs+, QJo",
+        },
+    },
+    20.0: {
+        "UTG": {
+            "MP": "TT+, AQs+, AKo",
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "99+, AQ+",
+            "BTN": "99+, AQ+",
+            "SB": "99+, AQ+",
+            "BB": "88+, AQ+",
+        },
+        "CO": {
+            "BTN": "77+, AJs+, AQo+",
+            "SB": "77+, AJ+",
+            "BB": "77+, ATs+, AJo+",
+        },
+        "BTN": {
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "55+, A8s+, ATo+, KJs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A5o+, K9s+, KTo+, QTs+",
+        },
+    },
+    20.5: {
+        "UTG": {
+            "MP": "TT+, AQs+, AKo",
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "99+, AQs+, AKo",
+            "BTN": "99+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "88+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "77+, AJ+",
+            "BB": "77+, ATs+, AJo+",
+        },
+        "BTN": {
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "55+, A8s+, ATo+, KJs+, KQo",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A5o+, K9s+, KTo+, QTs+",
+        },
+    },
+    21.0: {
+        "UTG": {
+            "MP": "TT+, AQs+, AKo",
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "99+, AQs+, AKo",
+            "BTN": "99+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "99+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "77+, AJs+, AQo+",
+            "BB": "77+, ATs+, AJo+, KQs",
+        },
+        "BTN": {
+            "SB": "55+, A9s+, ATo+, KQs",
+            "BB": "55+, A8s+, ATo+, KQ",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A6o+, K9s+, KTo+, QTs+",
+        },
+    },
+    21.5: {
+        "UTG": {
+            "MP": "TT+, AQs+, AKo",
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "99+, AQs+, AKo",
+            "BTN": "99+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "99+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "77+, AJs+, AQo+",
+            "BB": "77+, ATs+, AJo+",
+        },
+        "BTN": {
+            "SB": "66+, A9s+, ATo+, KQs",
+            "BB": "55+, A8s+, ATo+, KQs",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A7o+, K9s+, KTo+, QTs+",
+        },
+    },
+    22.0: {
+        "UTG": {
+            "MP": "JJ+, AQs+, AKo",
+            "CO": "JJ+, AQs+, AKo",
+            "BTN": "JJ+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "99+, AQs+, AKo",
+            "BTN": "99+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "99+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "77+, AJ+",
+        },
+        "BTN": {
+            "SB": "66+, A9s+, ATo+, KQs",
+            "BB": "55+, A9s+, ATo+, KQs",
+        },
+        "SB": {
+            "BB": "33+, A2s+, A7o+, K9s+, KTo+, QTs+",
+        },
+    },
+    22.5: {
+        "UTG": {
+            "MP": "JJ+, AQs+, AKo",
+            "CO": "JJ+, AQs+, AKo",
+            "BTN": "JJ+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "99+, AQ+",
+            "BB": "99+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "77+, AJ+",
+        },
+        "BTN": {
+            "SB": "66+, A9s+, ATo+, KQs",
+            "BB": "55+, A9s+, ATo+, KQs",
+        },
+        "SB": {
+            "BB": "44+, A2s+, A7o+, KT+, QTs+",
+        },
+    },
+    23.0: {
+        "UTG": {
+            "MP": "JJ+, AK",
+            "CO": "JJ+, AK",
+            "BTN": "JJ+, AK",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "99+, AQs+, AKo",
+            "BB": "99+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "BTN": {
+            "SB": "66+, AT+, KQs",
+            "BB": "66+, A9s+, ATo+, KQs",
+        },
+        "SB": {
+            "BB": "44+, A2s+, A7o+, KT+, QTs+",
+        },
+    },
+    23.5: {
+        "UTG": {
+            "MP": "JJ+, AK",
+            "CO": "JJ+, AK",
+            "BTN": "JJ+, AK",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "99+, AQs+, AKo",
+            "BB": "99+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AJs+, AQo+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "BTN": {
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, A9s+, ATo+, KQs",
+        },
+        "SB": {
+            "BB": "44+, A3s+, A7o+, KTs+, KJo+, QJs",
+        },
+    },
+    24.0: {
+        "UTG": {
+            "MP": "JJ+, AK",
+            "CO": "JJ+, AK",
+            "BTN": "JJ+, AK",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "99+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AQ+",
+            "SB": "88+, AJs+, AQo+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "BTN": {
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, A9s+, ATo+, KQs",
+        },
+        "SB": {
+            "BB": "44+, A3s+, A7o+, KTs+, KJo+, QJs",
+        },
+    },
+    24.5: {
+        "UTG": {
+            "MP": "JJ+, AK",
+            "CO": "JJ+, AK",
+            "BTN": "JJ+, AK",
+            "SB": "JJ+, AK",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "99+, AQ+",
+        },
+        "CO": {
+            "BTN": "88+, AQ+",
+            "SB": "88+, AQ+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "BTN": {
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, AT+, KQs",
+        },
+        "SB": {
+            "BB": "44+, A3s+, A7o+, KTs+, KJo+, QJs",
+        },
+    },
+    25.0: {
+        "UTG": {
+            "MP": "JJ+, AK",
+            "CO": "JJ+, AK",
+            "BTN": "JJ+, AK",
+            "SB": "JJ+, AK",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "MP": {
+            "CO": "TT+, AQs+, AKo",
+            "BTN": "TT+, AQs+, AKo",
+            "SB": "TT+, AQs+, AKo",
+            "BB": "TT+, AQs+, AKo",
+        },
+        "CO": {
+            "BTN": "99+, AQ+",
+            "SB": "88+, AQ+",
+            "BB": "88+, AJs+, AQo+",
+        },
+        "BTN": {
+            "SB": "66+, ATs+, AJo+, KQs",
+            "BB": "66+, AT+, KQs",
+        },
+        "SB": {
+            "BB": "44+, A4s+, A7o+, KTs+, KJo+, QJs",
+        },
+    },
+}
+
+PUSH_RANGES = {
+    stack: {position: Range(notation) for position, notation in ranges.items()}
+    for stack, ranges in _PUSH.items()
+}
+
+CALL_RANGES = {
+    stack: {
+        shover: {caller: Range(notation) for caller, notation in callers.items()}
+        for shover, callers in ranges.items()
+    }
+    for stack, ranges in _CALL.items()
+}
@@ -0,0 +1,236 @@
+"""
+Push/fold equilibrium by fictitious play over the 169 preflop classes.
+
+A spot is a six-handed table (POSITIONS) folded to `shover`, every
+player starting the hand with the same stack of S big blinds and the
+blinds at 0.5 / 1.  The shover goes all-in or folds; each player behind,
+in turn, calls or folds.  Once somebody calls the others are assumed to
+fold (no overcalls), so every showdown is heads up and can be priced from
+the preflop class equity matrix (preflop_equity.py).
+
+Card removal is kept through the disjoint combo pair counts between
+classes (combos.class_pair_counts): against a range R, class x meets
+class y in proportion to R[y] * n(x, y).
+
+Values are in big blinds, relative to folding:
+
+    everyone folds      D = 1.5 (the blinds)
+    called by j         eq * (2S + D - b_shover - b_j) - (S - b_shover)
+    j calls             eq_j * (same pot) - (S - b_j)
+
+where b is the blind already posted.  Fictitious play keeps the average
+strategy of every player and moves it toward the best response against
+the others' averages.  Iteration t is weighted by t (step 2 / (t + 2))
+and the callers respond to the shove range of the same iteration; both
+speed convergence up by orders of magnitude over plain 1 / t averaging.
+All stacks are solved at once as rows of one array.
+"""
+import textwrap
+from pathlib import Path
+
+import numpy as np
+
+from .combos import CLASS_COMBO_COUNT, CLASS_NAMES, class_pair_counts
+from .preflop_equity import DEFAULT_PATH, load_preflop_equity
+from .ranges import Range
+
+POSITIONS = ("UTG", "MP", "CO", "BTN", "SB", "BB")
+BLINDS = {"SB": 0.5, "BB": 1.0}
+DEAD_MONEY = sum(BLINDS.values())
+
+# Every stack from 1 to 25 BB in 0.5 BB steps
+STACKS = tuple(x / 2 for x in range(2, 51))
+
+# Chart entries: classes played at least this often in the average strategy
+CHART_THRESHOLD = 0.5
+
+_CLASS_WEIGHT = CLASS_COMBO_COUNT / CLASS_COMBO_COUNT.sum()
+
+
+def class_equity_matrix(path=DEFAULT_PATH):
+    """(169, 169) class equity from the precomputed table."""
+    table = load_preflop_equity(path)
+    if table is None:
+        raise FileNotFoundError(
+            f"No preflop equity table at {path}; run python manage.py build_preflop_equity"
+        )
+    return np.asarray(table["class"], dtype=np.float64)
+
+
+def versus_range(strategy, pairs, pair_equity):
+    """
+    Against a (n_stacks, 169) range: the chance each class meets it and
+    its equity when it does, both (n_stacks, 169).
+    """
+    met = strategy @ pairs.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        equity = np.where(met > 0, (strategy @ pair_equity.T) / met, 0.0)
+    return met / pairs.sum(axis=1), equity
+
+
+def _shove_ev(shover, callers, stacks, calls, pairs, pair_equity):
+    """(n_stacks, 169) value of shoving each class against the call ranges."""
+    s = stacks[:, None]
+    b = BLINDS.get(shover, 0.0)
+    ev = np.zeros((stacks.size, pairs.shape[0]))
+    reach = np.ones_like(ev)
+    for caller in callers:
+        p, eq = versus_range(calls[caller], pairs, pair_equity)
+        pot = 2 * s + DEAD_MONEY - b - BLINDS.get(caller, 0.0)
+        ev += reach * p * (eq * pot - (s - b))
+        reach *= 1 - p
+    return ev + reach * DEAD_MONEY
+
+
+def _call_ev(shover, caller, stacks, shove, pairs, pair_equity):
+    """(n_stacks, 169) value of calling with each class against the shove range."""
+    s = stacks[:, None]
+    _, eq = versus_range(shove, pairs, pair_equity)
+    pot = 2 * s + DEAD_MONEY - BLINDS.get(shover, 0.0) - BLINDS.get(caller, 0.0)
+    return eq * pot - (s - BLINDS.get(caller, 0.0))
+
+
+def _gain(ev, strategy):
+    """Per-stack gain of the best response over `strategy` (bb per hand)."""
+    return (np.maximum(ev, 0.0) - strategy * ev) @ _CLASS_WEIGHT
+
+
+def solve_pushfold(shover, stacks=STACKS, equity=None, iterations=2000, tol=1e-4):
+    """
+    Equilibrium of the spot folded to `shover` for every stack in `stacks`.
+
+    Returns a dict with
+        stacks          (n,) the stacks
+        shove           (n, 169) shove frequency of every class
+        call            {caller: (n, 169) call frequency}
+        shove_ev        (n, 169) value of shoving against the call ranges
+        exploitability  (n,) largest gain any player gets by deviating
+        iterations      fictitious play iterations run
+    Stops early once every stack is within `tol` big blinds.
+    """
+    if shover not in POSITIONS[:-1]:
+        raise ValueError(f"Unknown shove position: {shover!r}")
+    stacks = np.asarray(stacks, dtype=np.float64)
+    equity = class_equity_matrix() if equity is None else np.asarray(equity, dtype=np.float64)
+    pairs = class_pair_counts()
+    pair_equity = pairs * equity
+    callers = POSITIONS[POSITIONS.index(shover) + 1:]
+
+    shape = (stacks.size, len(CLASS_NAMES))
+    shove = np.full(shape, 0.5)
+    calls = {c: np.full(shape, 0.5) for c in callers}
+
+    for t in range(1, iterations + 1):
+        shove_ev = _shove_ev(shover, callers, stacks, calls, pairs, pair_equity)
+        call_evs = {c: _call_ev(shover, c, stacks, shove, pairs, pair_equity) for c in callers}
+
+        exploitability = _gain(shove_ev, shove)
+        for c in callers:
+            exploitability = np.maximum(exploitability, _gain(call_evs[c], calls[c]))
+        if exploitability.max() < tol:
+            break
+
+        step = 2 / (t + 2)
+        shove += step * ((shove_ev > 0) - shove)
+        for c in callers:
+            response = _call_ev(shover, c, stacks, shove, pairs, pair_equity) > 0
+            calls[c] += step * (response - calls[c])
+
+    return {
+        "stacks": stacks,
+        "shove": shove,
+        "call": calls,
+        "shove_ev": shove_ev,
+        "exploitability": exploitability,
+        "iterations": t,
+    }
+
+
+def chart_range(frequencies):
+    """Range of the classes played at least CHART_THRESHOLD of the time."""
+    return Range.from_classes(frequencies >= CHART_THRESHOLD)
+
+
+def solve_charts(stacks=STACKS, equity=None, iterations=2000, tol=1e-4):
+    """
+    Push and call charts for every position and stack:
+        push[stack][position]            shove range
+        call[stack][shover][caller]      call range against that shove
+    """
+    equity = class_equity_matrix() if equity is None else equity
+    push = {float(s): {} for s in stacks}
+    call = {float(s): {} for s in stacks}
+    for shover in POSITIONS[:-1]:
+        solved = solve_pushfold(shover, stacks, equity, iterations, tol)
+        for i, s in enumerate(solved["stacks"].tolist()):
+            push[s][shover] = chart_range(solved["shove"][i])
+            call[s][shover] = {c: chart_range(f[i]) for c, f in solved["call"].items()}
+    return push, call
+
+
+CHARTS_PATH = Path(__file__).resolve().with_name("pushfold_charts.py")
+
+_CHARTS_HEADER = '''"""
+Push/fold charts: shove and call ranges for a six-handed table at every
+stack from 1 to 25 BB in 0.5 BB steps.
+
+    PUSH_RANGES[stack][position]            shove range when folded to position
+    CALL_RANGES[stack][shover][caller]      call range against that shove
+
+Generated by `python manage.py build_pushfold_charts` from the equilibrium
+in pushfold_nash.py; do not edit by hand.
+"""
+from .ranges import Range
+'''
+
+_CHARTS_FOOTER = '''
+PUSH_RANGES = {
+    stack: {position: Range(notation) for position, notation in ranges.items()}
+    for stack, ranges in _PUSH.items()
+}
+
+CALL_RANGES = {
+    stack: {
+        shover: {caller: Range(notation) for caller, notation in callers.items()}
+        for shover, callers in ranges.items()
+    }
+    for stack, ranges in _CALL.items()
+}
+'''
+
+
+def _range_literal(rng, indent):
+    """Range notation, wrapped into string pieces."""
+    text = rng.notation()
+    lines = textwrap.wrap(text, 96 - len(indent)) or [""]
+    if len(lines) == 1:
+        return f'"{lines[0]}"'
+    pieces = [f'{indent}    "{line} "' for line in lines[:-1]] + [f'{indent}    "{lines[-1]}"']
+    return "(\n" + "\n".join(pieces) + f"\n{indent})"
+
+
+def format_charts(push, call):
+    """Source of the charts module for solve_charts() output."""
+    out = [_CHARTS_HEADER, "_PUSH = {"]
+    for stack, ranges in push.items():
+        out.append(f"    {stack!r}: {{")
+        for position, rng in ranges.items():
+            out.append(f'        "{position}": {_range_literal(rng, " " * 8)},')
+        out.append("    },")
+    out += ["}", "", "_CALL = {"]
+    for stack, ranges in call.items():
+        out.append(f"    {stack!r}: {{")
+        for shover, callers in ranges.items():
+            out.append(f'        "{shover}": {{')
+            for caller, rng in callers.items():
+                out.append(f'            "{caller}": {_range_literal(rng, " " * 12)},')
+            out.append("        },")
+        out.append("    },")
+    out.append("}")
+    return "\n".join(out) + "\n" + _CHARTS_FOOTER
+
+
+def write_charts(path=CHARTS_PATH, **solve_options):
+    """Solve every chart and write the charts module to `path`."""
+    push, call = solve_charts(**solve_options)
+    Path(path).write_text(format_charts(push, call))
@@ -0,0 +1,125 @@
+"""
+Range-vs-range equity on a flop, turn or river board.
+
+Ranges are expanded into weighted 1326-combo vectors (ranges.Range).
+Combos blocked by the board or dead cards get weight 0.  For every
+remaining runout the strengths of all combos are computed once with the
+batch evaluator, and win and valid-pair counts are accumulated for every
+(combo_a, combo_b) pair that does not share a card with each other or the
+runout.  The combo-vs-combo equity matrix is wins / counts, and the
+overall equity is the weighted matrix product
+
+    equity = (w_a . W . w_b) / (w_a . N . w_b)
+
+Board-independent work (range expansion, combo overlap) is cached, and so
+is the strength vector of every complete 5-card board, keyed on its
+suit-canonical form (isomorphism.py).  Moving to another board only
+evaluates runouts whose suit class has not been seen yet.
+"""
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+from .batch_eval import evaluate_batch
+from .cards import card_mask, cards_from_strs, deck_cards, find_duplicate
+from .combos import (
+    COMBO_CARDS,
+    N_COMBOS,
+    blocked_combos,
+    combo_overlap,
+    combo_suit_perm,
+)
+from .isomorphism import canonicalize
+from .ranges import Range
+
+# Complete boards whose combo strengths are kept (one river card per entry
+# for a turn, C(47, 2) = 1081 for a flop).
+BOARD_CACHE_SIZE = 8192
+
+
+def range_weights(spec):
+    """
+    Expand a range into a read-only (1326,) weight vector.
+    spec: anything ranges.Range accepts -- a Range, notation such as
+    "QQ+, AKs", chart sets ({"AK", "TT"}), a dict token -> weight or a
+    combo array.
+    """
+    return Range(spec).weights
+
+
+@lru_cache(maxsize=BOARD_CACHE_SIZE)
+def canonical_board_strengths(board):
+    """
+    (1326,) strengths of every combo on a complete canonical board (sorted
+    tuple of 5 card indices); -1 for combos that use a board card.
+    """
+    out = np.full(N_COMBOS, -1, dtype=np.int32)
+    free = np.flatnonzero(~blocked_combos(board))
+    rows = np.hstack([COMBO_CARDS[free], np.broadcast_to(np.array(board, dtype=np.int8), (free.size, 5))])
+    out[free] = evaluate_batch(rows)
+    out.setflags(write=False)
+    return out
+
+
+def board_strengths(board):
+    """
+    (1326,) combo strengths on a complete board (5 card indices).
+    Suit-isomorphic boards share one evaluation: the board is mapped to
+    its canonical form and the cached strengths are permuted back.
+    """
+    (canonical,), suit_map = canonicalize(board)
+    strengths = canonical_board_strengths(tuple(canonical))
+    return strengths[combo_suit_perm(tuple(suit_map))]
+
+
+def range_vs_range(range_a, range_b, board, dead=()):
+    """
+    Equity of range_a against range_b on a 3-5 card board.
+
+    Returns a dict with
+        equity        overall equity of range_a
+        combos_a/b    combo indices with non-zero weight
+        weights_a/b   their weights
+        matrix        combo-vs-combo equity (len(combos_a), len(combos_b))
+        counts        runouts behind each matrix entry (0 = cards overlap)
+        combo_equity  equity of each combo in range_a vs range_b
+    """
+    board = cards_from_strs(board)
+    dead = cards_from_strs(dead)
+    if not 3 <= len(board) <= 5:
+        raise ValueError("Range equity needs a flop, turn or river board")
+    if find_duplicate(board + dead) is not None:
+        raise ValueError("Duplicate board/dead card")
+
+    blocked = blocked_combos(board + dead)
+    wa = np.where(blocked, 0.0, range_weights(range_a))
+    wb = np.where(blocked, 0.0, range_weights(range_b))
+    ia, ib = np.flatnonzero(wa), np.flatnonzero(wb)
+    pair_ok = ~combo_overlap()[np.ix_(ia, ib)]
+
+    wins = np.zeros((ia.size, ib.size))
+    counts = np.zeros((ia.size, ib.size))
+    deck = deck_cards(card_mask(board + dead))
+    for runout in combinations(deck, 5 - len(board)):
+        strengths = board_strengths(board + list(runout))
+        sa, sb = strengths[ia], strengths[ib]
+        ok = pair_ok & (sa >= 0)[:, None] & (sb >= 0)[None, :]
+        wins += ok * ((sa[:, None] > sb[None, :]) + 0.5 * (sa[:, None] == sb[None, :]))
+        counts += ok
+
+    wa, wb = wa[ia], wb[ib]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        matrix = np.where(counts > 0, wins / counts, 0.0)
+        combo_equity = (wins @ wb) / (counts @ wb)
+    total = wa @ counts @ wb
+    return {
+        "equity": float(wa @ wins @ wb / total) if total else 0.0,
+        "combos_a": ia,
+        "combos_b": ib,
+        "weights_a": wa,
+        "weights_b": wb,
+        "matrix": matrix,
+        "counts": counts,
+        "combo_equity": combo_equity,
+    }
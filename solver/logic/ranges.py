@@ -1,4 +1,343 @@
+"""
+Preflop ranges as fixed (1326,) combo weight vectors.
+
+A Range is built from standard range notation,
+
+    "QQ+, ATs+, KQo, 76s-54s, AK:0.5, AsKs"
+
+(pairs, suited "s" / offsuit "o" / both, "+" for higher pairs or kickers,
+"-" for spans, ":w" for a weight, four-character exact combos), from a
+collection of such tokens (old chart sets like {"AK", "TT"}), from a
+{token: weight} dict, or from a (1326,) combo or (169,) class array.
+Union, intersection, difference and blocker removal are elementwise
+array operations, membership is one array read, and sampling draws
+combos in proportion to their weights.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .cards import CARD_INDEX, RANK_ORDER, SUIT_ORDER, cards_from_strs
+from .combos import (
+    CLASS_COMBO_COUNT,
+    CLASS_INDEX,
+    CLASS_NAMES,
+    COMBO_CLASS,
+    COMBO_INDEX,
+    N_CLASSES,
+    N_COMBOS,
+    blocked_combos,
+    combo_class_matrix,
+    combo_str,
+)
+
+
+def _class_combos(name):
+    return np.flatnonzero(COMBO_CLASS == CLASS_INDEX[name])
+
+
+def _shape(token):
+    """(high rank, low rank, suffix) of "AKs" / "AKo" / "AK" / "TT"."""
+    if len(token) not in (2, 3) or token[0] not in RANK_ORDER or token[1] not in RANK_ORDER:
+        raise ValueError(f"Unknown range token: {token!r}")
+    hi, lo = sorted((RANK_ORDER.index(token[0]), RANK_ORDER.index(token[1])), reverse=True)
+    suffix = token[2:]
+    if suffix not in ("", "s", "o") or (hi == lo and suffix):
+        raise ValueError(f"Unknown range token: {token!r}")
+    return hi, lo, suffix
+
+
+def _class_names(hi, lo, suffix):
+    if hi == lo:
+        return [RANK_ORDER[hi] * 2]
+    base = RANK_ORDER[hi] + RANK_ORDER[lo]
+    return [base + s for s in (suffix or "so")]
+
+
+def token_combos(token):
+    """
+    Combo indices of one notation token (no weight): "TT", "AKs", "AK",
+    "TT+", "ATs+", "99-66", "K9s-K6s", "76s-54s" or an exact combo
+    "AsKs".
+    """
+    if len(token) == 4 and token[1].lower() in SUIT_ORDER and token[3].lower() in SUIT_ORDER:
+        try:
+            a, b = CARD_INDEX[token[:2]], CARD_INDEX[token[2:]]
+        except KeyError:
+            raise ValueError(f"Unknown range token: {token!r}") from None
+        if a == b:
+            raise ValueError(f"Unknown range token: {token!r}")
+        return [int(COMBO_INDEX[a, b])]
+
+    token = token[:2].upper() + token[2:].lower()
+    if token.endswith("+"):
+        hi, lo, suffix = _shape(token[:-1])
+        if hi == lo:
+            names = [n for r in range(lo, 13) for n in _class_names(r, r, "")]
+        else:
+            names = [n for r in range(lo, hi) for n in _class_names(hi, r, suffix)]
+    elif "-" in token:
+        first, last = token.split("-")
+        (hi1, lo1, s1), (hi2, lo2, s2) = _shape(first), _shape(last[:2].upper() + last[2:].lower())
+        if hi1 == lo1 and hi2 == lo2:
+            names = [n for r in range(min(lo1, lo2), max(lo1, lo2) + 1) for n in _class_names(r, r, "")]
+        elif hi1 == hi2 and s1 == s2 and hi1 != lo1 and hi2 != lo2:
+            names = [n for r in range(min(lo1, lo2), max(lo1, lo2) + 1) for n in _class_names(hi1, r, s1)]
+        elif s1 == s2 and hi1 - lo1 == hi2 - lo2 and hi1 != lo1:
+            # Connector spans like 76s-54s: same gap, both ranks step down
+            gap = hi1 - lo1
+            names = [n for r in range(min(lo1, lo2), max(lo1, lo2) + 1) for n in _class_names(r + gap, r, s1)]
+        else:
+            raise ValueError(f"Unknown range token: {token!r}")
+    else:
+        names = _class_names(*_shape(token))
+    return np.concatenate([_class_combos(n) for n in names]).tolist()
+
+
+@lru_cache(maxsize=512)
+def _parse(notation):
+    weights = np.zeros(N_COMBOS)
+    for part in notation.replace(";", ",").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        token, _, weight = part.partition(":")
+        weights[token_combos(token.strip())] = float(weight) if weight else 1.0
+    weights.setflags(write=False)
+    return weights
+
+
+@lru_cache(maxsize=256)
+def _weights_from_items(items):
+    weights = np.zeros(N_COMBOS)
+    for token, weight in items:
+        weights[token_combos(token)] = weight
+    weights.setflags(write=False)
+    return weights
+
+
+def _spec_weights(spec):
+    if spec is None:
+        return np.zeros(N_COMBOS)
+    if isinstance(spec, Range):
+        return spec.weights
+    if isinstance(spec, str):
+        return _parse(spec)
+    if isinstance(spec, np.ndarray):
+        if spec.shape == (N_CLASSES,):
+            return spec[COMBO_CLASS].astype(np.float64)
+        if spec.shape != (N_COMBOS,):
+            raise ValueError(f"Range arrays have {N_COMBOS} combos or {N_CLASSES} classes, not {spec.shape}")
+        return spec.astype(np.float64)
+    items = spec.items() if isinstance(spec, dict) else ((token, 1.0) for token in spec)
+    return _weights_from_items(tuple(sorted(items)))
+
+
+class Range:
+    """A weighted preflop range; see the module docstring for the inputs."""
+
+    __slots__ = ("_weights", "_classes")
+
+    def __init__(self, spec=None):
+        weights = _spec_weights(spec)
+        if not weights.flags.writeable:
+            self._weights = weights
+        else:
+            self._weights = np.array(weights, dtype=np.float64)
+            self._weights.setflags(write=False)
+        self._classes = None
+
+    @classmethod
+    def from_classes(cls, class_weights):
+        """Range from a (169,) array of class weights."""
+        return cls(np.asarray(class_weights, dtype=np.float64))
+
+    @property
+    def weights(self):
+        """Read-only (1326,) combo weights."""
+        return self._weights
+
+    @property
+    def class_weights(self):
+        """(169,) mean combo weight of every class."""
+        if self._classes is None:
+            classes = self._weights @ combo_class_matrix() / CLASS_COMBO_COUNT
+            classes.setflags(write=False)
+            self._classes = classes
+        return self._classes
+
+    @property
+    def combos(self):
+        """Combo indices with non-zero weight."""
+        return np.flatnonzero(self._weights)
+
+    @property
+    def combo_count(self):
+        """Weighted number of combos."""
+        return float(self._weights.sum())
+
+    @property
+    def fraction(self):
+        """Share of all 1326 starting hands."""
+        return self.combo_count / N_COMBOS
+
+    def weight(self, hand):
+        """Weight of a class name ("AKs") or a combo ("AsKd" / ["As", "Kd"])."""
+        if isinstance(hand, str) and hand in CLASS_INDEX:
+            return float(self.class_weights[CLASS_INDEX[hand]])
+        if isinstance(hand, str):
+            hand = (hand[:2], hand[2:])
+        a, b = cards_from_strs(hand)
+        return float(self._weights[COMBO_INDEX[a, b]])
+
+    def __contains__(self, hand):
+        try:
+            return self.weight(hand) > 0
+        except (ValueError, KeyError):
+            return False
+
+    def without(self, dead_cards):
+        """The range with every combo that uses a dead card removed."""
+        dead = [CARD_INDEX[c] if isinstance(c, str) else c for c in dead_cards]
+        return Range(np.where(blocked_combos(dead), 0.0, self._weights))
+
+    def scale(self, factor):
+        return Range(self._weights * factor)
+
+    def __or__(self, other):
+        return Range(np.maximum(self._weights, Range(other).weights))
+
+    def __and__(self, other):
+        return Range(np.minimum(self._weights, Range(other).weights))
+
+    def __sub__(self, other):
+        return Range(np.where(Range(other).weights > 0, 0.0, self._weights))
+
+    __ror__ = __or__
+    __rand__ = __and__
+
+    def sample(self, size=None, dead=(), rng=None):
+        """
+        Combo strings drawn in proportion to their weights (one string
+        when `size` is None), skipping combos blocked by `dead`.
+        """
+        weights = self.without(dead).weights if dead else self._weights
+        total = weights.sum()
+        if total <= 0:
+            raise ValueError("Cannot sample from an empty range")
+        rng = np.random.default_rng() if rng is None else rng
+        picks = rng.choice(N_COMBOS, size=size, p=weights / total)
+        if size is None:
+            return combo_str(int(picks))
+        return [combo_str(int(i)) for i in picks]
+
+    def notation(self):
+        """Shortest standard notation for the range (see _notation)."""
+        return _notation(self)
+
+    def __len__(self):
+        return int(np.count_nonzero(self._weights))
+
+    def __bool__(self):
+        return bool(self._weights.any())
+
+    def __eq__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+        return np.array_equal(self._weights, other._weights)
+
+    def __hash__(self):
+        return hash(self._weights.tobytes())
+
+    def __str__(self):
+        return self.notation()
+
+    def __repr__(self):
+        return f"Range({self.notation()!r})"
+
+
+def _weight_suffix(weight):
+    return "" if weight == 1 else f":{weight:g}"
+
+
+def _runs(ranks):
+    """Consecutive runs of a descending list of rank ints."""
+    runs = []
+    for r in ranks:
+        if runs and runs[-1][-1] == r + 1:
+            runs[-1].append(r)
+        else:
+            runs.append([r])
+    return runs
+
+
+def _run_text(name, run, top):
+    if run[0] == top and len(run) > 1:
+        return name(run[-1]) + "+"
+    if len(run) == 1:
+        return name(run[0])
+    return name(run[0]) + "-" + name(run[-1])
+
+
+def _runs_by_weight(uniform, name, kickers):
+    """{weight: [runs]} of the uniform classes name(r) for r in kickers."""
+    by_weight = {}
+    for r in kickers:
+        if name(r) in uniform:
+            by_weight.setdefault(uniform[name(r)], []).append(r)
+    return {w: [tuple(run) for run in _runs(ranks)] for w, ranks in by_weight.items()}
+
+
+def _notation(rng):
+    """
+    Notation in chart order: pairs, then hands by high card. A run held
+    both suited and offsuit at one weight is written without a suffix.
+    Classes whose combos do not share one weight are written out as exact
+    combos.
+    """
+    weights = rng.weights
+    uniform = {}
+    exact = []
+    for i, name in enumerate(CLASS_NAMES):
+        values = weights[COMBO_CLASS == i]
+        if values[0] and (values == values[0]).all():
+            uniform[name] = float(values[0])
+        elif values.any():
+            exact += [(int(c), float(weights[c])) for c in np.flatnonzero((COMBO_CLASS == i) & (weights > 0))]
+
+    parts = []
+    pairs = _runs_by_weight(uniform, lambda r: RANK_ORDER[r] * 2, range(12, -1, -1))
+    for weight, runs in pairs.items():
+        parts += [_run_text(lambda r: RANK_ORDER[r] * 2, run, 12) + _weight_suffix(weight) for run in runs]
+
+    for hi in range(12, 0, -1):
+        def namer(suffix, hi=hi):
+            return lambda r: RANK_ORDER[hi] + RANK_ORDER[r] + suffix
+
+        kickers = range(hi - 1, -1, -1)
+        suited = _runs_by_weight(uniform, namer("s"), kickers)
+        offsuit = _runs_by_weight(uniform, namer("o"), kickers)
+        for suffix, runs_by_weight in (("s", suited), ("o", offsuit)):
+            other = offsuit if suffix == "s" else suited
+            for weight, runs in runs_by_weight.items():
+                for run in runs:
+                    both = run in other.get(weight, ())
+                    if both and suffix == "o":
+                        continue
+                    text = _run_text(namer("" if both else suffix), run, hi - 1)
+                    parts.append(text + _weight_suffix(weight))
+    parts += [combo_str(c) + _weight_suffix(w) for c, w in exact]
+    return ", ".join(parts)
+
+
 def get_preflop_recommendation(position, action, hand, stack):
-    # Placeholder: later you can plug in your real charts / logic here.
-    return f"Placeholder recommendation for {hand} at {stack}BB from {position} after {action}."
+    """
+    Push/fold recommendation from the solved charts (pushfold.py).
+    `action` is "open" when folded to `position`, or "vs <position>"
+    when facing that position's shove.
+    """
+    from .pushfold import pushfold_decision
 
+    words = (action or "").split()
+    vs = words[1].upper() if len(words) > 1 and words[0].lower() == "vs" else None
+    return pushfold_decision(position, hand, stack, vs=vs)
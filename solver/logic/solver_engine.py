@@ -1,4 +1,23 @@
+import numpy as np
+
+from . import mccfr
+from .cards import cards_from_strs
+from .cfr import solve_river, strategy_report
+from .combos import blocked_combos, combo_str
+from .game_tree import PLAYER_NAMES, BetConfig, build_tree
 from .hand_evaluator import evaluate_hand
+from .range_equity import range_weights
+
+# Tree used when the payload does not configure one
+DEFAULT_BET_SIZES = (0.5, 1.0)
+DEFAULT_RAISE_SIZES = (1.0,)
+
+# "cfr": full CFR+ on a river board; "mccfr": sampled runouts from a flop
+# or turn board (mccfr.py), the default for those boards
+SOLVER_MODES = ("cfr", "mccfr")
+
+# Spots whose regret tables would need more than this are refused
+MAX_TABLE_BYTES = 2 << 30
 
 
 def parse_cards(text):
@@ -14,6 +33,25 @@ def parse_cards(text):
 
 
 def run_solver(payload):
+    """
+    Evaluate "hand" on "board" and, when the payload has "oop_range" and
+    "ip_range" (range notation), solve the spot from the board's street:
+
+        mode                        "cfr" (river boards) or "mccfr" (flop
+                                    and turn boards, the default there)
+        pot, stack                  chips (default 10 / 100)
+        bet_sizes, raise_sizes      pot fractions (see game_tree.BetConfig)
+        max_raises                  raises after the first bet (default 2)
+        all_in, all_in_threshold    shove option and all-in cut-off
+        streets                     optional list of per-street dicts with
+                                    the keys above, overriding them
+        tree_only                   only report the tree's size (nodes,
+                                    tree and table bytes) without solving
+        iterations, target          CFR+ limits; target is exploitability
+                                    as a share of the pot (default 0.5%)
+        iterations, processes       MCCFR runouts to deal (default 2000)
+                                    and worker processes (default: all cores)
+    """
     hand_text = payload.get("hand", "")
     board_text = payload.get("board", "")
 
@@ -21,9 +59,100 @@ def run_solver(payload):
     board_cards = parse_cards(board_text)
     all_cards = hand_cards + board_cards
 
-    eval_result = evaluate_hand(all_cards)
+    result = {"cards": all_cards}
+    if hand_cards:
+        result["evaluation"] = evaluate_hand(all_cards)
+    if "oop_range" in payload and "ip_range" in payload:
+        result["solution"] = solve_spot(payload, board_cards)
+    return result
+
+
+def bet_configs(payload, streets):
+    """One BetConfig per street from the payload (see run_solver)."""
+    defaults = {"bet_sizes": DEFAULT_BET_SIZES, "raise_sizes": DEFAULT_RAISE_SIZES, **payload}
+    per_street = payload.get("streets")
+    if per_street is None:
+        return [BetConfig.from_dict(defaults)] * streets
+    if len(per_street) != streets:
+        raise ValueError(f"This board needs bet sizes for {streets} streets, got {len(per_street)}")
+    return [BetConfig.from_dict({**defaults, **options}) for options in per_street]
+
+
+def tree_footprint(tree, payload, board_cards, mode):
+    """
+    GameTree.footprint() for the spot: hands left after the board, and
+    for MCCFR the runouts that can get tables within the iterations.
+    """
+    blocked = blocked_combos(cards_from_strs(board_cards))
+    hands = [int(np.count_nonzero(range_weights(payload[k]) * ~blocked)) for k in ("oop_range", "ip_range")]
+    if mode == "cfr":
+        return tree.footprint(hands)
+    iterations = int(payload.get("iterations", 2000))
+    deck = 52 - len(board_cards)
+    runouts = [1]
+    for street in range(1, 6 - len(board_cards)):
+        runouts.append(min(iterations, runouts[-1] * (deck - street + 1)))
+    return tree.footprint(hands, runouts, itemsize=mccfr.TABLE_DTYPE().itemsize)
+
+
+def solver_mode(payload, board_cards):
+    """The payload's solver mode, by default cfr on the river and mccfr before."""
+    mode = payload.get("mode") or ("cfr" if len(board_cards) == 5 else "mccfr")
+    if mode not in SOLVER_MODES:
+        raise ValueError(f"Unknown solver mode: {mode!r}")
+    return mode
+
 
+def solve_spot(payload, board_cards):
+    mode = solver_mode(payload, board_cards)
+    streets = 6 - len(board_cards)
+    tree = build_tree(
+        float(payload.get("pot", 10)),
+        float(payload.get("stack", 100)),
+        streets=streets,
+        config=bet_configs(payload, streets),
+    )
+    footprint = tree_footprint(tree, payload, board_cards, mode)
+    if payload.get("tree_only"):
+        return {"mode": mode, "tree": footprint}
+    if footprint["table_bytes"] > MAX_TABLE_BYTES:
+        raise ValueError(
+            f"Solving this spot needs about {footprint['table_bytes'] >> 20} MB of tables "
+            f"({footprint['nodes']} nodes); the limit is {MAX_TABLE_BYTES >> 20} MB. "
+            "Use fewer bet sizes, narrower ranges or fewer iterations."
+        )
+    if mode == "cfr":
+        solved = solve_river(
+            tree,
+            board_cards,
+            payload["oop_range"],
+            payload["ip_range"],
+            iterations=int(payload.get("iterations", 1000)),
+            target=float(payload.get("target", 0.005)),
+        )
+        nodes = strategy_report(solved)
+    else:
+        solved = mccfr.solve_sampled(
+            tree,
+            board_cards,
+            payload["oop_range"],
+            payload["ip_range"],
+            iterations=int(payload.get("iterations", 2000)),
+            processes=payload.get("processes"),
+        )
+        nodes = mccfr.strategy_report(solved)
     return {
-        "cards": all_cards,
-        "evaluation": eval_result,
+        "mode": mode,
+        "tree": footprint,
+        "ev": dict(zip(PLAYER_NAMES, solved["ev"])),
+        "exploitability": solved["exploitability"],
+        "exploitability_pct": solved["exploitability_pct"],
+        # False for MCCFR's estimate from a sample of the runouts
+        "exact": solved.get("exact", True),
+        "iterations": solved["iterations"],
+        "nodes": nodes,
+        "combo_ev": {
+            name: {combo_str(int(c)): float(ev) for c, ev in zip(solved["hands"][p], solved["combo_ev"][p])}
+            for p, name in enumerate(PLAYER_NAMES)
+        },
     }
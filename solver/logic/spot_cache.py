@@ -0,0 +1,217 @@
+"""
+Bounded in-process LRU cache for per-spot results.
+
+A wrapped function declares how its result maps between suits with a
+restore(result, relabel) function that relabels its card fields (see
+Relabel).  It is then called with the caller's cards relabelled by the
+spot's canonical suit map (isomorphism.py), in the caller's order, and
+entries are keyed on those cards, so every suit relabelling of a spot
+shares one entry.  Positional results, like the best five picked from
+hole + board, come out the same as for the caller's cards.
+
+That only holds for functions whose result follows a relabelling of
+their input: one that breaks ties by absolute suit (the nuts completion
+picks the lowest suit) has no restore function and is keyed on the
+caller's exact cards.  verbose=True bypasses the cache, so a traced
+call is always run.
+
+Results are FrozenDict / tuple trees, so one cached object can be handed
+to any number of callers and threads.
+
+Usage:
+
+    cached_evaluate_hand = spot_cache(restore=restore_evaluation)(evaluate_hand)
+    cached_evaluate_hand.cache_info()   # hits, misses, size, maxsize
+"""
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from .cards import CARD_INDEX, CARD_STRINGS, cards_from_strs
+from .isomorphism import apply_suit_map, canonical_suit_map, invert_suit_map
+
+DEFAULT_MAXSIZE = 4096
+
+SUIT_LETTERS = "cdhs"
+SUIT_SYMBOLS = "♣♦♥♠"
+
+
+class FrozenDict(dict):
+    """Read-only dict; still a dict for templates and json."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("cached results are read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self):
+        return hash(tuple(sorted(self.items(), key=repr)))
+
+
+def freeze(obj):
+    """Recursively turn dicts into FrozenDicts and lists/sets into tuples."""
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(v) for v in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj):
+    """Plain, picklable copy of a frozen result (FrozenDicts cannot be unpickled)."""
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [thaw(v) for v in obj]
+    if isinstance(obj, frozenset):
+        return {thaw(v) for v in obj}
+    return obj
+
+
+class LRUCache:
+    """Thread-safe bounded mapping with LRU eviction and hit/miss counters."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+def _deck_key(text):
+    """Deck order of a card ("As", "AS") or of two joined cards ("5s6s")."""
+    return tuple(CARD_INDEX[text[i:i + 2]] for i in range(0, len(text), 2))
+
+
+class Relabel:
+    """
+    Maps the card fields of a result computed for the canonical spot back
+    to one caller's suits; restore functions pick the method that matches
+    how each field was built.
+    """
+
+    def __init__(self, suit_map, caller_cards):
+        self.inverse = invert_suit_map(suit_map)
+        self.caller = {CARD_INDEX[c]: c for c in caller_cards}
+
+    def _index(self, index):
+        return (index & ~3) | self.inverse[index & 3]
+
+    def card(self, text):
+        """One card, keeping the case of its suit letter."""
+        suit = CARD_STRINGS[self._index(CARD_INDEX[text])][1]
+        return text[0] + (suit.upper() if text[1].isupper() else suit)
+
+    def given(self, text):
+        """One of the caller's own cards, exactly as the caller wrote it."""
+        return self.caller[self._index(CARD_INDEX[text])]
+
+    def suit(self, text):
+        """A suit letter (either case) or suit symbol."""
+        lower = text.lower()
+        if lower in SUIT_LETTERS:
+            suit = SUIT_LETTERS[self.inverse[SUIT_LETTERS.index(lower)]]
+            return suit.upper() if text.isupper() else suit
+        return SUIT_SYMBOLS[self.inverse[SUIT_SYMBOLS.index(text)]]
+
+    def deck_order(self, cards):
+        """Cards collected by scanning the deck: relabelled and back in deck order."""
+        return sorted((self.card(c) for c in cards), key=_deck_key)
+
+    def combos(self, combos):
+        """Two joined cards ("5s6s") in deck order, each and the list."""
+        out = []
+        for text in combos:
+            pair = sorted((self.card(text[:2]), self.card(text[2:])), key=_deck_key)
+            out.append(pair[0] + pair[1])
+        return sorted(out, key=_deck_key)
+
+    def by_suit(self, mapping, value):
+        """{suit: value(v)} re-keyed by suit, in club, diamond, heart, spade order."""
+        items = {self.suit(k): value(v) for k, v in mapping.items()}
+        return {k: items[k] for k in sorted(items, key=lambda k: SUIT_LETTERS.index(k.lower()))}
+
+    @staticmethod
+    def first_found(mapping, first=lambda v: v[0]):
+        """
+        A dict filled while scanning the deck (category -> cards), in the
+        order of each entry's first card; `first` picks it from a value.
+        """
+        return dict(sorted(mapping.items(), key=lambda kv: _deck_key(first(kv[1]))))
+
+
+def spot_cache(maxsize=DEFAULT_MAXSIZE, restore=None):
+    """
+    Decorator for fn(hole, board, *args, **kwargs) taking card-string lists.
+    restore(result, relabel) maps a result back to a caller's suits (see
+    the module docstring); without it entries are keyed on the exact
+    cards.  Adds cache_info() and cache_clear() to the wrapper, like
+    functools.
+    """
+
+    def decorate(fn):
+        cache = LRUCache(maxsize)
+        missing = object()
+
+        @wraps(fn)
+        def wrapper(hole, board, *args, **kwargs):
+            if kwargs.get("verbose"):
+                return freeze(fn(hole, board, *args, **kwargs))
+            kwargs.pop("verbose", None)
+            spot = list(hole), list(board)
+            if restore is not None:
+                cards = [cards_from_strs(hole), cards_from_strs(board)]
+                suit_map = canonical_suit_map(*cards)
+                spot = tuple([CARD_STRINGS[c] for c in apply_suit_map(group, suit_map)] for group in cards)
+            key = (tuple(spot[0]), tuple(spot[1]), args, tuple(sorted(kwargs.items())))
+
+            result = cache.get(key, missing)
+            if result is missing:
+                result = freeze(fn(*spot, *args, **kwargs))
+                cache.put(key, result)
+            if restore is None:
+                return result
+            return freeze(restore(result, Relabel(suit_map, list(hole) + list(board))))
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorate
@@ -0,0 +1,117 @@
+"""
+Versioned binary files for precomputed tables, opened with mmap.
+
+Layout:
+
+    b"PKTB" | uint32 header length | JSON header | padding | arrays
+
+The JSON header records the file format, the table kind and version and,
+for every array, its name, dtype, shape and byte offset (64-byte
+aligned).  open_table() maps each array read-only with numpy.memmap, so
+opening a table costs nothing until pages are touched and every process
+shares the OS page cache.  A file whose kind, version or size does not
+match what the caller expects raises StaleTableError.
+
+Tables live in TABLE_DIR (solver/logic/data, or $SOLVER_TABLE_DIR).
+"""
+import json
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b"PKTB"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+TABLE_DIR = Path(os.environ.get("SOLVER_TABLE_DIR", Path(__file__).resolve().parent / "data"))
+
+
+class StaleTableError(ValueError):
+    """Table file exists but was built for another kind, version or layout."""
+
+
+def table_path(name):
+    return TABLE_DIR / name
+
+
+def _align(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_table(path, kind, version, arrays, meta=None):
+    """
+    Write {name: ndarray} as a table file. The file is written next to
+    `path` and renamed into place, so readers never see a partial table.
+    """
+    path = Path(path)
+    entries = []
+    header = b""
+    # The header size depends on the offsets and vice versa; two passes settle it.
+    for _ in range(2):
+        offset = _align(len(MAGIC) + 4 + len(header))
+        entries = []
+        for name, array in arrays.items():
+            entries.append({
+                "name": name,
+                "dtype": np.asarray(array).dtype.str,
+                "shape": list(np.shape(array)),
+                "offset": offset,
+            })
+            offset = _align(offset + np.asarray(array).nbytes)
+        header = json.dumps({
+            "format": FORMAT_VERSION,
+            "kind": kind,
+            "version": version,
+            "meta": meta or {},
+            "arrays": entries,
+            "size": offset,
+        }).encode()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(header)) + header)
+        for entry, array in zip(entries, arrays.values()):
+            f.write(b"\0" * (entry["offset"] - f.tell()))
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.write(b"\0" * (json.loads(header)["size"] - f.tell()))
+    os.replace(tmp, path)
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise StaleTableError(f"{path}: not a table file")
+        (length,) = struct.unpack("<I", f.read(4))
+        return json.loads(f.read(length))
+
+
+def open_table(path, kind, version):
+    """
+    Map a table file read-only. Returns (arrays dict, meta dict).
+    Raises FileNotFoundError if it is missing and StaleTableError if it
+    does not match `kind` / `version`.
+    """
+    path = Path(path)
+    header = read_header(path)
+    found = (header.get("format"), header.get("kind"), header.get("version"))
+    if found != (FORMAT_VERSION, kind, version):
+        raise StaleTableError(
+            f"{path}: built as {found[1]!r} v{found[2]} (format {found[0]}), "
+            f"expected {kind!r} v{version} (format {FORMAT_VERSION})"
+        )
+    if path.stat().st_size != header["size"]:
+        raise StaleTableError(f"{path}: truncated ({path.stat().st_size} of {header['size']} bytes)")
+
+    arrays = {}
+    for entry in header["arrays"]:
+        arrays[entry["name"]] = np.memmap(
+            path,
+            dtype=np.dtype(entry["dtype"]),
+            mode="r",
+            offset=entry["offset"],
+            shape=tuple(entry["shape"]),
+        )
+    return arrays, header["meta"]
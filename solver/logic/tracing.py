@@ -0,0 +1,93 @@
+"""
+Debug tracing for the solver modules.
+
+    _trace = get_tracer("solver.hand_strength", "[HS-DEBUG]")
+    _trace("Best from %d cards: %s %s", n, name, best_five)
+
+A call costs one context-variable lookup while tracing is off; the
+message is only %-formatted when it is emitted, so card lists and dicts
+passed as arguments are never turned into strings for nothing.
+
+Whether tracing is on is kept in a ContextVar: turning it on with
+`tracing()` affects the current thread / asyncio task only, so it can be
+scoped to one call or one request without touching other threads.
+set_default() changes the process-wide fallback (the old set_debug()).
+
+Records go to the tracer's logger through its own stderr handler; the
+logger's level is not consulted and sys.stdout is never replaced.
+"""
+import logging
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+# None: follow the process-wide default
+_enabled = ContextVar("solver_tracing", default=None)
+_default = False
+
+
+def set_default(enabled):
+    """Process-wide tracing default for contexts that did not choose."""
+    global _default
+    _default = bool(enabled)
+
+
+def is_enabled():
+    enabled = _enabled.get()
+    return _default if enabled is None else enabled
+
+
+@contextmanager
+def tracing(enabled=True):
+    """Turn tracing on (or off) for the current context only."""
+    token = _enabled.set(enabled)
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
+
+
+def traceable(fn):
+    """Give fn a `verbose` keyword that traces that one call."""
+
+    @wraps(fn)
+    def wrapper(*args, verbose=False, **kwargs):
+        if not verbose:
+            return fn(*args, **kwargs)
+        with tracing():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+class Tracer:
+    __slots__ = ("logger", "prefix")
+
+    def __init__(self, name, prefix=""):
+        self.logger = logging.getLogger(name)
+        self.prefix = prefix + " " if prefix else ""
+
+    def __bool__(self):
+        return is_enabled()
+
+    def __call__(self, msg, *args):
+        if not is_enabled():
+            return
+        record = self.logger.makeRecord(
+            self.logger.name, logging.DEBUG, "(trace)", 0, self.prefix + msg, args, None
+        )
+        self.logger.handle(record)
+
+
+_handler = logging.StreamHandler(sys.stderr)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+
+
+def get_tracer(name, prefix=""):
+    """Tracer writing to logger `name` (one stderr handler, no propagation)."""
+    logger = logging.getLogger(name)
+    if _handler not in logger.handlers:
+        logger.addHandler(_handler)
+        logger.propagate = False
+    return Tracer(name, prefix)
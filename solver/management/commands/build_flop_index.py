@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from solver.logic.flop_index import DEFAULT_PATH, build_flop_index
+
+
+class Command(BaseCommand):
+    help = "Precompute the flop index (1,755 flops x 1,326 combos)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=str(DEFAULT_PATH))
+        parser.add_argument("--processes", type=int, default=None)
+
+    def handle(self, *args, **options):
+        n = build_flop_index(options["path"], processes=options["processes"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {n} flops to {options['path']}"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from solver.logic.preflop_equity import DEFAULT_PATH, build_preflop_equity
+
+
+class Command(BaseCommand):
+    help = "Precompute preflop all-in equity (1326x1326 combos, 169x169 classes)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=str(DEFAULT_PATH))
+        parser.add_argument("--processes", type=int, default=None)
+
+    def handle(self, *args, **options):
+        build_preflop_equity(options["path"], processes=options["processes"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['path']}"))
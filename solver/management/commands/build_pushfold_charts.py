@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from solver.logic.preflop_equity import DEFAULT_PATH
+from solver.logic.pushfold_nash import CHARTS_PATH, class_equity_matrix, write_charts
+
+
+class Command(BaseCommand):
+    help = "Solve push/fold equilibria for 1-25 BB and regenerate the chart module."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=str(CHARTS_PATH))
+        parser.add_argument("--equity", default=str(DEFAULT_PATH), help="Preflop equity table")
+        parser.add_argument("--iterations", type=int, default=2000)
+        parser.add_argument("--tol", type=float, default=1e-4)
+
+    def handle(self, *args, **options):
+        write_charts(
+            options["path"],
+            equity=class_equity_matrix(options["equity"]),
+            iterations=options["iterations"],
+            tol=options["tol"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['path']}"))
@@ -0,0 +1,57 @@
+import json
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from solver.logic.cards import cards_to_strs
+from solver.logic.combos import COMBO_CARDS
+from solver.logic.isomorphism import canonical_boards
+from solver.logic.range_equity import range_weights
+from solver.result_cache import get_result_cache
+from solver.services import MAX_BATCH_SPOTS, evaluate_spots
+
+
+def popular_spots(hands, boards):
+    """
+    Spots of every combo of `hands` (range notation) on the `boards` most
+    frequent canonical flops (all 1,755 when None).
+    """
+    flops = sorted(canonical_boards(3), key=lambda bw: -bw[1])[:boards]
+    combos = [COMBO_CARDS[c].tolist() for c in np.flatnonzero(range_weights(hands))]
+    for flop, _ in flops:
+        for hole in combos:
+            if not set(hole) & set(flop):
+                yield [cards_to_strs(hole), cards_to_strs(flop)]
+
+
+class Command(BaseCommand):
+    help = "Preload the persistent result cache with popular spots."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hands", default="QQ+,AKs,AKo", help="Range of hole cards (default QQ+,AKs,AKo)")
+        parser.add_argument("--boards", type=int, default=None, help="Most frequent canonical flops (default all)")
+        parser.add_argument("--file", default=None, help="JSON list of spots to load instead, as the batch API takes")
+        parser.add_argument("--no-outs", action="store_true")
+        parser.add_argument("--no-nuts", action="store_true")
+
+    def handle(self, *args, **options):
+        cache = get_result_cache()
+        if cache is None:
+            raise CommandError("The result cache is off (SOLVER_RESULT_CACHE has no PATH)")
+        if options["file"]:
+            with open(options["file"]) as f:
+                spots = json.load(f)
+        else:
+            spots = list(popular_spots(options["hands"], options["boards"]))
+
+        before = len(cache)
+        errors = 0
+        for i in range(0, len(spots), MAX_BATCH_SPOTS):
+            results = evaluate_spots(
+                spots[i:i + MAX_BATCH_SPOTS], outs=not options["no_outs"], nuts=not options["no_nuts"], cache=cache
+            )
+            errors += sum(1 for r in results if "error" in r)
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed {len(spots) - errors} spots ({errors} invalid): "
+            f"{len(cache) - before} new entries, {len(cache)} in {cache.path}"
+        ))
@@ -0,0 +1,19 @@
+from django.conf import settings
+
+from .logic.tracing import tracing
+
+
+class TraceMiddleware:
+    """
+    Trace solver debug output for a single request by adding ?trace=1
+    to the URL (only when DEBUG is on). Other requests are unaffected.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if settings.DEBUG and request.GET.get("trace") == "1":
+            with tracing():
+                return self.get_response(request)
+        return self.get_response(request)
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SolvedSpot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('board', models.CharField(help_text='Board in canonical suits, e.g. AsKh7d', max_length=10)),
+                ('ranges_hash', models.CharField(max_length=32)),
+                ('config_hash', models.CharField(max_length=32)),
+                ('mode', models.CharField(max_length=8)),
+                ('pot', models.FloatField()),
+                ('stack', models.FloatField()),
+                ('spr', models.FloatField()),
+                ('oop_range', models.TextField()),
+                ('ip_range', models.TextField()),
+                ('iterations', models.PositiveIntegerField()),
+                ('exploitability_pct', models.FloatField()),
+                ('blob', models.BinaryField(help_text='zlib-compressed JSON of the solution, in canonical suits')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['config_hash'], name='solvedspot_config')],
+                'constraints': [models.UniqueConstraint(fields=('board', 'config_hash', 'ranges_hash', 'spr'), name='solvedspot_lookup')],
+            },
+        ),
+    ]
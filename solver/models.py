@@ -1,3 +1,212 @@
+"""
+Solved spots, kept so a repeated request is one indexed read instead of
+a re-solve.
+
+A spot is stored in the canonical suits of its board (isomorphism.py):
+the board, both ranges and the solution's combos are relabelled with the
+board's canonical suit map, so every suit relabelling of a spot finds
+the same row.  The ranges enter the key as a hash of their weights
+(board-blocked combos dropped), the bet sizing as a hash of the solver
+mode and the BetConfig of every street.
+
+Bet sizes are pot fractions, so a solution depends on pot and stack only
+through the stack-to-pot ratio: nearest() returns the stored spot with
+the closest SPR within SOLVER_STORE_SPR_TOLERANCE (relative), and its
+chip values are scaled to the new pot.  The solution itself is the
+solver_engine.solve_spot() output, JSON compressed into one blob per
+spot rather than a row per action.
+"""
+import hashlib
+import json
+import zlib
+from typing import NamedTuple
+
+import numpy as np
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+from .logic.cards import CARD_INDEX, CARD_STRINGS, cards_from_strs
+from .logic.combos import COMBO_INDEX, blocked_combos, combo_str, combo_suit_perm
+from .logic.isomorphism import apply_suit_map, canonical_suit_map, invert_suit_map
+from .logic.range_equity import range_weights
+from .logic.solver_engine import bet_configs, solver_mode
+
+# Relative SPR difference allowed between a request and a stored spot
+DEFAULT_SPR_TOLERANCE = 0.1
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class SpotKey(NamedTuple):
+    """Index key of a solver payload; see spot_key()."""
+
+    board: str
+    ranges_hash: str
+    config_hash: str
+    mode: str
+    pot: float
+    stack: float
+    suit_map: tuple
+
+    @property
+    def spr(self):
+        return self.stack / self.pot
+
+
+def spot_key(payload, board_cards):
+    """
+    SpotKey of a run_solver() payload with "oop_range" and "ip_range" on
+    `board_cards` (card strings).  Raises ValueError for bad input.
+    """
+    board = cards_from_strs(board_cards)
+    suit_map = tuple(canonical_suit_map(board))
+    canonical = sorted(apply_suit_map(board, suit_map), reverse=True)
+
+    perm = combo_suit_perm(suit_map)
+    live = ~blocked_combos(board)
+    ranges = np.zeros((2, len(perm)), dtype=np.float32)
+    for p, name in enumerate(("oop_range", "ip_range")):
+        ranges[p, perm] = range_weights(payload[name]) * live
+
+    pot, stack = float(payload.get("pot", 10)), float(payload.get("stack", 100))
+    if pot <= 0 or stack < 0:
+        raise ValueError("Pot must be positive and stack non-negative")
+    streets = 6 - len(board)
+    configs = [[getattr(c, k) for k in c.__slots__] for c in bet_configs(payload, streets)]
+    mode = solver_mode(payload, board_cards)
+    return SpotKey(
+        board="".join(CARD_STRINGS[c] for c in canonical),
+        ranges_hash=_digest(ranges.round(4).tobytes()),
+        config_hash=_digest(json.dumps([mode, configs]).encode()),
+        mode=mode,
+        pot=pot,
+        stack=stack,
+        suit_map=suit_map,
+    )
+
+
+def _relabel_combos(mapping, suit_map):
+    """{combo string: value} with the combos' suits relabelled, in combo order."""
+    items = []
+    for text, value in mapping.items():
+        a, b = apply_suit_map([CARD_INDEX[text[:2]], CARD_INDEX[text[2:]]], suit_map)
+        items.append((int(COMBO_INDEX[a, b]), value))
+    return {combo_str(c): value for c, value in sorted(items)}
+
+
+def relabel_solution(solution, suit_map, scale=1.0):
+    """
+    A solve_spot() result with its combos relabelled by `suit_map` and
+    its chip values (EVs, exploitability) multiplied by `scale`.
+    """
+    out = dict(solution)
+    out["nodes"] = [{**node, "strategy": _relabel_combos(node["strategy"], suit_map)} for node in solution["nodes"]]
+    out["combo_ev"] = {
+        name: _relabel_combos({c: ev * scale for c, ev in evs.items()}, suit_map)
+        for name, evs in solution["combo_ev"].items()
+    }
+    out["ev"] = {name: ev * scale for name, ev in solution["ev"].items()}
+    out["exploitability"] = solution["exploitability"] * scale
+    return out
+
+
+class SolvedSpotQuerySet(models.QuerySet):
+    def _candidates(self, key, tolerance):
+        if tolerance is None:
+            tolerance = getattr(settings, "SOLVER_STORE_SPR_TOLERANCE", DEFAULT_SPR_TOLERANCE)
+        spr = key.spr
+        return (
+            self.filter(
+                board=key.board,
+                config_hash=key.config_hash,
+                ranges_hash=key.ranges_hash,
+                spr__gte=spr * (1 - tolerance),
+                spr__lte=spr * (1 + tolerance),
+            )
+            .annotate(distance=models.Func(models.F("spr") - spr, function="ABS"))
+            .order_by("distance", "exploitability_pct")
+        )
+
+    def nearest(self, key, tolerance=None):
+        """The stored spot closest to `key` (a SpotKey) in SPR, or None."""
+        return self._candidates(key, tolerance).first()
+
+    async def anearest(self, key, tolerance=None):
+        return await self._candidates(key, tolerance).afirst()
+
+    def _row(self, key, payload, solution):
+        return self.model(
+            board=key.board,
+            ranges_hash=key.ranges_hash,
+            config_hash=key.config_hash,
+            mode=key.mode,
+            pot=key.pot,
+            stack=key.stack,
+            spr=key.spr,
+            oop_range=str(payload["oop_range"]),
+            ip_range=str(payload["ip_range"]),
+            iterations=int(solution["iterations"]),
+            exploitability_pct=solution["exploitability_pct"],
+            blob=SolvedSpot.compress(relabel_solution(solution, key.suit_map)),
+        )
+
+    def store(self, key, payload, solution):
+        """
+        Keep a solve_spot() result for the payload that produced it.  A spot
+        stored already (same key and SPR, e.g. by another process) is kept.
+        """
+        row = self._row(key, payload, solution)
+        self.bulk_create([row], ignore_conflicts=True)
+        return row
+
+    async def astore(self, key, payload, solution):
+        row = self._row(key, payload, solution)
+        await self.abulk_create([row], ignore_conflicts=True)
+        return row
+
+
+class SolvedSpot(models.Model):
+    board = models.CharField(max_length=10, help_text="Board in canonical suits, e.g. AsKh7d")
+    ranges_hash = models.CharField(max_length=32)
+    config_hash = models.CharField(max_length=32)
+    mode = models.CharField(max_length=8)
+    pot = models.FloatField()
+    stack = models.FloatField()
+    spr = models.FloatField()
+    oop_range = models.TextField()
+    ip_range = models.TextField()
+    iterations = models.PositiveIntegerField()
+    exploitability_pct = models.FloatField()
+    blob = models.BinaryField(help_text="zlib-compressed JSON of the solution, in canonical suits")
+    created = models.DateTimeField(auto_now_add=True)
+
+    objects = SolvedSpotQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            # One row per spot and SPR; its index serves nearest()
+            models.UniqueConstraint(fields=["board", "config_hash", "ranges_hash", "spr"], name="solvedspot_lookup"),
+        ]
+        indexes = [
+            models.Index(fields=["config_hash"], name="solvedspot_config"),
+        ]
+
+    def __str__(self):
+        return f"{self.board} spr {self.spr:g} ({self.mode}, exploitability {self.exploitability_pct:.3g})"
+
+    @staticmethod
+    def compress(solution):
+        return zlib.compress(json.dumps(solution, separators=(",", ":")).encode(), 6)
+
+    @property
+    def solution(self):
+        """The stored solution, in canonical suits and chips of the stored pot."""
+        return json.loads(zlib.decompress(self.blob))
+
+    def solution_for(self, key):
+        """The solution in the suits and pot of `key`, the spot that found it."""
+        solution = relabel_solution(self.solution, invert_suit_map(key.suit_map), key.pot / self.pot)
+        solution["stored"] = {"id": self.pk, "pot": self.pot, "stack": self.stack, "spr": self.spr}
+        return solution
@@ -0,0 +1,240 @@
+"""
+Persistent result cache shared by every process of the site.
+
+spot_cache keeps results in one process and loses them on restart, so
+each gunicorn worker (and each pool worker, see workers.py) warms up on
+its own.  ResultCache keeps evaluation and equity results in a SQLite
+file next to db.sqlite3 instead, in WAL mode: readers never wait for the
+writer, and any number of processes share the file.
+
+Keys are text keys of canonical spots (services builds them, e.g.
+"v2:spot:11:AsKs|QsJs2h", led by services.CACHE_VERSION so entries of
+older code are not served), stored as 16-byte blake2b hashes; values are
+JSON.  Reads and writes come in batches (get_many / set_many, one
+statement per few hundred keys, one transaction per batch), since the
+batch API asks for hundreds of spots at a time.
+
+Entries expire after the TTL and the least recently used ones are
+dropped when the file holds more than max_entries.  Counting the entries
+scans the table, so a process evicts only once it has written another
+EVICT_SHARE of max_entries rows: between evictions the file may exceed
+max_entries by that share per writing process.  Reading an entry
+refreshes its use time at most once per TOUCH_INTERVAL, so hot keys do
+not turn every read into a write.
+
+Results are computed for canonical spots and cached as such; mapping
+them back to a caller's suits is up to the caller (services.py).
+
+Settings: SOLVER_RESULT_CACHE = {"PATH": ..., "TTL": ..., "MAX_ENTRIES":
+...}; a PATH of None turns the cache off.  python manage.py
+warm_result_cache preloads popular spots.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 200_000
+TOUCH_INTERVAL = 60.0
+# Share of max_entries a process writes between two evictions
+EVICT_SHARE = 0.01
+
+# Keys per SELECT / DELETE, well under SQLite's bound-variable limit
+_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires REAL,
+    used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+CREATE INDEX IF NOT EXISTS results_expires ON results (expires);
+"""
+
+
+def spot_hash(key):
+    """16-byte hash of a text key."""
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
+def _chunks(items):
+    for i in range(0, len(items), _CHUNK):
+        yield items[i:i + _CHUNK]
+
+
+class ResultCache:
+    """
+    SQLite-backed mapping of text keys to JSON values with TTL and LRU
+    size eviction.  Safe to share between threads and processes, and
+    picklable: a copy sent to a pool worker opens its own connection.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._init()
+
+    def _init(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Rows written since this process last evicted
+        self._written = 0
+        self._evict_after = max(1, int(self.max_entries * EVICT_SHARE))
+
+    def __getstate__(self):
+        return {"path": self.path, "ttl": self.ttl, "max_entries": self.max_entries}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init()
+
+    def _connect(self):
+        # One connection per thread and process: connections must not
+        # cross threads or survive a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _count(self, hits, misses):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def get_many(self, keys):
+        """{key: value} of the keys present and not expired."""
+        keys = list(dict.fromkeys(keys))
+        by_hash = {spot_hash(k): k for k in keys}
+        now = time.time()
+        conn = self._connect()
+        found, stale = {}, []
+        for chunk in _chunks(list(by_hash)):
+            rows = conn.execute(
+                f"SELECT key, value, used FROM results WHERE key IN ({','.join('?' * len(chunk))})"
+                " AND (expires IS NULL OR expires > ?)",
+                (*chunk, now),
+            )
+            for h, value, used in rows:
+                found[by_hash[h]] = json.loads(value)
+                if used < now - TOUCH_INTERVAL:
+                    stale.append((now, h))
+        if stale:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("UPDATE results SET used = ? WHERE key = ?", stale)
+        self._count(len(found), len(keys) - len(found))
+        return found
+
+    def get(self, key, default=None):
+        return self.get_many([key]).get(key, default)
+
+    def set_many(self, items, ttl=None):
+        """
+        Store {key: JSON-friendly value} in one transaction, then evict if
+        this process wrote EVICT_SHARE of max_entries since it last did.
+        """
+        if not items:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires = now + ttl if ttl else None
+        rows = [(spot_hash(k), json.dumps(v, separators=(",", ":")), expires, now) for k, v in items.items()]
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("INSERT OR REPLACE INTO results (key, value, expires, used) VALUES (?, ?, ?, ?)", rows)
+        with self._lock:
+            self._written += len(rows)
+            due = self._written >= self._evict_after
+            if due:
+                self._written = 0
+        if due:
+            self.evict()
+
+    def set(self, key, value, ttl=None):
+        self.set_many({key: value}, ttl=ttl)
+
+    def evict(self):
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            removed = conn.execute("DELETE FROM results WHERE expires <= ?", (time.time(),)).rowcount
+            excess = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                removed += conn.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used LIMIT ?)", (excess,)
+                ).rowcount
+        return removed
+
+    def delete_many(self, keys):
+        conn = self._connect()
+        hashes = [spot_hash(k) for k in keys]
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for chunk in _chunks(hashes):
+                conn.execute(f"DELETE FROM results WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+
+    def clear(self):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM results")
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def info(self):
+        """Hits and misses of this process; entries and limits of the file."""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "path": self.path,
+        }
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """The site's ResultCache from SOLVER_RESULT_CACHE, or None when it is off."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            options = getattr(settings, "SOLVER_RESULT_CACHE", {})
+            if options.get("PATH") is None:
+                return None
+            _cache = ResultCache(
+                options["PATH"],
+                ttl=options.get("TTL", DEFAULT_TTL),
+                max_entries=options.get("MAX_ENTRIES", DEFAULT_MAX_ENTRIES),
+            )
+        return _cache
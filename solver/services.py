@@ -0,0 +1,348 @@
+"""
+Service layer between the HTTP views and the evaluators: plain Python in,
+plain JSON-friendly data out, no Django.
+
+evaluate_spots() serves the batch JSON API.  A request carries hundreds of
+(hole, board) spots; all of them are validated first, and every invalid
+spot gets its own {"error": ...} entry so one typo does not fail the batch.
+The valid spots are then evaluated together:
+
+    strength, category  one evaluate_batch() call per card count (5-7)
+    nuts                analytic nuts_completion() per spot, the completed
+                        holdings scored in one more evaluate_batch() call
+    outs                find_outs() on flops and turns (next card only)
+
+Spots are evaluated once per suit-isomorphism class, and with a
+ResultCache (result_cache.py) only the classes it does not hold yet.
+
+The other functions are the jobs the async views send to the worker
+pool (workers.py): module-level, plain arguments, picklable results.
+The home page evaluates the canonical spot (canonical_form) so that
+concurrent requests for suit relabellings of one spot share a single
+job; restore_form() maps the result back to each caller's suits.
+"""
+import json
+
+import numpy as np
+
+from .hand_strength import (
+    cached_compute_best_possible_hand,
+    cached_compute_future_improvements,
+    cached_evaluate_hand,
+    restore_evaluation,
+    restore_improvements,
+)
+from .logic.batch_eval import evaluate_batch
+from .logic.cards import CARD_STRINGS, cards_from_strs, find_duplicate
+from .logic.eval_tables import HAND_NAMES, strength_category
+from .logic.isomorphism import apply_suit_map, canonical_suit_map, canonicalize, invert_suit_map
+from .logic.nuts import nuts_completion
+from .logic.outs import find_outs
+from .logic.range_equity import range_vs_range
+from .logic.solver_engine import parse_cards, run_solver, solver_mode
+from .logic.spot_cache import Relabel, thaw
+
+# Largest batch the API accepts
+MAX_BATCH_SPOTS = 1000
+
+# Part of every ResultCache key: bump it whenever an evaluator or the
+# format of a cached result changes, so older entries are never served
+CACHE_VERSION = 2
+
+# Solver limits of the API: a job keeps its pool worker until it ends,
+# even after its caller timed out
+MAX_SOLVE_ITERATIONS = 10000
+MIN_SOLVE_TARGET = 0.001
+# MCCFR iterations of a flop (3 cards) or turn solve, its default and
+# limit: with the default bet sizes the solve and its evaluation take
+# 15-20 s on one core, inside SOLVER_TASK_TIMEOUT
+MCCFR_ITERATIONS = {3: 128, 4: 1024}
+
+
+def _card_list(value, what):
+    if isinstance(value, str):
+        text = value.replace(",", " ").strip()
+        # "AsKd" as well as "As Kd"
+        tokens = text.split() if " " in text else [text[i:i + 2] for i in range(0, len(text), 2)]
+    elif isinstance(value, (list, tuple)):
+        tokens = value
+    else:
+        raise ValueError(f"{what} must be a string or a list of cards")
+    if not all(isinstance(t, str) for t in tokens):
+        raise ValueError(f"{what} must be a string or a list of cards")
+    return cards_from_strs(tokens)
+
+
+def _check_range(payload, name):
+    """A range of the payload must be notation, a list of hands or {hand: weight}."""
+    value = payload[name]
+    if isinstance(value, str):
+        return
+    if isinstance(value, list) and all(isinstance(t, str) for t in value):
+        return
+    if isinstance(value, dict) and all(
+        isinstance(t, str) and isinstance(w, (int, float)) and not isinstance(w, bool) for t, w in value.items()
+    ):
+        return
+    raise ValueError(f"{name} must be range notation, a list of hands or {{hand: weight}}")
+
+
+def _check_bet_sizing(options, where):
+    for name in ("bet_sizes", "raise_sizes"):
+        sizes = options.get(name)
+        if sizes is not None and not (
+            isinstance(sizes, list) and all(isinstance(f, (int, float)) and not isinstance(f, bool) for f in sizes)
+        ):
+            raise ValueError(f"{where}{name} must be a list of pot fractions")
+    for name in ("max_raises", "all_in_threshold"):
+        value = options.get(name)
+        if value is not None and (not isinstance(value, (int, float)) or isinstance(value, bool)):
+            raise ValueError(f"{where}{name} must be a number")
+
+
+def _non_negative(payload, name, kind):
+    """payload[name] as a non-negative int or float; ValueError for anything else."""
+    value = payload[name]
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{name} must be a number")
+    try:
+        number = kind(value)
+    except (ValueError, OverflowError):
+        raise ValueError(f"{name} must be a number") from None
+    # Also false for NaN
+    if not number >= 0:
+        raise ValueError(f"{name} must not be negative")
+    return number
+
+
+def check_solve_payload(payload):
+    """
+    Raise ValueError, with a message for the client, when the cards,
+    ranges or bet sizing of a run_solver() payload have the wrong JSON
+    types.
+    """
+    for name in ("hand", "board"):
+        if not isinstance(payload.get(name, ""), str):
+            raise ValueError(f"{name} must be a string of cards")
+    for name in ("oop_range", "ip_range"):
+        if name in payload:
+            _check_range(payload, name)
+    _check_bet_sizing(payload, "")
+    streets = payload.get("streets")
+    if streets is None:
+        return
+    if not isinstance(streets, list) or not all(isinstance(options, dict) for options in streets):
+        raise ValueError("streets must be a list of bet sizing objects, one per street")
+    for i, options in enumerate(streets):
+        _check_bet_sizing(options, f"streets[{i}].")
+
+
+def parse_spot(spot):
+    """
+    (hole, board) card indices of {"hole": ..., "board": ...} or a
+    [hole, board] pair, each as "As Kd", "AsKd" or ["As", "Kd"].
+    Raises ValueError with a message for the client.
+    """
+    if isinstance(spot, dict):
+        hole, board = spot.get("hole", spot.get("hand")), spot.get("board", "")
+    elif isinstance(spot, (list, tuple)) and len(spot) == 2:
+        hole, board = spot
+    else:
+        raise ValueError('A spot is {"hole": ..., "board": ...} or [hole, board]')
+    if hole is None:
+        raise ValueError("Missing hole cards")
+    hole, board = _card_list(hole, "hole"), _card_list(board or "", "board")
+    if len(hole) != 2:
+        raise ValueError(f"Need 2 hole cards, got {len(hole)}")
+    if not 3 <= len(board) <= 5:
+        raise ValueError(f"Need a 3-5 card board, got {len(board)}")
+    duplicate = find_duplicate(hole + board)
+    if duplicate is not None:
+        raise ValueError(f"Duplicate card: {CARD_STRINGS[duplicate]}")
+    return hole, board
+
+
+def _evaluate_rows(rows):
+    """Strengths for card lists of 5-7 cards, one batch call per length."""
+    out = np.empty(len(rows), dtype=np.int64)
+    by_length = {}
+    for i, row in enumerate(rows):
+        by_length.setdefault(len(row), []).append(i)
+    for indices in by_length.values():
+        out[indices] = evaluate_batch(np.array([rows[i] for i in indices], dtype=np.int8))
+    return out
+
+
+def _spot_text(hole, board):
+    """Text key of a spot: "AsKs|QsJs2h" for its card indices."""
+    return "".join(CARD_STRINGS[c] for c in hole) + "|" + "".join(CARD_STRINGS[c] for c in board)
+
+
+def _evaluate_canonical(keys, outs, nuts):
+    """evaluate_spots() entries of canonical (hole, board) spots."""
+    strengths = _evaluate_rows([list(h) + list(b) for h, b in keys])
+    if nuts:
+        completed = [list(h) + list(b) + nuts_completion(list(h) + list(b), 5 - len(b)) for h, b in keys]
+        nuts_strengths = _evaluate_rows(completed)
+
+    entries = []
+    for k, (hole, board) in enumerate(keys):
+        strength = int(strengths[k])
+        entry = {"strength": strength, "category": HAND_NAMES[strength_category(strength)]}
+        if nuts:
+            best = int(nuts_strengths[k])
+            entry["nuts"] = HAND_NAMES[strength_category(best)]
+            entry["is_nuts"] = strength >= best
+        if outs and len(board) < 5:
+            report = find_outs(hole, board, runner_runner=False)
+            entry["outs"] = [CARD_STRINGS[c] for c in report["outs"]]
+            entry["out_probability"] = round(report["probability"], 4)
+        entries.append(entry)
+    return entries
+
+
+def _restore_entry(entry, suit_map):
+    """A canonical entry in the suits of the spot canonicalised with suit_map."""
+    if "outs" not in entry:
+        return dict(entry)
+    inverse = invert_suit_map(suit_map)
+    outs = sorted(apply_suit_map(cards_from_strs(entry["outs"]), inverse))
+    return {**entry, "outs": [CARD_STRINGS[c] for c in outs]}
+
+
+def evaluate_spots(spots, outs=True, nuts=True, cache=None):
+    """
+    Compact evaluation of every spot, in order:
+
+        {"strength": int, "category": "Two Pair",
+         "nuts": "Flush", "is_nuts": false,
+         "outs": ["Ah", ...], "out_probability": 0.19}
+
+    "nuts" is the best holding hero can still reach and "outs" are only
+    given on flops and turns.  Invalid spots are {"error": message}.
+
+    Spots are evaluated once per suit-isomorphism class.  With a
+    ResultCache (result_cache.py) the classes are read from it in one
+    batch and only the missing ones are evaluated and written back.
+    """
+    if len(spots) > MAX_BATCH_SPOTS:
+        raise ValueError(f"At most {MAX_BATCH_SPOTS} spots per request, got {len(spots)}")
+
+    results = [None] * len(spots)
+    unique = {}
+    for i, spot in enumerate(spots):
+        try:
+            hole, board = parse_spot(spot)
+        except ValueError as exc:
+            results[i] = {"error": str(exc)}
+            continue
+        (hole, board), suit_map = canonicalize(hole, board)
+        unique.setdefault(_spot_text(hole, board), ((hole, board), []))[1].append((i, suit_map))
+
+    prefix = f"v{CACHE_VERSION}:spot:{outs:d}{nuts:d}:"
+    entries = {}
+    if cache is not None and unique:
+        entries = {k[len(prefix):]: v for k, v in cache.get_many([prefix + k for k in unique]).items()}
+    missing = [k for k in unique if k not in entries]
+    if missing:
+        computed = dict(zip(missing, _evaluate_canonical([unique[k][0] for k in missing], outs, nuts)))
+        if cache is not None:
+            cache.set_many({prefix + k: v for k, v in computed.items()})
+        entries.update(computed)
+
+    for key, (_, callers) in unique.items():
+        for i, suit_map in callers:
+            results[i] = _restore_entry(entries[key], suit_map)
+    return results
+
+
+def evaluate_batch_response(spots, outs=True, nuts=True, cache=None):
+    """evaluate_spots() as the API's response body."""
+    results = evaluate_spots(spots, outs=outs, nuts=nuts, cache=cache)
+    return {"results": results, "errors": sum(1 for r in results if "error" in r)}
+
+
+def evaluate_form(hand_cards, board_cards, cache=None):
+    """
+    The home page's result block: evaluation, nuts and improvements.  The
+    view passes the canonical spot, which is what a cache is keyed on.
+    """
+    key = f"v{CACHE_VERSION}:form:" + "".join(hand_cards) + "|" + "".join(board_cards)
+    result = cache.get(key) if cache is not None else None
+    if result is None:
+        result = thaw(cached_evaluate_hand(hand_cards, board_cards))
+        result["best_possible"] = thaw(cached_compute_best_possible_hand(hand_cards, board_cards))
+        result["future"] = thaw(cached_compute_future_improvements(hand_cards, board_cards))
+        if cache is not None:
+            cache.set(key, result)
+    return result
+
+
+def canonical_form(hand_cards, board_cards):
+    """
+    (key, hole, board, suit map) of the canonical spot of the home page's
+    card strings, in their order (the best five is picked by position);
+    raises ValueError for unknown cards.
+    """
+    hole, board = cards_from_strs(hand_cards), cards_from_strs(board_cards)
+    suit_map = canonical_suit_map(hole, board)
+    hole, board = apply_suit_map(hole, suit_map), apply_suit_map(board, suit_map)
+    return _spot_text(hole, board), [CARD_STRINGS[c] for c in hole], [CARD_STRINGS[c] for c in board], suit_map
+
+
+def restore_form(result, suit_map, hand_cards, board_cards):
+    """
+    evaluate_form() of the canonical spot in the caller's cards.  The nuts
+    completion depends on the actual suits, so it is the caller's own.
+    """
+    relabel = Relabel(suit_map, list(hand_cards) + list(board_cards))
+    restored = restore_evaluation(result, relabel)
+    restored["best_possible"] = cached_compute_best_possible_hand(hand_cards, board_cards)
+    restored["future"] = restore_improvements(result["future"], relabel)
+    return thaw(restored)
+
+
+def range_equity(payload, cache=None):
+    """{"equity"} of payload["range_a"] against payload["range_b"] on payload["board"]."""
+    _check_range(payload, "range_a")
+    _check_range(payload, "range_b")
+    board = sorted(_card_list(payload.get("board", ""), "board"), reverse=True)
+    board = [CARD_STRINGS[c] for c in board]
+    key = f"v{CACHE_VERSION}:equity:" + json.dumps([payload["range_a"], payload["range_b"], board], sort_keys=True)
+    result = cache.get(key) if cache is not None else None
+    if result is None:
+        equity = range_vs_range(payload["range_a"], payload["range_b"], board)
+        result = {"equity": equity["equity"], "combos": [int(equity["combos_a"].size), int(equity["combos_b"].size)]}
+        if cache is not None:
+            cache.set(key, result)
+    return result
+
+
+def solve(payload, solution=None):
+    """
+    run_solver() for the API.  MCCFR runs in one process whatever the
+    payload asks, since the pool already runs one job per core, and
+    iterations and target are bounded (MCCFR_ITERATIONS on flops and
+    turns).  A stored `solution` (models.SolvedSpot) stands in for
+    solving the spot.
+    """
+    check_solve_payload(payload)
+    payload = dict(payload)
+    board = parse_cards(payload.get("board", ""))
+    limit = MAX_SOLVE_ITERATIONS
+    if len(board) in MCCFR_ITERATIONS and solver_mode(payload, board) == "mccfr":
+        limit = MCCFR_ITERATIONS[len(board)]
+        payload.setdefault("iterations", limit)
+    if "iterations" in payload:
+        payload["iterations"] = _non_negative(payload, "iterations", int)
+        if payload["iterations"] > limit:
+            raise ValueError(f"At most {limit} iterations per solve of this board")
+    if "target" in payload:
+        payload["target"] = _non_negative(payload, "target", float)
+        if payload["target"] < MIN_SOLVE_TARGET:
+            raise ValueError(f"The exploitability target must be at least {MIN_SOLVE_TARGET}")
+    if solution is None:
+        return run_solver({**payload, "processes": 1})
+    result = run_solver({k: v for k, v in payload.items() if k not in ("oop_range", "ip_range")})
+    result["solution"] = solution
+    return result
@@ -0,0 +1,78 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+
+During busy periods many clients ask for the same spot at nearly the
+same time.  SingleFlight.do(key, fn, ...) runs fn for the first caller
+of a key (the leader); every caller that arrives with the same key while
+that run is in flight waits for it and gets the same result, or the same
+exception.  Once the run is over the key is forgotten, so results are
+never served stale: caching is spot_cache's job, not this one's.
+
+The views key their requests on the canonical spot (see
+services.canonical_form) or on the request body, and put one flight in
+front of the worker pool:
+
+    views -> spot_flights -> workers.offload -> services -> hand_strength
+
+Like workers.py, state is guarded by a thread lock and the shared result
+is a concurrent.futures.Future, so callers in different event loops (one
+per request under WSGI) coalesce as well.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from functools import partial
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def _join(self, key):
+        """(shared future, whether this caller leads the run)."""
+        with self._lock:
+            self.calls += 1
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._calls[key] = Future()
+            self.executions += 1
+            return future, True
+
+    def _settle(self, key, future, task):
+        with self._lock:
+            del self._calls[key]
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    async def do(self, key, fn, *args, **kwargs):
+        """Result of `await fn(*args, **kwargs)`, shared by concurrent callers of `key`."""
+        future, leader = self._join(key)
+        if leader:
+            # A task of its own, so the run survives its leader being cancelled
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            task.add_done_callback(partial(self._settle, key, future))
+        # shield: a caller that gives up must not cancel everyone's result
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+# The views' flight in front of the worker pool
+spot_flights = SingleFlight()
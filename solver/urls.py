@@ -1,6 +1,10 @@
 from django.urls import path
-from .views import home
+from .views import equity_api, evaluate_api, home, solve_api, stats_api
 
 urlpatterns = [
     path('', home, name='home'),
+    path('api/evaluate/', evaluate_api, name='api-evaluate'),
+    path('api/equity/', equity_api, name='api-equity'),
+    path('api/solve/', solve_api, name='api-solve'),
+    path('api/stats/', stats_api, name='api-stats'),
 ]
@@ -1,9 +1,21 @@
-from .hand_strength import compute_best_possible_hand
+import json
+
+from django.http import JsonResponse
 from django.shortcuts import render
-from .hand_strength import evaluate_hand, compute_future_improvements
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from . import services
+from .logic.duplicate_checker import check_for_duplicates
+from .logic.solver_engine import parse_cards
+from .models import SolvedSpot, spot_key
+from .result_cache import get_result_cache
+from .services import MAX_BATCH_SPOTS
+from .singleflight import spot_flights
+from .workers import POOL_ERRORS, busy_response, get_pool, offload
 
 
-def home(request):
+async def home(request):
     if request.method == "POST":
         raw_hand = request.POST.get("hand", "")
         raw_board = request.POST.get("board", "")
@@ -20,15 +32,27 @@ def home(request):
                 "result": None,
             })
 
-        # Evaluate the current hand
-        result = evaluate_hand(hand_cards, board_cards)
-        print("DEBUG RESULT:", result)
-
-        # Add future improvement info (placeholder)
-        all_cards = hand_cards + board_cards
-        result["best_possible"] = compute_best_possible_hand(all_cards)
-
-        result["future"] = compute_future_improvements(hand_cards, board_cards)
+        error = check_for_duplicates(raw_hand, raw_board)
+        if not error:
+            # The nuts and outs searches run in the worker pool, once for
+            # all concurrent requests of the same canonical spot
+            try:
+                key, hole, board, suit_map = services.canonical_form(hand_cards, board_cards)
+                result = await spot_flights.do(
+                    ("form", key), offload, services.evaluate_form, hole, board, get_result_cache()
+                )
+                result = services.restore_form(result, suit_map, hand_cards, board_cards)
+            except ValueError as exc:
+                error = str(exc)
+            except POOL_ERRORS as exc:
+                error = f"The solver is busy, please try again ({exc})."
+        if error:
+            return render(request, "solver/home.html", {
+                "hand": raw_hand,
+                "board": raw_board,
+                "result": None,
+                "error": error,
+            })
 
         return render(request, "solver/home.html", {
             "hand": raw_hand,
@@ -42,3 +66,120 @@ def home(request):
         "board": "",
         "result": None,
     })
+
+
+def _json_body(request):
+    """Parsed JSON object of the request, or None."""
+    try:
+        body = json.loads(request.body)
+    except ValueError:
+        return None
+    return body if isinstance(body, dict) else None
+
+
+def _body_key(kind, *parts):
+    """Single-flight key of a JSON request: identical bodies share a job."""
+    return kind, json.dumps(parts, sort_keys=True)
+
+
+async def _offload_json(key, fn, *args):
+    """JSON response of a pool job: 400 for bad input, 429/503 when busy."""
+    try:
+        return JsonResponse(await spot_flights.do(key, offload, fn, *args))
+    except POOL_ERRORS as exc:
+        return busy_response(exc)
+    except (ValueError, KeyError, TypeError) as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+
+@csrf_exempt
+@require_POST
+async def evaluate_api(request):
+    """
+    Batch JSON evaluation for bots and tools (see services.evaluate_spots).
+
+    POST {"spots": [{"hole": "As Kd", "board": "Ah 7c 2d"}, ...],
+          "outs": true, "nuts": true}
+    ->   {"results": [...], "errors": <invalid spots>}
+    """
+    body = _json_body(request)
+    if body is None:
+        return JsonResponse({"error": "Request body must be a JSON object"}, status=400)
+    spots = body.get("spots")
+    if not isinstance(spots, list):
+        return JsonResponse({"error": 'Expected {"spots": [...]}'}, status=400)
+    if len(spots) > MAX_BATCH_SPOTS:
+        return JsonResponse({"error": f"At most {MAX_BATCH_SPOTS} spots per request"}, status=413)
+    outs, nuts = bool(body.get("outs", True)), bool(body.get("nuts", True))
+    return await _offload_json(
+        _body_key("evaluate", spots, outs, nuts),
+        services.evaluate_batch_response, spots, outs, nuts, get_result_cache(),
+    )
+
+
+@csrf_exempt
+@require_POST
+async def equity_api(request):
+    """POST {"range_a", "range_b", "board"} -> {"equity", "combos"}."""
+    body = _json_body(request)
+    if body is None or "range_a" not in body or "range_b" not in body:
+        return JsonResponse({"error": 'Expected {"range_a": ..., "range_b": ..., "board": ...}'}, status=400)
+    return await _offload_json(_body_key("equity", body), services.range_equity, body, get_result_cache())
+
+
+async def _solve_stored(body):
+    """
+    Solve through the SolvedSpot store: the nearest stored solution if
+    there is one, else a fresh solve that is stored for the next request.
+    """
+    try:
+        services.check_solve_payload(body)
+        key = spot_key(body, parse_cards(body.get("board", "")))
+    except (ValueError, KeyError, TypeError) as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+    stored = await SolvedSpot.objects.anearest(key)
+    if stored is not None:
+        return await _offload_json(_body_key("solve", body), services.solve, body, stored.solution_for(key))
+
+    try:
+        # Solved and stored once for all coalesced requests
+        result = await spot_flights.do(_body_key("solve", body), _solve_and_store, key, body)
+    except POOL_ERRORS as exc:
+        return busy_response(exc)
+    except (ValueError, KeyError, TypeError) as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+    return JsonResponse(result)
+
+
+async def _solve_and_store(key, body):
+    result = await offload(services.solve, body)
+    await SolvedSpot.objects.astore(key, body, result["solution"])
+    return result
+
+
+@csrf_exempt
+@require_POST
+async def solve_api(request):
+    """
+    POST a solver_engine.run_solver() payload -> its result.  Spots with
+    ranges are served from the SolvedSpot store when it holds one close
+    enough, unless the payload says "reuse": false.
+    """
+    body = _json_body(request)
+    if body is None:
+        return JsonResponse({"error": "Request body must be a JSON object"}, status=400)
+    solving = "oop_range" in body and "ip_range" in body and not body.get("tree_only")
+    if solving and body.get("reuse", True):
+        return await _solve_stored(body)
+    return await _offload_json(_body_key("solve", body), services.solve, body)
+
+
+@require_GET
+def stats_api(request):
+    """Worker pool load, single-flight counters (coalesced requests) and result cache size."""
+    cache = get_result_cache()
+    return JsonResponse({
+        "pool": get_pool().stats(),
+        "singleflight": spot_flights.stats(),
+        "result_cache": cache.info() if cache is not None else None,
+    })
@@ -0,0 +1,168 @@
+"""
+Shared process pool for the CPU-heavy work of the async views (equity,
+nuts and outs searches, solving), so the event loop stays free for cheap
+requests.
+
+Every job takes a slot for as long as it runs or waits in the pool.
+There are SOLVER_POOL_SIZE running slots plus SOLVER_QUEUE_DEPTH waiting
+ones; when all are taken a new job is refused at once (PoolSaturated,
+HTTP 429) instead of queueing without bound.  A job that does not finish
+within SOLVER_TASK_TIMEOUT seconds gives its caller PoolTimeout (HTTP
+503), and its slot is held until the worker is actually done with it, so
+slow jobs still count against the queue.
+
+Jobs are module-level functions and plain arguments (they are pickled to
+the workers).  Counters are guarded by a thread lock, not an asyncio
+primitive: under WSGI each async view runs in an event loop of its own.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.http import JsonResponse
+
+
+class PoolSaturated(Exception):
+    """Every running and queued slot is taken."""
+
+
+class PoolTimeout(Exception):
+    """The job ran past its timeout."""
+
+
+class PoolUnavailable(Exception):
+    """The pool died under the job (a worker crashed or was killed)."""
+
+
+class WorkerPool:
+    def __init__(self, size=None, queue_depth=0, timeout=None):
+        self.size = size or os.cpu_count() or 1
+        self.queue_depth = queue_depth
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @property
+    def capacity(self):
+        return self.size + self.queue_depth
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.size)
+            return self._executor
+
+    def _acquire(self):
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def _release(self, _future=None):
+        with self._lock:
+            self.in_flight -= 1
+
+    async def run(self, fn, *args, timeout=None):
+        """Result of fn(*args) from a worker process; see the module docstring."""
+        if not self._acquire():
+            raise PoolSaturated(f"All {self.capacity} solver slots are busy")
+        try:
+            future = self._submit(fn, args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            # shield: a timeout must not cancel the job's future, whose
+            # callback frees the slot
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timed_out += 1
+            raise PoolTimeout(f"Job did not finish within {timeout:g}s") from None
+        except BrokenProcessPool:
+            self._reset()
+            raise PoolUnavailable("The solver pool restarted, please retry") from None
+
+    def _submit(self, fn, args):
+        # A worker can die while nobody awaits it (a job past its timeout),
+        # which breaks the pool for every later submit: start a new one
+        try:
+            return self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            self._reset()
+        try:
+            return self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            self._reset()
+            raise PoolUnavailable("The solver pool restarted, please retry") from None
+
+    def _reset(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": self.size,
+                "queue_depth": self.queue_depth,
+                "in_flight": self.in_flight,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
+
+    def shutdown(self):
+        self._reset()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """The process-wide pool, built from the SOLVER_* settings on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WorkerPool(
+                size=getattr(settings, "SOLVER_POOL_SIZE", None),
+                queue_depth=getattr(settings, "SOLVER_QUEUE_DEPTH", 0),
+                timeout=getattr(settings, "SOLVER_TASK_TIMEOUT", None),
+            )
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+async def offload(fn, *args, timeout=None):
+    """get_pool().run(); the views turn its exceptions into responses."""
+    return await get_pool().run(fn, *args, timeout=timeout)
+
+
+def busy_response(exc):
+    """JSON error response for a pool exception: 429 when full, else 503."""
+    status = 429 if isinstance(exc, PoolSaturated) else 503
+    response = JsonResponse({"error": str(exc)}, status=status)
+    response["Retry-After"] = "1"
+    return response
+
+
+POOL_ERRORS = (PoolSaturated, PoolTimeout, PoolUnavailable)
@@ -0,0 +1,9 @@
+import os
+
+import django
+
+
+def pytest_configure():
+    # Tests of the views, services, models and cache import Django code
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "mysite.settings")
+    django.setup()
@@ -0,0 +1,48 @@
+import random
+from itertools import combinations
+
+import numpy as np
+import pytest
+from solver.hand_strength import _classify_five, evaluate_hand, evaluate_hands_batch
+from solver.logic.batch_eval import cards_array
+from solver.logic.cards import cards_to_strs
+from solver.logic.eval_tables import make_strength
+
+DECK = [r + s for r in "23456789TJQKA" for s in "cdhs"]
+
+
+def _brute_force(cards):
+    best = None
+    for combo in combinations(cards, 5):
+        cat, _, tb, _ = _classify_five(list(combo))
+        if best is None or (cat, tb) > best:
+            best = (cat, tb)
+    return make_strength(*best)
+
+
+@pytest.mark.parametrize("n", [5, 6, 7])
+def test_batch_matches_classify_five(n):
+    rng = random.Random(100 + n)
+    hands = [rng.sample(DECK, n) for _ in range(3000)]
+    strengths = evaluate_hands_batch(cards_array(hands))
+    assert strengths.shape == (3000,)
+    assert strengths.tolist() == [_brute_force(h) for h in hands]
+
+
+def test_batch_decode_matches_scalar():
+    hands = [
+        ["Kh", "2h", "Ah", "Qh", "Jh", "3d", "4s"],
+        ["5h", "4d", "3c", "2s", "Ah", "Kd", "Kc"],
+        ["As", "Ad", "Ah", "Ac", "Kd", "2c", "7s"],
+    ]
+    out = evaluate_hands_batch(cards_array(hands), decode=True)
+    for i, hand in enumerate(hands):
+        res = evaluate_hand(hand[:2], hand[2:], verbose=False)
+        assert out["category"][i] == res["category"]
+        assert out["hand_name"][i] == res["hand_name"]
+        assert cards_to_strs(out["best_five"][i].tolist()) == res["best_five"]
+
+
+def test_batch_rejects_bad_shape():
+    with pytest.raises(ValueError):
+        evaluate_hands_batch(np.zeros((3, 4), dtype=np.int8))
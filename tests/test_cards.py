@@ -0,0 +1,35 @@
+import pytest
+from solver.logic.cards import (
+    CARD_STRINGS,
+    card_from_str,
+    card_mask,
+    card_to_str,
+    deck_cards,
+    find_duplicate,
+    mask_cards,
+    mask_from_strs,
+)
+from solver.logic.duplicate_checker import check_for_duplicates
+
+
+def test_string_round_trip():
+    assert [card_to_str(card_from_str(s)) for s in CARD_STRINGS] == CARD_STRINGS
+    assert card_from_str("AS") == card_from_str("as") == card_from_str("As") == 51
+    assert card_from_str("10h") == card_from_str("Th")
+    with pytest.raises(ValueError):
+        card_from_str("1x")
+
+
+def test_masks_and_deck():
+    known = mask_from_strs(["As", "Kd", "2c"])
+    assert mask_cards(known) == [0, 45, 51]
+    deck = deck_cards(known)
+    assert len(deck) == 49
+    assert card_mask(deck) & known == 0
+
+
+def test_duplicates():
+    assert find_duplicate([3, 7, 3]) == 3
+    assert find_duplicate([3, 7]) is None
+    assert check_for_duplicates("As Kh", "Qs 7d 2c") is None
+    assert check_for_duplicates("As Kh", "Qs AS 2c") == "Duplicate card detected: AS"
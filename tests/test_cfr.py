@@ -0,0 +1,86 @@
+import time
+
+import numpy as np
+import pytest
+
+from solver.logic.cfr import RiverSolver, solve_river
+from solver.logic.combos import combo_overlap
+from solver.logic.game_tree import build_river_tree
+from solver.logic.solver_engine import run_solver
+
+BOARD = ["Ks", "Th", "7d", "4c", "2s"]
+OOP = "22+, A2s+, K9s+, QTs+, JTs, ATo+, KJo+"
+IP = "55+, A5s+, KTs+, QJs, AJo+, KQo, AhKh"
+
+
+def test_terminal_values_match_hand_matrix():
+    solver = RiverSolver(build_river_tree(10, 50), BOARD, OOP, IP)
+    hero, opp = solver.sides
+    disjoint = ~combo_overlap()[np.ix_(hero.combos, opp.combos)]
+    sign = np.sign(hero.strength[:, None] - opp.strength[None, :]) * disjoint
+    reach = np.random.default_rng(18).random((4, opp.combos.size))
+    matchup = solver.matchups[0]
+    assert np.allclose(matchup.showdown(reach), reach @ sign.T)
+    assert np.allclose(matchup.fold_totals(reach, opp.onehot), reach @ disjoint.T)
+
+
+def test_converges_fast_and_is_constant_sum():
+    start = time.perf_counter()
+    result = solve_river(build_river_tree(10, 50), BOARD, OOP, IP, iterations=2000, target=0.005)
+    assert time.perf_counter() - start < 3
+    assert result["exploitability_pct"] <= 0.005
+    assert np.isclose(sum(result["ev"]), 10)
+    for player in (0, 1):
+        strategy = result["strategy"][player]
+        assert strategy.shape == (len(result["solver"].tree), result["hands"][player].size)
+
+
+def test_exploitability_falls():
+    solver = RiverSolver(build_river_tree(10, 50), BOARD, OOP, IP)
+    first = solver.exploitability()
+    solver.solve(50, target=0)
+    assert solver.exploitability() < first / 5
+
+
+def test_nuts_against_air_wins_the_pot():
+    result = solve_river(build_river_tree(10, 50), BOARD, "KK, TT", "98s, 65s", iterations=300)
+    assert result["ev"][0] == pytest.approx(10, abs=0.1)
+    assert np.all(result["combo_ev"][1] < 0.05)
+
+
+def test_run_solver_payload():
+    result = run_solver({
+        "hand": "As Kd",
+        "board": " ".join(BOARD),
+        "oop_range": OOP,
+        "ip_range": IP,
+        "pot": 10,
+        "stack": 50,
+        "bet_sizes": [0.75],
+    })
+    solution = result["solution"]
+    assert result["evaluation"]
+    assert solution["nodes"][0]["actions"] == ["check", "bet 75%", "all-in"]
+    assert np.isclose(sum(solution["nodes"][0]["frequencies"]), 1)
+    assert set(solution["ev"]) == {"OOP", "IP"}
+    assert "AhKh" in solution["combo_ev"]["IP"]
+
+
+def test_run_solver_reports_tree_before_solving():
+    payload = {"board": " ".join(BOARD[:3]), "oop_range": OOP, "ip_range": IP, "tree_only": True}
+    solution = run_solver(payload)["solution"]
+    assert solution["mode"] == "mccfr" and "ev" not in solution
+    assert solution["tree"]["nodes"] > 1000
+    with pytest.raises(ValueError, match="MB of tables"):
+        run_solver({**payload, "tree_only": False, "iterations": 10**6})
+    river = run_solver({**payload, "board": " ".join(BOARD), "streets": [{"bet_sizes": [0.75]}]})["solution"]
+    assert river["mode"] == "cfr"
+    assert river["tree"]["edges"][0] == [river["tree"]["edges"][0][0]]
+
+
+def test_bad_inputs():
+    tree = build_river_tree(10, 50)
+    with pytest.raises(ValueError):
+        RiverSolver(tree, BOARD[:4], OOP, IP)
+    with pytest.raises(ValueError):
+        RiverSolver(tree, BOARD, "KsKh", IP)
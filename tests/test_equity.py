@@ -0,0 +1,44 @@
+from itertools import combinations
+
+import pytest
+from solver.logic.cards import card_mask, cards_from_strs, deck_cards
+from solver.logic.equity import exact_equity
+from solver.logic.eval_tables import evaluate
+
+
+def _scalar_counts(hero, villain, board):
+    h, v, b = cards_from_strs(hero), cards_from_strs(villain), cards_from_strs(board)
+    counts = [0, 0, 0]
+    for run in combinations(deck_cards(card_mask(h + v + b)), 5 - len(b)):
+        sh = evaluate(h + b + list(run))
+        sv = evaluate(v + b + list(run))
+        counts[0 if sh > sv else 1 if sh == sv else 2] += 1
+    return counts
+
+
+def test_flop_matches_scalar_enumeration():
+    hero, villain, board = ["Ah", "Kh"], ["Qs", "Qc"], ["2h", "7h", "Jd"]
+    res = exact_equity(hero, villain, board)
+    assert [res["win"], res["tie"], res["loss"]] == _scalar_counts(hero, villain, board)
+    assert res["runouts"] == 990
+
+
+def test_river_and_symmetry():
+    res = exact_equity(["As", "Kd"], ["Ac", "Kh"], ["2c", "7d", "9s", "Jh", "3c"])
+    assert (res["tie"], res["runouts"], res["equity"]) == (1, 1, 0.5)
+    a = exact_equity(["8s", "8d"], ["Ah", "Kc"], ["2c", "9h", "Ts", "Kd"])
+    b = exact_equity(["Ah", "Kc"], ["8s", "8d"], ["2c", "9h", "Ts", "Kd"])
+    assert (a["win"], a["tie"], a["loss"]) == (b["loss"], b["tie"], b["win"])
+
+
+def test_preflop_pool_matches_single_process():
+    pooled = exact_equity(["As", "Ah"], ["Kd", "Kc"], processes=2)
+    single = exact_equity(["As", "Ah"], ["Kd", "Kc"], processes=1)
+    assert pooled == single
+    assert pooled["runouts"] == 1712304
+    assert 0.81 < pooled["equity"] < 0.83
+
+
+def test_duplicate_cards_rejected():
+    with pytest.raises(ValueError):
+        exact_equity(["As", "Ah"], ["As", "Kc"])
@@ -0,0 +1,49 @@
+import random
+from itertools import combinations
+
+import pytest
+from solver.hand_strength import _classify_five, evaluate_hand
+from solver.logic.cards import CARD_INDEX
+from solver.logic.eval_tables import (
+    evaluate,
+    make_strength,
+    strength_category,
+    strength_tiebreak,
+)
+
+DECK = [r + s for r in "23456789TJQKA" for s in "cdhs"]
+
+
+def _brute_force(cards):
+    best = None
+    for combo in combinations(cards, 5):
+        cat, _, tb, _ = _classify_five(list(combo))
+        if best is None or (cat, tb) > best:
+            best = (cat, tb)
+    return best
+
+
+@pytest.mark.parametrize("n", [5, 6, 7])
+def test_table_matches_classify_five(n):
+    rng = random.Random(n)
+    for _ in range(2000):
+        cards = rng.sample(DECK, n)
+        strength = evaluate([CARD_INDEX[c] for c in cards])
+        cat, tb = _brute_force(cards)
+        assert strength_category(strength) == cat
+        assert strength_tiebreak(strength) == tb
+        assert strength == make_strength(cat, tb)
+
+
+def test_strength_orders_hands():
+    wheel = evaluate([CARD_INDEX[c] for c in ["Ah", "2c", "3d", "4s", "5h", "Kd", "Kc"]])
+    six_high = evaluate([CARD_INDEX[c] for c in ["6h", "2c", "3d", "4s", "5h", "Kd", "Kc"]])
+    trips = evaluate([CARD_INDEX[c] for c in ["Ah", "Ac", "Ad", "4s", "9h", "Kd", "2c"]])
+    assert six_high > wheel > trips
+
+
+def test_evaluate_hand_best_five_keeps_input_order():
+    res = evaluate_hand(["Kd", "Ks"], ["2c", "Kh", "2d", "2h", "Qs"], verbose=False)
+    assert res["hand_name"] == "Full House"
+    assert res["tiebreak"] == [11, 0]
+    assert res["best_five"] == ["Kd", "Ks", "2c", "Kh", "2d"]
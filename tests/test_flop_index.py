@@ -0,0 +1,68 @@
+import random
+
+import numpy as np
+import pytest
+
+from solver.logic.cards import cards_from_strs
+from solver.logic.flop_index import (
+    FLOP_INDEX_KIND,
+    _evaluate_info,
+    build_flop_index,
+    flop_lookup,
+    flop_summary,
+    load_flop_index,
+)
+from solver.logic.hand_strength import evaluate_best_possible_flop
+from solver.logic.table_file import StaleTableError, open_table, write_table
+
+
+def test_table_file_round_trip_and_version_check(tmp_path):
+    path = tmp_path / "t.bin"
+    arrays = {"a": np.arange(10, dtype=np.uint16), "b": np.ones((3, 4), dtype=np.int8)}
+    write_table(path, "demo", 2, arrays, meta={"note": "x"})
+    loaded, meta = open_table(path, "demo", 2)
+    assert meta == {"note": "x"}
+    assert np.array_equal(loaded["a"], arrays["a"])
+    assert np.array_equal(loaded["b"], arrays["b"])
+    with pytest.raises(StaleTableError):
+        open_table(path, "demo", 3)
+
+
+def test_lookup_matches_evaluation(tmp_path):
+    path = tmp_path / "flops.bin"
+    flops = [cards_from_strs(f) for f in (["Ah", "Kh", "2c"], ["9s", "8s", "7s"], ["Qd", "Qc", "5h"])]
+    assert build_flop_index(path, processes=1, flops=flops) == 3
+    rng = random.Random(13)
+    for flop in flops:
+        # A suit relabelling of the flop uses the same row
+        perm = rng.sample(range(4), 4)
+        flop = [(c & ~3) | perm[c & 3] for c in flop]
+        for _ in range(100):
+            hole = rng.sample([c for c in range(52) if c not in flop], 2)
+            assert flop_lookup(hole, flop, path) == _evaluate_info(hole, flop)
+    assert flop_lookup(cards_from_strs(["As", "Ad"]), cards_from_strs(["Kd", "7c", "2h"]), path) is None
+
+
+def test_summary_falls_back_without_index(tmp_path):
+    summary = flop_summary(["Ah", "5h"], ["4h", "3c", "Kh"], path=tmp_path / "missing.bin")
+    assert not summary["indexed"]
+    assert summary["draws"] == ["Flush Draw", "Gutshot"]
+    assert summary["hand_name"] == "High Card"
+    # 9 hearts, 3 other deuces and 14 cards that pair
+    assert summary["outs"] == 26
+
+
+def test_stale_index_is_ignored(tmp_path):
+    path = tmp_path / "old.bin"
+    write_table(path, FLOP_INDEX_KIND, 0, {"info": np.zeros(1, dtype=np.uint16)})
+    with pytest.warns(RuntimeWarning):
+        assert load_flop_index(path) is None
+
+
+def test_flop_outs_skip_runner_runner_unless_asked():
+    hole, flop = ["7s", "8s"], ["9s", "2d", "3c"]
+    _, _, future = evaluate_best_possible_flop(hole, flop)
+    assert future["outs"]["runner_runner"] is None
+    assert future["outs"]["outs"]
+    _, _, future = evaluate_best_possible_flop(hole, flop, runner_runner=True)
+    assert "Straight Flush" in future["outs"]["runner_runner"]["by_category"]
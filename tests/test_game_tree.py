@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from solver.logic.game_tree import ACTION, CHANCE, FOLD, SHOWDOWN, BetConfig, build_river_tree, build_tree
+
+
+def test_tree_layout():
+    tree = build_river_tree(10, 50)
+    for node in range(1, len(tree)):
+        assert tree.parent[node] < node
+    for node in tree.action_nodes:
+        children = list(tree.children(node))
+        assert children and all(tree.parent[c] == node for c in children)
+        assert all(tree.player[c] != tree.player[node] for c in children if tree.kind[c] == ACTION)
+    showdowns = tree.kind == SHOWDOWN
+    assert np.all(tree.commit[showdowns, 0] == tree.commit[showdowns, 1])
+    assert tree.commit.max() == 50
+    # Every bet and raise can be folded to
+    assert (tree.kind == FOLD).sum() == sum(1 for n in range(len(tree)) if tree.action[n] == "fold")
+    assert tree.path(int(np.flatnonzero(showdowns)[0])) == "check > check"
+
+
+def test_raise_cap_and_all_in():
+    capped = build_river_tree(10, 1000, bet_sizes=(0.5,), raise_sizes=(1.0,), max_raises=1, all_in=False)
+    assert max(p.count("raise") for p in map(capped.path, range(len(capped)))) == 1
+    short = build_river_tree(10, 4, bet_sizes=(0.5, 1.0))
+    # Both sizes are (nearly) the whole stack, so only the all-in is left
+    assert [short.action[c] for c in short.children(0)] == ["check", "all-in"]
+
+
+def test_streets_joined_by_chance_nodes():
+    tree = build_tree(10, 100, streets=3, bet_sizes=(0.5,), raise_sizes=(1.0,), max_raises=1)
+    chance = np.flatnonzero(tree.kind == CHANCE)
+    assert chance.size and np.all(tree.n_children[chance] == 1)
+    for node in chance:
+        child = tree.first_child[node]
+        assert tree.street[child] == tree.street[node] + 1 and tree.player[child] == 0
+    # Calling an all-in ends the hand on any street
+    called_all_in = [n for n in range(len(tree)) if tree.path(n).endswith("all-in > call")]
+    assert called_all_in and all(tree.kind[n] == SHOWDOWN for n in called_all_in)
+    assert tree.street.max() == 2
+    assert tree.path(int(tree.first_child[chance[0]]) + 1) == "check > check | check"
+    assert np.all(tree.commit.max(axis=1) <= 100)
+
+
+def test_per_street_config_and_footprint():
+    flop = BetConfig(bet_sizes=(0.33, 0.75), raise_sizes=(1.0,), max_raises=1)
+    later = BetConfig(bet_sizes=(0.75,), raise_sizes=(), max_raises=0, all_in=False)
+    tree = build_tree(10, 100, streets=3, config=[flop, later, later])
+    assert [tree.action[c] for c in tree.children(0)] == ["check", "bet 33%", "bet 75%", "all-in"]
+    turn_root = int(tree.first_child[np.flatnonzero(tree.kind == CHANCE)[0]])
+    assert [tree.action[c] for c in tree.children(turn_root)] == ["check", "bet 75%"]
+    assert np.allclose(tree.pots, 10 + tree.commit.sum(axis=1))
+    assert np.all(tree.behind >= 0)
+
+    report = tree.footprint((100, 200), runouts=(1, 10, 100))
+    assert report["nodes"] == len(tree)
+    assert report["tree_bytes"] == tree.nbytes < 100 * len(tree)
+    rows = report["edges"]
+    assert sum(map(sum, rows)) == tree.n_children[tree.kind == ACTION].sum()
+    expected = sum(rows[p][s] * (1, 10, 100)[s] * (100, 200)[p] * 2 * 8 for p in (0, 1) for s in range(3))
+    assert report["table_bytes"] == expected
+
+
+def test_two_size_flop_tree_is_small():
+    tree = build_tree(10, 200, streets=3, bet_sizes=(0.5, 1.0), raise_sizes=(0.5, 1.0), max_raises=3)
+    assert len(tree) > 10_000
+    assert tree.nbytes < 64 * len(tree)
+
+
+def test_bad_tree():
+    with pytest.raises(ValueError):
+        build_river_tree(0, 10)
+    with pytest.raises(ValueError):
+        BetConfig(bet_sizes=(0,))
+    with pytest.raises(ValueError):
+        build_tree(10, 100, streets=3, config=[BetConfig()] * 2)
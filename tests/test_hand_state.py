@@ -0,0 +1,39 @@
+import random
+
+from solver.logic.eval_tables import evaluate
+from solver.logic.hand_state import HandState
+from solver.logic.hand_strength import evaluate_best_possible_river, evaluate_streets
+
+
+def test_add_remove_matches_evaluate():
+    rng = random.Random(12)
+    for _ in range(300):
+        cards = rng.sample(range(52), 7)
+        state = HandState(cards[:5])
+        assert state.strength() == evaluate(cards[:5])
+        state.add_card(cards[5])
+        state.add_card(cards[6])
+        assert state.strength() == evaluate(cards)
+        state.remove_card(cards[5])
+        assert state.strength() == evaluate(cards[:5] + cards[6:])
+        assert cards[5] not in state and cards[6] in state
+        assert len(state) == 6
+
+
+def test_counts_and_masks():
+    state = HandState([48, 49, 50, 0, 4])  # Ac Ad Ah 2c 3c
+    assert state.rank_counts[12] == 3
+    assert state.rank_counts[0] == 1
+    assert state.suit_counts == [3, 1, 1, 0]
+    assert state.rank_mask == (1 << 12) | 0b11
+    other = state.copy()
+    other.remove_card(48)
+    assert state.rank_counts[12] == 3
+
+
+def test_evaluate_streets_matches_single_street():
+    hand, board = ["As", "Kd"], ["Ah", "Ad", "7c", "Kc", "2s"]
+    streets = evaluate_streets(hand, board)
+    assert list(streets) == ["flop", "turn", "river"]
+    assert streets["river"][:2] == evaluate_best_possible_river(hand, board)[:2]
+    assert streets["turn"][1] == "Full House"
@@ -0,0 +1,98 @@
+import itertools
+import time
+
+import numpy as np
+import pytest
+
+from solver.logic.icm import finish_probabilities, icm_equity
+from solver.logic.combos import N_CLASSES
+from solver.logic.pushfold import icm_decision, pushfold_decision
+
+
+def _toy_equity():
+    strength = np.linspace(1.0, 0.0, N_CLASSES)
+    return 0.5 + 0.35 * (strength[:, None] - strength[None, :])
+
+
+def _harville_brute_force(stacks, payouts):
+    ev = np.zeros(len(stacks))
+    for order in itertools.permutations(range(len(stacks))):
+        p, rest = 1.0, sum(stacks)
+        for i in order:
+            p *= stacks[i] / rest
+            rest -= stacks[i]
+        for place, i in enumerate(order[: len(payouts)]):
+            ev[i] += p * payouts[place]
+    return ev
+
+
+def test_exact_matches_brute_force():
+    stacks, payouts = [10, 20, 30, 5, 35, 12], [50, 30, 20]
+    assert np.allclose(icm_equity(stacks, payouts), _harville_brute_force(stacks, payouts))
+
+
+def test_basic_properties():
+    assert np.allclose(icm_equity([10, 10, 10], [60, 40]), [100 / 3] * 3)
+    # Winner take all is chip equity
+    assert np.allclose(icm_equity([10, 30, 60], [1]), [0.1, 0.3, 0.6])
+    # Busted players get nothing, live players share the places
+    assert np.allclose(icm_equity([0, 10, 10], [60, 40, 10]), [0, 50, 50])
+    probs = finish_probabilities([10, 20, 30, 40])
+    assert np.allclose(probs.sum(axis=0), 1) and np.allclose(probs.sum(axis=1), 1)
+    with pytest.raises(ValueError):
+        icm_equity([-1, 5], [1])
+
+
+def test_nine_handed_is_fast_and_monte_carlo_agrees():
+    stacks = [12, 25, 8, 40, 33, 19, 27, 6, 31]
+    payouts = [40, 25, 15, 10, 5, 3, 2]
+    start = time.perf_counter()
+    exact = icm_equity(stacks, payouts, method="exact")
+    assert time.perf_counter() - start < 0.05
+    assert np.isclose(exact.sum(), sum(payouts))
+    sampled = icm_equity(stacks, payouts, method="monte_carlo", samples=100_000, rng=np.random.default_rng(17))
+    assert np.abs(sampled - exact).max() < 0.15
+
+
+def test_auto_switches_to_monte_carlo_for_big_fields():
+    stacks = list(range(5, 105, 5))
+    ev = icm_equity(stacks, list(range(20, 0, -1)), samples=20_000, rng=np.random.default_rng(1))
+    assert np.isclose(ev.sum(), 210)
+    assert np.all(np.diff(ev) > 0)
+
+
+def test_icm_decision_reduces_to_chip_ev_winner_take_all():
+    stacks = {"CO": 10, "BTN": 30, "SB": 8, "BB": 15, "other": 20}
+    total = sum(stacks.values())
+    good = icm_decision("CO", "As Ad", stacks, [1], equity=_toy_equity())
+    bad = icm_decision("CO", "7c 2d", stacks, [1], equity=_toy_equity())
+    assert good["action"] == "Jam" and bad["action"] == "Fold"
+    assert np.isclose(good["ev_fold"], 10 / total)
+
+
+def test_bubble_tightens_calls():
+    # Two short stacks on the bubble of a 3-paid, 4-player game: calling
+    # off with a marginal hand is worth less than it is in chips.
+    stacks = {"SB": 10, "BB": 10, "a": 40, "b": 40}
+    hand = "Qc Td"
+    chips = icm_decision("BB", hand, stacks, [1], vs="SB", equity=_toy_equity())
+    bubble = icm_decision("BB", hand, stacks, [50, 30, 20], vs="SB", equity=_toy_equity())
+    chip_edge = chips["ev_play"] / chips["ev_fold"]
+    icm_edge = bubble["ev_play"] / bubble["ev_fold"]
+    assert icm_edge < chip_edge
+
+
+def test_pushfold_decision_icm_message(monkeypatch):
+    import solver.logic.pushfold as pushfold
+
+    monkeypatch.setattr(pushfold, "class_equity_matrix", _toy_equity)
+    text = pushfold_decision("CO", "As Ad", None, stacks={"CO": 10, "BTN": 30, "SB": 8, "BB": 15}, payouts=[60, 40])
+    assert text.startswith("Jam (AA in ICM terms")
+
+
+def test_pushfold_decision_icm_checks_stacks():
+    stacks = {"CO": 10, "BTN": 30, "SB": 8, "BB": 15}
+    assert pushfold_decision("CO", "As Ad", 10, payouts=[60, 40]).startswith("No ICM decision")
+    assert "no stack given for CO" in pushfold_decision("CO", "As Ad", 10, stacks={"BB": 15}, payouts=[1])
+    assert "no stack given for UTG" in pushfold_decision("BB", "As Ad", 10, vs="UTG", stacks=stacks, payouts=[1])
+    assert pushfold_decision("BB", "As Ad", 10, vs="XX", stacks=stacks, payouts=[1]).startswith("No range defined")
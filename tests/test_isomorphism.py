@@ -0,0 +1,46 @@
+from math import comb
+
+from solver.logic.cards import cards_from_strs
+from solver.logic.equity import exact_equity
+from solver.logic.eval_tables import evaluate
+from solver.logic.isomorphism import (
+    apply_suit_map,
+    canonical_boards,
+    canonical_key,
+    canonicalize,
+    invert_suit_map,
+    iter_runouts,
+)
+
+
+def test_flop_classes():
+    flops = canonical_boards(3)
+    assert len(flops) == 1755
+    assert sum(w for _, w in flops) == comb(52, 3)
+
+
+def test_isomorphic_spots_share_a_key():
+    key_a, map_a = canonical_key(["As", "Ks"], ["Qs", "Js", "2h"])
+    key_b, map_b = canonical_key(["Ah", "Kh"], ["Qh", "Jh", "2c"])
+    assert key_a == key_b
+    assert canonical_key(["As", "Ks"], ["Qs", "Js", "2s"])[0] != key_a
+
+
+def test_suit_map_round_trip():
+    hole = cards_from_strs(["Ah", "Kd"])
+    (canon_hole,), suit_map = canonicalize(hole)
+    back = apply_suit_map(canon_hole, invert_suit_map(suit_map))
+    assert sorted(back) == sorted(hole)
+
+
+def test_weighted_runouts_reproduce_exact_counts():
+    hero, villain, board = ["Ah", "Kh"], ["Qs", "Qc"], ["2h", "7h", "Jd"]
+    h, v, b = cards_from_strs(hero), cards_from_strs(villain), cards_from_strs(board)
+    runouts = list(iter_runouts([h, v, b], 2))
+    assert len(runouts) < comb(45, 2)
+    counts = [0, 0, 0]
+    for run, weight in runouts:
+        sh, sv = evaluate(h + b + run), evaluate(v + b + run)
+        counts[0 if sh > sv else 1 if sh == sv else 2] += weight
+    res = exact_equity(hero, villain, board)
+    assert counts == [res["win"], res["tie"], res["loss"]]
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from solver.logic.game_tree import build_tree
+from solver.logic.mccfr import MCCFRSolver, SampledGame, solve_sampled
+from solver.logic.range_equity import range_vs_range
+from solver.logic.solver_engine import run_solver
+
+TURN = ["Ks", "Th", "7d", "4c"]
+OOP = "22+, A2s+, K9s+, QTs+, JTs, ATo+, KJo+"
+IP = "55+, A5s+, KTs+, QJs, AJo+, KQo"
+
+
+def test_check_down_is_range_equity():
+    # With no bets every runout goes to showdown, so the exact evaluation
+    # over all runouts is the range equity
+    oop, ip = "QQ+, AK, KQs", "TT+, AQs+, KJs+"
+    for board in (TURN, TURN[:3]):
+        tree = build_tree(10, 100, streets=6 - len(board), bet_sizes=(), raise_sizes=(), all_in=False)
+        evaluation = MCCFRSolver(tree, board, oop, ip, processes=1).evaluate()
+        equity = range_vs_range(oop, ip, board)["equity"]
+        assert evaluation["ev"][0] == pytest.approx(10 * equity)
+        assert sum(evaluation["ev"]) == pytest.approx(10)
+        assert evaluation["exploitability"] == pytest.approx(0, abs=1e-9)
+
+
+def test_sampled_evaluation_estimates_flop_values():
+    oop, ip = "QQ+, AK, KQs", "TT+, AQs+, KJs+"
+    tree = build_tree(10, 100, streets=3, bet_sizes=(), raise_sizes=(), all_in=False)
+    solver = MCCFRSolver(tree, TURN[:3], oop, ip, processes=1, seed=5)
+    # A budget that covers every runout evaluates exactly
+    assert solver.evaluate(runouts=49 * 48)["exact"]
+    sampled = solver.evaluate(runouts=100)
+    assert not sampled["exact"]
+    assert sampled["ev"][0] == pytest.approx(10 * range_vs_range(oop, ip, TURN[:3])["equity"], abs=0.5)
+
+
+def test_isomorphic_runouts_share_tables():
+    # A monotone flop with suit-symmetric ranges: the three other suits
+    # are interchangeable, so turn cards fall into far fewer classes
+    game = SampledGame(build_tree(10, 50, streets=3), ["Ks", "Ts", "7s"], "QQ+, AK", "JJ+, AQs+")
+    assert len(game.suit_maps) == 6
+    classes = {game.runout_key([c])[0] for c in game.deck}
+    assert len(classes) < len(game.deck) / 2
+    # A hand maps onto the hand that plays its part on the canonical runout
+    key, m = game.runout_key([4 * 12 + 1])
+    assert game.hand_maps[m][0].size == game.hands[0].size
+    assert sorted(game.hand_maps[m][0]) == list(range(game.hands[0].size))
+
+
+def test_sampled_solve_converges():
+    tree = build_tree(10, 50, streets=2, bet_sizes=(0.5,), raise_sizes=(1.0,), max_raises=1)
+    with MCCFRSolver(tree, TURN, OOP, IP, processes=1, seed=19) as solver:
+        start = solver.evaluate()["exploitability"]
+        solver.solve(1000)
+        end = solver.evaluate()
+    assert end["exploitability"] < start / 10
+    assert sum(end["ev"]) == pytest.approx(10)
+
+
+def test_workers_merge_updates():
+    tree = build_tree(10, 50, streets=2, bet_sizes=(0.5,), raise_sizes=(1.0,), max_raises=1)
+    result = solve_sampled(tree, TURN, OOP, IP, iterations=600, processes=2, batch=10, seed=19)
+    assert result["processes"] == 2
+    assert result["iterations"] >= 600
+    assert result["exploitability_pct"] < 0.3
+    for player in (0, 1):
+        strategy = result["strategy"][player]
+        assert strategy.shape[1] == result["hands"][player].size
+        assert np.all(strategy >= 0)
+
+
+def test_run_solver_mode():
+    payload = {
+        "board": " ".join(TURN),
+        "oop_range": OOP,
+        "ip_range": IP,
+        "stack": 50,
+        "bet_sizes": [0.5],
+        "max_raises": 1,
+        "iterations": 64,
+        "processes": 1,
+    }
+    solution = run_solver(payload)["solution"]
+    assert solution["mode"] == "mccfr"
+    assert solution["nodes"][0]["actions"] == ["check", "bet 50%", "all-in"]
+    assert set(solution["ev"]) == {"OOP", "IP"}
+    with pytest.raises(ValueError):
+        run_solver({**payload, "mode": "cfr"})
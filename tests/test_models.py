@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+
+from solver.logic.solver_engine import run_solver
+from solver.models import SolvedSpot, spot_key
+from solver.views import solve_api
+
+PAYLOAD = {
+    "board": "As Kd 7c 2h 3s",
+    "oop_range": "AA,KK,72o",
+    "ip_range": "QQ,JJ,A7s",
+    "pot": 10,
+    "stack": 50,
+    "iterations": 50,
+}
+# The same spot with hearts and spades swapped
+SWAPPED = {**PAYLOAD, "board": "Ah Kd 7c 2s 3h"}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def test_db():
+    # A throwaway database (in memory for SQLite), never db.sqlite3
+    old_name = connection.creation.create_test_db(verbosity=0)
+    yield
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+@pytest.fixture(autouse=True)
+def empty_store():
+    SolvedSpot.objects.all().delete()
+
+
+def _board(payload):
+    return payload["board"].split()
+
+
+def test_keys_match_isomorphic_spots():
+    key = spot_key(PAYLOAD, _board(PAYLOAD))
+    swapped = spot_key(SWAPPED, _board(SWAPPED))
+    assert key.board == swapped.board and key.ranges_hash == swapped.ranges_hash
+    assert key.config_hash == swapped.config_hash
+    assert spot_key({**PAYLOAD, "bet_sizes": [0.33]}, _board(PAYLOAD)).config_hash != key.config_hash
+    assert spot_key({**PAYLOAD, "ip_range": "QQ"}, _board(PAYLOAD)).ranges_hash != key.ranges_hash
+
+
+def test_nearest_relabels_and_scales():
+    solution = run_solver(PAYLOAD)["solution"]
+    SolvedSpot.objects.store(spot_key(PAYLOAD, _board(PAYLOAD)), PAYLOAD, solution)
+
+    # Same spot in other suits, twice the chips: same SPR
+    request = {**SWAPPED, "pot": 20, "stack": 100}
+    key = spot_key(request, _board(request))
+    stored = SolvedSpot.objects.nearest(key)
+    assert stored is not None
+    found = stored.solution_for(key)
+    assert found["ev"]["OOP"] == pytest.approx(2 * solution["ev"]["OOP"])
+    # AhAs in the original spot is AsAh -> AsAh, AhAd -> AsAd after the swap
+    assert found["combo_ev"]["OOP"]["AsAd"] == pytest.approx(2 * solution["combo_ev"]["OOP"]["AhAd"])
+    assert found["nodes"][0]["strategy"]["AsAd"] == solution["nodes"][0]["strategy"]["AhAd"]
+
+    far = {**PAYLOAD, "stack": 100}
+    assert SolvedSpot.objects.nearest(spot_key(far, _board(far))) is None
+
+
+def test_solve_api_stores_and_reuses():
+    factory = RequestFactory()
+
+    def post(payload):
+        request = factory.post("/api/solve/", json.dumps(payload), content_type="application/json")
+        return json.loads(asyncio.run(solve_api(request)).content)
+
+    first = post({**PAYLOAD, "processes": 1})
+    assert "stored" not in first["solution"]
+    assert SolvedSpot.objects.count() == 1
+
+    second = post({**SWAPPED, "processes": 1})
+    assert second["solution"]["stored"]["id"] == SolvedSpot.objects.get().pk
+    assert second["solution"]["ev"] == pytest.approx(first["solution"]["ev"])
+    assert SolvedSpot.objects.count() == 1
+
+
+def test_concurrent_solves_store_one_row():
+    factory = RequestFactory()
+
+    async def burst():
+        requests = [
+            factory.post("/api/solve/", json.dumps({**PAYLOAD, "processes": 1}), content_type="application/json")
+            for _ in range(4)
+        ]
+        return await asyncio.gather(*(solve_api(r) for r in requests))
+
+    assert all(r.status_code == 200 for r in asyncio.run(burst()))
+    assert SolvedSpot.objects.count() == 1
+
+    # A second store of the same spot and SPR keeps the first row
+    solution = json.loads(asyncio.run(burst())[0].content)["solution"]
+    SolvedSpot.objects.store(spot_key(PAYLOAD, _board(PAYLOAD)), PAYLOAD, solution)
+    assert SolvedSpot.objects.count() == 1
@@ -0,0 +1,36 @@
+from solver.logic.equity import exact_equity
+from solver.logic.montecarlo import (
+    monte_carlo_equity,
+    parallel_monte_carlo_equity,
+    spawn_rngs,
+)
+
+
+def test_agrees_with_exact_within_error():
+    hero, villain, board = ["Ah", "Kh"], ["Qs", "Qc"], ["2h", "7h", "Jd"]
+    exact = exact_equity(hero, villain, board)["equity"]
+    mc = monte_carlo_equity([hero, villain], board, target_stderr=0.003, seed=7)
+    assert mc["stopped"] == "precision"
+    assert abs(mc["equity"][0] - exact) < 4 * mc["stderr"][0]
+    assert abs(sum(mc["equity"]) - 1) < 1e-9
+
+
+def test_seeded_runs_are_reproducible():
+    hands = [["9s", "9d"], None, None]
+    a = monte_carlo_equity(hands, max_samples=20000, target_stderr=None, seed=11)
+    b = monte_carlo_equity(hands, max_samples=20000, target_stderr=None, seed=11)
+    assert a == b
+    assert a["samples"] == 20000 and a["stopped"] == "samples"
+
+
+def test_spawned_streams_differ():
+    r1, r2 = spawn_rngs(5, 2)
+    assert r1.random() != r2.random()
+
+
+def test_parallel_is_reproducible():
+    hands = [["As", "Ah"], ["Kd", "Kc"]]
+    a = parallel_monte_carlo_equity(hands, workers=2, max_samples=20000, target_stderr=None, seed=3)
+    b = parallel_monte_carlo_equity(hands, workers=2, max_samples=20000, target_stderr=None, seed=3)
+    assert a == b
+    assert a["samples"] == 20000
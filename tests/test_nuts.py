@@ -0,0 +1,36 @@
+import random
+from itertools import combinations
+
+from solver.hand_strength import compute_best_possible_hand
+from solver.logic.cards import card_mask, deck_cards
+from solver.logic.eval_tables import evaluate, make_strength
+from solver.logic.nuts import nuts_completion
+
+
+def _brute_force(known, to_add):
+    deck = deck_cards(card_mask(known))
+    return max(evaluate(known + list(extra)) for extra in combinations(deck, to_add))
+
+
+def test_nuts_completion_matches_brute_force():
+    rng = random.Random(4)
+    for _ in range(400):
+        board_len = rng.choice([2, 3, 4])
+        known = rng.sample(range(52), 2 + board_len)
+        extra = nuts_completion(known, 5 - board_len)
+        assert len(extra) == 5 - board_len
+        assert not set(extra) & set(known)
+        assert evaluate(known + extra) == _brute_force(known, 5 - board_len)
+
+
+def test_preflop_nuts_is_royal_flush():
+    assert evaluate([0, 1] + nuts_completion([0, 1], 5)) == make_strength(8, [12])
+
+
+def test_compute_best_possible_hand_flop():
+    hole, board = ["7h", "8h"], ["9h", "Th", "2c"]
+    nuts = compute_best_possible_hand(hole, board, verbose=False)
+    assert nuts["best_name"] == "Straight Flush"
+    assert nuts["best_tiebreak"] == [10]
+    assert sorted(nuts["completion"]) == ["Jh", "Qh"]
+    assert nuts["best_five"] == ["8h", "9h", "Th", "Jh", "Qh"]
@@ -0,0 +1,54 @@
+import random
+from itertools import combinations
+
+from solver.logic.cards import card_mask, cards_from_strs, deck_cards
+from solver.logic.eval_tables import evaluate, strength_category
+from solver.logic.hand_strength import simulate_future_outs
+from solver.logic.outs import find_outs
+
+
+def test_category_outs_match_brute_force():
+    rng = random.Random(11)
+    for _ in range(50):
+        known = rng.sample(range(52), rng.choice([5, 6]))
+        hole, board = known[:2], known[2:]
+        report = find_outs(hole, board, runner_runner=False)
+        base = strength_category(evaluate(known))
+        expected = [c for c in deck_cards(card_mask(known)) if strength_category(evaluate(known + [c])) > base]
+        found = [c for c, s in zip(report["outs"], report["out_strengths"]) if strength_category(s) > base]
+        assert found == expected
+        assert sorted(report["kicker_outs"] + found) == report["outs"]
+
+
+def test_runner_runner_matches_brute_force():
+    hole, board = cards_from_strs(["Ah", "Kh"]), cards_from_strs(["Qh", "7c", "2d"])
+    known = hole + board
+    rr = find_outs(hole, board)["runner_runner"]
+    deck = deck_cards(card_mask(known))
+    cat = lambda cards: strength_category(evaluate(known + list(cards)))
+    expected = [
+        (t, r) for t, r in combinations(deck, 2)
+        if cat((t, r)) > max(cat((t,)), cat((r,)))
+    ]
+    assert rr["combos"] == expected
+    flushes = rr["by_category"]["Flush"]["combos"]
+    assert len(flushes) == 44  # 10 hearts left, C(10, 2) minus the royal
+    assert rr["reach"]["High Card"] == 1.0
+
+
+def test_kicker_outs_need_hero_cards():
+    # AK high on Q72: a 3 or a J only lifts shared kickers
+    report = find_outs(cards_from_strs(["Ah", "Kh"]), cards_from_strs(["Qh", "7c", "2d"]))
+    assert report["kicker_outs"] == []
+    # A5 on A722: a 5 or a 7 beats aces and deuces with hero's cards
+    # playing, a K only lifts the shared kicker
+    report = find_outs(cards_from_strs(["Ah", "5c"]), cards_from_strs(["Ad", "7c", "2d", "2s"]))
+    assert report["kicker_outs"] == cards_from_strs(["5d", "5h", "5s", "7d", "7h", "7s"])
+
+
+def test_simulate_future_outs_format():
+    future = simulate_future_outs(["AH", "KH"], ["QH", "JH", "2C"])
+    assert list(future) == ["C", "D", "H", "S"]
+    assert ("TH", "♥", "Royal Flush") in future["H"]
+    assert ("9H", "♥", "Flush") in future["H"]
+    assert simulate_future_outs(["AH", "KH"], ["QH", "JH", "2C", "3D", "4S"])["H"] == []
@@ -0,0 +1,48 @@
+import numpy as np
+
+from solver.logic.cards import cards_from_strs
+from solver.logic.combos import CLASS_INDEX, N_CLASSES, N_COMBOS, combo_index
+from solver.logic.eval_tables import evaluate
+from solver.logic.isomorphism import all_suit_maps, apply_suit_map, canonical_boards
+from solver.logic.preflop_equity import PREFLOP_EQUITY_KIND, PREFLOP_EQUITY_VERSION, preflop_equity, win_counts
+from solver.logic.table_file import write_table
+
+
+def test_orbit_symmetrized_wins_match_direct_count():
+    boards = canonical_boards(5)
+    boards = boards[:3] + boards[-2:]
+    wins = win_counts([(tuple(b), w) for b, w in boards], processes=1, chunks=2)
+
+    orbit = set()
+    for board, _ in boards:
+        for suit_map in all_suit_maps():
+            orbit.add(tuple(sorted(apply_suit_map(board, suit_map))))
+    assert len(orbit) == sum(w for _, w in boards)
+
+    rng = np.random.default_rng(14)
+    for _ in range(40):
+        a, b, c, d = (int(x) for x in rng.choice(52, 4, replace=False))
+        expected = sum(
+            1 for board in orbit
+            if not {a, b, c, d} & set(board)
+            and evaluate([a, b, *board]) > evaluate([c, d, *board])
+        )
+        assert wins[combo_index(a, b), combo_index(c, d)] == expected
+
+
+def test_lookups_read_the_table(tmp_path):
+    path = tmp_path / "pf.bin"
+    combo = np.full((N_COMBOS, N_COMBOS), 0.25, dtype=np.float32)
+    combo[combo_index(*cards_from_strs(["As", "Ah"])), combo_index(*cards_from_strs(["Ks", "Kh"]))] = 0.8
+    klass = np.full((N_CLASSES, N_CLASSES), 0.5)
+    klass[CLASS_INDEX["AA"], CLASS_INDEX["KK"]] = 0.82
+    write_table(path, PREFLOP_EQUITY_KIND, PREFLOP_EQUITY_VERSION, {"combo": combo, "class": klass})
+
+    assert preflop_equity("AA", "KK", path) == 0.82
+    assert np.isclose(preflop_equity("AsAh", ["Ks", "Kh"], path), 0.8)
+    assert np.isnan(preflop_equity("AsAh", "AsKd", path))
+
+
+def test_fallback_enumerates_without_table(tmp_path):
+    eq = preflop_equity("AsAh", "KsKh", tmp_path / "missing.bin")
+    assert abs(eq - 0.8264) < 0.0005
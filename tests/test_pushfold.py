@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from solver.logic.combos import N_CLASSES
+from solver.logic.pushfold import CALL_RANGES, PUSH_RANGES, normalize_combo, pushfold_decision, stack_band
+from solver.logic.ranges import Range
+from solver.logic.pushfold_nash import POSITIONS, STACKS, chart_range, format_charts, solve_pushfold
+
+
+def _toy_equity():
+    """Antisymmetric class equities ordered by class index (AA best)."""
+    strength = np.linspace(1.0, 0.0, N_CLASSES)
+    return 0.5 + 0.35 * (strength[:, None] - strength[None, :])
+
+
+def test_charts_cover_every_stack_and_position():
+    assert sorted(PUSH_RANGES) == list(STACKS)
+    for stack in STACKS:
+        assert set(PUSH_RANGES[stack]) == set(POSITIONS[:-1])
+        assert set(CALL_RANGES[stack]["UTG"]) == set(POSITIONS[1:])
+        assert "AA" in PUSH_RANGES[stack]["UTG"]
+    # Later positions shove wider, everyone shoves tighter when deeper
+    assert PUSH_RANGES[10.0]["UTG"].fraction < PUSH_RANGES[10.0]["BTN"].fraction < PUSH_RANGES[10.0]["SB"].fraction
+    assert PUSH_RANGES[20.0]["SB"].fraction < PUSH_RANGES[5.0]["SB"].fraction
+
+
+def test_stack_band_and_normalize():
+    assert stack_band(13) == 13.0
+    assert stack_band(7.3) == 7.5
+    assert stack_band(0.4) == 1.0
+    assert stack_band(40) is None
+    assert normalize_combo("As Kh") == "AKo"
+    assert normalize_combo("Ts Ks") == "KTs"
+    assert normalize_combo("7d 7c") == "77"
+
+
+def test_pushfold_decision():
+    assert pushfold_decision("UTG", "As Ad", 13).startswith("Jam")
+    assert pushfold_decision("UTG", "7s 2d", 13).startswith("Fold")
+    assert "call range for BB vs SB" in pushfold_decision("BB", "As Ad", 10)
+    assert pushfold_decision("BB", "As Ad", 10, vs="CO").startswith("Call")
+    assert pushfold_decision("UTG", "As Ad", 40).startswith("No range")
+
+
+def test_solver_converges_to_threshold_ranges():
+    solved = solve_pushfold("SB", stacks=[2.0, 10.0], equity=_toy_equity(), tol=1e-4)
+    assert solved["exploitability"].max() < 1e-4
+    for i in range(2):
+        shove = np.flatnonzero(chart_range(solved["shove"][i]).class_weights)
+        call = np.flatnonzero(chart_range(solved["call"]["BB"][i]).class_weights)
+        # With equity monotone in class index both ranges are top-n ranges
+        assert shove.tolist() == list(range(shove.size))
+        assert call.tolist() == list(range(call.size))
+    assert chart_range(solved["shove"][0]).fraction > chart_range(solved["shove"][1]).fraction
+
+
+def test_format_charts_round_trips():
+    push = {2.0: {"SB": Range("TT+, A2s+, KQ, 72o")}}
+    call = {2.0: {"SB": {"BB": Range()}}}
+    namespace = {"__name__": "solver.logic.charts_test", "__package__": "solver.logic"}
+    exec(format_charts(push, call), namespace)
+    assert namespace["PUSH_RANGES"] == push
+    assert namespace["CALL_RANGES"] == call
+
+
+def test_unknown_shover():
+    with pytest.raises(ValueError):
+        solve_pushfold("BB", equity=_toy_equity())
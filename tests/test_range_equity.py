@@ -0,0 +1,45 @@
+import numpy as np
+from solver.logic.combos import CLASS_COMBO_COUNT, COMBO_CARDS, N_COMBOS, combo_index
+from solver.logic.cards import card_from_str
+from solver.logic.equity import exact_equity
+from solver.logic.range_equity import board_strengths, canonical_board_strengths, range_vs_range, range_weights
+
+
+def test_combo_tables():
+    assert COMBO_CARDS.shape == (N_COMBOS, 2)
+    assert CLASS_COMBO_COUNT.sum() == N_COMBOS
+    assert sorted(set(CLASS_COMBO_COUNT.tolist())) == [4, 6, 12]
+    i = combo_index(card_from_str("As"), card_from_str("Kd"))
+    assert i == combo_index(card_from_str("Kd"), card_from_str("As"))
+
+
+def test_range_weights_expansion():
+    assert range_weights({"AK", "TT"}).sum() == 22
+    assert range_weights(["AKs"]).sum() == 4
+    assert range_weights({"AKo": 0.5}).sum() == 6
+
+
+def test_single_combos_match_exact_equity():
+    board = ["2h", "7h", "Jd"]
+    res = range_vs_range(["AhKh"], ["QsQc"], board)
+    assert np.isclose(res["equity"], exact_equity(["Ah", "Kh"], ["Qs", "Qc"], board)["equity"])
+
+
+def test_board_blocks_combos_and_reuses_strengths():
+    board = ["As", "7h", "2d", "9c", "Kd"]
+    res = range_vs_range({"AA", "KK"}, {"QQ"}, board)
+    assert res["combos_a"].size == 6
+    assert res["equity"] == 1.0
+    before = canonical_board_strengths.cache_info().hits
+    range_vs_range({"QQ"}, {"JJ"}, ["Ah", "7s", "2c", "9d", "Kc"])
+    assert canonical_board_strengths.cache_info().hits > before
+
+
+def test_isomorphic_boards_share_strengths():
+    board = [card_from_str(c) for c in ["2h", "7h", "Jd", "3c", "9s"]]
+    relabelled = [card_from_str(c) for c in ["2s", "7s", "Jc", "3d", "9h"]]
+    a, b = board_strengths(board), board_strengths(relabelled)
+    assert sorted(a.tolist()) == sorted(b.tolist())
+    ks = combo_index(card_from_str("Kh"), card_from_str("Qh"))
+    ks2 = combo_index(card_from_str("Ks"), card_from_str("Qs"))
+    assert a[ks] == b[ks2] > 0
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from solver.logic.combos import CLASS_INDEX, N_CLASSES, N_COMBOS
+from solver.logic.ranges import Range, get_preflop_recommendation, token_combos
+
+
+@pytest.mark.parametrize("notation, combos", [
+    ("AA", 6),
+    ("AKs", 4),
+    ("AKo", 12),
+    ("AK", 16),
+    ("TT+", 30),
+    ("ATs+", 16),
+    ("K9o+", 48),
+    ("99-66", 24),
+    ("A5s-A2s", 16),
+    ("76s-54s", 12),
+    ("AsKs", 1),
+    ("QQ+, AKs, AK:0.5", 18 + 16 * 0.5),
+])
+def test_notation_combo_counts(notation, combos):
+    assert Range(notation).combo_count == combos
+
+
+@pytest.mark.parametrize("notation", [
+    "QQ+, ATs+, KQo, 76s-54s, AK:0.5, AsKs",
+    "22+, A2+, K9s+, KTo+",
+    "99-66, A5-A2, 87s:0.25",
+    "",
+])
+def test_notation_round_trips(notation):
+    r = Range(notation)
+    assert Range(r.notation()) == r
+
+
+def test_notation_is_compact():
+    assert Range("AA, KK, QQ, AKs, AQs, AJs").notation() == "QQ+, AJs+"
+    assert Range({"AK", "TT"}).notation() == "TT, AK"
+
+
+def test_bad_tokens():
+    for token in ["AKx", "A", "AA+s", "AsAs", "AKs-QJo"]:
+        with pytest.raises(ValueError):
+            token_combos(token)
+
+
+def test_inputs_agree():
+    expected = Range("TT, AK")
+    assert Range({"AK", "TT"}) == expected
+    assert Range({"AK": 1.0, "TT": 1.0}) == expected
+    assert Range(expected.weights) == expected
+    assert Range.from_classes(expected.class_weights) == expected
+    assert Range(expected.class_weights) == expected
+    with pytest.raises(ValueError):
+        Range(np.zeros(12))
+
+
+def test_membership_and_weights():
+    r = Range("AKs:0.5, QQ")
+    assert "AKs" in r and "AsKs" in r and ["Qh", "Qd"] in r
+    assert "AKo" not in r and "AsKd" not in r and "junk" not in r
+    assert r.weight("AhKh") == 0.5
+    assert r.class_weights[CLASS_INDEX["AKs"]] == 0.5
+    assert r.class_weights.shape == (N_CLASSES,)
+    assert r.weights.shape == (N_COMBOS,)
+    with pytest.raises(ValueError):
+        r.weights[0] = 1
+
+
+def test_set_operations_and_blockers():
+    a, b = Range("TT+, AK"), Range("QQ+, AQ")
+    assert a | b == Range("TT+, AQ+")
+    assert a & b == Range("QQ+")
+    assert a - b == Range("TT-JJ, AK")
+    assert a.without(["As", "Ah"]).combo_count == 30 - 5 + 16 - 8
+    assert Range("AA").without([51]).combo_count == 3
+
+
+def test_sampling_follows_weights():
+    rng = np.random.default_rng(16)
+    r = Range("AA, KK:0.5")
+    picks = r.sample(3000, rng=rng)
+    share_aa = sum(p[0] == p[2] == "A" for p in picks) / len(picks)
+    assert abs(share_aa - 2 / 3) < 0.03
+    assert all("As" not in p for p in r.sample(200, dead=["As"], rng=rng))
+    assert isinstance(r.sample(rng=rng), str)
+    with pytest.raises(ValueError):
+        Range().sample()
+
+
+def test_preflop_recommendation_uses_charts():
+    assert get_preflop_recommendation("UTG", "open", "As Ad", 12).startswith("Jam")
+    assert get_preflop_recommendation("BB", "vs BTN", "7c 2d", 12).startswith("Fold")
@@ -0,0 +1,93 @@
+import os
+import pickle
+import time
+
+from django.core.management import call_command
+
+from solver.result_cache import ResultCache
+from solver.services import evaluate_spots, range_equity
+
+
+def test_batched_round_trip(tmp_path):
+    cache = ResultCache(tmp_path / "cache.sqlite3")
+    cache.set_many({f"k{i}": {"n": i, "cards": ["As"]} for i in range(1200)})
+    found = cache.get_many([f"k{i}" for i in range(0, 1300, 7)])
+    assert len(found) == len(range(0, 1200, 7))
+    assert found["k7"] == {"n": 7, "cards": ["As"]}
+    assert cache.get("missing") is None
+    info = cache.info()
+    assert info["entries"] == 1200 and info["hits"] == len(found)
+    assert cache._connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_ttl_and_size_eviction(tmp_path):
+    cache = ResultCache(tmp_path / "cache.sqlite3", ttl=60, max_entries=3)
+    cache.set("short", 1, ttl=0.01)
+    time.sleep(0.05)
+    assert cache.get("short") is None
+
+    for key in "abc":
+        cache.set(key, key)
+        time.sleep(0.01)
+    cache.set("d", "d")
+    # The least recently used entry went
+    assert sorted(cache.get_many("abcd")) == ["b", "c", "d"]
+
+
+def test_eviction_waits_for_a_share_of_writes(tmp_path):
+    cache = ResultCache(tmp_path / "cache.sqlite3", max_entries=1000)
+    cache.set_many({f"old{i}": i for i in range(1000)})
+    time.sleep(0.01)
+    assert len(cache) == 1000
+    # Up to 1% of max_entries (10 rows) is written before the next eviction
+    for i in range(9):
+        cache.set(f"new{i}", i)
+    assert len(cache) == 1009
+    cache.set("new9", 9)
+    assert len(cache) == 1000
+    # The oldest entries went, the newest stayed
+    assert len(cache.get_many([f"old{i}" for i in range(1000)])) == 990
+    assert len(cache.get_many([f"new{i}" for i in range(10)])) == 10
+
+
+def test_shared_between_copies(tmp_path):
+    cache = ResultCache(tmp_path / "cache.sqlite3")
+    cache.set("spot", [1, 2])
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.get("spot") == [1, 2]
+    copy.set("other", 3)
+    assert cache.get("other") == 3
+
+
+def test_services_use_cache(tmp_path):
+    cache = ResultCache(tmp_path / "cache.sqlite3")
+    spots = [["Ah Kh", "Qh Jh 2c"], ["As Ks", "Qs Js 2d"], ["7c 7d", "7h 9s Ts 2c"]]
+    expected = evaluate_spots(spots)
+    assert evaluate_spots(spots, cache=cache) == expected
+    # The two flush-draw spots are one class
+    assert len(cache) == 2
+    assert evaluate_spots(spots, cache=cache) == expected
+    assert cache.info()["hits"] == 2
+
+    payload = {"range_a": "AA", "range_b": "KK", "board": "2c 7d 9h"}
+    assert range_equity(payload, cache=cache) == range_equity(payload)
+    assert range_equity({**payload, "board": "9h 2c 7d"}, cache=cache) == range_equity(payload)
+    assert len(cache) == 3
+
+
+def test_warm_command(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr("solver.management.commands.warm_result_cache.get_result_cache", lambda: cache)
+    call_command("warm_result_cache", "--hands", "AA", "--boards", "2", stdout=open(os.devnull, "w"))
+    warmed = len(cache)
+    assert warmed > 0
+    # A warmed spot (on the most frequent flop class) is served from the cache
+    hits = cache.info()["hits"]
+    spot = [["Ac Ad", "4s 3h 2d"]]
+    assert evaluate_spots(spot, cache=cache) == evaluate_spots(spot)
+    assert cache.info()["hits"] == hits + 1 and len(cache) == warmed
+
+    spots = tmp_path / "spots.json"
+    spots.write_text('[["As Kd", "Ah 7c 2d"], ["As", ""]]')
+    call_command("warm_result_cache", "--file", str(spots), stdout=open(os.devnull, "w"))
+    assert len(cache) == warmed + 1
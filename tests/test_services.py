@@ -0,0 +1,140 @@
+import asyncio
+import json
+import time
+
+import numpy as np
+import pytest
+from django.conf import settings
+from django.test import RequestFactory
+
+from solver.hand_strength import compute_best_possible_hand, evaluate_hand
+from solver.logic.cards import CARD_STRINGS
+from solver.result_cache import ResultCache
+from solver.services import MAX_BATCH_SPOTS, evaluate_spots, parse_spot
+from solver.services import (
+    MAX_SOLVE_ITERATIONS,
+    MCCFR_ITERATIONS,
+    canonical_form,
+    evaluate_form,
+    range_equity,
+    restore_form,
+    solve,
+)
+from solver.views import equity_api, evaluate_api, solve_api
+
+
+def test_parse_spot_formats():
+    expected = parse_spot({"hole": "As Kd", "board": "Ah 7c 2d"})
+    assert parse_spot(["AsKd", "Ah7c2d"]) == expected
+    assert parse_spot({"hand": ["as", "kd"], "board": ["AH", "7C", "2D"]}) == expected
+    for bad in ({"hole": "As", "board": "Ah 7c 2d"}, ["As Kd", "Ah 7c"], ["As Kd", "As 7c 2d"], ["Xx Kd", "Ah 7c 2d"], 42):
+        with pytest.raises(ValueError):
+            parse_spot(bad)
+
+
+def test_batch_matches_single_spot_evaluators():
+    rng = np.random.default_rng(21)
+    spots = []
+    for _ in range(200):
+        cards = [CARD_STRINGS[c] for c in rng.choice(52, 2 + rng.integers(3, 6), replace=False)]
+        spots.append({"hole": cards[:2], "board": cards[2:]})
+    results = evaluate_spots(spots)
+    for spot, result in zip(spots, results):
+        single = evaluate_hand(spot["hole"], spot["board"])
+        assert result["category"] == single["hand_name"]
+        assert result["nuts"] == compute_best_possible_hand(spot["hole"], spot["board"])["best_name"]
+        assert ("outs" in result) == (len(spot["board"]) < 5)
+
+
+def test_errors_stay_per_spot():
+    results = evaluate_spots([["As Kd", "Ah 7c 2d"], ["As As", "2c 3c 4c"], ["As Kd", "Ah 7c 2d"]], outs=False)
+    assert results[0] == results[2] and "outs" not in results[0]
+    assert results[1] == {"error": "Duplicate card: As"}
+    with pytest.raises(ValueError):
+        evaluate_spots([["As Kd", "Ah 7c 2d"]] * (MAX_BATCH_SPOTS + 1))
+
+
+def _call(view, request):
+    return asyncio.run(view(request))
+
+
+def test_api_view(tmp_path, monkeypatch):
+    # Never the site's cache file: results must not come from earlier runs
+    monkeypatch.setattr("solver.views.get_result_cache", lambda: ResultCache(tmp_path / "cache.sqlite3"))
+    factory = RequestFactory()
+    body = {"spots": [{"hole": "7h 8h", "board": "9h Th 2c"}, {"hole": "As", "board": ""}], "nuts": False}
+    response = _call(evaluate_api, factory.post("/api/evaluate/", json.dumps(body), content_type="application/json"))
+    assert response.status_code == 200
+    data = json.loads(response.content)
+    assert data["errors"] == 1
+    assert data["results"][0]["category"] == "High Card" and "nuts" not in data["results"][0]
+    assert "Jh" in data["results"][0]["outs"]
+
+    assert _call(evaluate_api, factory.post("/api/evaluate/", "nope", content_type="application/json")).status_code == 400
+    assert _call(evaluate_api, factory.post("/api/evaluate/", "{}", content_type="application/json")).status_code == 400
+    assert _call(evaluate_api, factory.get("/api/evaluate/")).status_code == 405
+
+
+@pytest.mark.parametrize("view, path, body", [
+    (equity_api, "/api/equity/", {"range_a": 5, "range_b": "KK", "board": "2c 7d 9h"}),
+    (equity_api, "/api/equity/", {"range_a": "AA", "range_b": ["KK", 3], "board": "2c 7d 9h"}),
+    (solve_api, "/api/solve/", {"board": "2c 7d 9h Js 3c", "oop_range": 5, "ip_range": "KK"}),
+    (solve_api, "/api/solve/", {"board": "2c 7d 9h Js 3c", "oop_range": "AA", "ip_range": "KK", "streets": 3}),
+    (solve_api, "/api/solve/", {"board": "2c 7d 9h Js 3c", "oop_range": "AA", "ip_range": "KK", "streets": [3]}),
+    (solve_api, "/api/solve/", {"board": "2c 7d 9h Js 3c", "oop_range": "AA", "ip_range": "KK", "bet_sizes": 0.5}),
+    (solve_api, "/api/solve/", {"board": 5, "oop_range": "AA", "ip_range": "KK", "reuse": False}),
+    (solve_api, "/api/solve/", {"board": "2c 7d 9h Js 3c", "oop_range": "AA", "ip_range": "KK", "iterations": None,
+                                "reuse": False}),
+])
+def test_api_rejects_wrong_types(view, path, body):
+    request = RequestFactory().post(path, json.dumps(body), content_type="application/json")
+    response = _call(view, request)
+    assert response.status_code == 400
+    assert "error" in json.loads(response.content)
+
+
+def test_range_equity_service():
+    result = range_equity({"range_a": "AA", "range_b": "KK", "board": "2c 7d 9h Js 3c"})
+    assert result["equity"] > 0.9
+    assert result["combos"] == [6, 6]
+
+
+@pytest.mark.parametrize("hand, board", [
+    (["Ah", "Kh"], ["Qh", "Jh", "2c"]),
+    (["7d", "7s"], ["7c", "9d", "Td", "2s"]),
+])
+def test_canonical_form_round_trip(hand, board):
+    key, hole, canon_board, suit_map = canonical_form(hand, board)
+    assert restore_form(evaluate_form(hole, canon_board), suit_map, hand, board) == evaluate_form(hand, board)
+    # Suit relabellings share the key
+    swap = str.maketrans("hcds", "sdch")
+    assert canonical_form([c.translate(swap) for c in hand], [c.translate(swap) for c in board])[0] == key
+
+
+def test_solve_limits(monkeypatch):
+    spot = {"board": "As Kd 7c 2h 3s", "oop_range": "AA", "ip_range": "KK"}
+    with pytest.raises(ValueError):
+        solve({**spot, "iterations": MAX_SOLVE_ITERATIONS + 1})
+    with pytest.raises(ValueError):
+        solve({**spot, "target": 0})
+    for bad in (None, [100], "many", -5, True, float("nan")):
+        with pytest.raises(ValueError):
+            solve({**spot, "iterations": bad})
+        with pytest.raises(ValueError):
+            solve({**spot, "target": bad})
+    # The client cannot fork workers of its own
+    monkeypatch.setattr("solver.services.run_solver", lambda payload: payload)
+    assert solve({**spot, "processes": 64})["processes"] == 1
+    assert solve({**spot, "iterations": "200", "target": "0.01"})["iterations"] == 200
+
+
+def test_api_flop_solve_fits_the_timeout():
+    spot = {"board": "Ks Th 7d", "oop_range": "22+, A2s+, K9s+, QTs+, JTs, ATo+, KJo+",
+            "ip_range": "55+, A5s+, KTs+, QJs, AJo+, KQo"}
+    with pytest.raises(ValueError):
+        solve({**spot, "iterations": MCCFR_ITERATIONS[3] + 1})
+    start = time.perf_counter()
+    solution = solve(spot)["solution"]
+    assert time.perf_counter() - start < settings.SOLVER_TASK_TIMEOUT
+    assert solution["iterations"] == MCCFR_ITERATIONS[3]
+    assert not solution["exact"]
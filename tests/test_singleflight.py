@@ -0,0 +1,79 @@
+import asyncio
+import threading
+
+import pytest
+
+from solver.singleflight import SingleFlight
+
+
+def _counting_job(runs, delay=0.05):
+    async def job(value):
+        runs.append(value)
+        await asyncio.sleep(delay)
+        return value * 2
+
+    return job
+
+
+def test_concurrent_calls_share_one_run():
+    flight, runs = SingleFlight(), []
+    job = _counting_job(runs)
+
+    async def burst():
+        return await asyncio.gather(*(flight.do("spot", job, 21) for _ in range(5)), flight.do("other", job, 1))
+
+    assert asyncio.run(burst()) == [42] * 5 + [2]
+    assert runs == [21, 1]
+    assert flight.stats() == {"calls": 6, "executions": 2, "coalesced": 4, "in_flight": 0}
+
+    # Finished runs are not cached
+    asyncio.run(flight.do("spot", job, 21))
+    assert runs == [21, 1, 21]
+
+
+def test_errors_reach_every_caller():
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise ValueError("bad spot")
+
+    async def burst():
+        return await asyncio.gather(*(flight.do("spot", failing) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(burst())
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_callers_in_other_event_loops_coalesce():
+    flight, runs = SingleFlight(), []
+    job = _counting_job(runs, delay=0.3)
+    results = []
+
+    def request():
+        results.append(asyncio.run(flight.do("spot", job, 5)))
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [10] * 4
+    assert runs == [5]
+    assert flight.stats()["coalesced"] == 3
+
+
+def test_cancelled_follower_leaves_the_run_alone():
+    flight, runs = SingleFlight(), []
+    job = _counting_job(runs, delay=0.1)
+
+    async def scenario():
+        leader = asyncio.ensure_future(flight.do("spot", job, 3))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(flight.do("spot", job, 3), 0.01)
+        return await leader
+
+    assert asyncio.run(scenario()) == 6
+    assert runs == [3]
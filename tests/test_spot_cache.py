@@ -0,0 +1,127 @@
+import json
+import logging
+import random
+
+import pytest
+
+from solver.hand_strength import (
+    cached_compute_best_possible_hand,
+    cached_compute_future_improvements,
+    cached_evaluate_hand,
+    compute_best_possible_hand,
+    compute_future_improvements,
+    evaluate_hand,
+    restore_evaluation,
+)
+from solver.logic.cards import CARD_STRINGS
+from solver.logic.hand_strength import (
+    cached_evaluate_best_possible_flop,
+    cached_evaluate_best_possible_river,
+    cached_evaluate_best_possible_turn,
+    cached_outs_report,
+    cached_simulate_future_outs,
+    evaluate_best_possible_flop,
+    evaluate_best_possible_river,
+    evaluate_best_possible_turn,
+    outs_report,
+    simulate_future_outs,
+)
+from solver.logic.spot_cache import FrozenDict, LRUCache, freeze, spot_cache, thaw
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.mark.parametrize("cached, plain, boards", [
+    (cached_evaluate_hand, evaluate_hand, (3, 4, 5)),
+    (cached_compute_best_possible_hand, compute_best_possible_hand, (3, 4, 5)),
+    (cached_compute_future_improvements, compute_future_improvements, (3, 4, 5)),
+    (cached_simulate_future_outs, simulate_future_outs, (3, 4, 5)),
+    (cached_outs_report, outs_report, (3, 4)),
+    (cached_evaluate_best_possible_flop, evaluate_best_possible_flop, (3, 4, 5)),
+    (cached_evaluate_best_possible_turn, evaluate_best_possible_turn, (3, 4, 5)),
+    (cached_evaluate_best_possible_river, evaluate_best_possible_river, (3, 4, 5)),
+])
+def test_cached_matches_uncached(cached, plain, boards):
+    rng = random.Random(9)
+    for _ in range(60):
+        cards = [CARD_STRINGS[c] for c in rng.sample(range(52), 2 + rng.choice(boards))]
+        hole, board = cards[:2], cards[2:]
+        # Same result, field order and dict order included
+        assert json.dumps(thaw(cached(hole, board))) == json.dumps(thaw(freeze(plain(hole, board))))
+
+
+def test_verbose_calls_are_traced_not_cached():
+    handler = _Capture()
+    logger = logging.getLogger("solver.hand_strength")
+    logger.addHandler(handler)
+    hole, board = ["Ah", "Kh"], ["Qh", "Jh", "2c"]
+    cached_evaluate_hand(hole, board)
+    before = cached_evaluate_hand.cache_info()
+    for _ in range(2):
+        assert thaw(cached_evaluate_hand(hole, board, verbose=True)) == evaluate_hand(hole, board)
+    logger.removeHandler(handler)
+    assert any("evaluate_hand" in m for m in handler.messages)
+    assert cached_evaluate_hand.cache_info() == before
+    # verbose=False is the cached call
+    cached_evaluate_hand(hole, board, verbose=False)
+    assert cached_evaluate_hand.cache_info()["hits"] == before["hits"] + 1
+
+
+@pytest.mark.parametrize("cached, plain", [
+    (cached_compute_future_improvements, compute_future_improvements),
+    (cached_outs_report, outs_report),
+])
+def test_runner_runner_combos_keep_caller_suits(cached, plain):
+    # Spades are not the canonical first suit, so every combo is relabelled
+    hole, board = ["7s", "8s"], ["9s", "2d", "3c"]
+    assert thaw(cached(hole, board)) == plain(hole, board)
+    rng = random.Random(4)
+    for _ in range(10):
+        cards = [CARD_STRINGS[c] for c in rng.sample(range(52), 5)]
+        assert thaw(cached(cards[:2], cards[2:])) == plain(cards[:2], cards[2:])
+
+
+def test_isomorphic_spots_share_an_entry():
+    fn = spot_cache(maxsize=8, restore=restore_evaluation)(evaluate_hand)
+    first = fn(["7h", "8h"], ["9h", "Th", "Jh", "2c"])
+    second = fn(["7s", "8s"], ["9s", "Ts", "Js", "2d"])
+    assert fn.cache_info()["hits"] == 1
+    assert fn.cache_info()["size"] == 1
+    assert first["hand_name"] == second["hand_name"] == "Straight Flush"
+    assert list(first["best_five"]) == ["7h", "8h", "9h", "Th", "Jh"]
+    assert list(second["best_five"]) == ["7s", "8s", "9s", "Ts", "Js"]
+
+
+def test_suit_dependent_results_key_on_exact_cards():
+    # The nuts completion picks suits by index: no relabelled sharing
+    fn = spot_cache(maxsize=8)(compute_best_possible_hand)
+    first = fn(["Ah", "5d"], ["3h", "9s", "2d", "8c"])
+    second = fn(["As", "5c"], ["3s", "9h", "2c", "8d"])
+    assert fn.cache_info()["size"] == 2
+    assert thaw(first) == compute_best_possible_hand(["Ah", "5d"], ["3h", "9s", "2d", "8c"])
+    assert thaw(second) == compute_best_possible_hand(["As", "5c"], ["3s", "9h", "2c", "8d"])
+
+
+def test_results_are_read_only():
+    res = cached_compute_best_possible_hand(["As", "Kd"], ["Ah", "Ad", "Ac"])
+    assert isinstance(res, FrozenDict)
+    with pytest.raises(TypeError):
+        res["best_name"] = "x"
+    assert isinstance(res["best_five"], tuple)
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 2, "maxsize": 2}
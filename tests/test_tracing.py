@@ -0,0 +1,70 @@
+import logging
+import threading
+
+from solver.hand_strength import evaluate_hand
+from solver.logic.tracing import get_tracer, tracing
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class _Loud:
+    formatted = 0
+
+    def __str__(self):
+        _Loud.formatted += 1
+        return "loud"
+
+
+def _capture(name):
+    handler = _Capture()
+    logging.getLogger(name).addHandler(handler)
+    return handler
+
+
+def test_disabled_tracing_formats_nothing():
+    trace = get_tracer("solver.test_tracing")
+    handler = _capture("solver.test_tracing")
+    _Loud.formatted = 0
+    trace("value %s", _Loud())
+    assert handler.messages == []
+    assert _Loud.formatted == 0
+    with tracing():
+        trace("value %s", _Loud())
+    assert handler.messages == ["value loud"]
+
+
+def test_verbose_traces_one_call(capsys):
+    handler = _capture("solver.hand_strength")
+    evaluate_hand(["As", "Kd"], ["Ah", "Ad", "Ac"])
+    assert handler.messages == []
+    evaluate_hand(["As", "Kd"], ["Ah", "Ad", "Ac"], verbose=True)
+    assert any("Four of a Kind" in m for m in handler.messages)
+    assert capsys.readouterr().out == ""
+
+
+def test_tracing_is_per_thread():
+    trace = get_tracer("solver.test_tracing_threads")
+    handler = _capture("solver.test_tracing_threads")
+    inside = threading.Event()
+    done = threading.Event()
+
+    def other():
+        inside.wait()
+        trace("other thread")
+        done.set()
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    with tracing():
+        inside.set()
+        done.wait()
+        trace("this thread")
+    thread.join()
+    assert handler.messages == ["this thread"]
@@ -0,0 +1,84 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from solver.workers import (
+    PoolSaturated,
+    PoolTimeout,
+    WorkerPool,
+    busy_response,
+)
+
+
+def _crash(seconds):
+    time.sleep(seconds)
+    os._exit(1)
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def test_pool_runs_jobs():
+    pool = WorkerPool(size=1, queue_depth=1, timeout=30)
+    try:
+        assert asyncio.run(pool.run(pow, 2, 10)) == 1024
+        assert pool.stats()["in_flight"] == 0
+    finally:
+        pool.shutdown()
+
+
+def test_full_pool_refuses_at_once():
+    pool = WorkerPool(size=1, queue_depth=0, timeout=30)
+
+    async def two_jobs():
+        first = asyncio.ensure_future(pool.run(_sleep, 0.5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PoolSaturated):
+            await pool.run(_sleep, 0)
+        return await first
+
+    try:
+        assert asyncio.run(two_jobs()) == 0.5
+        assert pool.stats()["rejected"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_timeout_keeps_slot_until_job_ends():
+    pool = WorkerPool(size=1, queue_depth=0, timeout=30)
+    try:
+        with pytest.raises(PoolTimeout):
+            asyncio.run(pool.run(_sleep, 0.5, timeout=0.05))
+        # The worker is still busy with the job
+        assert pool.stats()["in_flight"] == 1
+        deadline = time.monotonic() + 10
+        while pool.stats()["in_flight"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool.stats()["in_flight"] == 0
+        assert asyncio.run(pool.run(_sleep, 0)) == 0
+    finally:
+        pool.shutdown()
+
+
+def test_pool_recovers_from_a_worker_dying_unobserved():
+    pool = WorkerPool(size=1, queue_depth=0, timeout=30)
+    try:
+        with pytest.raises(PoolTimeout):
+            asyncio.run(pool.run(_crash, 0.2, timeout=0.01))
+        deadline = time.monotonic() + 10
+        while pool.stats()["in_flight"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert asyncio.run(pool.run(pow, 2, 3)) == 8
+        assert asyncio.run(pool.run(pow, 2, 4)) == 16
+    finally:
+        pool.shutdown()
+
+
+def test_busy_response():
+    response = busy_response(PoolSaturated("full"))
+    assert response.status_code == 429 and response["Retry-After"] == "1"
+    assert busy_response(PoolTimeout("slow")).status_code == 503